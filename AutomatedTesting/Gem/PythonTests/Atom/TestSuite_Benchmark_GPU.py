@@ -11,6 +11,7 @@ import psutil
 import pytest
 
 import editor_python_test_tools.hydra_test_utils as hydra
+from ly_test_tools.benchmark.benchmark_history import BENCHMARK_HISTORY_ENV_VAR, format_regression
 from ly_test_tools.benchmark.data_aggregator import BenchmarkDataAggregator
 
 logger = logging.getLogger(__name__)
@@ -81,6 +82,20 @@ class TestPerformanceBenchmarkSuite(object):
         aggregator = BenchmarkDataAggregator(workspace, logger, 'main_gpu')
         aggregator.upload_metrics('dx12')
 
+    def test_AtomFeatureIntegrationBenchmarkTest_CheckBenchmarkRegressions_DX12(
+            self, request, editor, workspace, project, launcher_platform, level):
+        """
+        Records the DX12 benchmark metrics in the local benchmark history and fails if they regressed from the
+        previous runs. Skipped when the history doesn't have enough previous runs, so $LYTT_BENCHMARK_HISTORY must
+        point to persistent storage in CI, which is not cleaned between builds.
+        """
+        aggregator = BenchmarkDataAggregator(workspace, logger, 'main_gpu')
+        regressions = aggregator.check_regressions('dx12')
+        assert not regressions, '\n'.join(format_regression(regression) for regression in regressions)
+        if aggregator.runs_without_baseline:
+            pytest.skip(f'Not enough previous runs in the benchmark history {aggregator.history_path} to check for '
+                        f'regressions, ${BENCHMARK_HISTORY_ENV_VAR} must point to persistent storage in CI')
+
     @pytest.mark.parametrize('rhi', ['-rhi=Vulkan'])
     def test_AtomFeatureIntegrationBenchmarkTest_GatherBenchmarkMetrics_Vulkan(
             self, request, editor, workspace, rhi, project, launcher_platform, level):
@@ -123,3 +138,17 @@ class TestPerformanceBenchmarkSuite(object):
         """
         aggregator = BenchmarkDataAggregator(workspace, logger, 'main_gpu')
         aggregator.upload_metrics('Vulkan')
+
+    def test_AtomFeatureIntegrationBenchmarkTest_CheckBenchmarkRegressions_Vulkan(
+            self, request, editor, workspace, project, launcher_platform, level):
+        """
+        Records the Vulkan benchmark metrics in the local benchmark history and fails if they regressed from the
+        previous runs. Skipped when the history doesn't have enough previous runs, so $LYTT_BENCHMARK_HISTORY must
+        point to persistent storage in CI, which is not cleaned between builds.
+        """
+        aggregator = BenchmarkDataAggregator(workspace, logger, 'main_gpu')
+        regressions = aggregator.check_regressions('Vulkan')
+        assert not regressions, '\n'.join(format_regression(regression) for regression in regressions)
+        if aggregator.runs_without_baseline:
+            pytest.skip(f'Not enough previous runs in the benchmark history {aggregator.history_path} to check for '
+                        f'regressions, ${BENCHMARK_HISTORY_ENV_VAR} must point to persistent storage in CI')
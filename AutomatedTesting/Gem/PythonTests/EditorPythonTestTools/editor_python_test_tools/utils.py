@@ -293,6 +293,7 @@ class Timeout:
 class Report:
     _results = []
     _exception = None
+    _start_time = None
 
     @staticmethod
     def start_test(test_function : Callable):
@@ -302,6 +303,7 @@ class Report:
         """
         Report._results = []
         Report._exception = None
+        Report._start_time = time.monotonic()
         general.test_output(f"Starting test {test_function.__name__}...\n")
         try:
             test_function()
@@ -345,6 +347,9 @@ class Report:
         report += "Test result:  " + ("SUCCESS" if success else "FAILURE")
         report_dict['success'] = success
         report_dict['output'] = report
+        # The duration of the test alone, which the external runner can't time when tests share an editor
+        if Report._start_time is not None:
+            report_dict['duration'] = round(time.monotonic() - Report._start_time, 3)
         report_json_str = json.dumps(report_dict)
         # For helping parsing, the json will be always contained between JSON_START JSON_END
         report += f"\nJSON_START({report_json_str})JSON_END\n"
@@ -17,7 +17,7 @@ from . import ap_setup_fixture
 
 # Import LyTestTools
 import ly_test_tools.environment.waiter as waiter
-from ly_test_tools.o3de.ap_log_parser import APLogParser
+from ly_test_tools.o3de.ap_log_parser import StreamingAPLogParser
 
 
 @pytest.mark.usefixtures("test_assets")
@@ -54,11 +54,15 @@ class TimestampChecker(object):
                     # a log from a previous run where our current test hasn't engaged any action from AP
                     if time.time() - self.start_time > updatetime_max:
                         return True
-            self.log = APLogParser(self.file)
-            line_index = len(self.log.runs[-1]["Lines"]) - 1
-            while line_index > 0:
-                line = self.log.runs[-1]["Lines"][line_index]
-                timestamp = self.log.runs[-1]["Timestamps"][line_index]
+            # The log is only read from where the previous check stopped
+            if self.log is None or self.log.file_path != self.file:
+                self.log = StreamingAPLogParser(self.file)
+            else:
+                self.log.update()
+            if not len(self.log.runs):
+                return False
+            # Only the lines after the latest relevant message are read, rather than parsing the whole last run
+            for line, timestamp in self.log.get_lines_reversed(run=-1):
                 if self.log.get_line_type(line) == "AssetProcessor":
                     message = self.log.remove_line_type(line)
                     if timestamp <= self.original_mod_time:
@@ -68,7 +72,6 @@ class TimestampChecker(object):
                     elif "Job processing completed. Asset Processor is currently idle." in message:
                         self.original_mod_time = timestamp
                         return True
-                line_index -= 1
 
         waiter.wait_for(lambda: (log_reports_idle()), timeout=timeout or self.timeout)
 
@@ -22,6 +22,10 @@ def pytest_addoption(parser: argparse.ArgumentParser) -> None:
     parser.addoption("--no-editor-batch", action="store_true", help="Don't batch multiple tests in single editor")
     parser.addoption("--no-editor-parallel", action="store_true", help="Don't run multiple editors in parallel")
     parser.addoption("--editors-parallel", type=int, action="store", help="Override the number editors to run at the same time")
+    parser.addoption("--editors-parallel-adaptive", action="store_true",
+                     help="Size the number of editors to run at the same time from the available cores and memory")
+    parser.addoption("--warm-editor-pool", action="store_true",
+                     help="Run the shared tests in editors which are kept running between tests")
 
 def pytest_pycollect_makeitem(collector: PyCollector, name: str, obj: object) -> PyCollector:
     """
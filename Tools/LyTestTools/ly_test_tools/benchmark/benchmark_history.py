@@ -0,0 +1,293 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Local history of benchmark results, kept in a SQLite file, which detects performance regressions without the remote
+metrics stack. Every run of a benchmark stores the samples of each frame, and a run is compared against the previous
+runs of the same benchmark, RHI and test suite with a one-sided Mann-Whitney U test per metric.
+"""
+from argparse import ArgumentParser
+import collections
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+
+import numpy
+
+# Environment variable with the path of the history file used when no path is given
+BENCHMARK_HISTORY_ENV_VAR = 'LYTT_BENCHMARK_HISTORY'
+DEFAULT_BASELINE_RUNS = 5  # previous runs pooled as the baseline of a comparison
+DEFAULT_MIN_BASELINE_RUNS = 3  # previous runs needed before a run without regressions is trusted to have none
+DEFAULT_SIGNIFICANCE = 0.01  # p-value below which a slowdown is significant
+DEFAULT_MIN_REGRESSION = 0.05  # relative increase of the median below which a slowdown is ignored
+MIN_SAMPLES = 5  # metrics with fewer samples in the run or the baseline are not compared
+SQLITE_TIMEOUT = 30  # seconds to wait for another process writing to the history
+
+BenchmarkRegression = collections.namedtuple(
+    'BenchmarkRegression',
+    ['benchmark', 'metric', 'name', 'baseline_median', 'median', 'relative_change', 'p_value'])
+
+
+def mann_whitney_u(samples, baseline_samples):
+    '''
+    One-sided Mann-Whitney U test of whether the samples tend to be greater than the baseline samples. Uses the normal
+    approximation with tie and continuity corrections, which holds for the frame counts of benchmarks.
+
+    :param samples: Sequence of the samples of the run
+    :param baseline_samples: Sequence of the samples of the baseline
+    :return: Tuple with two indexes:
+        [0]: U statistic of the samples
+        [1]: p-value of the samples not being greater than the baseline samples
+    '''
+    samples = numpy.asarray(samples, dtype=numpy.float64)
+    baseline_samples = numpy.asarray(baseline_samples, dtype=numpy.float64)
+    count = len(samples)
+    baseline_count = len(baseline_samples)
+    total_count = count + baseline_count
+
+    # tied values get the average of their ranks
+    _, inverse, tie_counts = numpy.unique(
+        numpy.concatenate((samples, baseline_samples)), return_inverse=True, return_counts=True)
+    average_ranks = numpy.cumsum(tie_counts) - (tie_counts - 1) / 2.0
+    u_statistic = float(average_ranks[inverse[:count]].sum()) - count * (count + 1) / 2.0
+
+    tie_correction = float((tie_counts ** 3 - tie_counts).sum()) / (total_count * (total_count - 1))
+    variance = count * baseline_count / 12.0 * (total_count + 1 - tie_correction)
+    if variance <= 0:
+        # all the samples are equal
+        return u_statistic, 1.0
+
+    z_score = (u_statistic - count * baseline_count / 2.0 - 0.5) / math.sqrt(variance)
+    return u_statistic, 0.5 * math.erfc(z_score / math.sqrt(2))
+
+
+class BenchmarkHistory(object):
+    def __init__(self, history_path):
+        '''
+        Initializes a local history of benchmark results. The SQLite file is only opened while reading or writing.
+
+        :param history_path: Path of the SQLite file, it is created if it doesn't exist
+        '''
+        self.history_path = history_path
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.history_path)), exist_ok=True)
+        connection = sqlite3.connect(self.history_path, timeout=SQLITE_TIMEOUT)
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS runs ('
+            'run_id INTEGER PRIMARY KEY AUTOINCREMENT, rhi TEXT NOT NULL, test_suite TEXT NOT NULL, '
+            'benchmark TEXT NOT NULL, build TEXT, timestamp REAL NOT NULL)')
+        connection.execute('CREATE INDEX IF NOT EXISTS runs_key ON runs (rhi, test_suite, benchmark, run_id)')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS samples ('
+            'run_id INTEGER NOT NULL, metric TEXT NOT NULL, name TEXT NOT NULL, data BLOB NOT NULL, '
+            'PRIMARY KEY (run_id, metric, name))')
+        return connection
+
+    @staticmethod
+    def get_benchmark_key(benchmark_metadata):
+        '''
+        Returns the key of the runs of a benchmark which are compared with each other.
+
+        :param benchmark_metadata: Dict of benchmark metadata from the metadata file, e.g. benchmark name and GPU
+        '''
+        return json.dumps(benchmark_metadata, sort_keys=True)
+
+    def add_run(self, rhi, test_suite, benchmark_metadata, samples, build=None, timestamp=None):
+        '''
+        Stores the samples of a run of a benchmark.
+
+        :param rhi: The RHI the benchmark was run on
+        :param test_suite: Name of the test suite the benchmark was run in
+        :param benchmark_metadata: Dict of benchmark metadata from the metadata file
+        :param samples: Dict of the samples of the run (key: tuple of metric and name, value: sequence of the samples)
+        :param build: Identifier of the build which was benchmarked, e.g. the git commit
+        :param timestamp: Time of the run, defaults to now
+        :return: The id of the run
+        '''
+        if timestamp is None:
+            timestamp = time.time()
+
+        connection = self._connect()
+        try:
+            with connection:
+                run_id = connection.execute(
+                    'INSERT INTO runs (rhi, test_suite, benchmark, build, timestamp) VALUES (?, ?, ?, ?, ?)',
+                    (rhi, test_suite, self.get_benchmark_key(benchmark_metadata), build, timestamp)).lastrowid
+                connection.executemany(
+                    'INSERT INTO samples VALUES (?, ?, ?, ?)',
+                    [(run_id, metric, name, numpy.asarray(values, dtype=numpy.float64).tobytes())
+                     for (metric, name), values in samples.items()])
+        finally:
+            connection.close()
+        return run_id
+
+    def get_latest_runs(self, rhi, test_suite):
+        '''
+        Returns the latest run of each benchmark run on an RHI in a test suite.
+
+        :param rhi: The RHI the benchmarks were run on
+        :param test_suite: Name of the test suite the benchmarks were run in
+        :return: List of run ids
+        '''
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                'SELECT MAX(run_id) FROM runs WHERE rhi = ? AND test_suite = ? GROUP BY benchmark ORDER BY 1',
+                (rhi, test_suite)).fetchall()
+        finally:
+            connection.close()
+        return [run_id for run_id, in rows]
+
+    def get_run(self, run_id):
+        '''
+        Returns a run of a benchmark.
+
+        :param run_id: The id of the run
+        :return: Tuple with three indexes:
+            [0]: Dict of the run (keys: rhi, test_suite, benchmark, build, timestamp)
+            [1]: Dict of the samples of the run (key: tuple of metric and name, value: array of the samples)
+            [2]: List of the ids of the previous runs of the same benchmark, most recent first
+        '''
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                'SELECT rhi, test_suite, benchmark, build, timestamp FROM runs WHERE run_id = ?',
+                (run_id,)).fetchone()
+            if row is None:
+                raise KeyError(f'Run {run_id} is not in the benchmark history {self.history_path}')
+            run = dict(zip(('rhi', 'test_suite', 'benchmark', 'build', 'timestamp'), row))
+        finally:
+            connection.close()
+        return run, self.get_samples([run_id]), self.get_previous_run_ids(run_id)
+
+    def get_previous_run_ids(self, run_id):
+        '''
+        Returns the previous runs of the same benchmark, RHI and test suite as a run.
+
+        :param run_id: The id of the run
+        :return: List of the ids of the previous runs, most recent first
+        '''
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                'SELECT previous.run_id FROM runs AS run JOIN runs AS previous ON previous.rhi = run.rhi AND '
+                'previous.test_suite = run.test_suite AND previous.benchmark = run.benchmark AND '
+                'previous.run_id < run.run_id WHERE run.run_id = ? ORDER BY previous.run_id DESC', (run_id,)).fetchall()
+        finally:
+            connection.close()
+        return [previous_run_id for previous_run_id, in rows]
+
+    def get_samples(self, run_ids):
+        '''
+        Returns the samples of runs, pooled together.
+
+        :param run_ids: List of run ids
+        :return: Dict of the samples of the runs (key: tuple of metric and name, value: array of the samples)
+        '''
+        samples = {}
+        if not run_ids:
+            return samples
+
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                f'SELECT metric, name, data FROM samples WHERE run_id IN ({",".join("?" * len(run_ids))}) '
+                'ORDER BY run_id', list(run_ids)).fetchall()
+        finally:
+            connection.close()
+        for metric, name, data in rows:
+            samples.setdefault((metric, name), []).append(numpy.frombuffer(data, dtype=numpy.float64))
+        return {key: numpy.concatenate(arrays) for key, arrays in samples.items()}
+
+    def compare_run(self, run_id, baseline_runs=DEFAULT_BASELINE_RUNS, significance=DEFAULT_SIGNIFICANCE,
+                    min_regression=DEFAULT_MIN_REGRESSION):
+        '''
+        Compares each metric of a run against the pooled samples of the previous runs of the same benchmark.
+
+        :param run_id: The id of the run
+        :param baseline_runs: Number of previous runs in the baseline
+        :param significance: p-value below which a slowdown is significant
+        :param min_regression: Relative increase of the median below which a slowdown is ignored
+        :return: List of BenchmarkRegression for the metrics which are significantly slower than the baseline
+        '''
+        run, samples, previous_run_ids = self.get_run(run_id)
+        baseline = self.get_samples(previous_run_ids[:baseline_runs])
+
+        regressions = []
+        for (metric, name), values in sorted(samples.items()):
+            baseline_values = baseline.get((metric, name))
+            if baseline_values is None or len(baseline_values) < MIN_SAMPLES or len(values) < MIN_SAMPLES:
+                continue
+
+            baseline_median = float(numpy.median(baseline_values))
+            median = float(numpy.median(values))
+            relative_change = (median - baseline_median) / baseline_median if baseline_median else 0.0
+            if relative_change < min_regression:
+                continue
+
+            _, p_value = mann_whitney_u(values, baseline_values)
+            if p_value < significance:
+                regressions.append(BenchmarkRegression(
+                    run['benchmark'], metric, name, baseline_median, median, relative_change, p_value))
+        return regressions
+
+    def compare_latest_runs(self, rhi, test_suite, baseline_runs=DEFAULT_BASELINE_RUNS,
+                            significance=DEFAULT_SIGNIFICANCE, min_regression=DEFAULT_MIN_REGRESSION):
+        '''
+        Compares the latest run of each benchmark run on an RHI in a test suite, see compare_run().
+
+        :return: List of BenchmarkRegression for all the benchmarks
+        '''
+        regressions = []
+        for run_id in self.get_latest_runs(rhi, test_suite):
+            regressions.extend(self.compare_run(run_id, baseline_runs, significance, min_regression))
+        return regressions
+
+
+def format_regression(regression):
+    '''
+    Returns a line describing a regression.
+
+    :param regression: The BenchmarkRegression
+    '''
+    return (f'{regression.benchmark} {regression.metric} {regression.name}: median {regression.baseline_median:.4f} -> '
+            f'{regression.median:.4f} ({regression.relative_change:+.1%}, p={regression.p_value:.2g})')
+
+
+def main(argv=None):
+    parser = ArgumentParser(
+        description='Compares the latest benchmark runs against the previous runs in the local benchmark history. '
+                    'Exits with 1 if any pass or frame time regressed.')
+    parser.add_argument('--history', default=os.environ.get(BENCHMARK_HISTORY_ENV_VAR),
+                        help=f'Path of the benchmark history file, defaults to ${BENCHMARK_HISTORY_ENV_VAR}')
+    parser.add_argument('--rhi', required=True, help='RHI the benchmarks were run on, e.g. dx12')
+    parser.add_argument('--test-suite', default='local', help='Test suite the benchmarks were run in')
+    parser.add_argument('--baseline-runs', type=int, default=DEFAULT_BASELINE_RUNS,
+                        help='Number of previous runs in the baseline')
+    parser.add_argument('--significance', type=float, default=DEFAULT_SIGNIFICANCE,
+                        help='p-value below which a slowdown is significant')
+    parser.add_argument('--min-regression', type=float, default=DEFAULT_MIN_REGRESSION,
+                        help='Relative increase of the median below which a slowdown is ignored')
+    args = parser.parse_args(argv)
+    if not args.history:
+        parser.error(f'--history is required when ${BENCHMARK_HISTORY_ENV_VAR} is not set')
+
+    regressions = BenchmarkHistory(args.history).compare_latest_runs(
+        args.rhi, args.test_suite, args.baseline_runs, args.significance, args.min_regression)
+    for regression in regressions:
+        print(format_regression(regression))
+    if regressions:
+        print(f'{len(regressions)} benchmark regression(s) found')
+        return 1
+    print('No benchmark regressions found')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,14 +6,27 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 """
 
 from argparse import ArgumentParser
+import collections
+import concurrent.futures
 import json
 from pathlib import Path
 import time
 import subprocess
 import os
 
+import numpy
+
+from ly_test_tools.benchmark.benchmark_history import BenchmarkHistory, BENCHMARK_HISTORY_ENV_VAR, \
+    DEFAULT_BASELINE_RUNS, DEFAULT_MIN_BASELINE_RUNS, DEFAULT_SIGNIFICANCE, DEFAULT_MIN_REGRESSION
 from ly_test_tools.mars.filebeat_client import FilebeatClient
 
+PERCENTILES = (50, 90, 99)
+TRIMMED_MEAN_PROPORTION = 0.05  # proportion of the lowest and of the highest values left out of the trimmed mean
+
+# All the samples of a benchmark, see load_benchmark_samples()
+BenchmarkSamples = collections.namedtuple(
+    'BenchmarkSamples', ['metadata', 'gpu_frame_times', 'gpu_pass_times', 'cpu_frame_times'])
+
 class BenchmarkPathException(Exception):
     """Custom Exception class for invalid benchmark file paths."""
     pass
@@ -60,6 +73,135 @@ class RunningStatistics(object):
     def getCount(self):
         return self.count
 
+class ArrayStatistics(object):
+    def __init__(self, values):
+        '''
+        Initializes a helper class for calculating statistics over all the values at once.
+
+        :param values: Sequence of the values
+        '''
+        self.values = numpy.asarray(values, dtype=numpy.float64)
+
+    def getAvg(self):
+        '''
+        Returns the average of the values.
+        '''
+        return float(self.values.mean())
+
+    def getMax(self):
+        '''
+        Returns the maximum of the values.
+        '''
+        return float(self.values.max())
+
+    def getMin(self):
+        '''
+        Returns the minimum of the values.
+        '''
+        return float(self.values.min())
+
+    def getCount(self):
+        return len(self.values)
+
+    def getStdDev(self):
+        '''
+        Returns the standard deviation of the values.
+        '''
+        return float(self.values.std())
+
+    def getPercentiles(self, percentiles=PERCENTILES):
+        '''
+        Returns percentiles of the values.
+
+        :param percentiles: The percentiles to compute, from 0 to 100
+        :return: Dict of percentile to value
+        '''
+        return dict(zip(percentiles, numpy.percentile(self.values, percentiles).tolist()))
+
+    def getTrimmedAvg(self, proportion=TRIMMED_MEAN_PROPORTION):
+        '''
+        Returns the average of the values without the outliers, which are the lowest and the highest values.
+
+        :param proportion: Proportion of the values left out at each end
+        '''
+        trimmed_count = int(proportion * len(self.values))
+        sorted_values = numpy.sort(self.values)
+        return float(sorted_values[trimmed_count:len(sorted_values) - trimmed_count].mean())
+
+    def getSummary(self, scale=1.0):
+        '''
+        Returns all the statistics used for reporting.
+
+        :param scale: Factor applied to the statistics, e.g. to convert them to another unit
+        :return: Dict of statistic name to value
+        '''
+        summary = {
+            'avg': self.getAvg(),
+            'max': self.getMax(),
+            'min': self.getMin(),
+            'stddev': self.getStdDev(),
+            'trimmedAvg': self.getTrimmedAvg(),
+        }
+        summary.update({f'p{percentile}': value for percentile, value in self.getPercentiles().items()})
+        return {name: value * scale for name, value in summary.items()}
+
+def load_benchmark_samples(benchmark_dir):
+    '''
+    Loads the results of a single benchmark into arrays with the samples of every frame. This is a module function, so
+    that the benchmarks can be loaded in parallel processes.
+
+    :param benchmark_dir: Path of directory containing the benchmark results
+    :return: BenchmarkSamples with:
+        metadata: Dict with the benchmark metadata from the metadata file
+        gpu_frame_times: Array of the GPU frame times in nanoseconds
+        gpu_pass_times: Dict of GPU pass times in nanoseconds (key: pass name, value: array of the pass times)
+        cpu_frame_times: Array of the CPU frame times
+    '''
+    # Parse benchmark metadata
+    metadata_file = benchmark_dir / 'benchmark_metadata.json'
+    if metadata_file.exists():
+        metadata = json.loads(metadata_file.read_text())['ClassData']
+    else:
+        raise BenchmarkPathException(f'Metadata file could not be found at {metadata_file}')
+
+    gpu_frame_times = []
+    gpu_pass_times = {}  # key: pass name, value: list of pass times
+    cpu_frame_times = []
+
+    # this allows us to add additional data if necessary, e.g. frame_test_timestamps.json
+    is_timestamp_file = lambda file: file.name.startswith('frame') and file.name.endswith('_timestamps.json')
+    is_frame_time_file = lambda file: file.name.startswith('cpu_frame') and file.name.endswith('_time.json')
+
+    # parse benchmark files, sorted so the samples are in the same order on every platform
+    for file in sorted(benchmark_dir.iterdir()):
+        if file.is_dir():
+            continue
+
+        if is_timestamp_file(file):
+            data = json.loads(file.read_text())
+            frame_time = 0
+            for entry in data['ClassData']['timestampEntries']:
+                time_ns = entry['timestampResultInNanoseconds']
+                gpu_pass_times.setdefault(entry['passName'], []).append(time_ns)
+                frame_time += time_ns
+            gpu_frame_times.append(frame_time)
+
+        if is_frame_time_file(file):
+            data = json.loads(file.read_text())
+            cpu_frame_times.append(data['ClassData']['frameTime'])
+
+    if not gpu_frame_times:
+        raise BenchmarkPathException(f'No GPU frame timestamp logs were found in {benchmark_dir}')
+
+    if not cpu_frame_times:
+        raise BenchmarkPathException(f'No CPU frame times were found in {benchmark_dir}')
+
+    return BenchmarkSamples(
+        metadata,
+        numpy.array(gpu_frame_times, dtype=numpy.float64),
+        {name: numpy.array(times, dtype=numpy.float64) for name, times in gpu_pass_times.items()},
+        numpy.array(cpu_frame_times, dtype=numpy.float64))
+
 class BenchmarkDataAggregator(object):
     def __init__(self, workspace, logger, test_suite):
         '''
@@ -71,23 +213,33 @@ class BenchmarkDataAggregator(object):
         '''
         self.build_dir = workspace.paths.build_directory()
         self.results_dir = Path(workspace.paths.project(), 'user/Scripts/PerformanceBenchmarks')
+        self.history_path = os.environ.get(BENCHMARK_HISTORY_ENV_VAR) or \
+            Path(workspace.paths.project(), 'user/Scripts/benchmark_history.db')
         self.test_suite = test_suite if os.environ.get('BUILD_NUMBER') else 'local'
-        self.filebeat_client = FilebeatClient(logger)
+        self.logger = logger
+        self.filebeat_client = None  # only connected when uploading, so the history can be used without filebeat
+        self.runs_without_baseline = []  # runs checked by check_regressions with too few previous runs
 
-    def _update_pass(self, gpu_pass_stats, entry):
+    def _get_git_commit_hash(self):
+        git_commit_data = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=self.build_dir)
+        return git_commit_data.decode('ascii').strip()
+
+    def _aggregate_samples(self, samples, benchmark_metadata):
         '''
-        Modifies gpu_pass_stats dict keyed by pass name with the time recorded in a pass timestamp entry.
+        Aggregates the samples loaded from a single benchmark.
 
-        :param gpu_pass_stats: dict aggregating statistics from each pass (key: pass name, value: dict with stats)
-        :param entry: dict representing the timestamp entry of a pass
-        :return: Time (in nanoseconds) recorded by this pass
+        :param samples: BenchmarkSamples loaded by load_benchmark_samples()
+        :param benchmark_metadata: Dict with benchmark metadata mutated with additional info from metadata file
+        :return: Tuple with three indexes:
+            [0]: ArrayStatistics for GPU frame times
+            [1]: Dict aggregating statistics from GPU pass times (key: pass name, value: ArrayStatistics)
+            [2]: ArrayStatistics for CPU frame times
         '''
-        name = entry['passName']
-        time_ns = entry['timestampResultInNanoseconds']
-        pass_entry = gpu_pass_stats.get(name, RunningStatistics())
-        pass_entry.update(time_ns)
-        gpu_pass_stats[name] = pass_entry
-        return time_ns
+        benchmark_metadata.update(samples.metadata)
+        gpu_frame_stats = ArrayStatistics(samples.gpu_frame_times)
+        gpu_pass_stats = {name: ArrayStatistics(times) for name, times in samples.gpu_pass_times.items()}
+        cpu_frame_stats = ArrayStatistics(samples.cpu_frame_times)
+        return gpu_frame_stats, gpu_pass_stats, cpu_frame_stats
 
     def _process_benchmark(self, benchmark_dir, benchmark_metadata):
         '''
@@ -95,81 +247,50 @@ class BenchmarkDataAggregator(object):
 
         :param benchmark_dir: Path of directory containing the benchmark results
         :param benchmark_metadata: Dict with benchmark metadata mutated with additional info from metadata file
-        :return: Tuple with two indexes:
-            [0]: RunningStatistics for GPU frame times
-            [1]: Dict aggregating statistics from GPU pass times (key: pass name, value: RunningStatistics)
-        '''
-        # Parse benchmark metadata
-        metadata_file = benchmark_dir / 'benchmark_metadata.json'
-        if metadata_file.exists():
-            data = json.loads(metadata_file.read_text())
-            benchmark_metadata.update(data['ClassData'])
-        else:
-            raise BenchmarkPathException(f'Metadata file could not be found at {metadata_file}')
-
-        # data structures aggregating statistics from timestamp logs
-        gpu_frame_stats = RunningStatistics()
-        cpu_frame_stats = RunningStatistics()
-        gpu_pass_stats = {}  # key: pass name, value: RunningStatistics
-
-        # this allows us to add additional data if necessary, e.g. frame_test_timestamps.json
-        is_timestamp_file = lambda file: file.name.startswith('frame') and file.name.endswith('_timestamps.json')
-        is_frame_time_file = lambda file: file.name.startswith('cpu_frame') and file.name.endswith('_time.json')
-
-        # parse benchmark files
-        for file in benchmark_dir.iterdir():
-            if file.is_dir():
-                continue
-
-            if is_timestamp_file(file):
-                data = json.loads(file.read_text())
-                entries = data['ClassData']['timestampEntries']
-
-                frame_time = sum(self._update_pass(gpu_pass_stats, entry) for entry in entries)
-                gpu_frame_stats.update(frame_time)
-
-            if is_frame_time_file(file):
-                data = json.loads(file.read_text())
-                frame_time = data['ClassData']['frameTime']
-                cpu_frame_stats.update(frame_time)
-
-        if gpu_frame_stats.getCount() < 1:
-            raise BenchmarkPathException(f'No GPU frame timestamp logs were found in {benchmark_dir}')
-
-        if cpu_frame_stats.getCount() < 1:
-            raise BenchmarkPathException(f'No CPU frame times were found in {benchmark_dir}')
+        :return: Tuple with three indexes:
+            [0]: ArrayStatistics for GPU frame times
+            [1]: Dict aggregating statistics from GPU pass times (key: pass name, value: ArrayStatistics)
+            [2]: ArrayStatistics for CPU frame times
+        '''
+        return self._aggregate_samples(load_benchmark_samples(benchmark_dir), benchmark_metadata)
 
-        return gpu_frame_stats, gpu_pass_stats, cpu_frame_stats
+    def _load_benchmarks(self, max_workers=None):
+        '''
+        Loads the samples of all the benchmarks in self.results_dir, parsing the benchmarks in parallel processes.
+
+        :param max_workers: Maximum number of processes parsing benchmarks, defaults to the number of cores
+        :return: List of tuples, each with two indexes:
+            [0]: Path of the benchmark directory
+            [1]: BenchmarkSamples of the benchmark
+        '''
+        benchmark_dirs = sorted(path for path in self.results_dir.iterdir() if path.is_dir())
+        if len(benchmark_dirs) <= 1 or max_workers == 1:
+            return [(benchmark_dir, load_benchmark_samples(benchmark_dir)) for benchmark_dir in benchmark_dirs]
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(zip(benchmark_dirs, executor.map(load_benchmark_samples, benchmark_dirs)))
 
     def _generate_payloads(self, benchmark_metadata, gpu_frame_stats, gpu_pass_stats, cpu_frame_stats):
         '''
         Generates payloads to send to Filebeat based on aggregated stats and metadata.
 
         :param benchmark_metadata: Dict of benchmark metadata
-        :param gpu_frame_stats: RunningStatistics for GPU frame data
-        :param gpu_pass_stats: Dict of aggregated pass RunningStatistics
-        :param cpu_frame_stats: RunningStatistics for CPU frame data
+        :param gpu_frame_stats: ArrayStatistics for GPU frame data
+        :param gpu_pass_stats: Dict of aggregated pass ArrayStatistics
+        :param cpu_frame_stats: ArrayStatistics for CPU frame data
         :return payloads: List of tuples, each with two indexes:
             [0]: Elasticsearch index suffix associated with the payload
             [1]: Payload dict to deliver to Filebeat
         '''
-        ns_to_ms = lambda ns: ns / 1e6
+        ns_to_ms = 1 / 1e6
         payloads = []
 
         # calculate statistics based on aggregated frame data
         gpu_frame_payload = {
-            'frameTime': {
-                'avg': ns_to_ms(gpu_frame_stats.getAvg()),
-                'max': ns_to_ms(gpu_frame_stats.getMax()),
-                'min': ns_to_ms(gpu_frame_stats.getMin())
-            }
+            'frameTime': gpu_frame_stats.getSummary(ns_to_ms)
         }
         cpu_frame_payload = {
-            'frameTime': {
-                'avg': cpu_frame_stats.getAvg(),
-                'max': cpu_frame_stats.getMax(),
-                'min': cpu_frame_stats.getMin()
-            }
+            'frameTime': cpu_frame_stats.getSummary()
         }
         # add benchmark metadata to payload
         gpu_frame_payload.update(benchmark_metadata)
@@ -181,10 +302,7 @@ class BenchmarkDataAggregator(object):
         for name, stat in gpu_pass_stats.items():
             gpu_pass_payload = {
                 'passName': name,
-                'passTime': {
-                    'avg': ns_to_ms(stat.getAvg()),
-                    'max': ns_to_ms(stat.getMax())
-                }
+                'passTime': stat.getSummary(ns_to_ms)
             }
             # add benchmark metadata to payload
             gpu_pass_payload.update(benchmark_metadata)
@@ -192,27 +310,27 @@ class BenchmarkDataAggregator(object):
 
         return payloads
 
-    def upload_metrics(self, rhi):
+    def upload_metrics(self, rhi, max_workers=None):
         '''
         Uploads metrics aggregated from all the benchmarks run in a test suite to filebeat.
 
         :param rhi: The RHI the benchmarks were run on
+        :param max_workers: Maximum number of processes parsing benchmarks, defaults to the number of cores
         '''
         start_timestamp = time.time()
 
-        git_commit_data = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=self.build_dir)
-        git_commit_hash = git_commit_data.decode('ascii').strip()
+        git_commit_hash = self._get_git_commit_hash()
         build_date = time.strftime('%m/%d/%y', time.localtime(start_timestamp))  # use gmtime if GMT is preferred
 
-        for benchmark_dir in self.results_dir.iterdir():
-            if not benchmark_dir.is_dir():
-                continue
+        if self.filebeat_client is None:
+            self.filebeat_client = FilebeatClient(self.logger)
 
+        for benchmark_dir, samples in self._load_benchmarks(max_workers):
             benchmark_metadata = {
                 'gitCommitAndBuildDate': f'{git_commit_hash} {build_date}',
                 'RHI': rhi
             }
-            gpu_frame_stats, gpu_pass_stats, cpu_frame_stats = self._process_benchmark(benchmark_dir, benchmark_metadata)
+            gpu_frame_stats, gpu_pass_stats, cpu_frame_stats = self._aggregate_samples(samples, benchmark_metadata)
             payloads = self._generate_payloads(benchmark_metadata, gpu_frame_stats, gpu_pass_stats, cpu_frame_stats)
 
             for index_suffix, payload in payloads:
@@ -221,3 +339,59 @@ class BenchmarkDataAggregator(object):
                     f'ly_atom.performance_metrics.{self.test_suite}.{index_suffix}',
                     start_timestamp
                 )
+
+    def record_history(self, rhi, max_workers=None):
+        '''
+        Stores the samples of all the benchmarks run in a test suite in the local benchmark history, which defaults to
+        user/Scripts/benchmark_history.db in the project and can be set with $LYTT_BENCHMARK_HISTORY. CI workspaces
+        are usually cleaned between builds, so $LYTT_BENCHMARK_HISTORY must point to persistent storage in CI.
+
+        :param rhi: The RHI the benchmarks were run on
+        :param max_workers: Maximum number of processes parsing benchmarks, defaults to the number of cores
+        :return: List of the ids of the runs added to the history
+        '''
+        ns_to_ms = 1 / 1e6
+        history = BenchmarkHistory(self.history_path)
+        git_commit_hash = self._get_git_commit_hash()
+
+        run_ids = []
+        for benchmark_dir, samples in self._load_benchmarks(max_workers):
+            # same metrics and units as the uploaded payloads
+            history_samples = {
+                ('gpu.frame_data', 'frameTime'): samples.gpu_frame_times * ns_to_ms,
+                ('cpu.frame_data', 'frameTime'): samples.cpu_frame_times,
+            }
+            for name, times in samples.gpu_pass_times.items():
+                history_samples[('gpu.pass_data', name)] = times * ns_to_ms
+            run_ids.append(history.add_run(rhi, self.test_suite, samples.metadata, history_samples, git_commit_hash))
+        return run_ids
+
+    def check_regressions(self, rhi, baseline_runs=DEFAULT_BASELINE_RUNS, significance=DEFAULT_SIGNIFICANCE,
+                          min_regression=DEFAULT_MIN_REGRESSION, max_workers=None,
+                          min_baseline_runs=DEFAULT_MIN_BASELINE_RUNS):
+        '''
+        Records the benchmarks run in a test suite in the local benchmark history and compares them against the previous
+        runs, see BenchmarkHistory.compare_run(). The runs with fewer than min_baseline_runs previous runs are logged
+        and listed in runs_without_baseline, as not finding a regression in them doesn't mean there is none.
+
+        :param rhi: The RHI the benchmarks were run on
+        :param baseline_runs: Number of previous runs in the baseline
+        :param significance: p-value below which a slowdown is significant
+        :param min_regression: Relative increase of the median below which a slowdown is ignored
+        :param max_workers: Maximum number of processes parsing benchmarks, defaults to the number of cores
+        :param min_baseline_runs: Number of previous runs needed for a run to be fully checked
+        :return: List of BenchmarkRegression for the frame and pass times which are significantly slower
+        '''
+        history = BenchmarkHistory(self.history_path)
+        regressions = []
+        self.runs_without_baseline = []
+        for run_id in self.record_history(rhi, max_workers):
+            previous_run_count = len(history.get_previous_run_ids(run_id))
+            if previous_run_count < min(min_baseline_runs, baseline_runs):
+                self.logger.warning(
+                    f'Benchmark run {run_id} only has {previous_run_count} previous runs in the benchmark history '
+                    f'{self.history_path}, {min_baseline_runs} are needed to check it for regressions. Set '
+                    f'${BENCHMARK_HISTORY_ENV_VAR} to a path in persistent storage to keep the history between builds.')
+                self.runs_without_baseline.append(run_id)
+            regressions.extend(history.compare_run(run_id, baseline_runs, significance, min_regression))
+        return regressions
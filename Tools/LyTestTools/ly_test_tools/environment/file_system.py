@@ -6,6 +6,7 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 
 File system related functions.
 """
+import contextlib
 import errno
 import glob
 import logging
@@ -18,6 +19,11 @@ import tarfile
 import time
 import zipfile
 
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
 import ly_test_tools.environment.process_utils as process_utils
 
 logger = logging.getLogger(__name__)
@@ -26,6 +32,9 @@ ONE_KIB = 1024
 ONE_MIB = 1024 * ONE_KIB
 ONE_GIB = 1024 * ONE_MIB
 
+DEFAULT_FILE_LOCK_TIMEOUT = 60  # seconds to wait for other processes to release a file lock
+_FILE_LOCK_RETRY_INTERVAL = 0.1  # seconds between attempts to take a file lock held by another process
+
 
 def check_free_space(dest, required_space, msg):
     """ Make sure the required space is available on destination, raising an IOError if there is not. """
@@ -245,6 +254,48 @@ def lock_file(file_name):
         return False
 
 
+@contextlib.contextmanager
+def exclusive_file_lock(locked_file, timeout=DEFAULT_FILE_LOCK_TIMEOUT):
+    """
+    Holds an exclusive advisory lock on an open file, so that other processes locking the same file wait for it.
+    Only lock contention is retried, any other locking error is raised immediately.
+
+    :param locked_file: File object opened in binary mode with write access
+    :param timeout: Seconds to wait for other processes to release the lock
+    :raises TimeoutError: If another process still holds the lock after the timeout
+    """
+    if os.name == 'nt':
+        busy_errors = (errno.EDEADLOCK, errno.EACCES)
+    else:
+        busy_errors = (errno.EAGAIN, errno.EWOULDBLOCK)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if os.name == 'nt':
+                # msvcrt locks the bytes from the current position, so always lock the first byte
+                locked_file.seek(0)
+                msvcrt.locking(locked_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(locked_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            break
+        except OSError as e:
+            if e.errno not in busy_errors:
+                raise
+            if time.monotonic() >= deadline:
+                raise TimeoutError(errno.ETIMEDOUT, f'Timed out after {timeout} seconds waiting for another process '
+                                                    f'to release the lock on {locked_file.name}') from e
+        time.sleep(_FILE_LOCK_RETRY_INTERVAL)
+
+    try:
+        yield locked_file
+    finally:
+        if os.name == 'nt':
+            locked_file.seek(0)
+            msvcrt.locking(locked_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(locked_file.fileno(), fcntl.LOCK_UN)
+
+
 def remove_symlink(path):
     try:
         # Rmdir can delete a symlink without following the symlink to the original content
@@ -16,6 +16,7 @@ import time
 
 import ly_test_tools
 import ly_test_tools.environment.process_utils as process_utils
+import ly_test_tools.log.log_tailer as log_tailer
 
 logger = logging.getLogger(__name__)
 
@@ -210,8 +211,11 @@ class CrashLogWatchdog(Watchdog):
         :param error_message: The error message to log when bool_fn returns True. Defaults to printing the watchdog name
         """
         self._log_path = log_path
+        self._crash_log_lines = []
 
         def crash_exists():
+            # The crash log is read while it is written, so it is printed by stop() without reading it again
+            self._crash_log_subscription.poll()
             return os.path.exists(log_path)
 
         if not error_message:
@@ -222,6 +226,8 @@ class CrashLogWatchdog(Watchdog):
             logger.info(f"Removing existing {log_path} when initializing crash log watchdog.")
             os.remove(log_path)
 
+        self._crash_log_subscription = log_tailer.subscribe(log_path, self._crash_log_lines.append)
+
         super(CrashLogWatchdog, self).__init__(bool_fn=crash_exists, interval=interval,
                                                raise_on_condition=raise_on_condition,
                                                name=name, error_message=error_message)
@@ -236,9 +242,11 @@ class CrashLogWatchdog(Watchdog):
         header = "================= Crash Log Print =================\n"
         if self.caught_failure:
             print(header)
-            with open(self._log_path, "r") as crash_log:
-                for line in crash_log:
-                    print(line.strip('\n'))
+            # Read the end of the crash log written since the last check
+            self._crash_log_subscription.poll(final=True)
+            for line in self._crash_log_lines:
+                print(line)
             print("=" * len(header) + "\n")
+        self._crash_log_subscription.close()
 
         super(CrashLogWatchdog, self).stop()
\ No newline at end of file
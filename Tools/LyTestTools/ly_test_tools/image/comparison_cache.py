@@ -0,0 +1,134 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Cache of the results of screenshot comparisons against golden images, kept in a local SQLite file. A result is keyed by
+the content hash of both images and the parameters of the comparison, so comparing images which didn't change since a
+previous run only costs hashing them.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import time
+
+logger = logging.getLogger(__name__)
+
+# Environment variable with the path of the cache file used when the comparison is not given a cache
+COMPARISON_CACHE_ENV_VAR = 'LYTT_IMAGE_COMPARISON_CACHE'
+DEFAULT_MAX_ENTRIES = 10000  # comparisons kept in the cache, the least recently used ones are removed first
+SQLITE_TIMEOUT = 30  # seconds to wait for another process writing to the cache
+
+
+class ComparisonCache(object):
+
+    def __init__(self, cache_path, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Cache of screenshot comparison results. The SQLite file is only opened while reading or writing a result, so
+        the cache can be shared by parallel processes. The diff images are copied to a folder next to the SQLite file,
+        since the diff image of a later comparison may be written to the same path.
+
+        :param cache_path: Path of the SQLite file, it is created if it doesn't exist.
+        :param max_entries: Maximum number of results kept, the least recently used results are removed first.
+        """
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.diff_dir = f"{os.path.splitext(cache_path)[0]}_diffs"
+
+    def _connect(self):
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+        os.makedirs(cache_dir, exist_ok=True)
+        connection = sqlite3.connect(self.cache_path, timeout=SQLITE_TIMEOUT)
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS comparisons ('
+            'screenshot_hash TEXT NOT NULL, golden_hash TEXT NOT NULL, parameters TEXT NOT NULL, '
+            'similarity REAL NOT NULL, diff_path TEXT, last_used REAL NOT NULL, '
+            'PRIMARY KEY (screenshot_hash, golden_hash, parameters))')
+        connection.execute('CREATE INDEX IF NOT EXISTS comparisons_last_used ON comparisons (last_used)')
+        return connection
+
+    def get(self, screenshot_hash, golden_hash, parameters):
+        """
+        Returns the cached result of a comparison and marks it as recently used.
+
+        :param screenshot_hash: Content hash of the screenshot.
+        :param golden_hash: Content hash of the golden image.
+        :param parameters: String identifying the algorithm and its parameters.
+        :return: Tuple of (similarity, path of the copy of the diff image or None) or None if the comparison is not
+            cached.
+        """
+        key = (screenshot_hash, golden_hash, parameters)
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    row = connection.execute(
+                        'SELECT similarity, diff_path FROM comparisons '
+                        'WHERE screenshot_hash = ? AND golden_hash = ? AND parameters = ?', key).fetchone()
+                    if row is not None:
+                        connection.execute(
+                            'UPDATE comparisons SET last_used = ? '
+                            'WHERE screenshot_hash = ? AND golden_hash = ? AND parameters = ?', (time.time(),) + key)
+            finally:
+                connection.close()
+        except sqlite3.Error as ex:
+            # The comparison can always be done without the cache
+            logger.warning(f"Failed to read the image comparison cache {self.cache_path}: {ex}")
+            return None
+        return row
+
+    def put(self, screenshot_hash, golden_hash, parameters, similarity, diff_path):
+        """
+        Stores the result of a comparison, and removes the least recently used results above max_entries.
+
+        :param screenshot_hash: Content hash of the screenshot.
+        :param golden_hash: Content hash of the golden image.
+        :param parameters: String identifying the algorithm and its parameters.
+        :param similarity: Result of the comparison.
+        :param diff_path: Path of the diff image written by the comparison, or None.
+        """
+        cached_diff_path = None
+        if diff_path is not None and os.path.isfile(diff_path):
+            key_hash = hashlib.sha256('\n'.join((screenshot_hash, golden_hash, parameters)).encode()).hexdigest()
+            cached_diff_path = os.path.join(self.diff_dir, key_hash + os.path.splitext(diff_path)[1])
+            try:
+                os.makedirs(self.diff_dir, exist_ok=True)
+                shutil.copyfile(diff_path, cached_diff_path)
+            except OSError as ex:
+                logger.warning(f"Failed to copy the diff image {diff_path} to the image comparison cache: {ex}")
+                cached_diff_path = None
+
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(
+                        'INSERT OR REPLACE INTO comparisons VALUES (?, ?, ?, ?, ?, ?)',
+                        (screenshot_hash, golden_hash, parameters, similarity, cached_diff_path, time.time()))
+                    evicted_rows = connection.execute(
+                        'SELECT rowid, diff_path FROM comparisons ORDER BY last_used DESC LIMIT -1 OFFSET ?',
+                        (self.max_entries,)).fetchall()
+                    connection.executemany('DELETE FROM comparisons WHERE rowid = ?',
+                                           [(rowid,) for rowid, _ in evicted_rows])
+            finally:
+                connection.close()
+        except sqlite3.Error as ex:
+            logger.warning(f"Failed to write the image comparison cache {self.cache_path}: {ex}")
+            return
+
+        for _, evicted_diff_path in evicted_rows:
+            if evicted_diff_path and os.path.isfile(evicted_diff_path):
+                os.remove(evicted_diff_path)
+
+
+def get_default_cache():
+    """
+    Returns the cache set with the LYTT_IMAGE_COMPARISON_CACHE environment variable.
+
+    :return: The ComparisonCache, or None if the environment variable is not set.
+    """
+    cache_path = os.environ.get(COMPARISON_CACHE_ENV_VAR)
+    return ComparisonCache(cache_path) if cache_path else None
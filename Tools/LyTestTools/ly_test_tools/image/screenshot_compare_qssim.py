@@ -8,12 +8,37 @@ Python implementation of Quaternion Structural Similarity by Amir Kolaman and Or
 IEEE Transaction on Image Processing Vol 21 No 4 April 2012.
 """
 
-import imageio
-import numpy
+import concurrent.futures
+import functools
+import hashlib
+import json
+import logging
 import os
+import shutil
 
+import imageio
+import numpy
 from scipy import ndimage
 
+import ly_test_tools.image.comparison_cache as comparison_cache
+
+logger = logging.getLogger(__name__)
+
+# Algorithm tuning parameters. Can me modified as needed.
+SIGMA = 1.5
+# Radius of the gaussian blur, from the default truncate of 4.0 standard deviations of scipy
+BLUR_RADIUS = int(4.0 * SIGMA + 0.5)
+
+# These parameters are just to prevent divide by zero issues.
+L = 1
+K1 = 0.01
+K2 = 0.03
+C1 = (K1 * L) ** 2
+C2 = (K2 * L) ** 2
+
+QSSIM_TILE_ROWS = 256  # rows of the images compared at once
+HASH_CHUNK_SIZE = 1024 * 1024  # bytes
+
 
 def _quaternion_matrix_conj(q):
     q_out = numpy.zeros(q.shape)
@@ -60,7 +85,85 @@ def _quaternion_matrix_div(q1, q2):
     return numpy.divide(q, numpy.dstack([q2_norm] * 4))
 
 
-def qssim(screenshot, goldenimage, channel_max=255, diff_path='.'):
+def _get_file_hash(file_path):
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as image_file:
+        for chunk in iter(lambda: image_file.read(HASH_CHUNK_SIZE), b''):
+            file_hash.update(chunk)
+    return file_hash.digest()
+
+
+def _files_are_identical(screenshot, goldenimage):
+    """
+    Returns True if both files exist and have the same content, which is much cheaper to check than comparing the images
+    """
+    if not os.path.isfile(screenshot) or not os.path.isfile(goldenimage):
+        return False
+    if os.path.getsize(screenshot) != os.path.getsize(goldenimage):
+        return False
+    return _get_file_hash(screenshot) == _get_file_hash(goldenimage)
+
+
+def _get_cache_parameters(channel_max):
+    """Returns the string identifying the algorithm and its parameters in the comparison cache."""
+    return json.dumps({'algorithm': 'qssim', 'channel_max': channel_max, 'sigma': SIGMA, 'K1': K1, 'K2': K2, 'L': L},
+                      sort_keys=True)
+
+
+def _gaussian_blur(image):
+    """Blurs each channel of a (rows, columns, channels) image."""
+    image = ndimage.gaussian_filter1d(image, SIGMA, axis=0)
+    return ndimage.gaussian_filter1d(image, SIGMA, axis=1)
+
+
+def _qssim_tile(img1, img2, start, end):
+    """
+    Returns the quaternion similarity map of the rows [start, end) of two rgb images.
+
+    The pixels are pure quaternions (no real part) so every quaternion product p * conj(q) of the algorithm is the
+    dot product p.q as real part and the cross product -(p x q) as imaginary part. The products are computed directly
+    and the ones which are blurred are stacked, so that they are blurred together.
+    Blurring reads the pixels up to BLUR_RADIUS away, and the second blur is applied on values computed from the first
+    one, so the rows up to 2 * BLUR_RADIUS around the tile are used to get the same result as for the whole image.
+    """
+    rows = img1.shape[0]
+    tile_start = max(0, start - 2 * BLUR_RADIUS)
+    tile_end = min(rows, end + 2 * BLUR_RADIUS)
+    hue1 = img1[tile_start:tile_end]
+    hue2 = img2[tile_start:tile_end]
+
+    mu1 = _gaussian_blur(hue1)
+    mu2 = _gaussian_blur(hue2)
+    hue1 = hue1 - mu1
+    hue2 = hue2 - mu2
+
+    # sigma1, sigma2, real and imaginary parts of sigma12
+    sigmas = numpy.empty(hue1.shape[:2] + (6,), dtype=numpy.float32)
+    sigmas[:, :, 0] = numpy.einsum('ijk,ijk->ij', hue1, hue1)
+    sigmas[:, :, 1] = numpy.einsum('ijk,ijk->ij', hue2, hue2)
+    sigmas[:, :, 2] = numpy.einsum('ijk,ijk->ij', hue1, hue2)
+    sigmas[:, :, 3:6] = numpy.cross(hue1, hue2)
+    sigmas = _gaussian_blur(sigmas)
+
+    # Only keep the rows of the tile
+    mu1 = mu1[start - tile_start:end - tile_start]
+    mu2 = mu2[start - tile_start:end - tile_start]
+    sigmas = sigmas[start - tile_start:end - tile_start]
+
+    mu12_real = numpy.einsum('ijk,ijk->ij', mu1, mu2)
+    mu12_imaginary = numpy.cross(mu1, mu2)
+    numerator1 = numpy.sqrt((2 * mu12_real + C1) ** 2 + 4 * numpy.einsum('ijk,ijk->ij', mu12_imaginary, mu12_imaginary))
+    denominator1 = numpy.einsum('ijk,ijk->ij', mu1, mu1) + numpy.einsum('ijk,ijk->ij', mu2, mu2) + C1
+
+    sigma12_imaginary = sigmas[:, :, 3:6]
+    numerator2 = numpy.sqrt(
+        (2 * sigmas[:, :, 2] + C2) ** 2 + 4 * numpy.einsum('ijk,ijk->ij', sigma12_imaginary, sigma12_imaginary))
+    denominator2 = sigmas[:, :, 0] + sigmas[:, :, 1] + C2
+
+    return (numerator1 / denominator1) * (numerator2 / denominator2)
+
+
+def qssim(screenshot, goldenimage, channel_max=255, diff_path='.', cache=None):
     """
     Returns the mean quaternion similarity index between two images.
     For images that are the same the expected result is 1.000.
@@ -69,86 +172,115 @@ def qssim(screenshot, goldenimage, channel_max=255, diff_path='.'):
     There are a series of tuning parameters that are taken from the 2004 paper by Wang et al
     Image Quality Assesment: From Error Visibility to Structural Similarity.
 
+    Identical files return 1.0 without loading the images, and without writing a diff image. Otherwise the images are
+    compared in tiles of QSSIM_TILE_ROWS rows using float32, so the memory used stays bounded for large captures.
+    When a cache is used, a comparison of the same images with the same parameters returns the cached result and copies
+    the cached diff image.
+
     :param screenshot: Screenshot filename to test
     :param goldenimage: Golden image to test against.
     :param channel_max: Maximum channel value.
     :param diff_path: Target path where diff image should be stored.
+    :param cache: ComparisonCache of the previous results, defaults to the cache set with the
+        LYTT_IMAGE_COMPARISON_CACHE environment variable.
     :return: Mean quaternion similarity from 0.00->1.00 (identical).
     """
+    extension = os.path.splitext(screenshot)[1]
+    screenshot_name = os.path.basename(screenshot)
+    diff_name = '.'.join(screenshot_name.split('.')[:-1]) + "_diff" + extension
+    diff_full_path = os.path.join(diff_path, diff_name)
 
-    # load image and copy it into a 4 channel array to treat rgb like quaternions
+    if cache is None:
+        cache = comparison_cache.get_default_cache()
+    cache_key = None
+    if cache is None:
+        if _files_are_identical(screenshot, goldenimage):
+            return 1.0
+    elif os.path.isfile(screenshot) and os.path.isfile(goldenimage):
+        cache_key = (_get_file_hash(screenshot).hex(), _get_file_hash(goldenimage).hex(),
+                     _get_cache_parameters(channel_max))
+        if cache_key[0] == cache_key[1]:
+            return 1.0
+        cached_result = cache.get(*cache_key)
+        if cached_result is not None:
+            similarity, cached_diff_path = cached_result
+            if cached_diff_path and os.path.isfile(cached_diff_path):
+                shutil.copyfile(cached_diff_path, diff_full_path)
+            return similarity
+
+    # load image and treat the rgb channels as the imaginary parts of quaternions, any alpha channel is ignored
     img1 = imageio.imread(screenshot)
     img2 = imageio.imread(goldenimage)
     # Avoid later precision issues
-    img1 = img1.astype(numpy.float64) / channel_max
-    img2 = img2.astype(numpy.float64) / channel_max
-
-    im1_size = img1.shape
-    im2_size = img2.shape
-    # check im1 and im2 are same size
-
-    hue1 = numpy.zeros((im1_size[0], im1_size[1], im1_size[2] + 1))
-    hue2 = numpy.zeros((im1_size[0], im1_size[1], im1_size[2] + 1))
-    mu1 = numpy.zeros((im1_size[0], im1_size[1], im1_size[2] + 1))
-    mu2 = numpy.zeros((im1_size[0], im1_size[1], im1_size[2] + 1))
-    offset1 = numpy.zeros((im1_size[0], im1_size[1], im1_size[2] + 1))
-    offset2 = numpy.zeros((im1_size[0], im1_size[1], im1_size[2] + 1))
-
-    hue1[:, :, 1:4] = img1
-    hue2[:, :, 1:4] = img2
-    mu1[:, :, 1:4] = img1
-    mu2[:, :, 1:4] = img2
-
-    # Algorithm tuning parameters. Can me modified as needed.
-    sigma = 1.5
-
-    # These parameters are just to prevent divide by zero issues.
-    L = 1
-    K1 = 0.01
-    K2 = 0.03
-
-    C1 = (K1 * L) ** 2
-    C2 = (K2 * L) ** 2
-    offset1[:, :, 0] = C1
-    offset2[:, :, 0] = C2
-
-    # blur each color channel of both images
-    mu1 = ndimage.filters.gaussian_filter1d(mu1, sigma, 0)
-    mu1 = ndimage.filters.gaussian_filter1d(mu1, sigma, 1)
-    mu2 = ndimage.filters.gaussian_filter1d(mu2, sigma, 0)
-    mu2 = ndimage.filters.gaussian_filter1d(mu2, sigma, 1)
-
-    mu1_sq = _quaternion_matrix_mult(mu1, _quaternion_matrix_conj(mu1))
-    mu2_sq = _quaternion_matrix_mult(mu2, _quaternion_matrix_conj(mu2))
-    mu12 = _quaternion_matrix_mult(mu1, _quaternion_matrix_conj(mu2))
-    hue1_sq = _quaternion_matrix_mult(hue1 - mu1, _quaternion_matrix_conj(hue1 - mu1))
-    hue2_sq = _quaternion_matrix_mult(hue2 - mu2, _quaternion_matrix_conj(hue2 - mu2))
-    hue12 = _quaternion_matrix_mult(hue1 - mu1, _quaternion_matrix_conj(hue2 - mu2))
-
-    sigma1 = ndimage.filters.gaussian_filter1d(hue1_sq, sigma, 0)
-    sigma1 = ndimage.filters.gaussian_filter1d(sigma1, sigma, 1)
-    sigma2 = ndimage.filters.gaussian_filter1d(hue2_sq, sigma, 0)
-    sigma2 = ndimage.filters.gaussian_filter1d(sigma2, sigma, 1)
-    sigma12 = ndimage.filters.gaussian_filter1d(hue12, sigma, 0)
-    sigma12 = ndimage.filters.gaussian_filter1d(sigma12, sigma, 1)
-    numerator1 = 2 * mu12 + offset1
-    numerator2 = 2 * sigma12 + offset2
-
-    denominator1 = mu1_sq + mu2_sq + offset1
-    denominator2 = sigma1 + sigma2 + offset2
-
-    part1 = _quaternion_matrix_norm(numerator1) / denominator1[:, :, 0]
-    part2 = _quaternion_matrix_norm(numerator2) / denominator2[:, :, 0]
-
-    qssim_map = numpy.multiply(part1, part2)
+    img1 = img1[:, :, :3].astype(numpy.float32) / channel_max
+    img2 = img2[:, :, :3].astype(numpy.float32) / channel_max
+    if img1.shape != img2.shape:
+        raise ValueError(f"Images {screenshot} and {goldenimage} have different sizes: {img1.shape} and {img2.shape}")
+
+    rows, columns = img1.shape[:2]
+    diff_image = numpy.empty((rows, columns), dtype=numpy.uint8)
+    similarity_sum = 0.0
+    for start in range(0, rows, QSSIM_TILE_ROWS):
+        end = min(rows, start + QSSIM_TILE_ROWS)
+        qssim_map = _qssim_tile(img1, img2, start, end)
+        diff_image[start:end] = (qssim_map * channel_max).astype(numpy.uint8)
+        similarity_sum += numpy.abs(qssim_map).sum(dtype=numpy.float64)
+
+    imageio.imwrite(diff_full_path, diff_image)
+    similarity = similarity_sum / (rows * columns)
+    if cache_key is not None:
+        cache.put(*cache_key, similarity, diff_full_path)
+    return similarity
+
+
+def compare_screenshots(screenshot_pairs, channel_max=255, diff_path='.', max_workers=None, cache=None):
+    """
+    Returns the mean quaternion similarity index of many pairs of images, the pairs are compared in parallel processes.
 
-    extension = os.path.splitext(screenshot)[1]
-    screenshot_name = os.path.basename(screenshot)
-    diff_name = '.'.join(screenshot_name.split('.')[:-1]) + "_diff" + extension
-    diff_full_path = os.path.join(diff_path, diff_name)
+    :param screenshot_pairs: List of (screenshot filename, golden image filename) tuples to compare.
+    :param channel_max: Maximum channel value.
+    :param diff_path: Target path where the diff images should be stored.
+    :param max_workers: Maximum number of processes comparing images, defaults to the number of cores.
+    :param cache: ComparisonCache of the previous results, see qssim.
+    :return: List of the mean quaternion similarity of each pair, in the same order as the pairs.
+    """
+    screenshots = [screenshot for screenshot, _ in screenshot_pairs]
+    goldenimages = [goldenimage for _, goldenimage in screenshot_pairs]
+    compare = functools.partial(qssim, channel_max=channel_max, diff_path=diff_path, cache=cache)
+    if len(screenshot_pairs) <= 1 or max_workers == 1:
+        return list(map(compare, screenshots, goldenimages))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(compare, screenshots, goldenimages))
 
-    imageio.imwrite(diff_full_path, (qssim_map * channel_max).astype(numpy.uint8))
-    return ndimage.mean(numpy.abs(qssim_map))
+
+def compare_screenshot_directory(screenshot_dir, golden_dir, channel_max=255, diff_path='.', max_workers=None,
+                                 cache=None):
+    """
+    Compares every screenshot of a directory against the golden image with the same filename, see compare_screenshots.
+
+    :param screenshot_dir: Directory of the screenshots to test.
+    :param golden_dir: Directory of the golden images to test against.
+    :param channel_max: Maximum channel value.
+    :param diff_path: Target path where the diff images should be stored.
+    :param max_workers: Maximum number of processes comparing images, defaults to the number of cores.
+    :param cache: ComparisonCache of the previous results, see qssim.
+    :return: Dictionary of screenshot filename to the mean quaternion similarity, screenshots without golden image
+        are skipped.
+    """
+    screenshot_names = []
+    for screenshot_name in sorted(os.listdir(screenshot_dir)):
+        if not os.path.isfile(os.path.join(screenshot_dir, screenshot_name)):
+            continue
+        if os.path.isfile(os.path.join(golden_dir, screenshot_name)):
+            screenshot_names.append(screenshot_name)
+        else:
+            logger.warning(f"No golden image found for screenshot {screenshot_name} in {golden_dir}")
+
+    screenshot_pairs = [(os.path.join(screenshot_dir, screenshot_name), os.path.join(golden_dir, screenshot_name))
+                        for screenshot_name in screenshot_names]
+    similarities = compare_screenshots(screenshot_pairs, channel_max, diff_path, max_workers, cache)
+    return dict(zip(screenshot_names, similarities))
 
 
 if __name__ == "__main__":
@@ -6,16 +6,20 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 
 Functions to aid in monitoring log files being actively written to for a set of lines to read for.
 """
+import collections
+import functools
 import logging
 import os
 import re
+import time
 
-import ly_test_tools.environment.waiter as waiter
 import ly_test_tools.launchers.platforms.base
 
 logger = logging.getLogger(__name__)
 
 LOG_MONITOR_INTERVAL = 0.1  # seconds
+LOG_MONITOR_MIN_INTERVAL = 0.005  # seconds, first wait for the log file to change before backing off
+LOG_MONITOR_MAX_LINES = 10000  # most recent log lines kept for the python log output
 
 
 class LogMonitorException(Exception):
@@ -38,14 +42,32 @@ def check_exact_match(line, expected_line):
     :return: An exact match for the string if one is found, None otherwise.
     """
 
-    # Look for either start of line or whitespace, then the expected_line, then either end of the line or whitespace.
-    # This way we don't partial match inside of a string.  So for example, 'foo' matches 'foo bar' but not 'foobar'
-    regex_pattern = re.compile("(^|\\s){}($|\\s)".format(re.escape(expected_line)), re.UNICODE)
-    if regex_pattern.search(line) is not None:
+    if _compile_exact_match(expected_line).search(line) is not None:
         return expected_line
 
     return None
 
+
+@functools.lru_cache(maxsize=1024)
+def _compile_exact_match(expected_line):
+    # Look for either start of line or whitespace, then the expected_line, then either end of the line or whitespace.
+    # This way we don't partial match inside of a string.  So for example, 'foo' matches 'foo bar' but not 'foobar'
+    return re.compile("(^|\\s){}($|\\s)".format(re.escape(expected_line)), re.UNICODE)
+
+
+def _compile_search_pattern(lines):
+    """
+    Compiles a single regular expression which finds any of the lines as a substring, it is used to skip the log lines
+    which can't be an exact match for any of them.
+
+    :param lines: tuple of strings to search for.
+    :return: The compiled regular expression, or None if there are no lines to search for.
+    """
+    if not lines:
+        return None
+    return re.compile("|".join(re.escape(line) for line in sorted(set(lines))), re.UNICODE)
+
+
 class LogMonitor(object):
 
     def __init__(self, launcher, log_file_path, log_creation_max_wait_time=5):
@@ -61,8 +83,20 @@ class LogMonitor(object):
         self.expected_lines_not_found = []
         self.launcher = launcher
         self.log_file_path = log_file_path
-        self.py_log = ""
         self.log_creation_max_wait_time = log_creation_max_wait_time
+        self._py_log_lines = collections.deque(maxlen=LOG_MONITOR_MAX_LINES)
+        self._offset = 0  # bytes of the log file read so far
+        self._pending_data = b''  # last line of the log file read so far, which is still being written
+        self._log = None  # the log file being monitored, opened again when the log is replaced
+        self._search_lines = None
+        self._search_pattern = None
+
+    @property
+    def py_log(self):
+        """
+        The most recent lines read from the log file, up to LOG_MONITOR_MAX_LINES lines.
+        """
+        return "".join(self._py_log_lines)
 
     def monitor_log_for_lines(self,
                               expected_lines=None,
@@ -118,22 +152,33 @@ class LogMonitor(object):
             raise LogMonitorException("Found expected_lines in unexpected_lines:\n{}".format("\n".join(unexpected_lines_in_expected)))
 
         # Log file is now opened by our process, start monitoring log lines:
-        self.py_log = ""
+        self._py_log_lines.clear()
+        self._offset = 0
+        self._pending_data = b''
         try:
             logger.debug("Monitoring log file in '{}' ".format(self.log_file_path))
-            with open(self.log_file_path, mode='r', encoding='utf-8') as log:
+            # The log is read as bytes, so that a line which is still being written is only decoded once it is complete
+            self._log = open(self.log_file_path, mode='rb')
+            try:
                 logger.info(
                     "Monitoring log file '{}' for '{}' seconds".format(self.log_file_path, timeout))
-                    
+
                 search_expected_lines = expected_lines.copy()
                 search_unexpected_lines = unexpected_lines.copy()
-                waiter.wait_for(  # Sets the values for self.unexpected_lines_found & self.expected_lines_not_found
-                    lambda: self._find_lines(log, search_expected_lines, search_unexpected_lines, halt_on_unexpected),
-                    timeout=timeout,
-                    interval=LOG_MONITOR_INTERVAL)
-        except AssertionError:  # Raised by waiter when timeout is reached.
-            logger.warning(f"Timeout of '{timeout}' seconds was reached, log lines may not have been found")
-            # exception will be raised below by _validate_results with failure analysis
+                self.expected_lines_not_found = search_expected_lines
+                deadline = time.monotonic() + timeout
+                # Sets the values for self.unexpected_lines_found & self.expected_lines_not_found
+                while not self._find_lines(self._log, search_expected_lines, search_unexpected_lines,
+                                           halt_on_unexpected):
+                    if time.monotonic() > deadline:
+                        logger.warning(
+                            f"Timeout of '{timeout}' seconds was reached, log lines may not have been found")
+                        # exception will be raised below by _validate_results with failure analysis
+                        break
+                    self._wait_for_log_change()
+            finally:
+                self._log.close()
+                self._log = None
         finally:
             logger.info("Python log output:\n" + self.py_log)
             logger.info(
@@ -243,13 +288,66 @@ class LogMonitor(object):
     
         return True
 
+    def _get_log_stamp(self):
+        try:
+            log_stat = os.stat(self.log_file_path)
+        except OSError:
+            return None
+        return log_stat.st_mtime_ns, log_stat.st_size
+
+    def _open_replacement_log(self, log):
+        """
+        Opens the log file again if the file at the log file path was replaced since the log was opened. The open
+        file object keeps reading the replaced file on POSIX, as it refers to the old inode.
+
+        :param log: BinaryIO file object of the log file being read.
+        :return: BinaryIO file object of the new log file, or None if the log file was not replaced
+        """
+        try:
+            log_stat = os.stat(self.log_file_path)
+            open_log_stat = os.fstat(log.fileno())
+        except (OSError, ValueError):
+            return None
+        if (log_stat.st_dev, log_stat.st_ino) == (open_log_stat.st_dev, open_log_stat.st_ino):
+            return None
+        try:
+            return open(self.log_file_path, mode='rb')
+        except OSError:
+            return None
+
+    def _wait_for_log_change(self):
+        """
+        Waits until the log file changes, for at most LOG_MONITOR_INTERVAL seconds so that the launcher process is
+        still checked regularly. The file is checked with os.stat(), which is much cheaper than reading it, starting
+        with a short interval which doubles after every check.
+        """
+        stamp = self._get_log_stamp()
+        interval = LOG_MONITOR_MIN_INTERVAL
+        waited = 0
+        while waited < LOG_MONITOR_INTERVAL:
+            time.sleep(interval)
+            waited += interval
+            if self._get_log_stamp() != stamp:
+                return
+            interval = min(interval * 2, LOG_MONITOR_INTERVAL - waited)
+
+    def _get_search_pattern(self, expected_lines, unexpected_lines):
+        # The pattern only changes when a line is found, so it is compiled again only then
+        search_lines = tuple(expected_lines + unexpected_lines)
+        if search_lines != self._search_lines:
+            self._search_lines = search_lines
+            self._search_pattern = _compile_search_pattern(search_lines)
+        return self._search_pattern
+
     def _find_lines(self, log, expected_lines, unexpected_lines, halt_on_unexpected):
         """
-        Given a list of strings in expected_lines, unexpected_lines, and a log file, read every line in the log file,
-        and make sure all expected_lines strings appear & no unexpected_lines strings appear in the log file.
-        NOTE: This loop will only end when a launcher process ends or if used as a callback function (i.e. waiter).
+        Given a list of strings in expected_lines, unexpected_lines, and a log file, read the lines added to the log
+        file since the last call, and make sure all expected_lines strings appear & no unexpected_lines strings appear
+        in the log file. Only the lines containing one of the strings are checked for an exact match.
+        A truncated log file is read again from the start, a replaced log file is opened again.
+        NOTE: This is called in a loop by monitor_log_for_lines(), which only ends when the launcher process ends.
 
-        :param log: TextIO or BinaryIO file object to read lines from.
+        :param log: BinaryIO file object to read lines from.
         :param expected_lines: list of strings to search for in each read line from the log file.
         :param unexpected_lines: list of strings that must not be present in the log_file_path file.
         :param halt_on_unexpected: boolean to determine whether to raise LogMonitorException on the first
@@ -259,27 +357,53 @@ class LogMonitor(object):
         """
         log_filename = os.path.basename(self.log_file_path)
 
-        def process_line(line):
-            self.py_log += ("|%s| %s\n" % (log_filename, line))
-            expected_lines_not_found = self._find_expected_lines(line, expected_lines)
-            unexpected_lines_found = self._find_unexpected_lines(line, unexpected_lines, halt_on_unexpected)
-            self.unexpected_lines_found = unexpected_lines_found
-            self.expected_lines_not_found = expected_lines_not_found
-
-        exception_info = None
-
         # To avoid race conditions, we will check *before reading*
         # If in the mean time the file is closed, we will make sure we read everything by issuing an extra call
         # by returning the previous alive state
-        process_runing = self.launcher.is_alive() 
-        for line in log:
-            line = line[:-1]  # remove /n
-            try:
-                process_line(line)
-            except LogMonitorException as e:
-                if exception_info is None:
-                    exception_info = e.args
+        process_runing = self.launcher.is_alive()
+        replacement_log = self._open_replacement_log(log)
+        log_stamp = self._get_log_stamp()
+        if replacement_log is None and log_stamp is not None and log_stamp[1] < self._offset:
+            # The log file was truncated, read it from the start
+            log.seek(0)
+            self._offset = 0
+            self._pending_data = b''
+        data = log.read()
+        self._offset += len(data)
+        if replacement_log is not None:
+            # The log file was replaced by a new log. The rest of the replaced log was read above and its last line
+            # is complete, the new log is read from the start
+            if (self._pending_data + data) and not data.endswith(b'\n'):
+                data += b'\n'
+            log.close()
+            self._log = log = replacement_log
+            new_data = log.read()
+            self._offset = len(new_data)
+            data += new_data
+        data_lines = (self._pending_data + data).split(b'\n')
+        # The last line is still being written unless the process has ended, keep it for the next read
+        self._pending_data = data_lines.pop()
+        if not process_runing and self._pending_data:
+            data_lines.append(self._pending_data)
+            self._pending_data = b''
+        lines = [line.rstrip(b'\r').decode('utf-8', errors='replace') for line in data_lines]
+        self._py_log_lines.extend("|%s| %s\n" % (log_filename, line) for line in lines)
 
+        exception_info = None
+        search_pattern = self._get_search_pattern(expected_lines, unexpected_lines)
+        if search_pattern is not None and search_pattern.search("\n".join(lines)):
+            for line in lines:
+                # Skip the lines without any of the strings, the pattern may include strings which were already found
+                if not search_pattern.search(line):
+                    continue
+                try:
+                    self._find_expected_lines(line, expected_lines)
+                    self._find_unexpected_lines(line, unexpected_lines, halt_on_unexpected)
+                except LogMonitorException as e:
+                    if exception_info is None:
+                        exception_info = e.args
+
+        self.expected_lines_not_found = expected_lines
         if exception_info is not None:
             raise LogMonitorException(*exception_info)
 
@@ -0,0 +1,248 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Shared tailing of log files being actively written to. There is one LogTailer per log path, which reads the bytes added
+to the log once and passes every new line to the subscribers of the log, so that any number of watchers of the same
+log cost a single read.
+
+The tailer is used by the readers which follow a log while it is being written: the AP GUI log read for the ports of
+the Asset Processor, the crash log of CrashLogWatchdog and the logs of the warm editors. LogMonitor keeps its own
+incremental reader, as it matches every line of the log from its start, and retrieve_editor_log_content() reads a
+finished log once.
+"""
+import collections
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+LOG_TAILER_MAX_LINES = 10000  # most recent log lines kept to replay to new subscribers, older lines are read again
+
+
+class LogSubscription(object):
+    """
+    A subscriber of a LogTailer, which is called back for the lines of the log matching its predicate
+    """
+
+    def __init__(self, tailer, callback, predicate=None):
+        """
+        :param tailer: The LogTailer of the log
+        :param callback: Function called with every new line of the log matching the predicate, without the line ending
+        :param predicate: Function called with every new line of the log, returning True if the callback should be
+            called for the line. All the lines are passed to the callback if None
+        """
+        self.tailer = tailer
+        self.callback = callback
+        self.predicate = predicate
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def poll(self, final=False):
+        """
+        Reads the lines added to the log since the last poll by any subscriber, see LogTailer.poll()
+        """
+        return self.tailer.poll(final)
+
+    def close(self):
+        """
+        Stops calling back the subscriber
+        """
+        self.tailer.unsubscribe(self)
+
+    def _notify(self, line):
+        if self.predicate is None or self.predicate(line):
+            self.callback(line)
+
+
+class LogTailer(object):
+    _tailers = {}  # the LogTailer of each log path, while it has subscribers
+    _tailers_lock = threading.Lock()
+
+    def __init__(self, log_path):
+        """
+        Reads a log file incrementally and passes the new lines to its subscribers. Use LogTailer.get() or subscribe()
+        to share the tailer of a log path instead of creating one.
+
+        :param log_path: The path of the log file, which doesn't need to exist yet
+        """
+        self.log_path = log_path
+        self._subscriptions = []
+        self._lines = collections.deque(maxlen=LOG_TAILER_MAX_LINES)
+        self._lines_dropped = False  # True once lines read so far are no longer kept in self._lines
+        self._offset = 0  # bytes of the log file read so far
+        self._pending_data = b''  # last line of the log file read so far, which is still being written
+        self._file_id = None  # device and inode of the log file read so far, to detect a new log replacing it
+        # Reentrant, so that a callback can close its own subscription
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _get_key(log_path):
+        return os.path.normcase(os.path.abspath(log_path))
+
+    @classmethod
+    def get(cls, log_path):
+        """
+        Returns the tailer of a log path, which is shared by all of its subscribers
+
+        :param log_path: The path of the log file
+        :return: The LogTailer of the log path
+        """
+        key = cls._get_key(log_path)
+        with cls._tailers_lock:
+            tailer = cls._tailers.get(key)
+            if tailer is None:
+                tailer = cls(log_path)
+                cls._tailers[key] = tailer
+            return tailer
+
+    def subscribe(self, callback, predicate=None, replay=False):
+        """
+        Registers a subscriber which is called back for the new lines of the log matching its predicate. The callbacks
+        are called from the thread polling the log, one line at a time.
+
+        :param callback: Function called with every new line of the log matching the predicate, without the line ending
+        :param predicate: Function returning True if the callback should be called for a line, or None for all lines
+        :param replay: If True, the callback is also called for the matching lines which were already read. Once more
+            than LOG_TAILER_MAX_LINES lines were read, they are read again from the log
+        :return: The LogSubscription, which must be closed when the subscriber is done with the log
+        """
+        subscription = LogSubscription(self, callback, predicate)
+        with self._lock:
+            if replay:
+                if self._lines_dropped:
+                    self._replay_from_log(subscription)
+                else:
+                    for line in self._lines:
+                        subscription._notify(line)
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Removes a subscriber, the tailer is no longer shared once it has no subscribers
+
+        :param subscription: The LogSubscription returned by subscribe()
+        """
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            has_subscriptions = bool(self._subscriptions)
+        if not has_subscriptions:
+            with LogTailer._tailers_lock:
+                key = self._get_key(self.log_path)
+                if LogTailer._tailers.get(key) is self and not self._subscriptions:
+                    del LogTailer._tailers[key]
+
+    def _reset(self):
+        self._lines.clear()
+        self._lines_dropped = False
+        self._offset = 0
+        self._pending_data = b''
+        self._file_id = None
+
+    @staticmethod
+    def _get_file_id(log_stat):
+        return log_stat.st_dev, log_stat.st_ino
+
+    @staticmethod
+    def _decode_line(data_line):
+        return data_line.rstrip(b'\r').decode('utf-8', errors='replace')
+
+    def _read_new_data(self):
+        try:
+            log_stat = os.stat(self.log_path)
+        except OSError:
+            log_stat = None
+        if log_stat is None or log_stat.st_size < self._offset or \
+                (self._file_id is not None and self._get_file_id(log_stat) != self._file_id):
+            # The log file was removed, truncated or replaced by a new log, read it from the start
+            self._reset()
+        if log_stat is None or log_stat.st_size == self._offset:
+            return b''
+
+        # The file is only opened while reading, so that the process writing the log can still rename or remove it
+        try:
+            with open(self.log_path, 'rb') as log:
+                file_id = self._get_file_id(os.fstat(log.fileno()))
+                if file_id != self._get_file_id(log_stat):
+                    # The log was replaced after it was checked, it is read from the start by the next poll
+                    return b''
+                log.seek(self._offset)
+                data = log.read()
+        except OSError as ex:
+            logger.debug(f"Failed to read log {self.log_path}", exc_info=ex)
+            return b''
+        self._file_id = file_id
+        self._offset += len(data)
+        return data
+
+    def _replay_from_log(self, subscription):
+        """
+        Passes the lines read so far to a new subscriber by reading them again from the log, as the oldest of them are
+        no longer kept
+        """
+        replay_end = self._offset - len(self._pending_data)
+        try:
+            with open(self.log_path, 'rb') as log:
+                if self._get_file_id(os.fstat(log.fileno())) == self._file_id:
+                    position = 0
+                    for data_line in log:
+                        if position >= replay_end:
+                            break
+                        position += len(data_line)
+                        subscription._notify(self._decode_line(data_line.rstrip(b'\n')))
+                    return
+        except OSError as ex:
+            logger.debug(f"Failed to read log {self.log_path}", exc_info=ex)
+        # The log was replaced since it was read, so only the kept lines can be replayed
+        logger.warning(f"Only the last {len(self._lines)} lines of log {self.log_path} could be replayed")
+        for line in self._lines:
+            subscription._notify(line)
+
+    def poll(self, final=False):
+        """
+        Reads the lines added to the log since the last poll and passes them to the subscribers. The last line is only
+        passed once it is complete, unless final is True.
+
+        :param final: True if the process writing the log has ended, so that the last line is passed even without a
+            line ending
+        :return: The number of new lines read
+        """
+        with self._lock:
+            # Read first, as a new log replacing the log discards the pending data of the old one
+            data = self._read_new_data()
+            data_lines = (self._pending_data + data).split(b'\n')
+            self._pending_data = data_lines.pop()
+            if final and self._pending_data:
+                data_lines.append(self._pending_data)
+                self._pending_data = b''
+
+            lines = [self._decode_line(line) for line in data_lines]
+            if len(self._lines) + len(lines) > LOG_TAILER_MAX_LINES:
+                self._lines_dropped = True
+            self._lines.extend(lines)
+            for subscription in list(self._subscriptions):
+                for line in lines:
+                    subscription._notify(line)
+            return len(lines)
+
+
+def subscribe(log_path, callback, predicate=None, replay=False):
+    """
+    Registers a subscriber to the shared tailer of a log path, see LogTailer.subscribe()
+
+    :param log_path: The path of the log file, which doesn't need to exist yet
+    :param callback: Function called with every new line of the log matching the predicate, without the line ending
+    :param predicate: Function returning True if the callback should be called for a line, or None for all lines
+    :param replay: If True, the callback is also called for the matching lines which were already read
+    :return: The LogSubscription, which must be closed when the subscriber is done with the log
+    """
+    return LogTailer.get(log_path).subscribe(callback, predicate, replay)
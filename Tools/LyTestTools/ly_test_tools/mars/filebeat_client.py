@@ -5,15 +5,65 @@ For complete copyright and license terms please see the LICENSE at the root of t
 SPDX-License-Identifier: Apache-2.0 OR MIT
 """
 
+import contextlib
 import datetime
 import json
+import os
 import socket
+import time
+
+import ly_test_tools.environment.file_system as file_system
+
+DEFAULT_MAX_BATCH_BYTES = 64 * 1024  # buffered events are sent in one frame once they reach this size
+DEFAULT_MAX_BUFFERED_BYTES = 16 * 1024 * 1024  # events kept in memory while filebeat is down and there is no spool
+DEFAULT_MAX_SPOOL_BYTES = 64 * 1024 * 1024  # the oldest spooled events are dropped above this size
+DEFAULT_RECONNECT_INTERVAL = 5  # seconds between attempts to reconnect to filebeat while it is down
 
 
 class FilebeatExn(Exception):
     pass
 
 
+@contextlib.contextmanager
+def _locked_spool(spool_path):
+    """
+    Opens the spool file and holds an exclusive lock on it, so that clients in other processes sharing the spool file
+    do not append to it while it is sent and truncated. The file is only ever modified in place, never removed or
+    replaced, so that every client locks the same file.
+
+    :param spool_path: Path of the spool file, which is created if it doesn't exist
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(spool_path)), exist_ok=True)
+    with os.fdopen(os.open(spool_path, os.O_RDWR | os.O_CREAT), "r+b") as spool, \
+            file_system.exclusive_file_lock(spool):
+        try:
+            yield spool
+        finally:
+            spool.flush()
+
+
+def _remove_spool_head(spool, start, chunk_bytes=DEFAULT_MAX_BATCH_BYTES):
+    """
+    Moves the content of the locked spool file from start to the beginning of the file, dropping the content before it
+
+    :param spool: Spool file opened by _locked_spool()
+    :param start: Offset of the first byte to keep
+    :param chunk_bytes: Size of the chunks copied at once
+    """
+    read_position = start
+    write_position = 0
+    while True:
+        spool.seek(read_position)
+        data = spool.read(chunk_bytes)
+        if not data:
+            break
+        read_position += len(data)
+        spool.seek(write_position)
+        spool.write(data)
+        write_position += len(data)
+    spool.truncate(write_position)
+
+
 class FilebeatClient(object):
     def __init__(self, logger, host="127.0.0.1", port=9000, timeout=20):
         self._logger = logger.getChild("filebeat_client")
@@ -25,6 +75,13 @@ class FilebeatClient(object):
         self._open_socket()
 
     def send_event(self, payload, index, timestamp=None, pipeline="filebeat"):
+        data = self._serialize_event(payload, index, timestamp, pipeline)
+
+        self._logger.debug(f"-> {data}")
+        self._send_data(data)
+
+    @staticmethod
+    def _serialize_event(payload, index, timestamp, pipeline):
         if timestamp is None:
             timestamp = datetime.datetime.utcnow().timestamp()
 
@@ -37,10 +94,7 @@ class FilebeatClient(object):
 
         # Serialise event, add new line and encode as UTF-8 before sending to Filebeat.
         data = json.dumps(event, sort_keys=True) + "\n"
-        data = data.encode()
-
-        self._logger.debug(f"-> {data}")
-        self._send_data(data)
+        return data.encode()
 
     def _open_socket(self):
         self._logger.info(f"Connecting to Filebeat on {self._filebeat_host}:{self._filebeat_port}")
@@ -66,3 +120,168 @@ class FilebeatClient(object):
                 total_sent = 0
             else:
                 total_sent = total_sent + sent
+
+
+class BufferedFilebeatClient(FilebeatClient):
+    def __init__(self, logger, host="127.0.0.1", port=9000, timeout=20, spool_path=None,
+                 max_batch_bytes=DEFAULT_MAX_BATCH_BYTES, max_buffered_bytes=DEFAULT_MAX_BUFFERED_BYTES,
+                 max_spool_bytes=DEFAULT_MAX_SPOOL_BYTES, reconnect_interval=DEFAULT_RECONNECT_INTERVAL):
+        """
+        Filebeat client which batches events into newline-delimited frames sent over one persistent connection.
+        Sending a frame blocks while filebeat is not reading, up to the socket timeout, which holds back the caller.
+        While filebeat can't be reached the events are appended to the spool file, which is sent before any other
+        event once filebeat is reached again, by this client or by a later client using the same spool file.
+        The spool file is locked while it is modified, so it can be shared by clients in several processes.
+        Call flush() or close() to send the events still buffered.
+
+        :param logger: Logger of the caller
+        :param host: Host of filebeat
+        :param port: Port of filebeat
+        :param timeout: Seconds to wait for filebeat to connect or to read a frame before it is considered down
+        :param spool_path: Path of the file keeping events while filebeat is down, or None to only keep them in memory
+        :param max_batch_bytes: Size of buffered events which are sent as one frame
+        :param max_buffered_bytes: Size of events kept in memory while filebeat is down and there is no spool file,
+            above which FilebeatExn is raised
+        :param max_spool_bytes: Size of the spool file above which the oldest events in it are dropped
+        :param reconnect_interval: Seconds between attempts to reconnect to filebeat while it is down
+        """
+        self._logger = logger.getChild("filebeat_client")
+        self._filebeat_host = host
+        self._filebeat_port = port
+        self._socket_timeout = timeout
+        self._socket = None
+        self._spool_path = spool_path
+        self._max_batch_bytes = max_batch_bytes
+        self._max_buffered_bytes = max_buffered_bytes
+        self._max_spool_bytes = max_spool_bytes
+        self._reconnect_interval = reconnect_interval
+        self._next_connect_time = 0
+        self._buffer = []
+        self._buffered_bytes = 0
+
+        if self._connect():
+            self._send_spool()
+        elif spool_path is None:
+            raise FilebeatExn("Failed to connect to Filebeat")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def send_event(self, payload, index, timestamp=None, pipeline="filebeat"):
+        data = self._serialize_event(payload, index, timestamp, pipeline)
+        self._buffer.append(data)
+        self._buffered_bytes += len(data)
+        if self._buffered_bytes >= self._max_batch_bytes:
+            self.flush()
+
+    def flush(self):
+        """
+        Sends the buffered events to filebeat, or appends them to the spool file if filebeat can't be reached
+        """
+        if not self._buffer:
+            return
+
+        data = b"".join(self._buffer)
+        if self._connect() and self._send_spool() and self._send_frame(data):
+            self._logger.debug(f"-> {len(self._buffer)} events")
+        elif self._spool_path is not None:
+            self._logger.debug(f"Filebeat can't be reached, spooling {len(self._buffer)} events")
+            self._append_spool(data)
+        elif self._buffered_bytes > self._max_buffered_bytes:
+            raise FilebeatExn(f"Filebeat can't be reached and {self._buffered_bytes} bytes of events are buffered")
+        else:
+            # keep the events, they are sent with the next frame
+            return
+
+        self._buffer = []
+        self._buffered_bytes = 0
+
+    def close(self):
+        """
+        Sends the buffered events and closes the connection
+
+        :raises FilebeatExn: If filebeat can't be reached and there is no spool file, the buffered events are lost
+        """
+        try:
+            self.flush()
+            if self._buffer:
+                raise FilebeatExn(f"Filebeat can't be reached, {len(self._buffer)} events were not sent")
+        finally:
+            self._close_socket()
+
+    def _connect(self):
+        if self._socket is not None:
+            return True
+        if time.monotonic() < self._next_connect_time:
+            return False
+
+        try:
+            self._open_socket()
+        except (FilebeatExn, OSError) as ex:
+            self._logger.debug(f"Failed to connect to Filebeat: {ex}")
+            self._close_socket()
+            self._next_connect_time = time.monotonic() + self._reconnect_interval
+            return False
+        return True
+
+    def _close_socket(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _send_frame(self, data):
+        # The peer may have closed an idle connection, so reconnect once before considering filebeat down
+        for attempt in range(2):
+            if attempt and not self._connect():
+                return False
+            try:
+                self._socket.sendall(data)
+                return True
+            except OSError as ex:
+                self._logger.debug(f"Failed to send to Filebeat: {ex}")
+                self._close_socket()
+        return False
+
+    def _append_spool(self, data):
+        with _locked_spool(self._spool_path) as spool:
+            spool.seek(0, os.SEEK_END)
+            spool.write(data)
+            size = spool.tell()
+            if size > self._max_spool_bytes:
+                # drop the oldest events, keeping the file starting on an event boundary
+                spool.seek(size - self._max_spool_bytes - 1)
+                spool.readline()
+                start = spool.tell()
+                self._logger.warning(f"Spool file {self._spool_path} is full, dropping the oldest {start} bytes of events")
+                _remove_spool_head(spool, start)
+
+    def _send_spool(self):
+        """
+        Sends the events of the spool file, and empties the file once they are all sent
+
+        :return: True if the spool file is empty
+        """
+        if self._spool_path is None or not os.path.isfile(self._spool_path):
+            return True
+
+        with _locked_spool(self._spool_path) as spool:
+            frame = b""
+            while True:
+                data = spool.read(self._max_batch_bytes)
+                frame += data
+                # frames end on an event boundary
+                end = frame.rfind(b"\n") + 1 if data else len(frame)
+                if end and not self._send_frame(frame[:end]):
+                    break
+                frame = frame[end:]
+                if not data:
+                    break
+
+            # keep the events which were not sent
+            start = spool.tell() - len(frame)
+            sent_all = start == spool.seek(0, os.SEEK_END)
+            _remove_spool_head(spool, start)
+            return sent_all
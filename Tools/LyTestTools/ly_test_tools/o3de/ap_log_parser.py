@@ -5,13 +5,19 @@ For complete copyright and license terms please see the LICENSE at the root of t
 SPDX-License-Identifier: Apache-2.0 OR MIT
 """
 
+import array
+import collections.abc
 import logging
+import os
 import re
 from typing import List, Optional, Dict, Generator, Tuple
 import time
 
 logger = logging.getLogger(__name__)
 
+# Line logged at the start of every run of a process appending to the same log file
+NEW_RUN_LINE = "AzFramework File Logging New Run"
+
 
 class APOutputParser:
     """
@@ -22,7 +28,7 @@ class APOutputParser:
     _SEPARATOR = ": "
     _NONE_LINE = "none"
     # Does support multiple output runs
-    _NEW_RUN_LINE = "AzFramework File Logging New Run"
+    _NEW_RUN_LINE = NEW_RUN_LINE
 
     # Regular expression constants and keys used for looking up information later.
     _RE_INT_LINES = (  # Extract an integer
@@ -218,7 +224,7 @@ class APLogParser(APOutputParser):
     _SEPARATOR = "~~"
 
     _NONE_LINE = "none"
-    _NEW_RUN_LINE = "AzFramework File Logging New Run"
+    _NEW_RUN_LINE = NEW_RUN_LINE
 
     def __init__(self, file_path: str, raw_output: str = None) -> None:
         self._runs = []
@@ -264,3 +270,275 @@ class APLogParser(APOutputParser):
         if len(split) > 4:
             return split[4], int(split[1])
         return "", 0
+
+
+class _APLogRuns(collections.abc.Sequence):
+    """Read-only list of the runs of a StreamingAPLogParser, each run is only parsed when it is accessed"""
+
+    def __init__(self, parser: "StreamingAPLogParser") -> None:
+        self._parser = parser
+
+    def __len__(self) -> int:
+        return self._parser._get_run_count()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._parser._get_run(i) for i in range(*index.indices(len(self)))]
+        return self._parser._get_run(index)
+
+
+class StreamingAPLogParser(APLogParser):
+    """
+    Asset Processor Log Parser for large or growing asset processor logs.
+    The log is read once to index the byte offset and the line type of every line and where each run starts. A run is
+    only parsed into a dictionary when it is accessed, and get_lines() reads the lines of the runs it searches from the
+    index. Call update() to index the lines added to the log since it was last read. The last line of the log is only
+    indexed once it ends with a newline, unless the log is final.
+    """
+
+    LINE_TYPE_INFO = "info"
+    LINE_TYPE_WARNING = "warning"
+    LINE_TYPE_ERROR = "error"
+    _LINE_TYPES = (LINE_TYPE_INFO, LINE_TYPE_WARNING, LINE_TYPE_ERROR)
+
+    # Severity column of the log lines, see AzFramework::LogFile::SeverityLevel
+    _SEVERITY_WARNING = 2
+    _SEVERITY_ERROR = 3
+
+    _READ_SIZE = 1024 * 1024  # bytes read from the log at once while indexing
+
+    def __init__(self, file_path: str, final: bool = False) -> None:
+        """
+        :param file_path: The path to the log file
+        :param final: Whether the log is complete and won't be written to, so its last line is indexed even if it
+            doesn't end with a newline
+        """
+        self._final = final
+        self._line_offsets = array.array('q')  # byte offset of every line in the runs
+        self._line_types = array.array('b')  # index in _LINE_TYPES of every line in the runs
+        self._run_starts = [0]  # index of the first line of every run
+        self._offset = 0  # bytes of the log read so far
+        self._pending_data = b''  # last line of the log read so far, which is still being written
+        self._previous_line = b''
+        self._parsed_runs = {}  # run index -> (number of lines parsed, parsed run)
+        super(StreamingAPLogParser, self).__init__(file_path)
+
+    @property
+    def runs(self) -> _APLogRuns:
+        """
+        Returns all runs from the log, see APOutputParser.runs. The runs are parsed when they are accessed, the last run
+        is parsed again if it grew since it was last accessed.
+        """
+        return _APLogRuns(self)
+
+    def _parse_file(self) -> None:
+        logger.info(f"Indexing log file: {self._file_path}")
+        self.update(final=self._final)
+
+    def _reset(self) -> None:
+        self._line_offsets = array.array('q')
+        self._line_types = array.array('b')
+        self._run_starts = [0]
+        self._offset = 0
+        self._pending_data = b''
+        self._previous_line = b''
+        self._parsed_runs.clear()
+
+    def update(self, final: bool = False) -> int:
+        """
+        Indexes the lines added to the log since it was last read. The log is indexed again from the start if it was
+        truncated or replaced by a new log.
+
+        :param final: Whether the log is complete and won't be written to anymore, so its last line is indexed even if
+            it doesn't end with a newline
+        :return: The number of lines added to the runs
+        """
+        try:
+            log_size = os.path.getsize(self._file_path)
+        except OSError:
+            logger.error(f"Error opening file: {self._file_path}")
+            self._reset()
+            return 0
+        if log_size < self._offset:
+            self._reset()
+
+        line_count = len(self._line_offsets)
+        try:
+            with open(self._file_path, "rb") as log_file:
+                log_file.seek(self._offset)
+                # Offset of the start of the pending data, which is the next line to index
+                line_offset = self._offset - len(self._pending_data)
+                while True:
+                    data = log_file.read(self._READ_SIZE)
+                    if not data:
+                        break
+                    self._offset += len(data)
+                    raw_lines = (self._pending_data + data).split(b'\n')
+                    self._pending_data = raw_lines.pop()
+                    for raw_line in raw_lines:
+                        self._index_line(raw_line, line_offset)
+                        line_offset += len(raw_line) + 1
+        except OSError:
+            logger.error(f"Error opening file: {self._file_path}")
+        if final and self._pending_data:
+            self._index_line(self._pending_data, self._offset - len(self._pending_data))
+            self._pending_data = b''
+        return len(self._line_offsets) - line_count
+
+    def _index_line(self, raw_line: bytes, line_offset: int) -> None:
+        """Adds a line to the index, following the same rules as APOutputParser._parse_lines()"""
+        separator = self._SEPARATOR.encode()
+        split = raw_line.strip().split(separator, 4)
+        previous_line = self._previous_line
+        self._previous_line = raw_line
+        if len(split) <= 4:
+            return
+        # The trimmed line is <line-type>~~<line-contents>, see _trim_line()
+        trimmed = split[4]
+        line_type_end = trimmed.find(separator)
+        if line_type_end <= 0:
+            return
+
+        if trimmed[:line_type_end] != self._NONE_LINE.encode():
+            try:
+                severity = int(split[2])
+            except ValueError:
+                severity = 0
+            if severity >= self._SEVERITY_ERROR:
+                line_type = 2
+            elif severity == self._SEVERITY_WARNING:
+                line_type = 1
+            else:
+                line_type = 0
+            self._line_offsets.append(line_offset)
+            self._line_types.append(line_type)
+        elif self._NEW_RUN_LINE.encode() in previous_line and len(self._line_offsets) > self._run_starts[-1]:
+            # Hit the end of a "run" in the log
+            self._run_starts.append(len(self._line_offsets))
+
+    def _get_run_count(self) -> int:
+        if len(self._line_offsets) > self._run_starts[-1]:
+            return len(self._run_starts)
+        # The last run doesn't have any lines yet
+        return len(self._run_starts) - 1
+
+    def _get_run_line_range(self, run: int) -> range:
+        run_count = self._get_run_count()
+        if run < 0:
+            run += run_count
+        if not 0 <= run < run_count:
+            raise IndexError("run index out of range")
+        run_end = self._run_starts[run + 1] if run + 1 < len(self._run_starts) else len(self._line_offsets)
+        return range(self._run_starts[run], run_end)
+
+    def _read_raw_lines(self, line_indices: range or List[int]) -> Generator[bytes, None, None]:
+        """Reads the indexed lines from the log, only seeking when the lines don't follow each other"""
+        with open(self._file_path, "rb") as log_file:
+            next_offset = None
+            for line_index in line_indices:
+                line_offset = self._line_offsets[line_index]
+                if line_offset != next_offset:
+                    log_file.seek(line_offset)
+                raw_line = log_file.readline()
+                next_offset = line_offset + len(raw_line)
+                yield raw_line
+
+    def get_lines_reversed(self, run: int = -1) -> Generator[Tuple[str, int], None, None]:
+        """
+        Iterate the lines of a run from the last line to the first, with the timestamp of each line. Only the lines
+        which are iterated are read from the log, so finding a recent line doesn't read the whole run.
+
+        :param run: The index of the run to search
+        :return: The trimmed line and its timestamp
+        """
+        for raw_line in self._read_raw_lines(reversed(self._get_run_line_range(run))):
+            yield self._decode_line(raw_line)
+
+    def _decode_line(self, raw_line: bytes) -> Tuple[str, int]:
+        return self._trim_line(raw_line.decode("utf-8", errors="replace"))
+
+    def _get_run(self, run: int) -> Dict:
+        line_range = self._get_run_line_range(run)
+        parsed_line_count, parsed_run = self._parsed_runs.get(line_range.start, (0, None))
+        if parsed_line_count != len(line_range):
+            parsed_run = self._create_log_dict()
+            for raw_line in self._read_raw_lines(line_range):
+                trimmed, timestamp = self._decode_line(raw_line)
+                self._digest_line(trimmed, parsed_run, timestamp)
+            self._parsed_runs[line_range.start] = (len(line_range), parsed_run)
+        return parsed_run
+
+    # fmt:off
+    def get_lines(self, run: Optional[int], contains: Optional[List[str] or str] = None,
+                  regex: Optional[str] = None,
+                  line_type: Optional[str] = None) -> Generator[str, None, None] or Generator[re.Match, None, None]:
+        # fmt:on
+        """
+        Iterate the lines in the log by specifying a run index (or None for all), see APOutputParser.get_lines().
+        The lines are read from the log as they are iterated, without parsing the runs.
+
+        :param run: The index of the run to search. If None, all runs are searched
+        :param contains: A string (or list of strings) to search for in the log
+        :param regex: A regular expression string to use to search the log.
+        :param line_type: Only search the lines of this type, one of LINE_TYPE_INFO, LINE_TYPE_WARNING or
+            LINE_TYPE_ERROR. If None, all lines are searched
+        :return: Each line that matches
+        """
+        if run is None:
+            line_indices = range(len(self._line_offsets))
+        else:
+            line_indices = self._get_run_line_range(run)
+        if line_type is not None:
+            line_type_index = self._LINE_TYPES.index(line_type)
+            line_indices = [i for i in line_indices if self._line_types[i] == line_type_index]
+        if type(contains) == str:
+            contains = [contains]
+        # Skip the lines which can't contain the strings before decoding them
+        encoded_contains = [search_string.encode() for search_string in contains] if contains and regex is None else []
+
+        for raw_line in self._read_raw_lines(line_indices):
+            if not all(search_bytes in raw_line for search_bytes in encoded_contains):
+                continue
+            line, _ = self._decode_line(raw_line)
+            if regex is not None:
+                match = re.match(regex, line)
+                if match:
+                    yield match
+            elif contains is not None:
+                if all(search_string in line for search_string in contains):
+                    yield line
+            else:
+                yield line
+
+    def count_lines(self, run: Optional[int], line_type: str) -> int:
+        """
+        Counts the lines of a type from the index, without reading them
+
+        :param run: The index of the run to search. If None, all runs are searched
+        :param line_type: One of LINE_TYPE_INFO, LINE_TYPE_WARNING or LINE_TYPE_ERROR
+        :return: The number of lines of the type
+        """
+        line_type_index = self._LINE_TYPES.index(line_type)
+        if run is None:
+            return self._line_types.count(line_type_index)
+        line_range = self._get_run_line_range(run)
+        return self._line_types[line_range.start:line_range.stop].count(line_type_index)
+
+    def get_port(self, port_type: str, run: int = -1) -> Optional[int]:
+        """
+        Reads a port recorded in a run, such as "Control Port" or "Listening Port", without parsing the run
+
+        :param port_type: The name of the port
+        :param run: The index of the run to search
+        :return: The port, or None if it isn't in the run
+        """
+        if not self._get_run_count():
+            return None
+        port = None
+        port_pattern = re.compile(rf"^{re.escape(port_type)}: (\d+)")
+        for line in self.get_lines(run, contains=f"{port_type}: "):
+            match = port_pattern.match(self.remove_line_type(line))
+            if match:
+                # The last port recorded in the run is used, as in the parsed run
+                port = int(match.group(1))
+        return port
@@ -10,6 +10,7 @@ The class manages a workspace's asset processor and asset configurations.
 import logging
 import os
 import psutil
+import re
 import shutil
 import socket
 import stat
@@ -23,8 +24,9 @@ import ly_test_tools
 import ly_test_tools.environment.file_system as file_system
 import ly_test_tools.environment.process_utils as process_utils
 import ly_test_tools.environment.waiter as waiter
+import ly_test_tools.log.log_tailer as log_tailer
 import ly_test_tools.o3de.pipeline_utils as utils
-from ly_test_tools.o3de.ap_log_parser import APLogParser
+from ly_test_tools.o3de.ap_log_parser import NEW_RUN_LINE
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,8 @@ ASSET_PROCESSOR_PLATFORM_MAP = {
 }
 
 ASSET_PROCESSOR_SETTINGS_ROOT_KEY = '/Amazon/AssetProcessor/Settings'
+# Port line of the AP log, ex. ~~1581617216532~~1~~0000000000002540~~AssetProcessor~~Control Port: 45643
+AP_LOG_PORT_PATTERN = re.compile(r"~~(Control Port|Listening Port): (\d+)")
 
 
 class AssetProcessorError(Exception):
@@ -74,6 +78,8 @@ class AssetProcessor(object):
         self._temp_log_root = None
         self._disable_all_platforms = False
         self._enabled_platform_overrides = dict()
+        self._ap_log_subscription = None
+        self._ap_log_ports = dict()
 
     # Starts AP but does not by default run until idle.
     def start(self, connection_timeout=30, quitonidle=False, add_gem_scan_folders=None, add_config_scan_folders=None,
@@ -178,30 +184,53 @@ class AssetProcessor(object):
         """
         Read the a port chosen by AP from the log
         """
-        port = None
+        # The AP log is followed from when AP is started until it is stopped, so every poll only reads the lines added
+        # since the last one rather than the whole log
+        subscription = self._subscribe_ap_log()
 
         def _get_port_from_log():
-            nonlocal port
-            if not os.path.exists(self._workspace.paths.ap_gui_log()):
-                return False
-
-            log = APLogParser(self._workspace.paths.ap_gui_log())
-            if len(log.runs):
-                try:
-                    port = log.runs[-1][port_type]
-                    logger.debug(f"Read port type {port_type} : {port}")
-                    return True
-                except Exception as ex:  # intentionally broad
-                    logger.debug("Failed to read port from file", exc_info=ex)
-            return False
+            subscription.poll()
+            return self._ap_log_ports.get(port_type) is not None
 
-        # the timeout needs to be large enough to load all the dynamic libraries the AP-GUI loads since the control port
-        # is opened after all the DLL loads, this can take a long time in a Debug build
+        # the timeout needs to be large enough to load all the dynamic libraries the AP-GUI loads since the control
+        # port is opened after all the DLL loads, this can take a long time in a Debug build
         ap_max_activate_time = 60
-        err = AssetProcessorError(f"Failed to read port type {port_type} from {self._workspace.paths.ap_gui_log()}")
+        err = AssetProcessorError(f"Failed to read port type {port_type} from {subscription.tailer.log_path}")
         waiter.wait_for(_get_port_from_log, timeout=ap_max_activate_time, exc=err)
+        port = self._ap_log_ports[port_type]
+        logger.debug(f"Read port type {port_type} : {port}")
         return port
 
+    def _on_ap_log_line(self, line):
+        if NEW_RUN_LINE in line:
+            # Only the ports of the last AP run are read
+            self._ap_log_ports.clear()
+        else:
+            match = AP_LOG_PORT_PATTERN.search(line)
+            self._ap_log_ports[match.group(1)] = int(match.group(2))
+
+    def _subscribe_ap_log(self):
+        """
+        Follows the AP GUI log, keeping the ports of the last AP run. The subscription is kept until AP is stopped
+        :return: The subscription to the AP GUI log
+        """
+        ap_gui_log = self._workspace.paths.ap_gui_log()
+        if self._ap_log_subscription is not None and self._ap_log_subscription.tailer.log_path != ap_gui_log:
+            # The log root was changed since the log was subscribed
+            self._close_ap_log_subscription()
+        if self._ap_log_subscription is None:
+            self._ap_log_ports.clear()
+            self._ap_log_subscription = log_tailer.subscribe(
+                ap_gui_log, self._on_ap_log_line,
+                lambda line: NEW_RUN_LINE in line or AP_LOG_PORT_PATTERN.search(line) is not None, replay=True)
+        return self._ap_log_subscription
+
+    def _close_ap_log_subscription(self):
+        if self._ap_log_subscription is not None:
+            self._ap_log_subscription.close()
+            self._ap_log_subscription = None
+        self._ap_log_ports.clear()
+
     def set_control_connection(self, connection):
         self._control_connection = connection
 
@@ -272,6 +301,7 @@ class AssetProcessor(object):
             it waits until finishing its current task, which can sometimes take a while.
          :return: None
          """
+        self._close_ap_log_subscription()
         if not self._ap_proc:
             logger.warning("Attempting to quit AP but none running")
             return
@@ -306,6 +336,7 @@ class AssetProcessor(object):
         Forcibly stops AP and child processes
         :return: None
         """
+        self._close_ap_log_subscription()
 
         process_list = self.get_process_list()
         # An Asset Processor process can be running but if _ap_proc is None, it means we don't own it.
@@ -486,6 +517,8 @@ class AssetProcessor(object):
             logger.warning(f"Cannot capture output when leaving AP connection open.")
 
         logger.info(f"Launching AP with command: {command}")
+        # Follow the AP log before AP starts writing to it, the ports are read from it until AP is stopped
+        self._subscribe_ap_log()
         try:
             self._ap_proc = subprocess.Popen(command, cwd=ap_exe_path, env=process_utils.get_display_env())
             time.sleep(1)
@@ -513,6 +546,7 @@ class AssetProcessor(object):
                     self._ap_proc.kill()
             except Exception as ex:
                 logger.exception("Ignoring exception while trying to terminate Asset Processor", ex)
+            self._close_ap_log_subscription()
             raise be  # raise whatever prompted us to clean up
 
     def connect_listen(self, timeout=DEFAULT_TIMEOUT_SECONDS):
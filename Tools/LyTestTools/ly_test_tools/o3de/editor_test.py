@@ -34,18 +34,23 @@ import functools
 import inspect
 import json
 import logging
-import math
 import os
+import queue
 import re
 import threading
+import time
 import types
 import warnings
 
+import psutil
+
 import ly_test_tools.environment.process_utils as process_utils
+import ly_test_tools.log.log_tailer as log_tailer
 import ly_test_tools.o3de.editor_test_utils as editor_utils
 import ly_test_tools._internal.pytest_plugin.test_tools_fixtures
 
 from ly_test_tools.o3de.asset_processor import AssetProcessor
+from ly_test_tools.o3de.warm_editor import WarmEditor
 from ly_test_tools.launchers.exceptions import WaitTimeoutError
 
 # This file contains ready-to-use test functions which are not actual tests, avoid pytest collection
@@ -165,16 +170,18 @@ class Result:
 
     class Pass(Base):
 
-        def __init__(self, test_spec: type(EditorTestBase), output: str, editor_log: str):
+        def __init__(self, test_spec: type(EditorTestBase), output: str, editor_log: str, duration: float = None):
             """
             Represents a test success
             :test_spec: The type of EditorTestBase
             :output: The test output
             :editor_log: The editor log's output
+            :duration: The duration of the test in seconds as reported by the editor, or None if it wasn't reported
             """
             self.test_spec = test_spec
             self.output = output
             self.editor_log = editor_log
+            self.duration = duration
 
         def __str__(self):
             output = (
@@ -188,16 +195,18 @@ class Result:
 
     class Fail(Base):
 
-        def __init__(self, test_spec: type(EditorTestBase), output: str, editor_log: str):
+        def __init__(self, test_spec: type(EditorTestBase), output: str, editor_log: str, duration: float = None):
             """
             Represents a normal test failure
             :test_spec: The type of EditorTestBase
             :output: The test output
             :editor_log: The editor log's output
+            :duration: The duration of the test in seconds as reported by the editor, or None if it wasn't reported
             """
             self.test_spec = test_spec
             self.output = output
             self.editor_log = editor_log
+            self.duration = duration
             
         def __str__(self):
             output = (
@@ -327,13 +336,116 @@ class EditorTestSuite:
     def get_number_parallel_editors():
         return 8
 
+    # Number of batches per parallel editor that the parallel batched tests are split into. Editors which finish their
+    # batch early pull the next batch, so more batches balance the load better at the cost of more editor start-ups.
+    # Suites with uneven test durations can opt in to a higher value
+    batches_per_parallel_editor = 1
+    # Expected duration (seconds) of a test without a recorded duration. The parallel tests are assigned to editors
+    # using the durations recorded in the artifact folder from previous runs, so that the editors finish together
+    default_test_duration_estimate = 60
+    # Whether to size the pool of parallel editors from the host cores and free memory instead of using
+    # get_number_parallel_editors(). This can also be enabled with --editors-parallel-adaptive
+    adaptive_parallel_editors = False
+    # Number of logical cores for each editor in the adaptive pool
+    adaptive_editor_cores = 2
+    # Fraction of the total memory that the adaptive pool keeps the memory in use under
+    adaptive_editor_memory_ceiling = 0.8
+    # Expected peak memory (MB) of an editor until the peak of the running editors has been sampled
+    adaptive_editor_default_rss_mb = 2048
+    # Whether to run the shared tests in warm editors, which are started once per suite and run the tests sent to them
+    # one after the other, instead of starting an editor for every batch. This can also be enabled with --warm-editor-pool
+    use_warm_editor_pool = False
+    # Number of tests a warm editor runs before it is restarted, it is also restarted after a crash or a timeout
+    warm_editor_max_tests = 20
+
     _TIMEOUT_CRASH_LOG = 20  # Maximum time (seconds) for waiting for a crash file, in seconds
     _TEST_FAIL_RETCODE = 0xF  # Return code for test failure
+    _ADAPTIVE_SAMPLE_INTERVAL = 1  # Time (seconds) between samples of the editor memory for the adaptive editor pool
 
     class TestData:
         def __init__(self):
             self.results = {}  # Dict of str(test_spec.__name__) -> Result
             self.asset_processor = None
+            self.slot_timings = []  # List of EditorTestSuite.SlotTiming, one for each editor slot of the parallel runs
+            self.test_duration_history = None  # Dict of test name -> recent durations, loaded on first use
+            self.use_warm_editor_pool = False
+            self.warm_editors = {}  # Dict of run id -> WarmEditor, kept running between the shared test runs
+            self.warm_editor_logs = {}  # Dict of run id -> (LogSubscription, list of the lines read) of the editor log
+
+    class SlotTiming:
+        def __init__(self, runner_name: str, slot: int):
+            """
+            Timing of an editor slot of a parallel run, which shows how long the slot was kept busy running editors
+            :runner_name: The name of the parallel runner function
+            :slot: The index of the editor slot, starting at 1
+            """
+            self.runner_name = runner_name
+            self.slot = slot
+            self.runs = []  # List of (list of test names, duration in seconds) for each editor run in the slot
+            self.total_secs = 0.0  # Duration of the whole parallel run, including the time the slot was idle
+
+        @property
+        def busy_secs(self) -> float:
+            return sum(duration for _, duration in self.runs)
+
+        @property
+        def utilization(self) -> float:
+            """
+            :return: The fraction of the parallel run duration that the slot spent running editors
+            """
+            return self.busy_secs / self.total_secs if self.total_secs > 0 else 0.0
+
+        def __str__(self):
+            return (f"{self.runner_name} editor slot {self.slot}: {len(self.runs)} editor run(s), "
+                    f"busy {self.busy_secs:.1f}s of {self.total_secs:.1f}s ({self.utilization:.0%})")
+
+    class AdaptiveEditorLimit:
+        def __init__(self, max_editors: int, memory_ceiling: float, default_editor_rss: int):
+            """
+            Limits the number of editors running at the same time so that the memory in use stays under a ceiling.
+            The memory of the running editors is sampled to find the peak memory of an editor, which is used to decide
+            how many editors fit in the memory left
+            :max_editors: The maximum number of editors, at least one editor is always allowed
+            :memory_ceiling: The fraction of the total memory to stay under
+            :default_editor_rss: The expected peak memory of an editor in bytes, until the running editors are sampled
+            """
+            self.max_editors = max(1, max_editors)
+            self.memory_ceiling = memory_ceiling
+            self.default_editor_rss = default_editor_rss
+            self.peak_editor_rss = 0  # Peak resident memory of a single editor process, in bytes
+            self._editors_rss = 0  # Resident memory of all the running editors at the last sample, in bytes
+            self._lock = threading.Lock()
+
+        def sample(self) -> None:
+            """
+            Samples the resident memory of the editor processes started by this process
+            """
+            editors_rss = 0
+            peak_editor_rss = 0
+            for process in psutil.Process().children(recursive=True):
+                try:
+                    if os.path.splitext(process.name())[0] != "Editor":
+                        continue
+                    rss = process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+                editors_rss += rss
+                peak_editor_rss = max(peak_editor_rss, rss)
+            with self._lock:
+                self._editors_rss = editors_rss
+                self.peak_editor_rss = max(self.peak_editor_rss, peak_editor_rss)
+
+        def get_limit(self) -> int:
+            """
+            :return: The number of editors which fit in the memory left under the ceiling, including the running editors
+            """
+            with self._lock:
+                editors_rss = self._editors_rss
+                editor_rss = self.peak_editor_rss or self.default_editor_rss
+            memory = psutil.virtual_memory()
+            used_by_others = memory.total - memory.available - editors_rss
+            budget = memory.total * self.memory_ceiling - used_by_others
+            return max(1, min(self.max_editors, int(budget // editor_rss)))
 
     @pytest.fixture(scope="class")
     def editor_test_data(self, request: _pytest.fixtures.FixtureRequest) -> EditorTestSuite.TestData:
@@ -350,7 +462,15 @@ class EditorTestSuite:
         A wrapper function for unit testing of this file to call directly. Do not use in production.
         """
         test_data = EditorTestSuite.TestData()
+        test_data.use_warm_editor_pool = \
+            self.use_warm_editor_pool or bool(request.config.getoption("--warm-editor-pool", False))
         yield test_data
+        for warm_editor in test_data.warm_editors.values():
+            warm_editor.stop()
+        test_data.warm_editors.clear()
+        for editor_log, _ in test_data.warm_editor_logs.values():
+            editor_log.close()
+        test_data.warm_editor_logs.clear()
         if test_data.asset_processor:
             test_data.asset_processor.stop(1)
             test_data.asset_processor.teardown()
@@ -725,10 +845,13 @@ class EditorTestSuite:
                 cur_log = editor_log_content[log_start: end]
                 log_start = end
 
+                duration = json_result.get("duration")
+                if not isinstance(duration, (int, float)) or duration < 0:
+                    duration = None
                 if json_result["success"]:
-                    result = Result.Pass(test_spec, json_output, cur_log)
+                    result = Result.Pass(test_spec, json_output, cur_log, duration)
                 else:
-                    result = Result.Fail(test_spec, json_output, cur_log)
+                    result = Result.Fail(test_spec, json_output, cur_log, duration)
                 results[test_spec.__name__] = result
 
         return results
@@ -830,6 +953,26 @@ class EditorTestSuite:
         results[test_spec.__name__] = test_result
         return results
 
+    def _get_shared_test_cmdline_args(self,
+                                      workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
+                                      cmdline_args: list[str]) -> list[str]:
+        """
+        Builds the command line arguments of an editor running shared tests, except the tests to run
+        :workspace: The LyTestTools Workspace object
+        :cmdline_args: Any additional command line args
+        :return: A list of command line arguments
+        """
+        test_cmdline_args = self.global_extra_cmdline_args + cmdline_args
+        if self.use_null_renderer:
+            test_cmdline_args += ["-rhi=null"]
+        if self.enable_prefab_system:
+            test_cmdline_args += [
+                "--regset=/Amazon/Preferences/EnablePrefabSystem=true",
+                f"--regset-file={os.path.join(workspace.paths.engine_root(), 'Registry', 'prefab.test.setreg')}"]
+        else:
+            test_cmdline_args += ["--regset=/Amazon/Preferences/EnablePrefabSystem=false"]
+        return test_cmdline_args
+
     def _exec_editor_multitest(self, request: _pytest.fixtures.FixtureRequest,
                                workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
                                editor: ly_test_tools.launchers.platforms.base.Launcher, run_id: int, log_name: str,
@@ -850,19 +993,11 @@ class EditorTestSuite:
         """
         if cmdline_args is None:
             cmdline_args = []
-        test_cmdline_args = self.global_extra_cmdline_args + cmdline_args
-        if self.use_null_renderer:
-            test_cmdline_args += ["-rhi=null"]
+        test_cmdline_args = self._get_shared_test_cmdline_args(workspace, cmdline_args)
         if any([t.attach_debugger for t in test_spec_list]):
             test_cmdline_args += ["--attach-debugger"]
         if any([t.wait_for_debugger for t in test_spec_list]):
             test_cmdline_args += ["--wait-for-debugger"]
-        if self.enable_prefab_system:
-            test_cmdline_args += [
-                "--regset=/Amazon/Preferences/EnablePrefabSystem=true",
-                f"--regset-file={os.path.join(workspace.paths.engine_root(), 'Registry', 'prefab.test.setreg')}"]
-        else:
-            test_cmdline_args += ["--regset=/Amazon/Preferences/EnablePrefabSystem=false"]
 
         # Cycle any old crash report in case it wasn't cycled properly
         editor_utils.cycle_crash_report(run_id, workspace)
@@ -960,6 +1095,133 @@ class EditorTestSuite:
                                                          self.timeout_editor_shared_test, result.editor_log)
         return results
     
+    def _get_warm_editor(self, workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
+                         editor: ly_test_tools.launchers.platforms.base.Launcher, editor_test_data: TestData,
+                         run_id: int, log_name: str, cmdline_args: list[str]) -> WarmEditor | None:
+        """
+        Retrieves the warm editor of the run id. A new warm editor is started if there is none, if the editor exited,
+        if it ran warm_editor_max_tests tests or if it was started with other command line args
+        :workspace: The LyTestTools Workspace object
+        :editor: The LyTestTools Editor object, which is duplicated to start a new editor
+        :editor_test_data: The TestData from calling editor_test_data(), which holds the warm editors
+        :run_id: The unique run id
+        :log_name: The name of the editor log
+        :cmdline_args: Any additional command line args
+        :return: The warm editor, or None if a new editor could not be started
+        """
+        log_path = editor_utils.retrieve_log_path(run_id, workspace)
+        cmdline = ["-logfile", f"@log@/{log_name}",
+                   "-project-log-path", log_path] + self._get_shared_test_cmdline_args(workspace, cmdline_args)
+        warm_editor = editor_test_data.warm_editors.get(run_id)
+        if warm_editor is not None and (not warm_editor.is_alive() or
+                                        warm_editor.tests_run >= self.warm_editor_max_tests or
+                                        warm_editor.cmdline_args != cmdline):
+            warm_editor.stop()
+            warm_editor = None
+            del editor_test_data.warm_editors[run_id]
+
+        if warm_editor is None:
+            # Cycle any old crash report in case it wasn't cycled properly
+            editor_utils.cycle_crash_report(run_id, workspace)
+            warm_editor = WarmEditor(editor.__class__(workspace, editor.args.copy()),
+                                     os.path.join(log_path, "warm_editor"))
+            if not warm_editor.start(cmdline, self.timeout_editor_shared_test):
+                return None
+            editor_test_data.warm_editors[run_id] = warm_editor
+        return warm_editor
+
+    def _get_warm_editor_log(self, workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
+                             editor_test_data: TestData, run_id: int,
+                             log_name: str) -> tuple[log_tailer.LogSubscription, list[str]]:
+        """
+        Returns the subscription to the log of the warm editor of the run id, and the list of the lines it read. The log
+        keeps growing with every test run by the warm editor, so it is read incrementally instead of from the start
+        :workspace: The LyTestTools Workspace object
+        :editor_test_data: The TestData from calling editor_test_data(), which holds the warm editor logs
+        :run_id: The unique run id
+        :log_name: The name of the editor log
+        :return: The subscription and the list of lines
+        """
+        if run_id not in editor_test_data.warm_editor_logs:
+            editor_log_lines = []
+            editor_log = editor_utils.subscribe_editor_log(run_id, log_name, workspace, editor_log_lines.append)
+            editor_test_data.warm_editor_logs[run_id] = (editor_log, editor_log_lines)
+        return editor_test_data.warm_editor_logs[run_id]
+
+    def _exec_warm_editor_tests(self, workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
+                                editor: ly_test_tools.launchers.platforms.base.Launcher, editor_test_data: TestData,
+                                run_id: int, log_name: str, test_spec_list: list[EditorSharedTest],
+                                cmdline_args: list[str] = None) -> dict[str, Result]:
+        """
+        Runs the tests one after the other in the warm editor of the run id and returns a dict of the result of every
+        test. The warm editor is restarted after a test crashes or times out, so the next tests still run. When a test
+        of the list attaches or waits for a debugger, the tests run in a warm editor started with the debugger flags
+        :workspace: The LyTestTools Workspace object
+        :editor: The LyTestTools Editor object, which is duplicated to start a new editor
+        :editor_test_data: The TestData from calling editor_test_data(), which holds the warm editors
+        :run_id: The unique run id
+        :log_name: The name of the editor log to retrieve
+        :test_spec_list: A list of EditorSharedTest tests to run
+        :cmdline_args: Any additional command line args
+        :return: A dict of Result objects
+        """
+        if cmdline_args is None:
+            cmdline_args = []
+        cmdline_args = list(cmdline_args)
+        if any([t.attach_debugger for t in test_spec_list]):
+            cmdline_args += ["--attach-debugger"]
+        if any([t.wait_for_debugger for t in test_spec_list]):
+            cmdline_args += ["--wait-for-debugger"]
+
+        results = {}
+        for test_spec in test_spec_list:
+            warm_editor = self._get_warm_editor(workspace, editor, editor_test_data, run_id, log_name, cmdline_args)
+            if warm_editor is None:
+                results[test_spec.__name__] = Result.Unknown(
+                    test_spec, extra_info="The warm editor exited or timed out during start-up")
+                continue
+
+            output_start = len(warm_editor.editor.get_output())
+            editor_log, editor_log_lines = self._get_warm_editor_log(workspace, editor_test_data, run_id, log_name)
+            editor_log.poll()
+            editor_log_lines.clear()
+            test_filename = editor_utils.get_testcase_module_filepath(test_spec.test_module)
+            timed_out = False
+            try:
+                success = warm_editor.run_test(test_filename, test_spec.timeout)
+            except WaitTimeoutError:
+                success = None
+                timed_out = True
+
+            # Only keep the output and log of this test
+            output = warm_editor.editor.get_output()[output_start:]
+            if timed_out:
+                warm_editor.editor.stop()
+            editor_log.poll(final=not warm_editor.is_alive())
+            editor_log_content = "".join(f"[{log_name}]  {line}\n" for line in editor_log_lines)
+            # Save the editor log
+            workspace.artifact_manager.save_artifact(
+                os.path.join(editor_utils.retrieve_log_path(run_id, workspace), log_name), f'({run_id}){log_name}')
+
+            if timed_out:
+                results[test_spec.__name__] = Result.Timeout(test_spec, output, test_spec.timeout, editor_log_content)
+            elif success is None:
+                return_code = warm_editor.editor.get_returncode()
+                crash_output = editor_utils.retrieve_crash_output(run_id, workspace, self._TIMEOUT_CRASH_LOG)
+                # Save the crash log
+                crash_file_name = os.path.basename(workspace.paths.crash_log())
+                if os.path.exists(crash_file_name):
+                    workspace.artifact_manager.save_artifact(
+                        os.path.join(editor_utils.retrieve_log_path(run_id, workspace), crash_file_name))
+                    editor_utils.cycle_crash_report(run_id, workspace)
+                else:
+                    logger.warning(f"Crash occurred, but could not find log {crash_file_name}")
+                results[test_spec.__name__] = Result.Crash(test_spec, output, return_code, crash_output,
+                                                           editor_log_content)
+            else:
+                results.update(self._get_results_using_output([test_spec], output, editor_log_content))
+        return results
+
     def _run_single_test(self, request: _pytest.fixtures.FixtureRequest,
                          workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
                          editor: ly_test_tools.launchers.platforms.base.Launcher,
@@ -978,7 +1240,9 @@ class EditorTestSuite:
         if hasattr(test_spec, "extra_cmdline_args"):
             extra_cmdline_args = test_spec.extra_cmdline_args
 
+        start_time = time.monotonic()
         result = self._exec_editor_test(request, workspace, editor, 1, "editor_test.log", test_spec, extra_cmdline_args)
+        self._save_test_durations(workspace, [(result, time.monotonic() - start_time)])
         if result is None:
             logger.error(f"Unexpectedly found no test run in the editor log during {test_spec}")
             result = {"Unknown":
@@ -1013,8 +1277,14 @@ class EditorTestSuite:
             return
 
         self._setup_editor_test(editor, workspace, editor_test_data)
-        results = self._exec_editor_multitest(request, workspace, editor, 1, "editor_test.log", test_spec_list,
-                                              extra_cmdline_args)
+        start_time = time.monotonic()
+        if editor_test_data.use_warm_editor_pool:
+            results = self._exec_warm_editor_tests(workspace, editor, editor_test_data, 1, "editor_test.log",
+                                                   test_spec_list, extra_cmdline_args)
+        else:
+            results = self._exec_editor_multitest(request, workspace, editor, 1, "editor_test.log", test_spec_list,
+                                                  extra_cmdline_args)
+        self._save_test_durations(workspace, [(results, time.monotonic() - start_time)])
         editor_test_data.results.update(results)
         # If at least one test did not pass, save assets with errors and warnings
         for result in results:
@@ -1025,12 +1295,153 @@ class EditorTestSuite:
                 editor_utils.save_failed_asset_joblogs(workspace)
                 return  # exit early on first batch failure
 
+    def _run_work_queue(self, workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
+                        editor: ly_test_tools.launchers.platforms.base.Launcher, editor_test_data: TestData,
+                        runner_name: str, work_items: list, num_slots: int, run_work_item: callable,
+                        editor_limit: AdaptiveEditorLimit = None) -> list:
+        """
+        Runs the work items on a number of editor slots in parallel. The work items are held in a shared queue and each
+        slot pulls the next item as soon as it finishes the previous one, so a slow test does not leave other slots idle.
+        The timing of each slot is stored in editor_test_data.slot_timings
+        :workspace: The LyTestTools Workspace object
+        :editor: The LyTestTools Editor object which is duplicated for every editor run
+        :editor_test_data: The TestData from calling editor_test_data()
+        :runner_name: The name of the runner, used to identify the slot timings
+        :work_items: A list of (test names, work item) for each editor run
+        :num_slots: The maximum number of editors to run at the same time
+        :run_work_item: Function called as run_work_item(editor, run_id, work_item) which returns a dict of Result
+        :editor_limit: If set, a slot only starts an editor while fewer editors than its limit are running. The memory
+            of the editors is sampled while they run
+        :return: A list with the (results, duration in seconds) of each work item, the results are None for an item
+            which did not return results
+        """
+        work_queue = queue.SimpleQueue()
+        for index, work_item in enumerate(work_items):
+            work_queue.put((index, work_item))
+        timed_results = [(None, 0.0)] * len(work_items)
+        # Number of editors running, used with the editor limit
+        running_editors = [0]
+        running_editors_changed = threading.Condition()
+        done = threading.Event()
+
+        def acquire_editor():
+            if editor_limit is None:
+                return
+            with running_editors_changed:
+                # Re-check the limit periodically, as it changes with the sampled memory
+                while running_editors[0] >= editor_limit.get_limit():
+                    running_editors_changed.wait(self._ADAPTIVE_SAMPLE_INTERVAL)
+                running_editors[0] += 1
+
+        def release_editor():
+            if editor_limit is None:
+                return
+            with running_editors_changed:
+                running_editors[0] -= 1
+                running_editors_changed.notify_all()
+
+        def sample_editors():
+            last_limit = None
+            while not done.wait(self._ADAPTIVE_SAMPLE_INTERVAL):
+                editor_limit.sample()
+                limit = editor_limit.get_limit()
+                if limit != last_limit:
+                    logger.info(f"{runner_name} runs up to {limit} editor(s), the peak editor memory is "
+                                f"{editor_limit.peak_editor_rss / (1024 * 1024):.0f} MB")
+                    last_limit = limit
+
+        def make_func(slot_timing):
+            def run():
+                while True:
+                    acquire_editor()
+                    try:
+                        index, (test_names, work_item) = work_queue.get_nowait()
+                    except queue.Empty:
+                        release_editor()
+                        return
+                    # Duplicate the editor using the one coming from the fixture, as each run adds its arguments
+                    cur_editor = editor.__class__(workspace, editor.args.copy())
+                    start_time = time.monotonic()
+                    results = None
+                    try:
+                        results = run_work_item(cur_editor, slot_timing.slot, work_item)
+                    except Exception:  # Intentionally broad, the slot moves on to the next item
+                        logger.exception(f"Unexpected error running {test_names} in {runner_name}")
+                    finally:
+                        duration = time.monotonic() - start_time
+                        timed_results[index] = (results, duration)
+                        slot_timing.runs.append((test_names, duration))
+                        release_editor()
+            return run
+
+        start_time = time.monotonic()
+        slot_timings = [EditorTestSuite.SlotTiming(runner_name, i + 1)
+                        for i in range(min(num_slots, len(work_items)))]
+        threads = []
+        for slot_timing in slot_timings:
+            t = threading.Thread(target=make_func(slot_timing))
+            t.start()
+            threads.append(t)
+        sampler = None
+        if editor_limit is not None:
+            sampler = threading.Thread(target=sample_editors, daemon=True)
+            sampler.start()
+
+        for t in threads:
+            t.join()
+        done.set()
+        if sampler is not None:
+            sampler.join()
+
+        total_secs = time.monotonic() - start_time
+        for slot_timing in slot_timings:
+            slot_timing.total_secs = total_secs
+            logger.info(str(slot_timing))
+        editor_test_data.slot_timings.extend(slot_timings)
+        return timed_results
+
+    def _update_parallel_results(self, workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
+                                 editor_test_data: TestData, test_spec_list: list[EditorSharedTest],
+                                 timed_results: list) -> None:
+        """
+        Stores the results of a parallel run, adding an Unknown result for every test which did not report one, and
+        records the duration of the tests which completed
+        :workspace: The LyTestTools Workspace object
+        :editor_test_data: The TestData from calling editor_test_data()
+        :test_spec_list: A list of EditorSharedTest tests which were run
+        :timed_results: A list with the (result dict, duration in seconds) of each editor run
+        :return: None
+        """
+        self._save_test_durations(workspace, timed_results)
+
+        save_asset_logs = False
+        for results, _ in timed_results:
+            if results is None:
+                logger.error("Unexpectedly found no test run in the editor log during a parallel run")
+                logger.debug(f"Results from parallel run:\n{timed_results}")
+                continue
+            editor_test_data.results.update(results)
+            if any(not isinstance(result, Result.Pass) for result in results.values()):
+                save_asset_logs = True
+
+        for test_spec in test_spec_list:
+            if test_spec.__name__ not in editor_test_data.results:
+                editor_test_data.results[test_spec.__name__] = Result.Unknown(
+                    test_spec=test_spec,
+                    extra_info="Unexpectedly found no test run information on stdout in the editor log")
+                save_asset_logs = True
+
+        # If at least one test did not pass, save assets with errors and warnings
+        if save_asset_logs:
+            editor_utils.save_failed_asset_joblogs(workspace)
+
     def _run_parallel_tests(self, request: _pytest.fixtures.FixtureRequest,
                             workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
                             editor: ly_test_tools.launchers.platforms.base.Launcher, editor_test_data: TestData,
                             test_spec_list: list[EditorSharedTest], extra_cmdline_args: list[str] = None) -> None:
         """
-        Runs multiple editors with one test on each editor (multiple editor, one test each)
+        Runs multiple editors with one test on each editor (multiple editor, one test each).
+        Each editor slot starts the next test as soon as its previous test completes
         :request: The Pytest Request
         :workspace: The LyTestTools Workspace object
         :editor: The LyTestTools Editor object
@@ -1046,58 +1457,39 @@ class EditorTestSuite:
             return
 
         self._setup_editor_test(editor, workspace, editor_test_data)
-        parallel_editors = self._get_number_parallel_editors(request)
+        editor_limit = self._get_adaptive_editor_limit(request)
+        if editor_limit is not None:
+            parallel_editors = editor_limit.max_editors
+        else:
+            parallel_editors = self._get_number_parallel_editors(request)
         assert parallel_editors > 0, "Must have at least one editor"
-        
-        # If there are more tests than max parallel editors, we will split them into multiple consecutive runs
-        num_iterations = int(math.ceil(len(test_spec_list) / parallel_editors))
-        for iteration in range(num_iterations):
-            tests_for_iteration = test_spec_list[iteration*parallel_editors:(iteration+1)*parallel_editors]
-            total_threads = len(tests_for_iteration)
-            threads = []
-            results_per_thread = [None] * total_threads
-            for i in range(total_threads):
-                def make_func(test_spec, index, my_editor):
-                    def run(request, workspace, extra_cmdline_args):
-                        results = self._exec_editor_test(request, workspace, my_editor, index+1, f"editor_test.log",
-                                                         test_spec, extra_cmdline_args)
-                        assert results is not None
-                        results_per_thread[index] = results
-                    return run
-
-                # Duplicate the editor using the one coming from the fixture
-                cur_editor = editor.__class__(workspace, editor.args.copy())
-                f = make_func(tests_for_iteration[i], i, cur_editor)
-                t = threading.Thread(target=f, args=(request, workspace, extra_cmdline_args))
-                t.start()
-                threads.append(t)
-
-            for t in threads:
-                t.join()
-
-            save_asset_logs = False
-
-            for result in results_per_thread:
-                if result is None:
-                    logger.error("Unexpectedly found no test run in the editor log during EditorParallelTest")
-                    logger.debug(f"Results from EditorParallelTest thread:\n{results_per_thread}")
-                    result = {"Unknown":
-                              Result.Unknown(
-                                  test_spec=EditorParallelTest,
-                                  extra_info="Unexpectedly found no test run information on stdout in the editor log")}
-                editor_test_data.results.update(result)
-                if not isinstance(result, Result.Pass):
-                    save_asset_logs = True
-            # If at least one test did not pass, save assets with errors and warnings
-            if save_asset_logs:
-                editor_utils.save_failed_asset_joblogs(workspace)
+
+        def run_test(cur_editor, run_id, test_spec):
+            if editor_test_data.use_warm_editor_pool:
+                return self._exec_warm_editor_tests(workspace, cur_editor, editor_test_data, run_id, f"editor_test.log",
+                                                    [test_spec], extra_cmdline_args)
+            results = self._exec_editor_test(request, workspace, cur_editor, run_id, f"editor_test.log",
+                                             test_spec, extra_cmdline_args)
+            assert results is not None
+            return results
+
+        # Start the longest tests first, so that the editor slots finish at about the same time
+        estimates = self._get_test_duration_estimates(workspace, editor_test_data, test_spec_list)
+        ordered_test_specs = [test_spec for _, test_spec in
+                              sorted(zip(estimates, test_spec_list), key=lambda pair: pair[0], reverse=True)]
+        work_items = [([test_spec.__name__], test_spec) for test_spec in ordered_test_specs]
+        timed_results = self._run_work_queue(workspace, editor, editor_test_data, "run_parallel_tests",
+                                             work_items, parallel_editors, run_test, editor_limit)
+        self._update_parallel_results(workspace, editor_test_data, test_spec_list, timed_results)
 
     def _run_parallel_batched_tests(self, request: _pytest.fixtures.FixtureRequest,
                                     workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
                                     editor: ly_test_tools.launchers.platforms.base.Launcher, editor_test_data: TestData,
                                     test_spec_list: list[EditorSharedTest], extra_cmdline_args: list[str] = None) -> None:
         """
-        Runs multiple editors with a batch of tests for each editor (multiple editor, multiple tests each)
+        Runs multiple editors with a batch of tests for each editor (multiple editor, multiple tests each).
+        The tests are split into batches_per_parallel_editor batches per editor, with about the same expected duration
+        each, and each editor slot starts the next batch as soon as its previous batch completes
         :request: The Pytest Request
         :workspace: The LyTestTools Workspace object
         :editor: The LyTestTools Editor object
@@ -1113,52 +1505,82 @@ class EditorTestSuite:
             return
 
         self._setup_editor_test(editor, workspace, editor_test_data)
-        total_threads = self._get_number_parallel_editors(request)
-        assert total_threads > 0, "Must have at least one editor"
-        threads = []
-        tests_per_editor = int(math.ceil(len(test_spec_list) / total_threads))
-        results_per_thread = [None] * total_threads
-        for i in range(total_threads):
-            tests_for_thread = test_spec_list[i*tests_per_editor:(i+1)*tests_per_editor]
+        editor_limit = self._get_adaptive_editor_limit(request)
+        if editor_limit is not None:
+            parallel_editors = editor_limit.max_editors
+        else:
+            parallel_editors = self._get_number_parallel_editors(request)
+        assert parallel_editors > 0, "Must have at least one editor"
 
-            def make_func(test_spec_list_for_editor, index, my_editor):
-                def run(request, workspace, extra_cmdline_args):
-                    results = None
-                    if len(test_spec_list_for_editor) > 0:
-                        results = self._exec_editor_multitest(request, workspace, my_editor, index+1,
-                                                              f"editor_test.log", test_spec_list_for_editor,
-                                                              extra_cmdline_args)
-                        assert results is not None
-                    else:
-                        results = {}
-                    results_per_thread[index] = results
-                return run
-
-            # Duplicate the editor using the one coming from the fixture
-            cur_editor = editor.__class__(workspace, editor.args.copy())
-            f = make_func(tests_for_thread, i, cur_editor)
-            t = threading.Thread(target=f, args=(request, workspace, extra_cmdline_args))
-            t.start()
-            threads.append(t)
+        def run_batch(cur_editor, run_id, test_spec_list_for_editor):
+            if editor_test_data.use_warm_editor_pool:
+                return self._exec_warm_editor_tests(workspace, cur_editor, editor_test_data, run_id, f"editor_test.log",
+                                                    test_spec_list_for_editor, extra_cmdline_args)
+            results = self._exec_editor_multitest(request, workspace, cur_editor, run_id, f"editor_test.log",
+                                                  test_spec_list_for_editor, extra_cmdline_args)
+            assert results is not None
+            return results
+
+        num_batches = min(len(test_spec_list), parallel_editors * max(1, self.batches_per_parallel_editor))
+        estimates = self._get_test_duration_estimates(workspace, editor_test_data, test_spec_list)
+        # The batches come from the longest to the shortest, so the longest batches are started first
+        batches = editor_utils.split_longest_processing_time_first(test_spec_list, estimates, num_batches)
+        work_items = [([test_spec.__name__ for test_spec in batch], batch) for batch in batches]
+        timed_results = self._run_work_queue(workspace, editor, editor_test_data, "run_parallel_batched_tests",
+                                             work_items, parallel_editors, run_batch, editor_limit)
+        self._update_parallel_results(workspace, editor_test_data, test_spec_list, timed_results)
 
-        for t in threads:
-            t.join()
+    @staticmethod
+    def _get_test_duration_key(test_spec: EditorTestBase) -> str:
+        """
+        :test_spec: The test class
+        :return: The name of the test in the duration history, which includes the name of its suite
+        """
+        return getattr(test_spec, "__qualname__", test_spec.__name__)
 
-        save_asset_logs = False
-        for result in results_per_thread:
-            if result is None:
-                logger.error("Unexpectedly found no test run in the editor log during EditorSharedTest")
-                logger.debug(f"Results from EditorSharedTest thread:\n{results_per_thread}")
-                result = {"Unknown":
-                          Result.Unknown(
-                              test_spec=EditorSharedTest,
-                              extra_info="Unexpectedly found no test run information on stdout in the editor log")}
-            editor_test_data.results.update(result)
-            if not isinstance(result, Result.Pass):
-                save_asset_logs = True
-        # If at least one test did not pass, save assets with errors and warnings
-        if save_asset_logs:
-            editor_utils.save_failed_asset_joblogs(workspace)
+    def _get_test_duration_estimates(self, workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
+                                     editor_test_data: TestData, test_spec_list: list[EditorTestBase]) -> list[float]:
+        """
+        Retrieves the expected duration of each test from the durations recorded by previous runs
+        :workspace: The LyTestTools Workspace object
+        :editor_test_data: The TestData from calling editor_test_data(), which holds the loaded duration history
+        :test_spec_list: A list of tests
+        :return: The expected duration of each test in seconds, default_test_duration_estimate for a test without history
+        """
+        if editor_test_data.test_duration_history is None:
+            editor_test_data.test_duration_history = editor_utils.load_test_duration_history(
+                editor_utils.get_test_duration_history_path(workspace))
+        return [editor_utils.estimate_test_duration(editor_test_data.test_duration_history,
+                                                    self._get_test_duration_key(test_spec),
+                                                    self.default_test_duration_estimate)
+                for test_spec in test_spec_list]
+
+    def _save_test_durations(self, workspace: ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager,
+                             timed_results: list) -> None:
+        """
+        Adds the duration of the tests to the duration history. The duration of each test is the one reported by the
+        editor in its result. An editor run with a single test can also be timed as a whole, while the other tests
+        which didn't report their duration are not saved and keep being estimated from default_test_duration_estimate
+        :workspace: The LyTestTools Workspace object
+        :timed_results: A list with the (result dict, duration in seconds) of each editor run
+        :return: None
+        """
+        test_durations = {}
+        for results, duration in timed_results:
+            if not results:
+                continue
+            for result in results.values():
+                if isinstance(result, (Result.Pass, Result.Fail)) and result.duration is not None:
+                    test_duration = result.duration
+                elif len(results) == 1 and isinstance(result, (Result.Pass, Result.Fail, Result.Timeout)):
+                    test_duration = duration
+                else:
+                    continue
+                test_durations[self._get_test_duration_key(result.test_spec)] = test_duration
+
+        if test_durations:
+            editor_utils.save_test_durations(editor_utils.get_test_duration_history_path(workspace),
+                                             test_durations)
 
     def _get_number_parallel_editors(self, request: _pytest.fixtures.FixtureRequest) -> int:
         """
@@ -1171,3 +1593,20 @@ class EditorTestSuite:
             return int(parallel_editors_value)
 
         return self.get_number_parallel_editors()
+
+    def _get_adaptive_editor_limit(self, request: _pytest.fixtures.FixtureRequest) -> AdaptiveEditorLimit | None:
+        """
+        Creates the limit of the adaptive editor pool if it is enabled. The pool is sized from the logical cores, with
+        adaptive_editor_cores for each editor, and --editors-parallel is the maximum if set
+        :request: The Pytest Request
+        :return: The AdaptiveEditorLimit, or None if the number of parallel editors is fixed
+        """
+        if not (request.config.getoption("--editors-parallel-adaptive", False) or self.adaptive_parallel_editors):
+            return None
+
+        max_editors = (psutil.cpu_count() or 1) // max(1, self.adaptive_editor_cores)
+        parallel_editors_value = request.config.getoption("--editors-parallel", None)
+        if parallel_editors_value:
+            max_editors = min(max_editors, int(parallel_editors_value))
+        return EditorTestSuite.AdaptiveEditorLimit(max_editors, self.adaptive_editor_memory_ceiling,
+                                                   self.adaptive_editor_default_rss_mb * 1024 * 1024)
@@ -7,16 +7,25 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 Utility functions mostly for the editor_test module. They can also be used for assisting Editor tests.
 """
 from __future__ import annotations
+import heapq
+import json
 import os
 import time
 import logging
 import re
 
+import ly_test_tools.environment.file_system as file_system
 import ly_test_tools.environment.process_utils as process_utils
 import ly_test_tools.environment.waiter as waiter
+import ly_test_tools.log.log_tailer as log_tailer
 
 logger = logging.getLogger(__name__)
 
+# Name of the file which keeps the wall-clock duration of the recent runs of each editor test
+TEST_DURATION_HISTORY_FILENAME = "editor_test_durations.json"
+# Number of recent durations kept for each test, the estimated duration of a test is their mean
+TEST_DURATION_HISTORY_SIZE = 5
+
 def kill_all_ly_processes(include_asset_processor: bool = True) -> None:
     """
     Kills all common O3DE processes such as the Editor, Game Launchers, and optionally Asset Processor. Defaults to
@@ -134,6 +143,20 @@ def retrieve_editor_log_content(run_id: int, log_name: str, workspace: AbstractW
         editor_info = f"-- Error reading {log_name}: {str(ex)} --"
     return editor_info
 
+def subscribe_editor_log(run_id: int, log_name: str, workspace: AbstractWorkspaceManager,
+                         callback: callable) -> log_tailer.LogSubscription:
+    """
+    Subscribes to the lines added to the given editor log file. The log is read once for all of its subscribers, so
+    following a log which keeps growing doesn't read it again from the start.
+    :param run_id: editor id that will be used for differentiating paths
+    :param log_name: The name of the editor log to follow
+    :param workspace: Workspace fixture
+    :param callback: Function called with every new line of the log
+    :return: The subscription, which must be closed when done with the log
+    """
+    editor_log = os.path.join(retrieve_log_path(run_id, workspace), log_name)
+    return log_tailer.subscribe(editor_log, callback)
+
 def retrieve_last_run_test_index_from_output(test_spec_list: list[EditorTestBase], output: str) -> int:
     """
     Finds out what was the last test that was run by inspecting the input.
@@ -194,3 +217,109 @@ def _check_log_errors_warnings(log_path: str) -> bool:
     if regex_match is None or (int)(regex_match.group(1)) != 0 or (int)(regex_match.group(2)) != 0:
         return True
     return False
+
+def get_test_duration_history_path(workspace: AbstractWorkspaceManager) -> str | None:
+    """
+    return the path of the test duration history file. The file is kept in the TestResults folder that contains the
+    timestamped artifact folder of each run, so that it persists between runs. If the artifact folder is not within a
+    TestResults folder the file is kept in the artifact folder itself.
+    :param workspace: The workspace which holds the artifact manager
+    :return str: The path to the history file, or None if the workspace does not save artifacts
+    """
+    artifact_path = getattr(workspace.artifact_manager, "artifact_path", None)
+    if not isinstance(artifact_path, str):
+        return None
+
+    artifact_path = os.path.abspath(artifact_path)
+    history_folder = artifact_path
+    while True:
+        if os.path.basename(history_folder) == "TestResults":
+            break
+        parent_folder = os.path.dirname(history_folder)
+        if parent_folder == history_folder:
+            history_folder = artifact_path
+            break
+        history_folder = parent_folder
+    return os.path.join(history_folder, TEST_DURATION_HISTORY_FILENAME)
+
+def load_test_duration_history(history_path: str | None) -> dict[str, list[float]]:
+    """
+    Loads the recent durations of each test from the history file
+    :param history_path: Path to the history file
+    :return dict: Test name to a list of its most recent wall-clock durations in seconds, oldest first
+    """
+    if not history_path or not os.path.isfile(history_path):
+        return {}
+    try:
+        with open(history_path, "r") as history_file:
+            history = json.load(history_file)
+        return {test_name: [float(duration) for duration in durations]
+                for test_name, durations in history.get("tests", {}).items()}
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring the invalid test duration history at {history_path}: {e}")
+        return {}
+
+def save_test_durations(history_path: str | None, test_durations: dict[str, float]) -> None:
+    """
+    Adds the durations of a run to the history file. The history file is locked while it is read again, merged
+    and written, so that the durations saved by other test suites at the same time are kept
+    :param history_path: Path to the history file
+    :param test_durations: Test name to its wall-clock duration in seconds
+    :return: None
+    """
+    if not history_path or not test_durations:
+        return
+
+    temp_history_path = f"{history_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(history_path), exist_ok=True)
+        # The lock is taken on a separate file, as the history itself is replaced rather than written in place
+        with open(f"{history_path}.lock", "a+b") as lock_file, file_system.exclusive_file_lock(lock_file):
+            history = load_test_duration_history(history_path)
+            for test_name, duration in test_durations.items():
+                durations = history.setdefault(test_name, [])
+                durations.append(round(duration, 3))
+                del durations[:-TEST_DURATION_HISTORY_SIZE]
+
+            # Write to a temporary file which replaces the history, so a reader never sees a partially written file
+            with open(temp_history_path, "w") as history_file:
+                json.dump({"tests": history}, history_file, indent=4, sort_keys=True)
+            os.replace(temp_history_path, history_path)
+    except OSError as e:
+        logger.warning(f"Could not save the test duration history to {history_path}: {e}")
+
+def estimate_test_duration(history: dict[str, list[float]], test_name: str, default_duration: float) -> float:
+    """
+    return the expected duration of a test from its recent durations
+    :param history: Test name to a list of its most recent durations, from load_test_duration_history()
+    :param test_name: The name of the test
+    :param default_duration: The duration to expect from a test without history
+    :return float: The mean of the recent durations of the test, or the default duration
+    """
+    durations = history.get(test_name)
+    if not durations:
+        return default_duration
+    return sum(durations) / len(durations)
+
+def split_longest_processing_time_first(items: list, durations: list[float], num_bins: int) -> list[list]:
+    """
+    Splits the items into bins with about the same total duration, using longest-processing-time-first packing:
+    the items are taken from the longest to the shortest and each is added to the bin with the lowest total so far
+    :param items: The items to split
+    :param durations: The expected duration of each item
+    :param num_bins: The maximum number of bins
+    :return list: The non empty bins from the longest total duration to the shortest, each keeps the original order
+        of its items
+    """
+    num_bins = max(1, min(num_bins, len(items)))
+    bins = [[] for _ in range(num_bins)]
+    totals = [(0.0, index) for index in range(num_bins)]
+    for item_index in sorted(range(len(items)), key=lambda index: durations[index], reverse=True):
+        total, bin_index = heapq.heappop(totals)
+        bins[bin_index].append(item_index)
+        heapq.heappush(totals, (total + durations[item_index], bin_index))
+
+    bin_totals = {bin_index: total for total, bin_index in totals}
+    ordered_bins = sorted(range(num_bins), key=lambda bin_index: bin_totals[bin_index], reverse=True)
+    return [[items[item_index] for item_index in sorted(bins[bin_index])] for bin_index in ordered_bins
+            if bins[bin_index]]
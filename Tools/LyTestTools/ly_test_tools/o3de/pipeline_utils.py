@@ -25,7 +25,7 @@ from typing import Dict, List, Tuple, Optional, Callable
 # Import LyTestTools
 import ly_test_tools.environment.file_system as fs
 import ly_test_tools.environment.process_utils as process_utils
-from ly_test_tools.o3de.ap_log_parser import APLogParser
+from ly_test_tools.o3de.ap_log_parser import StreamingAPLogParser
 
 logger = logging.getLogger(__name__)
 
@@ -479,7 +479,8 @@ def validate_log_messages(
     """
 
     # Search the log lines in the latest log run
-    validate_log_output(APLogParser(log_file).runs[-1]["Lines"], expected_queries, unexpected_queries)
+    validate_log_output(StreamingAPLogParser(log_file, final=True).runs[-1]["Lines"],
+                        expected_queries, unexpected_queries)
 
 
 def validate_relocation_report(
@@ -502,7 +503,7 @@ def validate_relocation_report(
     in_relocation_report = False
 
     # Search the log lines which appear between opening and closing RELOCATION REPORT lines in the latest log run
-    for line in APLogParser(log_file).runs[-1]["Lines"]:
+    for line in StreamingAPLogParser(log_file, final=True).runs[-1]["Lines"]:
         if "RELOCATION REPORT" in line:
             in_relocation_report = not in_relocation_report
             continue  # Go to next log line
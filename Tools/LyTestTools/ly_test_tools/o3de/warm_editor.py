@@ -0,0 +1,132 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+A warm editor is an Editor which is started once and runs many test modules, so the editor start-up cost is paid once.
+The editor runs warm_editor_server.py, which reads the test modules to run from json files in a control folder and
+writes back a json file with the result of each test.
+"""
+from __future__ import annotations
+import json
+import logging
+import os
+import shutil
+import time
+
+from ly_test_tools.launchers.exceptions import WaitTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# Script run by the editor, which runs the tests sent over the control folder
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "warm_editor_server.py")
+
+# The names of the control files must match warm_editor_server.py
+READY_FILENAME = "ready.json"
+QUIT_FILENAME = "quit.json"
+TEST_FILENAME = "test_{}.json"
+RESULT_FILENAME = "result_{}.json"
+
+# Time (seconds) between checks of the control folder
+POLL_INTERVAL = 0.1
+
+
+class WarmEditor(object):
+    """
+    Runs test modules one after the other in the same Editor process
+    """
+
+    def __init__(self, editor: ly_test_tools.launchers.platforms.base.Launcher, control_folder: str):
+        """
+        :param editor: The LyTestTools Editor object to run, it must not be started yet
+        :param control_folder: The folder used to send the tests to the editor, it is emptied when the editor starts
+        """
+        self.editor = editor
+        self.control_folder = control_folder
+        self.tests_run = 0  # Number of tests sent to the editor
+        self.cmdline_args = []  # Command line arguments the editor was started with, besides the server script
+        self._next_test_id = 1
+
+    def _write_json(self, filename: str, data: dict) -> None:
+        # Replace the file at once, so the editor never reads a partially written file
+        path = os.path.join(self.control_folder, filename)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as json_file:
+            json.dump(data, json_file)
+        os.replace(temp_path, path)
+
+    def _read_json(self, filename: str) -> dict | None:
+        path = os.path.join(self.control_folder, filename)
+        if not os.path.isfile(path):
+            return None
+        with open(path, "r") as json_file:
+            return json.load(json_file)
+
+    def is_alive(self) -> bool:
+        return self.editor.is_alive()
+
+    def start(self, cmdline_args: list[str], timeout: float) -> bool:
+        """
+        Starts the editor and waits for it to be ready to run tests
+        :param cmdline_args: The command line arguments of the editor
+        :param timeout: The maximum time (seconds) to wait for the editor to be ready
+        :return: True if the editor is ready, False if it exited or was stopped after the timeout
+        """
+        if os.path.exists(self.control_folder):
+            shutil.rmtree(self.control_folder)
+        os.makedirs(self.control_folder)
+
+        self.cmdline_args = list(cmdline_args)
+        self.editor.args.extend(["--runpythontest", SERVER_SCRIPT, "--runpythonargs", self.control_folder] +
+                                cmdline_args)
+        self.editor.start(backupFiles=False, launch_ap=False, configure_settings=False)
+
+        timeout_end = time.monotonic() + timeout
+        while self._read_json(READY_FILENAME) is None:
+            if not self.editor.is_alive():
+                logger.warning(f"Warm editor exited during start-up with return code {self.editor.get_returncode()}")
+                return False
+            if time.monotonic() > timeout_end:
+                logger.warning(f"Warm editor was not ready after {timeout}s, stopping it")
+                self.editor.stop()
+                return False
+            time.sleep(POLL_INTERVAL)
+        return True
+
+    def run_test(self, test_module_path: str, timeout: float) -> bool | None:
+        """
+        Runs a test module in the editor and waits for it to complete
+        :param test_module_path: Path to the test module
+        :param timeout: The maximum time (seconds) to wait for the test
+        :return: True if the test module ran without raising an exception, False if it raised, or None if the editor
+            exited during the test
+        """
+        test_id = self._next_test_id
+        self._next_test_id += 1
+        self.tests_run += 1
+        self._write_json(TEST_FILENAME.format(test_id), {"id": test_id, "test_module": test_module_path})
+
+        timeout_end = time.monotonic() + timeout
+        while True:
+            result = self._read_json(RESULT_FILENAME.format(test_id))
+            if result is not None:
+                return result["success"]
+            if not self.editor.is_alive():
+                return None
+            if time.monotonic() > timeout_end:
+                raise WaitTimeoutError(f"Test {test_module_path} did not complete in the warm editor after {timeout}s")
+            time.sleep(POLL_INTERVAL)
+
+    def stop(self, timeout: float = 30) -> None:
+        """
+        Asks the editor to exit, and stops it if it is still running after the timeout
+        :param timeout: The maximum time (seconds) to wait for the editor to exit
+        """
+        if self.editor.is_alive():
+            try:
+                self._write_json(QUIT_FILENAME, {})
+                self.editor.wait(timeout)
+            except (OSError, WaitTimeoutError):
+                logger.warning(f"Warm editor did not exit after {timeout}s, stopping it")
+        self.editor.stop()
@@ -0,0 +1,103 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Control loop of a warm editor, see ly_test_tools.o3de.warm_editor. The editor runs this script with --runpythontest and
+the path of the control folder as its only argument. The script waits for test modules written to the control folder
+and runs them one after the other in the same editor, resetting the python state and leaving game mode between tests.
+
+This script runs in the Editor python, so it can only depend on the standard library and azlmbr.
+"""
+import gc
+import json
+import os
+import runpy
+import sys
+import traceback
+
+import azlmbr.legacy.general as general
+
+# The names of the control files must match ly_test_tools.o3de.warm_editor
+READY_FILENAME = "ready.json"
+QUIT_FILENAME = "quit.json"
+TEST_FILENAME = "test_{}.json"
+RESULT_FILENAME = "result_{}.json"
+
+# Time (seconds) the editor idles between checks of the control folder
+POLL_INTERVAL = 0.1
+
+
+def _write_json(path, data):
+    # Replace the file at once, so the test runner never reads a partially written file
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as json_file:
+        json.dump(data, json_file)
+    os.replace(temp_path, path)
+
+
+def _run_test_module(test_module_path):
+    """
+    Runs a test module as the main module, like the editor does with --runpythontest
+    :param test_module_path: Path to the test module
+    :return: True if the test module ran without raising an exception
+    """
+    sys.argv[:] = [test_module_path]
+    sys.path.insert(0, os.path.dirname(test_module_path))
+    try:
+        runpy.run_path(test_module_path, run_name="__main__")
+    except SystemExit as e:
+        return e.code in (None, 0)
+    except Exception:  # Intentionally broad, a failed test must not stop the warm editor
+        traceback.print_exc()
+        return False
+    return True
+
+
+def _reset_state(modules, path, argv, cwd):
+    """
+    Restores the python state recorded before the first test and leaves game mode, so a test is not affected by the
+    tests that ran before it in the same editor
+    """
+    if general.is_in_game_mode():
+        general.exit_game_mode()
+        general.idle_wait_frames(1)
+
+    # The modules imported by the test are imported again by the next test, the azlmbr bindings are kept
+    for module_name in list(sys.modules):
+        if module_name not in modules and not module_name.startswith("azlmbr"):
+            del sys.modules[module_name]
+    sys.path[:] = path
+    sys.argv[:] = argv
+    os.chdir(cwd)
+    gc.collect()
+
+
+def main(control_folder):
+    modules = set(sys.modules)
+    path = list(sys.path)
+    argv = list(sys.argv)
+    cwd = os.getcwd()
+
+    _write_json(os.path.join(control_folder, READY_FILENAME), {"pid": os.getpid()})
+    test_id = 1
+    while True:
+        test_path = os.path.join(control_folder, TEST_FILENAME.format(test_id))
+        if os.path.exists(test_path):
+            with open(test_path, "r") as test_file:
+                test = json.load(test_file)
+            success = _run_test_module(test["test_module"])
+            _reset_state(modules, path, argv, cwd)
+            _write_json(os.path.join(control_folder, RESULT_FILENAME.format(test_id)),
+                        {"id": test_id, "success": success})
+            test_id += 1
+        elif os.path.exists(os.path.join(control_folder, QUIT_FILENAME)):
+            return
+        else:
+            # Idle instead of sleeping, so the editor keeps processing its events
+            general.idle_wait(POLL_INTERVAL)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
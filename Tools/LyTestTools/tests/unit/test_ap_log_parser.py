@@ -0,0 +1,122 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.o3de.ap_log_parser
+"""
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from ly_test_tools.o3de.ap_log_parser import APLogParser, StreamingAPLogParser
+
+pytestmark = pytest.mark.SUITE_smoke
+
+FIRST_RUN = (
+    "~~1000~~1~~0000000000002540~~none~~AzFramework File Logging New Run Started\n"
+    "~~1001~~1~~0000000000002540~~none~~[Time] Started\n"
+    "~~1002~~1~~0000000000002540~~AssetProcessor~~Control Port: 45643\n"
+    "~~1003~~2~~0000000000002540~~AssetProcessor~~Warning: slow scan\n"
+    "continuation of the previous line\n"
+    "~~1004~~1~~0000000000002540~~AssetProcessor~~Number of Assets Successfully Processed: 12.\n"
+)
+SECOND_RUN = (
+    "~~2000~~1~~0000000000002540~~none~~AzFramework File Logging New Run Started\n"
+    "~~2001~~1~~0000000000002540~~none~~[Time] Started\n"
+    "~~2002~~1~~0000000000002540~~AssetProcessor~~Control Port: 45645\n"
+    "~~2003~~3~~0000000000002540~~AssetProcessor~~Error: failed to process asset.fbx\n"
+    "~~2004~~1~~0000000000002540~~AssetProcessor~~Total Assets Processing Time: 1.5s\n"
+)
+
+
+class TestStreamingAPLogParser(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, "AP_GUI.log")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_log(self, content, mode='a'):
+        with open(self.log_path, mode, newline='') as log:
+            log.write(content)
+
+    def test_Runs_ManyRuns_MatchesAPLogParser(self):
+        self.write_log(FIRST_RUN + SECOND_RUN)
+
+        under_test = StreamingAPLogParser(self.log_path)
+        expected_runs = APLogParser(self.log_path).runs
+
+        assert under_test.log_type == "GUI"
+        assert len(under_test.runs) == len(expected_runs) == 2
+        assert list(under_test.runs) == expected_runs
+        assert under_test.runs[-1]["Time"] == 1.5
+
+    def test_GetLines_ContainsRegexAndLineType_FiltersLines(self):
+        self.write_log(FIRST_RUN + SECOND_RUN)
+
+        under_test = StreamingAPLogParser(self.log_path)
+
+        assert list(under_test.get_lines(run=None, contains="Control Port")) == \
+            list(APLogParser(self.log_path).get_lines(run=None, contains="Control Port"))
+        assert [match.group(1) for match in under_test.get_lines(run=0, regex=r"AssetProcessor~~(\w+)")] == \
+            ["Control", "Warning", "Number"]
+        assert list(under_test.get_lines(run=None, line_type=StreamingAPLogParser.LINE_TYPE_ERROR)) == \
+            ["AssetProcessor~~Error: failed to process asset.fbx"]
+        assert under_test.count_lines(run=0, line_type=StreamingAPLogParser.LINE_TYPE_WARNING) == 1
+        assert under_test.count_lines(run=None, line_type=StreamingAPLogParser.LINE_TYPE_INFO) == 4
+
+    def test_Update_LogGrows_IndexesNewLinesAndRuns(self):
+        self.write_log(FIRST_RUN + SECOND_RUN[:100])
+        under_test = StreamingAPLogParser(self.log_path)
+        assert len(under_test.runs) == 1
+        assert under_test.get_port("Control Port") == 45643
+
+        self.write_log(SECOND_RUN[100:])
+        assert under_test.update() == 3
+
+        assert len(under_test.runs) == 2
+        assert under_test.get_port("Control Port") == 45645
+        assert under_test.get_port("Listening Port") is None
+        assert list(under_test.runs) == APLogParser(self.log_path).runs
+
+    def test_Update_LogReplaced_IndexesFromStart(self):
+        self.write_log(FIRST_RUN + SECOND_RUN)
+        under_test = StreamingAPLogParser(self.log_path)
+        assert len(under_test.runs) == 2
+
+        self.write_log(SECOND_RUN, mode='w')
+        under_test.update()
+
+        assert len(under_test.runs) == 1
+        assert under_test.runs[0]["Lines"] == APLogParser(self.log_path).runs[0]["Lines"]
+
+    def test_Runs_LogNotFound_NoRuns(self):
+        under_test = StreamingAPLogParser(self.log_path)
+
+        assert len(under_test.runs) == 0
+        assert under_test.get_port("Control Port") is None
+
+    def test_Update_FinalLineWithoutNewline_IndexedOnlyWhenFinal(self):
+        self.write_log(FIRST_RUN + SECOND_RUN.rstrip("\n"))
+
+        under_test = StreamingAPLogParser(self.log_path)
+        assert under_test.runs[-1]["Time"] is None
+        assert under_test.update(final=True) == 1
+
+        assert list(under_test.runs) == APLogParser(self.log_path).runs
+        assert list(StreamingAPLogParser(self.log_path, final=True).runs) == APLogParser(self.log_path).runs
+
+    def test_GetLinesReversed_LastRun_ReturnsLinesAndTimestampsFromTheEnd(self):
+        self.write_log(FIRST_RUN + SECOND_RUN)
+
+        under_test = StreamingAPLogParser(self.log_path)
+        expected_run = APLogParser(self.log_path).runs[-1]
+
+        assert list(under_test.get_lines_reversed(run=-1)) == \
+            list(zip(reversed(expected_run["Lines"]), reversed(expected_run["Timestamps"])))
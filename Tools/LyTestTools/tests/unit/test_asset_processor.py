@@ -14,6 +14,7 @@ import pytest
 
 import ly_test_tools._internal.managers.workspace
 import ly_test_tools._internal.managers.abstract_resource_locator
+import ly_test_tools.log.log_tailer
 import ly_test_tools.o3de.asset_processor
 
 pytestmark = pytest.mark.SUITE_smoke
@@ -193,3 +194,45 @@ class TestAssetProcessor(object):
 
         mock_stop.assert_called()
         mock_restore_ap.assert_called()
+
+    # os.path.abspath is patched for the class, so isolate the tailers which are keyed by the absolute log path
+    @mock.patch.dict(ly_test_tools.log.log_tailer.LogTailer._tailers, clear=True)
+    @mock.patch('ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager')
+    def test_ReadPortFromLog_ManyRuns_ReadsPortOfLastRun(self, mock_workspace, tmp_path):
+        ap_gui_log = tmp_path / "AP_GUI.log"
+        ap_gui_log.write_text(
+            "~~1581617216532~~1~~0000000000002540~~none~~AzFramework File Logging New Run\n"
+            "~~1581617216533~~1~~0000000000002540~~AssetProcessor~~Control Port: 45643\n"
+            "~~1581617216534~~1~~0000000000002540~~none~~AzFramework File Logging New Run\n"
+            "~~1581617216535~~1~~0000000000002540~~AssetProcessor~~Listening Port: 45644\n"
+            "~~1581617216536~~1~~0000000000002540~~AssetProcessor~~Control Port: 45645\n")
+        mock_workspace.paths.ap_gui_log.return_value = str(ap_gui_log)
+        under_test = ly_test_tools.o3de.asset_processor.AssetProcessor(mock_workspace)
+
+        assert under_test.read_port_from_log("Control Port") == 45645
+        assert under_test.read_port_from_log("Listening Port") == 45644
+
+    # os.path.abspath is patched for the class, so isolate the tailers which are keyed by the absolute log path
+    @mock.patch.dict(ly_test_tools.log.log_tailer.LogTailer._tailers, clear=True)
+    @mock.patch('ly_test_tools._internal.managers.workspace.AbstractWorkspaceManager')
+    def test_ReadPortFromLog_ManyReads_ReadsLogOnceUntilStopped(self, mock_workspace, tmp_path):
+        ap_gui_log = tmp_path / "AP_GUI.log"
+        ap_gui_log.write_text(
+            "~~1581617216534~~1~~0000000000002540~~none~~AzFramework File Logging New Run\n"
+            "~~1581617216535~~1~~0000000000002540~~AssetProcessor~~Listening Port: 45644\n"
+            "~~1581617216536~~1~~0000000000002540~~AssetProcessor~~Control Port: 45645\n")
+        mock_workspace.paths.ap_gui_log.return_value = str(ap_gui_log)
+        under_test = ly_test_tools.o3de.asset_processor.AssetProcessor(mock_workspace)
+
+        with mock.patch('builtins.open', wraps=open) as mock_open:
+            assert under_test.read_port_from_log("Control Port") == 45645
+            assert under_test.read_port_from_log("Listening Port") == 45644
+        assert [call for call in mock_open.call_args_list if call.args[1:] == ('rb',)] == \
+            [mock.call(str(ap_gui_log), 'rb')]
+        subscription = under_test._ap_log_subscription
+        assert ly_test_tools.log.log_tailer.LogTailer.get(str(ap_gui_log)) is subscription.tailer
+
+        under_test.stop()
+
+        assert under_test._ap_log_subscription is None
+        assert ly_test_tools.log.log_tailer.LogTailer.get(str(ap_gui_log)) is not subscription.tailer
@@ -0,0 +1,150 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.benchmark.data_aggregator
+"""
+import json
+import shutil
+import unittest.mock as mock
+
+import pytest
+
+import ly_test_tools.benchmark.data_aggregator as data_aggregator
+
+pytestmark = pytest.mark.SUITE_smoke
+
+
+def write_benchmark(benchmark_dir, pass_times, cpu_frame_times):
+    benchmark_dir.mkdir(parents=True)
+    (benchmark_dir / 'benchmark_metadata.json').write_text(json.dumps({'ClassData': {'testCase': benchmark_dir.name}}))
+    for index, frame_pass_times in enumerate(pass_times):
+        entries = [{'passName': name, 'timestampResultInNanoseconds': time_ns}
+                   for name, time_ns in frame_pass_times.items()]
+        (benchmark_dir / f'frame{index}_timestamps.json').write_text(
+            json.dumps({'ClassData': {'timestampEntries': entries}}))
+    for index, frame_time in enumerate(cpu_frame_times):
+        (benchmark_dir / f'cpu_frame{index}_time.json').write_text(json.dumps({'ClassData': {'frameTime': frame_time}}))
+
+
+class TestArrayStatistics(object):
+
+    def test_Statistics_Values_MatchRunningStatistics(self):
+        values = [4.0, 1.0, 3.0, 2.0]
+        running_stats = data_aggregator.RunningStatistics()
+        for value in values:
+            running_stats.update(value)
+
+        under_test = data_aggregator.ArrayStatistics(values)
+
+        assert under_test.getAvg() == running_stats.getAvg()
+        assert under_test.getMax() == running_stats.getMax()
+        assert under_test.getMin() == running_stats.getMin()
+        assert under_test.getCount() == running_stats.getCount()
+
+    def test_GetSummary_Outliers_TrimmedAvgIgnoresOutliers(self):
+        values = [10.0] * 18 + [0.0, 1000.0]
+
+        summary = data_aggregator.ArrayStatistics(values).getSummary(scale=0.5)
+
+        assert summary['trimmedAvg'] == 5.0
+        assert summary['p50'] == 5.0
+        assert summary['max'] == 500.0
+        assert summary['min'] == 0.0
+        assert summary['avg'] == pytest.approx(sum(values) / len(values) / 2)
+        assert summary['stddev'] > 0
+        assert summary['p90'] <= summary['p99'] <= summary['max']
+
+
+class TestBenchmarkDataAggregator(object):
+
+    def test_LoadBenchmarkSamples_BenchmarkDir_ReturnsColumns(self, tmp_path):
+        benchmark_dir = tmp_path / 'benchmark'
+        write_benchmark(benchmark_dir, [{'pass1': 1, 'pass2': 2}, {'pass1': 3, 'pass2': 4}], [5.0, 6.0])
+
+        samples = data_aggregator.load_benchmark_samples(benchmark_dir)
+
+        assert samples.metadata == {'testCase': 'benchmark'}
+        assert samples.gpu_frame_times.tolist() == [3, 7]
+        assert samples.gpu_pass_times['pass1'].tolist() == [1, 3]
+        assert samples.gpu_pass_times['pass2'].tolist() == [2, 4]
+        assert samples.cpu_frame_times.tolist() == [5.0, 6.0]
+
+    def test_LoadBenchmarkSamples_NoCpuFrames_RaisesException(self, tmp_path):
+        benchmark_dir = tmp_path / 'benchmark'
+        write_benchmark(benchmark_dir, [{'pass1': 1}], [])
+
+        with pytest.raises(data_aggregator.BenchmarkPathException):
+            data_aggregator.load_benchmark_samples(benchmark_dir)
+
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.FilebeatClient')
+    def test_LoadBenchmarks_ManyBenchmarks_LoadsEachBenchmark(self, mock_filebeat, tmp_path):
+        workspace = mock.MagicMock()
+        workspace.paths.project.return_value = str(tmp_path)
+        results_dir = tmp_path / 'user' / 'Scripts' / 'PerformanceBenchmarks'
+        write_benchmark(results_dir / 'benchmark1', [{'pass1': 1}], [1.0])
+        write_benchmark(results_dir / 'benchmark2', [{'pass1': 2}], [2.0])
+        under_test = data_aggregator.BenchmarkDataAggregator(workspace, mock.MagicMock(), 'suite')
+
+        for max_workers in (1, 2):
+            benchmarks = under_test._load_benchmarks(max_workers)
+
+            assert [benchmark_dir.name for benchmark_dir, _ in benchmarks] == ['benchmark1', 'benchmark2']
+            assert [samples.gpu_frame_times.tolist() for _, samples in benchmarks] == [[1], [2]]
+
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.FilebeatClient')
+    def test_GeneratePayloads_Stats_AddsPercentiles(self, mock_filebeat):
+        under_test = data_aggregator.BenchmarkDataAggregator(mock.MagicMock(), mock.MagicMock(), 'suite')
+        gpu_frame_stats = data_aggregator.ArrayStatistics([1e6, 2e6, 3e6])
+        gpu_pass_stats = {'pass1': data_aggregator.ArrayStatistics([1e6, 2e6, 3e6])}
+        cpu_frame_stats = data_aggregator.ArrayStatistics([1.0, 2.0, 3.0])
+
+        payloads = under_test._generate_payloads({}, gpu_frame_stats, gpu_pass_stats, cpu_frame_stats)
+
+        gpu_frame_payload = payloads[0][1]
+        assert gpu_frame_payload['frameTime']['p50'] == 2.0
+        assert gpu_frame_payload['frameTime']['max'] == 3.0
+        pass_payload = payloads[2][1]
+        assert pass_payload['passName'] == 'pass1'
+        assert pass_payload['passTime']['p50'] == 2.0
+
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.FilebeatClient')
+    def test_CheckRegressions_SlowerRun_ReturnsRegressions(self, mock_filebeat, tmp_path):
+        workspace = mock.MagicMock()
+        workspace.paths.project.return_value = str(tmp_path)
+        benchmark_dir = tmp_path / 'user' / 'Scripts' / 'PerformanceBenchmarks' / 'benchmark'
+        under_test = data_aggregator.BenchmarkDataAggregator(workspace, mock.MagicMock(), 'suite')
+        under_test._get_git_commit_hash = mock.MagicMock(return_value='abc')
+
+        cpu_frame_times = [1.0 + index for index in range(10)]
+
+        write_benchmark(benchmark_dir, [{'pass1': 1e6 + index} for index in range(10)], cpu_frame_times)
+        assert under_test.check_regressions('dx12') == []
+        shutil.rmtree(benchmark_dir)
+        write_benchmark(benchmark_dir, [{'pass1': 2e6 + index} for index in range(10)], cpu_frame_times)
+        regressions = under_test.check_regressions('dx12')
+
+        assert [(regression.metric, regression.name) for regression in regressions] == [
+            ('gpu.frame_data', 'frameTime'), ('gpu.pass_data', 'pass1')]
+        mock_filebeat.assert_not_called()
+
+    @mock.patch('ly_test_tools.benchmark.data_aggregator.FilebeatClient')
+    def test_CheckRegressions_TooFewPreviousRuns_ListsRunsWithoutBaseline(self, mock_filebeat, tmp_path):
+        workspace = mock.MagicMock()
+        workspace.paths.project.return_value = str(tmp_path)
+        benchmark_dir = tmp_path / 'user' / 'Scripts' / 'PerformanceBenchmarks' / 'benchmark'
+        mock_logger = mock.MagicMock()
+        under_test = data_aggregator.BenchmarkDataAggregator(workspace, mock_logger, 'suite')
+        under_test._get_git_commit_hash = mock.MagicMock(return_value='abc')
+        write_benchmark(benchmark_dir, [{'pass1': 1e6 + index} for index in range(10)],
+                        [1.0 + index for index in range(10)])
+
+        for previous_run_count in range(2):
+            assert under_test.check_regressions('dx12', min_baseline_runs=2) == []
+            assert under_test.runs_without_baseline == [previous_run_count + 1]
+        assert mock_logger.warning.call_count == 2
+
+        assert under_test.check_regressions('dx12', min_baseline_runs=2) == []
+        assert under_test.runs_without_baseline == []
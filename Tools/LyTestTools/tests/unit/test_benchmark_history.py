@@ -0,0 +1,90 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.benchmark.benchmark_history
+"""
+import numpy
+import pytest
+
+import ly_test_tools.benchmark.benchmark_history as benchmark_history
+
+pytestmark = pytest.mark.SUITE_smoke
+
+METADATA = {'benchmarkName': 'benchmark', 'gpuInfo': {'description': 'gpu', 'driverVersion': 1}}
+
+
+def make_samples(seed, frame_time, pass_time):
+    rng = numpy.random.default_rng(seed)
+    return {
+        ('gpu.frame_data', 'frameTime'): rng.normal(frame_time, 0.1, 100),
+        ('gpu.pass_data', 'pass1'): rng.normal(pass_time, 0.05, 100),
+        ('gpu.pass_data', 'pass2'): rng.normal(1.0, 0.05, 100),
+    }
+
+
+class TestMannWhitneyU(object):
+
+    def test_MannWhitneyU_GreaterSamples_LowPValue(self):
+        _, p_value = benchmark_history.mann_whitney_u([5, 6, 7, 8, 9, 10], [1, 2, 3, 4, 5, 6])
+
+        assert p_value < 0.01
+
+    def test_MannWhitneyU_SmallerSamples_HighPValue(self):
+        u_statistic, p_value = benchmark_history.mann_whitney_u([1, 2, 3], [4, 5, 6])
+
+        assert u_statistic == 0
+        assert p_value > 0.9
+
+    def test_MannWhitneyU_EqualSamples_NotSignificant(self):
+        _, p_value = benchmark_history.mann_whitney_u([1, 1, 1], [1, 1])
+
+        assert p_value == 1.0
+
+
+class TestBenchmarkHistory(object):
+
+    def test_AddRun_Samples_Stored(self, tmp_path):
+        under_test = benchmark_history.BenchmarkHistory(str(tmp_path / 'history.db'))
+        samples = make_samples(0, 10.0, 2.0)
+
+        run_id = under_test.add_run('dx12', 'local', METADATA, samples, build='abc')
+        run, run_samples, previous_run_ids = under_test.get_run(run_id)
+
+        assert run['rhi'] == 'dx12'
+        assert run['build'] == 'abc'
+        assert previous_run_ids == []
+        assert run_samples.keys() == samples.keys()
+        assert run_samples[('gpu.pass_data', 'pass1')].tolist() == samples[('gpu.pass_data', 'pass1')].tolist()
+
+    def test_CompareRun_SlowerPass_FlagsOnlyThatPass(self, tmp_path):
+        under_test = benchmark_history.BenchmarkHistory(str(tmp_path / 'history.db'))
+        for seed in range(3):
+            under_test.add_run('dx12', 'local', METADATA, make_samples(seed, 10.0, 2.0))
+        # a run on another RHI isn't part of the baseline
+        under_test.add_run('vulkan', 'local', METADATA, make_samples(3, 20.0, 4.0))
+        run_id = under_test.add_run('dx12', 'local', METADATA, make_samples(4, 10.0, 2.5))
+
+        regressions = under_test.compare_run(run_id)
+
+        assert [(regression.metric, regression.name) for regression in regressions] == [('gpu.pass_data', 'pass1')]
+        assert regressions[0].relative_change == pytest.approx(0.25, abs=0.02)
+
+    def test_CompareLatestRuns_NoRegression_ReturnsEmpty(self, tmp_path):
+        under_test = benchmark_history.BenchmarkHistory(str(tmp_path / 'history.db'))
+        for seed in range(3):
+            under_test.add_run('dx12', 'local', METADATA, make_samples(seed, 10.0, 2.0))
+
+        assert under_test.compare_latest_runs('dx12', 'local') == []
+
+    def test_Main_Regression_Returns1(self, tmp_path, capsys):
+        history_path = str(tmp_path / 'history.db')
+        under_test = benchmark_history.BenchmarkHistory(history_path)
+        under_test.add_run('dx12', 'local', METADATA, make_samples(0, 10.0, 2.0))
+        under_test.add_run('dx12', 'local', METADATA, make_samples(1, 12.0, 2.0))
+
+        assert benchmark_history.main(['--history', history_path, '--rhi', 'dx12']) == 1
+        assert 'gpu.frame_data frameTime' in capsys.readouterr().out
+        assert benchmark_history.main(['--history', history_path, '--rhi', 'vulkan']) == 0
@@ -0,0 +1,61 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.image.comparison_cache
+"""
+import os
+import unittest.mock as mock
+
+import pytest
+
+import ly_test_tools.image.comparison_cache as comparison_cache
+
+pytestmark = pytest.mark.SUITE_smoke
+
+
+class TestComparisonCache(object):
+
+    def test_Get_ResultStored_ReturnsSimilarityAndDiffCopy(self, tmp_path):
+        diff_path = tmp_path / 'screenshot_diff.png'
+        diff_path.write_bytes(b'diff image')
+        under_test = comparison_cache.ComparisonCache(str(tmp_path / 'cache.sqlite'))
+
+        under_test.put('screenshot', 'golden', 'qssim', 0.75, str(diff_path))
+        diff_path.write_bytes(b'diff image of another comparison')
+        similarity, cached_diff_path = under_test.get('screenshot', 'golden', 'qssim')
+
+        assert similarity == 0.75
+        with open(cached_diff_path, 'rb') as cached_diff:
+            assert cached_diff.read() == b'diff image'
+        assert under_test.get('screenshot', 'golden', 'other parameters') is None
+
+    def test_Put_MaxEntriesReached_EvictsLeastRecentlyUsed(self, tmp_path):
+        diff_path = tmp_path / 'screenshot_diff.png'
+        diff_path.write_bytes(b'diff image')
+        under_test = comparison_cache.ComparisonCache(str(tmp_path / 'cache.sqlite'), max_entries=2)
+
+        with mock.patch('time.time', side_effect=[1, 2, 3, 4]):
+            under_test.put('screenshot1', 'golden', 'qssim', 0.1, str(diff_path))
+            under_test.put('screenshot2', 'golden', 'qssim', 0.2, None)
+            # Using the first result makes the second one the least recently used
+            evicted_diff_path = under_test.get('screenshot1', 'golden', 'qssim')[1]
+            under_test.put('screenshot3', 'golden', 'qssim', 0.3, None)
+
+        assert under_test.get('screenshot1', 'golden', 'qssim') == (0.1, evicted_diff_path)
+        assert under_test.get('screenshot2', 'golden', 'qssim') is None
+        assert under_test.get('screenshot3', 'golden', 'qssim') == (0.3, None)
+
+        under_test.put('screenshot4', 'golden', 'qssim', 0.4, None)
+        under_test.put('screenshot5', 'golden', 'qssim', 0.5, None)
+        assert under_test.get('screenshot1', 'golden', 'qssim') is None
+        assert not os.path.exists(evicted_diff_path)
+
+    def test_GetDefaultCache_EnvironmentVariable_ReturnsCache(self, tmp_path):
+        cache_path = str(tmp_path / 'cache.sqlite')
+        with mock.patch.dict(os.environ, {comparison_cache.COMPARISON_CACHE_ENV_VAR: cache_path}):
+            assert comparison_cache.get_default_cache().cache_path == cache_path
+        with mock.patch.dict(os.environ, clear=True):
+            assert comparison_cache.get_default_cache() is None
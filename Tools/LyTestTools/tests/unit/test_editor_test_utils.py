@@ -4,8 +4,10 @@ For complete copyright and license terms please see the LICENSE at the root of t
 
 SPDX-License-Identifier: Apache-2.0 OR MIT
 """
+import concurrent.futures
 import pytest
 import os
+import tempfile
 import unittest.mock as mock
 import unittest
 
@@ -226,3 +228,71 @@ class TestEditorTestUtils(unittest.TestCase):
         with mock.patch('builtins.open', mock.mock_open(read_data=mock_log)) as mock_file:
             expected = editor_test_utils._check_log_errors_warnings(mock_log_path)
         assert expected
+
+    def test_GetTestDurationHistoryPath_InTestResults_ReturnsTestResultsFolder(self):
+        mock_workspace = mock.MagicMock()
+        mock_workspace.artifact_manager.artifact_path = os.path.join('dev', 'TestResults', '2022-01-01T00_00_00_000000')
+
+        history_path = editor_test_utils.get_test_duration_history_path(mock_workspace)
+
+        assert history_path == os.path.join(os.path.abspath(os.path.join('dev', 'TestResults')),
+                                            editor_test_utils.TEST_DURATION_HISTORY_FILENAME)
+
+    def test_GetTestDurationHistoryPath_NoArtifactPath_ReturnsNone(self):
+        mock_workspace = mock.MagicMock()
+
+        assert editor_test_utils.get_test_duration_history_path(mock_workspace) is None
+
+    def test_SaveTestDurations_ManyRuns_KeepsRecentDurations(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_path = os.path.join(temp_dir, editor_test_utils.TEST_DURATION_HISTORY_FILENAME)
+            for duration in range(editor_test_utils.TEST_DURATION_HISTORY_SIZE + 2):
+                editor_test_utils.save_test_durations(history_path, {'Suite.test_a': float(duration)})
+            editor_test_utils.save_test_durations(history_path, {'Suite.test_b': 4.0})
+
+            history = editor_test_utils.load_test_duration_history(history_path)
+
+        assert history['Suite.test_a'] == [float(duration) for duration in
+                                           range(2, editor_test_utils.TEST_DURATION_HISTORY_SIZE + 2)]
+        assert history['Suite.test_b'] == [4.0]
+
+    def test_SaveTestDurations_ConcurrentSaves_KeepsAllDurations(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_path = os.path.join(temp_dir, editor_test_utils.TEST_DURATION_HISTORY_FILENAME)
+            test_names = [f'Suite.test_{index}' for index in range(16)]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda test_name: editor_test_utils.save_test_durations(history_path,
+                                                                                          {test_name: 1.0}),
+                                  test_names))
+
+            history = editor_test_utils.load_test_duration_history(history_path)
+
+        assert sorted(history) == sorted(test_names)
+
+    def test_LoadTestDurationHistory_InvalidFile_ReturnsEmpty(self):
+        with mock.patch('os.path.isfile', return_value=True):
+            with mock.patch('builtins.open', mock.mock_open(read_data='not json')):
+                assert editor_test_utils.load_test_duration_history('history.json') == {}
+
+    def test_EstimateTestDuration_WithAndWithoutHistory_ReturnsMeanOrDefault(self):
+        history = {'test_a': [10.0, 20.0]}
+
+        assert editor_test_utils.estimate_test_duration(history, 'test_a', 60) == 15.0
+        assert editor_test_utils.estimate_test_duration(history, 'test_b', 60) == 60
+
+    def test_SplitLongestProcessingTimeFirst_UnevenDurations_BalancesBins(self):
+        items = ['a', 'b', 'c', 'd', 'e', 'f']
+        durations = [1, 10, 2, 7, 3, 5]
+
+        bins = editor_test_utils.split_longest_processing_time_first(items, durations, 2)
+
+        totals = [sum(durations[items.index(item)] for item in items_bin) for items_bin in bins]
+        assert totals == [14, 14]
+        assert sorted(sum(bins, [])) == items
+        # Each bin keeps the original order of its items
+        assert all(items_bin == sorted(items_bin) for items_bin in bins)
+
+    def test_SplitLongestProcessingTimeFirst_MoreBinsThanItems_NoEmptyBins(self):
+        bins = editor_test_utils.split_longest_processing_time_first(['a', 'b'], [1, 2], 4)
+
+        assert bins == [['b'], ['a']]
@@ -517,6 +517,56 @@ class TestLockFile(unittest.TestCase):
         self.assertFalse(success)
 
 
+class TestExclusiveFileLock(unittest.TestCase):
+
+    def setUp(self):
+        self.locked_file = mock.MagicMock()
+        self.locked_file.name = 'file.lock'
+        lock_function = 'msvcrt.locking' if os.name == 'nt' else 'fcntl.flock'
+        patcher = mock.patch(f'ly_test_tools.environment.file_system.{lock_function}')
+        self.mock_lock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ExclusiveFileLock_Free_LocksAndUnlocks(self):
+        with file_system.exclusive_file_lock(self.locked_file) as locked_file:
+            assert locked_file is self.locked_file
+            assert self.mock_lock.call_count == 1
+
+        assert self.mock_lock.call_count == 2
+
+    @mock.patch('ly_test_tools.environment.file_system._FILE_LOCK_RETRY_INTERVAL', 0)
+    def test_ExclusiveFileLock_HeldByOtherProcess_RetriesUntilReleased(self):
+        busy_errno = errno.EACCES if os.name == 'nt' else errno.EWOULDBLOCK
+        self.mock_lock.side_effect = [OSError(busy_errno, 'busy'), OSError(busy_errno, 'busy'), None, None]
+
+        with file_system.exclusive_file_lock(self.locked_file):
+            assert self.mock_lock.call_count == 3
+
+    @mock.patch('time.sleep')
+    @mock.patch('time.monotonic')
+    def test_ExclusiveFileLock_NeverReleased_RaisesTimeoutError(self, mock_monotonic, mock_sleep):
+        busy_errno = errno.EDEADLOCK if os.name == 'nt' else errno.EAGAIN
+        self.mock_lock.side_effect = OSError(busy_errno, 'busy')
+        mock_monotonic.side_effect = [0, 5, 11]
+
+        with pytest.raises(TimeoutError):
+            with file_system.exclusive_file_lock(self.locked_file, timeout=10):
+                pass
+
+        assert self.mock_lock.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_ExclusiveFileLock_OtherError_RaisesWithoutRetrying(self):
+        self.mock_lock.side_effect = OSError(errno.EBADF, 'bad file descriptor')
+
+        with pytest.raises(OSError) as raised:
+            with file_system.exclusive_file_lock(self.locked_file):
+                pass
+
+        assert raised.value.errno == errno.EBADF
+        self.mock_lock.assert_called_once()
+
+
 class TestRemoveSymlinks(unittest.TestCase):
 
     def setUp(self):
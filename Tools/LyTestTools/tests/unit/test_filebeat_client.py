@@ -0,0 +1,180 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.mars.filebeat_client
+"""
+import json
+import logging
+import socket
+import threading
+import unittest.mock as mock
+
+import pytest
+
+import ly_test_tools.mars.filebeat_client as filebeat_client
+
+pytestmark = pytest.mark.SUITE_smoke
+
+logger = logging.getLogger(__name__)
+
+
+class FakeFilebeat(object):
+    """
+    Local TCP server standing in for filebeat, which records the lines and the connections it receives
+    """
+
+    def __init__(self, port=0):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", port))
+        self._server.listen()
+        self._server.settimeout(0.05)
+        self.port = self._server.getsockname()[1]
+        self.connections = 0
+        self.received = b""
+        self._lock = threading.Lock()
+        self._threads = []
+        self._stopping = threading.Event()
+        self._accept_thread = threading.Thread(target=self._accept, daemon=True)
+        self._accept_thread.start()
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except socket.timeout:
+                # accept the pending connections before stopping
+                if self._stopping.is_set():
+                    return
+                continue
+            connection.settimeout(None)
+            self.connections += 1
+            thread = threading.Thread(target=self._receive, args=(connection,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _receive(self, connection):
+        with connection:
+            while True:
+                data = connection.recv(65536)
+                if not data:
+                    return
+                with self._lock:
+                    self.received += data
+
+    def stop(self):
+        self._stopping.set()
+        self._accept_thread.join(5)
+        self._server.close()
+        for thread in self._threads:
+            thread.join(5)
+
+    def get_events(self):
+        return [json.loads(line) for line in self.received.splitlines()]
+
+
+@pytest.fixture
+def fake_filebeat():
+    server = FakeFilebeat()
+    yield server
+    server.stop()
+
+
+def get_unused_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as unused:
+        unused.bind(("127.0.0.1", 0))
+        return unused.getsockname()[1]
+
+
+class TestBufferedFilebeatClient(object):
+
+    def test_SendEvent_ManyEvents_SentInBatchesOverOneConnection(self, fake_filebeat):
+        under_test = filebeat_client.BufferedFilebeatClient(logger, port=fake_filebeat.port, max_batch_bytes=1024)
+
+        with mock.patch.object(under_test, '_send_frame', wraps=under_test._send_frame) as mock_send_frame:
+            for index in range(100):
+                under_test.send_event({"value": index}, "index", timestamp=1)
+            under_test.close()
+        fake_filebeat.stop()
+
+        assert fake_filebeat.connections == 1
+        assert 1 < mock_send_frame.call_count < 100
+        events = fake_filebeat.get_events()
+        assert [json.loads(event["payload"])["value"] for event in events] == list(range(100))
+        assert events[0]["index"] == "index"
+
+    def test_Flush_FilebeatDown_SpooledAndSentOnReconnect(self, tmp_path):
+        port = get_unused_port()
+        spool_path = tmp_path / "spool.ndjson"
+        under_test = filebeat_client.BufferedFilebeatClient(logger, port=port, spool_path=str(spool_path))
+
+        under_test.send_event({"value": 1}, "index")
+        under_test.close()
+        assert spool_path.is_file()
+
+        server = FakeFilebeat(port)
+        try:
+            with filebeat_client.BufferedFilebeatClient(logger, port=port, spool_path=str(spool_path)) as replayer:
+                replayer.send_event({"value": 2}, "index")
+        finally:
+            server.stop()
+
+        assert [json.loads(event["payload"])["value"] for event in server.get_events()] == [1, 2]
+        assert spool_path.read_bytes() == b""
+
+    def test_Flush_SpoolFull_OldestEventsDropped(self, tmp_path):
+        spool_path = tmp_path / "spool.ndjson"
+        under_test = filebeat_client.BufferedFilebeatClient(
+            logger, port=get_unused_port(), spool_path=str(spool_path), max_spool_bytes=500)
+
+        for index in range(20):
+            under_test.send_event({"value": index}, "index", timestamp=1)
+            under_test.flush()
+        under_test.close()
+
+        spooled = spool_path.read_bytes()
+        values = [json.loads(json.loads(line)["payload"])["value"] for line in spooled.splitlines()]
+        assert len(spooled) <= 500
+        assert values == list(range(20 - len(values), 20))
+
+    def test_SendSpool_AppendWhileSending_AppendWaitsAndIsKept(self, fake_filebeat, tmp_path):
+        spool_path = tmp_path / "spool.ndjson"
+        spool_path.write_bytes(filebeat_client.FilebeatClient._serialize_event({"value": 1}, "index", 1, "filebeat"))
+        spooler = filebeat_client.BufferedFilebeatClient(logger, port=get_unused_port(), spool_path=str(spool_path))
+        spooler.send_event({"value": 2}, "index", timestamp=1)
+        append_thread = threading.Thread(target=spooler.flush)
+
+        under_test = filebeat_client.BufferedFilebeatClient(logger, port=fake_filebeat.port)
+        under_test._spool_path = str(spool_path)
+
+        def send_frame(data):
+            # another client spools events while the spool file is sent
+            append_thread.start()
+            append_thread.join(0.2)
+            assert append_thread.is_alive()
+            return True
+
+        with mock.patch.object(under_test, '_send_frame', side_effect=send_frame) as mock_send_frame:
+            assert under_test._send_spool()
+        append_thread.join(5)
+        under_test.close()
+
+        assert mock_send_frame.call_count == 1
+        assert [json.loads(json.loads(line)["payload"])["value"] for line in spool_path.read_bytes().splitlines()] == [2]
+
+    def test_Init_FilebeatDownNoSpool_RaisesFilebeatExn(self):
+        with pytest.raises(filebeat_client.FilebeatExn):
+            filebeat_client.BufferedFilebeatClient(logger, port=get_unused_port())
+
+    def test_Flush_FilebeatDownNoSpool_RaisesOnceBufferIsFull(self, fake_filebeat):
+        under_test = filebeat_client.BufferedFilebeatClient(
+            logger, port=fake_filebeat.port, max_batch_bytes=100, max_buffered_bytes=1000)
+        under_test._close_socket()
+        fake_filebeat.stop()
+
+        with pytest.raises(filebeat_client.FilebeatExn):
+            for index in range(100):
+                under_test.send_event({"value": index}, "index")
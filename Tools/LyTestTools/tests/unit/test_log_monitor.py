@@ -8,6 +8,7 @@ Unit tests for ly_test_tools.log.log_monitor
 """
 
 import io
+import os
 import unittest.mock as mock
 import pytest
 
@@ -96,7 +97,7 @@ class TestLogMonitor(object):
 
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_UTF8StringsPresentAndExpected_Success(self):
-        mock_file = io.StringIO('gr\xc3\xb6\xc3\x9feren pr\xc3\xbcfung \xd1\x82\xd0\xb5\xd1\x81\xd1\x82\xd1\x83\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8f\n\xc3\x80\xc3\x88\xc3\x8c\xc3\x92\xc3\x99\n\xc3\x85lpha\xc3\x9fravo\xc3\xa7harlie\n')
+        mock_file = io.BytesIO(u'gr\xc3\xb6\xc3\x9feren pr\xc3\xbcfung \xd1\x82\xd0\xb5\xd1\x81\xd1\x82\xd1\x83\xd0\xb2\xd0\xb0\xd0\xbd\xd0\xbd\xd1\x8f\n\xc3\x80\xc3\x88\xc3\x8c\xc3\x92\xc3\x99\n\xc3\x85lpha\xc3\x9fravo\xc3\xa7harlie\n'.encode('utf-8'))
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
@@ -106,7 +107,7 @@ class TestLogMonitor(object):
 
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_AllLinesFound_Success(self):
-        mock_file = io.StringIO(u'a\nb\nc\n')
+        mock_file = io.BytesIO(b'a\nb\nc\n')
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
@@ -114,7 +115,7 @@ class TestLogMonitor(object):
 
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_AllLinesNotFound_RaisesLogMonitorException(self):
-        mock_file = io.StringIO(u'a\nb\nc\n')
+        mock_file = io.BytesIO(b'a\nb\nc\n')
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
@@ -123,7 +124,7 @@ class TestLogMonitor(object):
 
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_SomeUnexpectedLinesFound_RaiseLogMonitorException(self):
-        mock_file = io.StringIO(u'foo\nbar\n')
+        mock_file = io.BytesIO(b'foo\nbar\n')
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
@@ -132,7 +133,7 @@ class TestLogMonitor(object):
 
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_ExpectedLinesNotFound_RaiseLogMonitorException(self):
-        mock_file = io.StringIO(u'foo\nbar\n')
+        mock_file = io.BytesIO(b'foo\nbar\n')
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
@@ -157,7 +158,7 @@ class TestLogMonitor(object):
 
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_NoneTypeUnexpectedLines_CastsToList(self):
-        mock_file = io.StringIO(u'foo\n')
+        mock_file = io.BytesIO(b'foo\n')
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
@@ -166,7 +167,7 @@ class TestLogMonitor(object):
     @mock.patch('ly_test_tools.log.log_monitor.logging.Logger.warning')
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_NoneTypeExpectedLines_LogsWarningAndCastsToList(self, mock_log_warning):
-        mock_file = io.StringIO(u'foo\n')
+        mock_file = io.BytesIO(b'foo\n')
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
@@ -175,7 +176,7 @@ class TestLogMonitor(object):
 
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_ExpectedLinesExactMatch_SucceedsOnExactMatch(self):
-        mock_file = io.StringIO(u'exact match\n')
+        mock_file = io.BytesIO(b'exact match\n')
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
@@ -183,13 +184,70 @@ class TestLogMonitor(object):
 
     @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
     def test_Monitor_ExpectedLinesPartialMatch_RaisesLogMonitorException(self):
-        mock_file = io.StringIO(u'exactlyy\n')
+        mock_file = io.BytesIO(b'exactlyy\n')
         mock_launcher.is_alive.side_effect = [True, True, True, False]
 
         with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
             with pytest.raises(ly_test_tools.log.log_monitor.LogMonitorException):
                 mock_log_monitor().monitor_log_for_lines(['exactly'], [])
 
+    @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
+    def test_Monitor_LineWrittenInTwoReads_MatchesCompleteLine(self):
+        mock_file = mock.MagicMock()
+        mock_file.__enter__.return_value = mock_file
+        mock_file.read.side_effect = [b'Log Monitoring', b' test 1\n', b'']
+        mock_launcher.is_alive.side_effect = [True, True, False]
+
+        with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
+            # The first read is only matched once the rest of the line is read
+            mock_log_monitor().monitor_log_for_lines(['Log Monitoring test 1'], ['test 2'])
+
+    @mock.patch('ly_test_tools.log.log_monitor.check_exact_match')
+    @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
+    def test_Monitor_ManyLines_ChecksOnlyLinesWithSearchedStrings(self, mock_check_exact_match):
+        mock_check_exact_match.side_effect = lambda line, expected_line: expected_line if line == expected_line else None
+        mock_file = io.BytesIO(b'noise\n' * 1000 + b'foo\n' + b'noise\n' * 1000)
+        mock_launcher.is_alive.side_effect = [True, False]
+
+        with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
+            mock_log_monitor().monitor_log_for_lines(['foo'], ['bar'])
+
+        # Only the line containing 'foo' is checked for each of the searched strings
+        assert mock_check_exact_match.call_count == 2
+
+    @mock.patch('ly_test_tools.log.log_monitor.LOG_MONITOR_MAX_LINES', 2)
+    @mock.patch('os.path.exists', mock.MagicMock(return_value=True))
+    def test_Monitor_MoreLinesThanMax_KeepsMostRecentLines(self):
+        mock_file = io.BytesIO(b'a\nb\nc\n')
+        mock_launcher.is_alive.side_effect = [True, False]
+        log_monitor = mock_log_monitor()
+
+        with mock.patch('ly_test_tools.log.log_monitor.open', return_value=mock_file, create=True):
+            log_monitor.monitor_log_for_lines(['c'])
+
+        assert log_monitor.py_log == '|mock_path| b\n|mock_path| c\n'
+
+    def test_Monitor_LogReplaced_ReadsRestOfOldLogAndNewLog(self, tmp_path):
+        log_path = tmp_path / 'game.log'
+        log_path.write_bytes(b'old line 1\n')
+        replaced_log_path = tmp_path / 'game.log.new'
+        replaced_log_path.write_bytes(b'new line 1\n')
+        alive_states = [True, True, False]
+
+        def is_alive():
+            if len(alive_states) == 2:
+                # The log is written to and then replaced by a new log between two reads
+                with open(log_path, 'ab') as log:
+                    log.write(b'old line 2')
+                os.replace(replaced_log_path, log_path)
+            return alive_states.pop(0)
+        mock_launcher.is_alive.side_effect = is_alive
+        log_monitor = ly_test_tools.log.log_monitor.LogMonitor(launcher=mock_launcher, log_file_path=str(log_path))
+
+        log_monitor.monitor_log_for_lines(['old line 1', 'old line 2', 'new line 1'])
+
+        assert log_monitor.py_log == '|game.log| old line 1\n|game.log| old line 2\n|game.log| new line 1\n'
+
     def test_ValidateResults_Valid_ReturnsTrue(self):
         mock_lm = mock_log_monitor()
         mock_expected_lines = ['expected_foo']
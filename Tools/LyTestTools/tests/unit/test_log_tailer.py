@@ -0,0 +1,120 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.log.log_tailer
+"""
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+
+import pytest
+
+import ly_test_tools.log.log_tailer as log_tailer
+
+pytestmark = pytest.mark.SUITE_smoke
+
+
+class TestLogTailer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, "test.log")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_log(self, content, mode='ab'):
+        with open(self.log_path, mode) as log:
+            log.write(content)
+
+    def test_Get_SamePath_ReturnsSharedTailer(self):
+        under_test = log_tailer.subscribe(self.log_path, mock.MagicMock())
+
+        assert log_tailer.LogTailer.get(self.log_path) is under_test.tailer
+        under_test.close()
+        assert log_tailer.LogTailer.get(self.log_path) is not under_test.tailer
+
+    def test_Poll_ManySubscribers_ReadsLogOnceAndCallsMatchingSubscribers(self):
+        all_lines = []
+        error_lines = []
+        self.write_log(b'info: start\r\nerror: fail')
+        with log_tailer.subscribe(self.log_path, all_lines.append) as all_subscription, \
+                log_tailer.subscribe(self.log_path, error_lines.append,
+                                     lambda line: line.startswith('error')) as error_subscription:
+            with mock.patch('builtins.open', wraps=open) as mock_open:
+                assert all_subscription.poll() == 1
+                # The last line is incomplete until it ends or the log is final
+                self.write_log(b'ed\nerror: again\n')
+                assert error_subscription.poll() == 2
+                assert all_subscription.poll() == 0
+
+            # Each poll reads the log once for every subscriber
+            assert [call for call in mock_open.call_args_list if call.args[1:] == ('rb',)] == \
+                [mock.call(self.log_path, 'rb')] * 2
+        assert all_lines == ['info: start', 'error: failed', 'error: again']
+        assert error_lines == ['error: failed', 'error: again']
+
+    def test_Poll_Final_PassesIncompleteLastLine(self):
+        lines = []
+        self.write_log(b'first\nlast')
+        with log_tailer.subscribe(self.log_path, lines.append) as under_test:
+            under_test.poll(final=True)
+
+        assert lines == ['first', 'last']
+
+    def test_Poll_LogTruncated_ReadsFromStart(self):
+        lines = []
+        self.write_log(b'old line 1\nold line 2\n')
+        with log_tailer.subscribe(self.log_path, lines.append) as under_test:
+            under_test.poll()
+            self.write_log(b'new\n', mode='wb')
+            under_test.poll()
+
+        assert lines == ['old line 1', 'old line 2', 'new']
+
+    def test_Subscribe_Replay_PassesLinesAlreadyRead(self):
+        self.write_log(b'port: 1\nother\n')
+        with log_tailer.subscribe(self.log_path, mock.MagicMock()) as first_subscription:
+            first_subscription.poll()
+            lines = []
+            with log_tailer.subscribe(self.log_path, lines.append, lambda line: line.startswith('port'),
+                                      replay=True):
+                pass
+
+        assert lines == ['port: 1']
+
+    def test_Poll_LogNotCreated_ReadsNothing(self):
+        callback = mock.MagicMock()
+        with log_tailer.subscribe(self.log_path, callback) as under_test:
+            assert under_test.poll(final=True) == 0
+
+        callback.assert_not_called()
+
+    def test_Poll_LogReplacedByLargerLog_ReadsNewLogFromStart(self):
+        lines = []
+        self.write_log(b'old\n')
+        with log_tailer.subscribe(self.log_path, lines.append) as under_test:
+            under_test.poll()
+            new_log_path = f"{self.log_path}.new"
+            with open(new_log_path, 'wb') as new_log:
+                new_log.write(b'new line 1\nnew line 2\n')
+            os.replace(new_log_path, self.log_path)
+            under_test.poll()
+
+        assert lines == ['old', 'new line 1', 'new line 2']
+
+    @mock.patch('ly_test_tools.log.log_tailer.LOG_TAILER_MAX_LINES', 2)
+    def test_Subscribe_ReplayMoreThanKeptLines_ReadsLinesAgainFromLog(self):
+        self.write_log(b'port: 1\nother\nport: 2\nlast')
+        with log_tailer.subscribe(self.log_path, mock.MagicMock()) as first_subscription:
+            first_subscription.poll()
+            lines = []
+            with log_tailer.subscribe(self.log_path, lines.append, replay=True):
+                pass
+
+        # The last line is not replayed until it is complete
+        assert lines == ['port: 1', 'other', 'port: 2']
@@ -4,6 +4,8 @@ For complete copyright and license terms please see the LICENSE at the root of t
 
 SPDX-License-Identifier: Apache-2.0 OR MIT
 """
+import os
+import time
 import unittest
 
 import pytest
@@ -484,6 +486,19 @@ class TestUtils(unittest.TestCase):
         assert 'mock_test_name' in results.keys()
         assert isinstance(results['mock_test_name'], editor_test.Result.Pass)
 
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.get_module_filename')
+    def test_GetResultsUsingOutput_DurationReported_SetsResultDuration(self, mock_get_module):
+        mock_get_module.return_value = 'mock_module_name'
+        mock_test_suite = editor_test.EditorTestSuite()
+        mock_test = mock.MagicMock()
+        mock_test.__name__ = 'mock_test_name'
+        mock_output = 'JSON_START(' \
+                      '{"name": "mock_module_name", "output": "mock_std_out", "success": true, "duration": 12.5}' \
+                      ')JSON_END'
+
+        results = mock_test_suite._get_results_using_output([mock_test], mock_output, '')
+        assert results['mock_test_name'].duration == 12.5
+
     @mock.patch('ly_test_tools.o3de.editor_test_utils.get_module_filename')
     def test_GetResultsUsingOutput_ValidJsonFail_CreatesFailResult(self, mock_get_module):
         mock_get_module.return_value = 'mock_module_name'
@@ -859,6 +874,7 @@ class TestRunningTests(unittest.TestCase):
     def test_RunBatchedTests_ValidTests_CallsCorrectly(self, mock_setup_test, mock_exec_multitest):
         mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
         mock_test_data = mock.MagicMock()
+        mock_test_data.use_warm_editor_pool = False
 
         mock_test_suite._run_batched_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(), mock_test_data,
                                            mock.MagicMock(), [])
@@ -867,62 +883,86 @@ class TestRunningTests(unittest.TestCase):
         assert mock_exec_multitest.called
         assert mock_test_data.results.update.called
 
+    @staticmethod
+    def make_mock_test_specs(num_tests):
+        mock_test_spec_list = []
+        for i in range(num_tests):
+            mock_test_spec = mock.MagicMock()
+            mock_test_spec.__name__ = f"test_{i}"
+            mock_test_spec_list.append(mock_test_spec)
+        return mock_test_spec_list
+
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
     @mock.patch('threading.Thread')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test')
     @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
-    def test_RunParallelTests_TwoTestsAndEditors_TwoThreads(self, mock_setup_test, mock_get_num_editors, mock_thread):
+    def test_RunParallelTests_TwoTestsAndEditors_TwoThreads(self, mock_setup_test, mock_get_num_editors,
+                                                            mock_thread):
         mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
         mock_get_num_editors.return_value = 2
-        mock_test_spec_list = [mock.MagicMock(), mock.MagicMock()]
-        mock_test_data = mock.MagicMock()
+        mock_test_spec_list = self.make_mock_test_specs(2)
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
 
-        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(), mock_test_data,
-                                            mock_test_spec_list, [])
+        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(),
+                                            mock_test_data, mock_test_spec_list, [])
 
         assert mock_setup_test.called
-        assert mock_test_data.results.update.call_count == len(mock_test_spec_list)
-        assert mock_thread.call_count == len(mock_test_spec_list)
+        # The threads are mocked, so no test reports a result
+        assert len(mock_test_data.results) == len(mock_test_spec_list)
+        assert all(isinstance(result, ly_test_tools.o3de.editor_test.Result.Unknown)
+                   for result in mock_test_data.results.values())
+        assert mock_thread.call_count == 2
 
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
     @mock.patch('threading.Thread')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test')
     @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
-    def test_RunParallelTests_TenTestsAndTwoEditors_TenThreads(self, mock_setup_test, mock_get_num_editors, mock_thread):
+    def test_RunParallelTests_TenTestsAndTwoEditors_TwoThreads(self, mock_setup_test, mock_get_num_editors,
+                                                               mock_thread):
         mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
         mock_get_num_editors.return_value = 2
-        mock_test_spec_list = []
-        for i in range(10):
-            mock_test_spec_list.append(mock.MagicMock())
-        mock_test_data = mock.MagicMock()
+        mock_test_spec_list = self.make_mock_test_specs(10)
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
 
-        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(), mock_test_data,
-                                            mock_test_spec_list, [])
+        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(),
+                                            mock_test_data, mock_test_spec_list, [])
 
         assert mock_setup_test.called
-        assert mock_test_data.results.update.call_count == len(mock_test_spec_list)
-        assert mock_thread.call_count == len(mock_test_spec_list)
+        # The threads are mocked, so no test reports a result
+        assert len(mock_test_data.results) == len(mock_test_spec_list)
+        assert all(isinstance(result, ly_test_tools.o3de.editor_test.Result.Unknown)
+                   for result in mock_test_data.results.values())
+        assert mock_thread.call_count == 2
 
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
     @mock.patch('threading.Thread')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test')
     @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
-    def test_RunParallelTests_TenTestsAndThreeEditors_TenThreads(self, mock_setup_test, mock_get_num_editors,
-                                                                 mock_thread):
+    def test_RunParallelTests_TenTestsAndThreeEditors_ThreeThreads(self, mock_setup_test, mock_get_num_editors,
+                                                                   mock_thread):
         mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
         mock_get_num_editors.return_value = 3
-        mock_test_spec_list = []
-        for i in range(10):
-            mock_test_spec_list.append(mock.MagicMock())
-        mock_test_data = mock.MagicMock()
+        mock_test_spec_list = self.make_mock_test_specs(10)
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
 
-        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(), mock_test_data,
-                                            mock_test_spec_list, [])
+        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(),
+                                            mock_test_data, mock_test_spec_list, [])
 
         assert mock_setup_test.called
-        assert mock_test_data.results.update.call_count == len(mock_test_spec_list)
-        assert mock_thread.call_count == len(mock_test_spec_list)
+        # The threads are mocked, so no test reports a result
+        assert len(mock_test_data.results) == len(mock_test_spec_list)
+        assert all(isinstance(result, ly_test_tools.o3de.editor_test.Result.Unknown)
+                   for result in mock_test_data.results.values())
+        assert mock_thread.call_count == 3
 
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
     @mock.patch('threading.Thread')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test')
@@ -931,56 +971,299 @@ class TestRunningTests(unittest.TestCase):
                                                                    mock_thread):
         mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
         mock_get_num_editors.return_value = 2
-        mock_test_spec_list = [mock.MagicMock(), mock.MagicMock()]
-        mock_test_data = mock.MagicMock()
+        mock_test_spec_list = self.make_mock_test_specs(2)
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
 
         mock_test_suite._run_parallel_batched_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(),
                                                     mock_test_data, mock_test_spec_list, [])
 
         assert mock_setup_test.called
-        assert mock_test_data.results.update.call_count == len(mock_test_spec_list)
-        assert mock_thread.call_count == len(mock_test_spec_list)
+        # The threads are mocked, so no test reports a result
+        assert len(mock_test_data.results) == len(mock_test_spec_list)
+        assert all(isinstance(result, ly_test_tools.o3de.editor_test.Result.Unknown)
+                   for result in mock_test_data.results.values())
+        assert mock_thread.call_count == 2
 
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
     @mock.patch('threading.Thread')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test')
     @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
     def test_RunParallelBatchedTests_TenTestsAndTwoEditors_2Threads(self, mock_setup_test, mock_get_num_editors,
-                                                                      mock_thread):
+                                                                    mock_thread):
         mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
         mock_get_num_editors.return_value = 2
-        mock_test_spec_list = []
-        for i in range(10):
-            mock_test_spec_list.append(mock.MagicMock())
-        mock_test_data = mock.MagicMock()
+        mock_test_spec_list = self.make_mock_test_specs(10)
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
 
         mock_test_suite._run_parallel_batched_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(),
                                                     mock_test_data, mock_test_spec_list, [])
 
         assert mock_setup_test.called
-        assert mock_test_data.results.update.call_count == 2
+        # The threads are mocked, so no test reports a result
+        assert len(mock_test_data.results) == len(mock_test_spec_list)
+        assert all(isinstance(result, ly_test_tools.o3de.editor_test.Result.Unknown)
+                   for result in mock_test_data.results.values())
         assert mock_thread.call_count == 2
 
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
     @mock.patch('threading.Thread')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
     @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test')
     @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
     def test_RunParallelBatchedTests_TenTestsAndThreeEditors_ThreeThreads(self, mock_setup_test, mock_get_num_editors,
-                                                                        mock_thread):
+                                                                          mock_thread):
         mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
         mock_get_num_editors.return_value = 3
-        mock_test_spec_list = []
-        for i in range(10):
-            mock_test_spec_list.append(mock.MagicMock())
-        mock_test_data = mock.MagicMock()
+        mock_test_spec_list = self.make_mock_test_specs(10)
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
 
         mock_test_suite._run_parallel_batched_tests(mock.MagicMock(), mock.MagicMock(), mock.MagicMock(),
                                                     mock_test_data, mock_test_spec_list, [])
 
         assert mock_setup_test.called
-        assert mock_test_data.results.update.call_count == 3
+        # The threads are mocked, so no test reports a result
+        assert len(mock_test_data.results) == len(mock_test_spec_list)
+        assert all(isinstance(result, ly_test_tools.o3de.editor_test.Result.Unknown)
+                   for result in mock_test_data.results.values())
         assert mock_thread.call_count == 3
 
+    class _FakeEditor(object):
+        def __init__(self, workspace, args):
+            self.workspace = workspace
+            self.args = args
+
+    @staticmethod
+    def make_timed_exec(durations):
+        def exec_editor_test(request, workspace, editor, run_id, log_name, test_spec, cmdline_args=None):
+            time.sleep(durations[test_spec.__name__])
+            return {test_spec.__name__: ly_test_tools.o3de.editor_test.Result.Pass(test_spec, "", "")}
+        return exec_editor_test
+
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._exec_editor_test')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
+    def test_RunParallelTests_OneSlowTest_OtherSlotRunsRemainingTests(self, mock_get_num_editors, mock_exec_test):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_get_num_editors.return_value = 2
+        mock_test_spec_list = self.make_mock_test_specs(5)
+        durations = {test_spec.__name__: 0.01 for test_spec in mock_test_spec_list}
+        durations["test_0"] = 0.5
+        mock_exec_test.side_effect = self.make_timed_exec(durations)
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
+
+        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), self._FakeEditor(None, []),
+                                            mock_test_data, mock_test_spec_list, [])
+
+        assert all(isinstance(mock_test_data.results[test_spec.__name__], ly_test_tools.o3de.editor_test.Result.Pass)
+                   for test_spec in mock_test_spec_list)
+        # The slot running the slow test is the only one kept busy by it, the other slot runs every other test
+        assert sorted(len(slot_timing.runs) for slot_timing in mock_test_data.slot_timings) == [1, 4]
+        for slot_timing in mock_test_data.slot_timings:
+            assert slot_timing.runner_name == "run_parallel_tests"
+            assert 0.0 < slot_timing.utilization <= 1.0
+            assert slot_timing.busy_secs <= slot_timing.total_secs
+
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._exec_editor_multitest')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
+    def test_RunParallelBatchedTests_TenTestsAndTwoEditors_SlotsPullBatches(self, mock_get_num_editors,
+                                                                            mock_exec_multitest):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_get_num_editors.return_value = 2
+        mock_test_spec_list = self.make_mock_test_specs(10)
+        run_batches = []
+
+        def exec_editor_multitest(request, workspace, editor, run_id, log_name, test_spec_list, cmdline_args=None):
+            run_batches.append([test_spec.__name__ for test_spec in test_spec_list])
+            # The editor is duplicated for every batch, so arguments from a previous batch are not kept
+            assert editor.args == []
+            editor.args.append("--runpythontest")
+            return {test_spec.__name__: ly_test_tools.o3de.editor_test.Result.Pass(test_spec, "", "")
+                    for test_spec in test_spec_list}
+        mock_exec_multitest.side_effect = exec_editor_multitest
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
+
+        mock_test_suite._run_parallel_batched_tests(mock.MagicMock(), mock.MagicMock(), self._FakeEditor(None, []),
+                                                    mock_test_data, mock_test_spec_list, [])
+
+        # The tests are split into batches_per_parallel_editor batches for each editor
+        assert len(run_batches) == 2 * mock_test_suite.batches_per_parallel_editor
+        assert sorted(sum(run_batches, [])) == sorted(test_spec.__name__ for test_spec in mock_test_spec_list)
+        assert len(mock_test_data.results) == len(mock_test_spec_list)
+        assert sum(len(slot_timing.runs) for slot_timing in mock_test_data.slot_timings) == len(run_batches)
+
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._exec_editor_test')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs')
+    def test_RunParallelTests_TestRaises_OtherTestsStillRun(self, mock_save_joblogs, mock_get_num_editors,
+                                                            mock_exec_test):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_get_num_editors.return_value = 1
+        mock_test_spec_list = self.make_mock_test_specs(3)
+        exec_editor_test = self.make_timed_exec({test_spec.__name__: 0 for test_spec in mock_test_spec_list})
+
+        def raise_on_first_test(request, workspace, editor, run_id, log_name, test_spec, cmdline_args=None):
+            if test_spec.__name__ == "test_0":
+                raise AssertionError()
+            return exec_editor_test(request, workspace, editor, run_id, log_name, test_spec, cmdline_args)
+        mock_exec_test.side_effect = raise_on_first_test
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
+
+        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), self._FakeEditor(None, []),
+                                            mock_test_data, mock_test_spec_list, [])
+
+        assert isinstance(mock_test_data.results["test_0"], ly_test_tools.o3de.editor_test.Result.Unknown)
+        assert isinstance(mock_test_data.results["test_1"], ly_test_tools.o3de.editor_test.Result.Pass)
+        assert isinstance(mock_test_data.results["test_2"], ly_test_tools.o3de.editor_test.Result.Pass)
+        assert mock_save_joblogs.called
+
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit',
+                mock.MagicMock(return_value=None))
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.save_test_durations')
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.load_test_duration_history')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._exec_editor_multitest')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_number_parallel_editors')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
+    def test_RunParallelBatchedTests_DurationHistory_BalancesBatchesAndSavesDurations(
+            self, mock_get_num_editors, mock_exec_multitest, mock_load_history, mock_save_durations):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_test_suite.batches_per_parallel_editor = 1
+        mock_test_suite.default_test_duration_estimate = 5
+        mock_get_num_editors.return_value = 2
+        mock_test_spec_list = self.make_mock_test_specs(4)
+        # test_3 has no history and is expected to take the default estimate
+        mock_load_history.return_value = {"test_0": [20.0], "test_1": [15.0], "test_2": [10.0]}
+        run_batches = []
+
+        def exec_editor_multitest(request, workspace, editor, run_id, log_name, test_spec_list, cmdline_args=None):
+            run_batches.append([test_spec.__name__ for test_spec in test_spec_list])
+            results = {test_spec.__name__: ly_test_tools.o3de.editor_test.Result.Pass(
+                test_spec, "", "", float(test_spec.__name__[-1]) + 0.5) for test_spec in test_spec_list}
+            results[test_spec_list[-1].__name__] = ly_test_tools.o3de.editor_test.Result.Unknown(test_spec_list[-1])
+            return results
+        mock_exec_multitest.side_effect = exec_editor_multitest
+        mock_workspace = mock.MagicMock()
+        mock_workspace.artifact_manager.artifact_path = os.path.join("TestResults", "run")
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
+
+        mock_test_suite._run_parallel_batched_tests(mock.MagicMock(), mock_workspace, self._FakeEditor(None, []),
+                                                    mock_test_data, mock_test_spec_list, [])
+
+        assert sorted(run_batches) == [["test_0", "test_3"], ["test_1", "test_2"]]
+        # The durations reported by the tests which completed are recorded, the test with an Unknown result is not
+        history_path, test_durations = mock_save_durations.call_args[0]
+        assert history_path == os.path.join(os.path.abspath("TestResults"),
+                                            ly_test_tools.o3de.editor_test_utils.TEST_DURATION_HISTORY_FILENAME)
+        assert test_durations == {"test_0": 0.5, "test_1": 1.5}
+
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.save_test_durations')
+    def test_SaveTestDurations_NoReportedDurations_SavesOnlySingleTestRuns(self, mock_save_durations):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_test_spec_list = self.make_mock_test_specs(3)
+        mock_workspace = mock.MagicMock()
+        mock_workspace.artifact_manager.artifact_path = os.path.join("TestResults", "run")
+        batch_results = {test_spec.__name__: ly_test_tools.o3de.editor_test.Result.Pass(test_spec, "", "")
+                         for test_spec in mock_test_spec_list[:2]}
+        single_results = {"test_2": ly_test_tools.o3de.editor_test.Result.Timeout(mock_test_spec_list[2], "", 30, "")}
+
+        mock_test_suite._save_test_durations(mock_workspace, [(batch_results, 40.0), (single_results, 30.0)])
+
+        # The tests sharing an editor can't be timed separately, so only the single test is saved
+        _, test_durations = mock_save_durations.call_args[0]
+        assert test_durations == {"test_2": 30.0}
+
+    @staticmethod
+    def make_passing_warm_editor():
+        passing_editor = mock.MagicMock()
+        passing_editor.tests_run = 0
+        output = []
+
+        def start(cmdline_args, timeout):
+            passing_editor.cmdline_args = cmdline_args
+            return True
+
+        def run_test(test_filename, timeout):
+            passing_editor.tests_run += 1
+            output.append(f'JSON_START({{"name": "{test_filename}", "success": true, "output": ""}})JSON_END')
+            return True
+        passing_editor.start.side_effect = start
+        passing_editor.run_test.side_effect = run_test
+        passing_editor.editor.get_output.side_effect = lambda: "\n".join(output)
+        return passing_editor
+
+    @mock.patch('ly_test_tools.o3de.editor_test.WarmEditor')
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.retrieve_crash_output', mock.MagicMock(return_value="crash"))
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.cycle_crash_report', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.subscribe_editor_log', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.get_module_filename', lambda test_module: test_module)
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.get_testcase_module_filepath', lambda test_module: test_module)
+    def test_ExecWarmEditorTests_TestCrashes_RestartsEditorForNextTests(self, mock_warm_editor):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_test_suite.warm_editor_max_tests = 2
+        mock_test_spec_list = self.make_mock_test_specs(4)
+        for test_spec in mock_test_spec_list:
+            test_spec.test_module = test_spec.__name__
+            test_spec.attach_debugger = False
+            test_spec.wait_for_debugger = False
+        crashing_editor = mock.MagicMock()
+        crashing_editor.editor.get_output.return_value = ""
+        crashing_editor.run_test.return_value = None
+        crashing_editor.is_alive.return_value = False
+        passing_editors = [self.make_passing_warm_editor() for _ in range(2)]
+        mock_warm_editor.side_effect = [crashing_editor] + passing_editors
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
+
+        results = mock_test_suite._exec_warm_editor_tests(mock.MagicMock(), self._FakeEditor(None, []), mock_test_data,
+                                                          1, "editor_test.log", mock_test_spec_list)
+
+        assert isinstance(results["test_0"], ly_test_tools.o3de.editor_test.Result.Crash)
+        assert all(isinstance(results[f"test_{i}"], ly_test_tools.o3de.editor_test.Result.Pass) for i in range(1, 4))
+        # The crashed editor is replaced, and the next editor is restarted after warm_editor_max_tests tests
+        crashing_editor.stop.assert_called_once()
+        passing_editors[0].stop.assert_called_once()
+        assert mock_test_data.warm_editors == {1: passing_editors[1]}
+
+    @mock.patch('ly_test_tools.o3de.editor_test.WarmEditor')
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.cycle_crash_report', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.subscribe_editor_log', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.get_module_filename', lambda test_module: test_module)
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.get_testcase_module_filepath', lambda test_module: test_module)
+    def test_ExecWarmEditorTests_TestWaitsForDebugger_RestartsEditorWithDebuggerFlags(self, mock_warm_editor):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_test_spec_list = self.make_mock_test_specs(3)
+        for test_spec in mock_test_spec_list:
+            test_spec.test_module = test_spec.__name__
+            test_spec.attach_debugger = False
+            test_spec.wait_for_debugger = False
+        mock_test_spec_list[2].wait_for_debugger = True
+        warm_editors = [self.make_passing_warm_editor() for _ in range(3)]
+        mock_warm_editor.side_effect = warm_editors
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
+
+        for batch in (mock_test_spec_list[:2], mock_test_spec_list[1:], mock_test_spec_list[:1]):
+            results = mock_test_suite._exec_warm_editor_tests(mock.MagicMock(), self._FakeEditor(None, []),
+                                                              mock_test_data, 1, "editor_test.log", batch)
+            assert all(isinstance(result, ly_test_tools.o3de.editor_test.Result.Pass) for result in results.values())
+
+        # The editor is restarted with the debugger flags for the batch with the debugger test, and without them after
+        assert ["--wait-for-debugger" in warm_editor.cmdline_args for warm_editor in warm_editors] == [False, True, False]
+        assert [warm_editor.tests_run for warm_editor in warm_editors] == [2, 2, 1]
+        assert all("--attach-debugger" not in warm_editor.cmdline_args for warm_editor in warm_editors)
+        assert mock_test_data.warm_editors == {1: warm_editors[2]}
+
     def test_GetNumberParallelEditors_ConfigExists_ReturnsConfig(self):
         mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
         mock_request = mock.MagicMock()
@@ -998,6 +1281,81 @@ class TestRunningTests(unittest.TestCase):
         assert num_of_editors == mock_test_suite.get_number_parallel_editors()
 
 
+    @mock.patch('psutil.cpu_count')
+    def test_GetAdaptiveEditorLimit_OptionSet_LimitedByCoresAndConfig(self, mock_cpu_count):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_cpu_count.return_value = 64
+        mock_request = mock.MagicMock()
+        options = {"--editors-parallel-adaptive": True, "--editors-parallel": None}
+        mock_request.config.getoption.side_effect = lambda name, default=None: options[name]
+
+        editor_limit = mock_test_suite._get_adaptive_editor_limit(mock_request)
+        assert editor_limit.max_editors == 64 // mock_test_suite.adaptive_editor_cores
+
+        options["--editors-parallel"] = 4
+        editor_limit = mock_test_suite._get_adaptive_editor_limit(mock_request)
+        assert editor_limit.max_editors == 4
+
+        options["--editors-parallel-adaptive"] = False
+        assert mock_test_suite._get_adaptive_editor_limit(mock_request) is None
+
+    @mock.patch('psutil.virtual_memory')
+    @mock.patch('psutil.Process')
+    def test_AdaptiveEditorLimit_SampledEditors_ShrinksLimit(self, mock_process, mock_virtual_memory):
+        gb = 1024 * 1024 * 1024
+        editor_limit = ly_test_tools.o3de.editor_test.EditorTestSuite.AdaptiveEditorLimit(8, 0.8, 2 * gb)
+        mock_virtual_memory.return_value = mock.MagicMock(total=16 * gb, available=10 * gb)
+
+        # 6GB are used by other processes, 6.8GB are left under the ceiling for editors of 2GB
+        assert editor_limit.get_limit() == 3
+
+        mock_editor = mock.MagicMock()
+        mock_editor.name.return_value = "Editor.exe"
+        mock_editor.memory_info.return_value.rss = 4 * gb
+        mock_other = mock.MagicMock()
+        mock_other.name.return_value = "AssetProcessor.exe"
+        mock_other.memory_info.return_value.rss = 1 * gb
+        mock_process.return_value.children.return_value = [mock_editor, mock_other]
+        mock_virtual_memory.return_value = mock.MagicMock(total=16 * gb, available=8 * gb)
+        editor_limit.sample()
+
+        # 4GB are used by other processes, 8.8GB are left under the ceiling for editors of 4GB
+        assert editor_limit.peak_editor_rss == 4 * gb
+        assert editor_limit.get_limit() == 2
+
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._exec_editor_test')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._get_adaptive_editor_limit')
+    @mock.patch('ly_test_tools.o3de.editor_test.EditorTestSuite._setup_editor_test', mock.MagicMock())
+    @mock.patch('ly_test_tools.o3de.editor_test_utils.save_failed_asset_joblogs', mock.MagicMock())
+    def test_RunParallelTests_AdaptiveLimit_RunsUpToLimit(self, mock_get_editor_limit, mock_exec_test):
+        mock_test_suite = ly_test_tools.o3de.editor_test.EditorTestSuite()
+        mock_editor_limit = mock.MagicMock()
+        mock_editor_limit.max_editors = 3
+        mock_editor_limit.get_limit.return_value = 2
+        mock_get_editor_limit.return_value = mock_editor_limit
+        mock_test_spec_list = self.make_mock_test_specs(6)
+        exec_editor_test = self.make_timed_exec({test_spec.__name__: 0.05 for test_spec in mock_test_spec_list})
+        running = []
+        peak_running = []
+
+        def count_running_editors(request, workspace, editor, run_id, log_name, test_spec, cmdline_args=None):
+            running.append(test_spec)
+            peak_running.append(len(running))
+            try:
+                return exec_editor_test(request, workspace, editor, run_id, log_name, test_spec, cmdline_args)
+            finally:
+                running.remove(test_spec)
+        mock_exec_test.side_effect = count_running_editors
+        mock_test_data = ly_test_tools.o3de.editor_test.EditorTestSuite.TestData()
+
+        mock_test_suite._run_parallel_tests(mock.MagicMock(), mock.MagicMock(), self._FakeEditor(None, []),
+                                            mock_test_data, mock_test_spec_list, [])
+
+        assert len(mock_test_data.slot_timings) == 3
+        assert max(peak_running) == 2
+        assert all(isinstance(result, ly_test_tools.o3de.editor_test.Result.Pass)
+                   for result in mock_test_data.results.values())
+
 @mock.patch('_pytest.python.Class.collect')
 class TestEditorTestClass(unittest.TestCase):
 
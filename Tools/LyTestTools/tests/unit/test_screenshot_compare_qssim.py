@@ -7,12 +7,14 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 Unit test for ly_test_tools.image.screenshot_compare_qssim
 """
 
+import os
 import unittest.mock as mock
 
 import numpy as np
 import pytest
 
 import ly_test_tools.image.screenshot_compare_qssim as screenshot_compare
+from ly_test_tools.image.comparison_cache import ComparisonCache
 
 pytestmark = pytest.mark.SUITE_smoke
 
@@ -98,3 +100,80 @@ class TestScreenshotCompare(object):
         mock_imageRead.side_effect = [matrix_a,matrix_b]
         screenshot_compare.qssim('test1.jpg', 'test2.jpg')
         mock_imageSave.assert_called()
+
+    @mock.patch('imageio.imread')
+    @mock.patch('imageio.imwrite')
+    def test_qssim_TiledImage_SameAsWholeImage(self, mock_imageSave, mock_imageRead):
+        random = np.random.default_rng(0)
+        matrix_a = random.integers(0, 256, (40, 30, 3))
+        matrix_b = np.clip(matrix_a + random.integers(-30, 30, (40, 30, 3)), 0, 255)
+        mock_imageRead.side_effect = [matrix_a, matrix_b, matrix_a, matrix_b]
+
+        whole_similarity = screenshot_compare.qssim('test1.png', 'test2.png')
+        whole_diff = mock_imageSave.call_args[0][1]
+        with mock.patch('ly_test_tools.image.screenshot_compare_qssim.QSSIM_TILE_ROWS', 7):
+            tiled_similarity = screenshot_compare.qssim('test1.png', 'test2.png')
+        tiled_diff = mock_imageSave.call_args[0][1]
+
+        assert 0.5 < tiled_similarity < 1
+        assert tiled_similarity == pytest.approx(whole_similarity, abs=1e-6)
+        assert np.array_equal(whole_diff, tiled_diff)
+
+    @mock.patch('imageio.imread')
+    def test_qssim_IdenticalFiles_ReturnsOneWithoutReadingImages(self, mock_imageRead, tmp_path):
+        screenshot = tmp_path / 'screenshot.png'
+        golden = tmp_path / 'golden.png'
+        screenshot.write_bytes(b'image data')
+        golden.write_bytes(b'image data')
+
+        assert screenshot_compare.qssim(str(screenshot), str(golden)) == 1.0
+        mock_imageRead.assert_not_called()
+
+    @mock.patch('ly_test_tools.image.screenshot_compare_qssim.qssim')
+    def test_CompareScreenshotDirectory_GoldensByName_ComparesPairsWithGolden(self, mock_qssim, tmp_path):
+        screenshot_dir = tmp_path / 'screenshots'
+        golden_dir = tmp_path / 'goldens'
+        screenshot_dir.mkdir()
+        golden_dir.mkdir()
+        for name in ['a.png', 'b.png', 'no_golden.png']:
+            (screenshot_dir / name).write_bytes(b'screenshot')
+        for name in ['a.png', 'b.png']:
+            (golden_dir / name).write_bytes(b'golden')
+        mock_qssim.side_effect = [0.5, 0.9]
+
+        result = screenshot_compare.compare_screenshot_directory(str(screenshot_dir), str(golden_dir), max_workers=1)
+
+        assert result == {'a.png': 0.5, 'b.png': 0.9}
+        mock_qssim.assert_any_call(str(screenshot_dir / 'a.png'), str(golden_dir / 'a.png'), channel_max=255,
+                                   diff_path='.', cache=None)
+
+    def test_CompareScreenshots_ManyPairs_ComparesInProcessPool(self, tmp_path):
+        pairs = []
+        for i in range(2):
+            screenshot = tmp_path / f'screenshot_{i}.png'
+            golden = tmp_path / f'golden_{i}.png'
+            screenshot.write_bytes(b'same image')
+            golden.write_bytes(b'same image')
+            pairs.append((str(screenshot), str(golden)))
+
+        assert screenshot_compare.compare_screenshots(pairs, max_workers=2) == [1.0, 1.0]
+
+    @mock.patch('imageio.imwrite')
+    @mock.patch('imageio.imread')
+    def test_qssim_CachedComparison_ReturnsCachedResult(self, mock_imageRead, mock_imageSave, tmp_path):
+        screenshot = tmp_path / 'screenshot.png'
+        golden = tmp_path / 'golden.png'
+        screenshot.write_bytes(b'screenshot data')
+        golden.write_bytes(b'golden data')
+        mock_imageRead.side_effect = [np.array([[[1, 2, 3], [4, 5, 6], [7, 8, 9]]]),
+                                      np.array([[[1, 2, 3], [4, 5, 6], [7, 8, 19]]])]
+        mock_imageSave.side_effect = lambda path, image: open(path, 'wb').close()
+        cache = ComparisonCache(str(tmp_path / 'cache.sqlite'))
+
+        similarity = screenshot_compare.qssim(str(screenshot), str(golden), diff_path=str(tmp_path), cache=cache)
+        os.remove(tmp_path / 'screenshot_diff.png')
+        cached_similarity = screenshot_compare.qssim(str(screenshot), str(golden), diff_path=str(tmp_path), cache=cache)
+
+        assert cached_similarity == similarity
+        assert mock_imageRead.call_count == 2
+        assert os.path.isfile(tmp_path / 'screenshot_diff.png')
@@ -0,0 +1,139 @@
+"""
+Copyright (c) Contributors to the Open 3D Engine Project.
+For complete copyright and license terms please see the LICENSE at the root of this distribution.
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+
+Unit tests for ly_test_tools.o3de.warm_editor
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+import unittest
+import unittest.mock as mock
+
+import pytest
+
+import ly_test_tools.o3de.warm_editor as warm_editor
+from ly_test_tools.launchers.exceptions import WaitTimeoutError
+
+pytestmark = pytest.mark.SUITE_smoke
+
+PASSING_TEST_MODULE = """
+import sys
+sys.modules["warm_editor_test_state"] = object()
+"""
+
+FAILING_TEST_MODULE = """
+import sys
+assert "warm_editor_test_state" not in sys.modules, "state from the previous test was not reset"
+raise AssertionError("test failed")
+"""
+
+
+def make_fake_azlmbr_modules():
+    general = types.ModuleType("azlmbr.legacy.general")
+    general.is_in_game_mode = lambda: False
+    general.idle_wait = time.sleep
+    legacy = types.ModuleType("azlmbr.legacy")
+    legacy.general = general
+    azlmbr = types.ModuleType("azlmbr")
+    azlmbr.legacy = legacy
+    return {"azlmbr": azlmbr, "azlmbr.legacy": legacy, "azlmbr.legacy.general": general}
+
+
+class FakeEditor(object):
+    """
+    Runs the warm editor server in a thread instead of an Editor process
+    """
+
+    def __init__(self, run_server=True):
+        self.args = []
+        self.run_server = run_server
+        self.stopped = False
+        self._thread = None
+
+    def start(self, backupFiles=True, launch_ap=None, configure_settings=True):
+        if self.run_server:
+            import ly_test_tools.o3de.warm_editor_server as warm_editor_server
+            control_folder = self.args[self.args.index("--runpythonargs") + 1]
+            self._thread = threading.Thread(target=warm_editor_server.main, args=(control_folder,))
+            self._thread.start()
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout=30):
+        self._thread.join(timeout)
+
+    def get_returncode(self):
+        return 0
+
+    def stop(self):
+        self.stopped = True
+
+
+class TestWarmEditor(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.control_folder = os.path.join(self.temp_dir.name, "warm_editor")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_test_module(self, name, content):
+        path = os.path.join(self.temp_dir.name, f"{name}.py")
+        with open(path, "w") as test_module:
+            test_module.write(content)
+        return path
+
+    @mock.patch('ly_test_tools.o3de.warm_editor.POLL_INTERVAL', 0.01)
+    def test_RunTest_ManyTests_RunsEachTestInSameEditor(self):
+        passing_test = self.write_test_module("passing_test", PASSING_TEST_MODULE)
+        failing_test = self.write_test_module("failing_test", FAILING_TEST_MODULE)
+        editor = FakeEditor()
+        under_test = warm_editor.WarmEditor(editor, self.control_folder)
+
+        with mock.patch.dict(sys.modules, make_fake_azlmbr_modules()):
+            assert under_test.start(["-BatchMode"], timeout=10)
+            assert editor.args == ["--runpythontest", warm_editor.SERVER_SCRIPT, "--runpythonargs",
+                                   self.control_folder, "-BatchMode"]
+            assert under_test.cmdline_args == ["-BatchMode"]
+
+            assert under_test.run_test(passing_test, timeout=10) is True
+            assert under_test.run_test(failing_test, timeout=10) is False
+            assert under_test.run_test(passing_test, timeout=10) is True
+            assert under_test.tests_run == 3
+
+            under_test.stop(timeout=10)
+
+        assert not editor.is_alive()
+        assert editor.stopped
+
+    @mock.patch('ly_test_tools.o3de.warm_editor.POLL_INTERVAL', 0.01)
+    def test_Start_EditorExits_ReturnsFalse(self):
+        under_test = warm_editor.WarmEditor(FakeEditor(run_server=False), self.control_folder)
+
+        assert not under_test.start([], timeout=10)
+
+    @mock.patch('ly_test_tools.o3de.warm_editor.POLL_INTERVAL', 0.01)
+    def test_RunTest_EditorExits_ReturnsNone(self):
+        editor = FakeEditor(run_server=False)
+        under_test = warm_editor.WarmEditor(editor, self.control_folder)
+        os.makedirs(self.control_folder)
+
+        assert under_test.run_test("test_module.py", timeout=10) is None
+
+    @mock.patch('ly_test_tools.o3de.warm_editor.POLL_INTERVAL', 0.01)
+    def test_RunTest_NoResult_RaisesTimeout(self):
+        editor = FakeEditor(run_server=False)
+        editor.is_alive = mock.MagicMock(return_value=True)
+        under_test = warm_editor.WarmEditor(editor, self.control_folder)
+        os.makedirs(self.control_folder)
+
+        with pytest.raises(WaitTimeoutError):
+            under_test.run_test("test_module.py", timeout=0.05)
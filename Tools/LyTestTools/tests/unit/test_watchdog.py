@@ -6,6 +6,8 @@ SPDX-License-Identifier: Apache-2.0 OR MIT
 
 Unit Tests for watchdog.py
 """
+import os
+import tempfile
 import unittest
 import unittest.mock as mock
 import pytest
@@ -232,18 +234,19 @@ class TestCrashLogWatchdog(unittest.TestCase):
 
     @mock.patch('threading.Thread.join', mock.MagicMock())
     @mock.patch('builtins.print')
-    @mock.patch('builtins.open')
-    @mock.patch('os.path.exists')
-    def test_CrashLogWatchdogStop_LogsExists_OpensLogAndPrints(self, mock_exists, mock_open, mock_print):
-        mock_exists.side_effect = [False, True]
-        mock_watchdog = watchdog.CrashLogWatchdog(self.mock_log_path)
-        mock_watchdog.caught_failure = True
-        mock_watchdog._raise_on_condition = False
-
-        mock_watchdog.stop()
-
-        mock_open.assert_called_once_with(mock_watchdog._log_path, "r")
-        assert mock_print.called
+    def test_CrashLogWatchdogStop_LogsExists_ReadsLogAndPrints(self, mock_print):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, 'error.log')
+            mock_watchdog = watchdog.CrashLogWatchdog(log_path)
+            mock_watchdog.caught_failure = True
+            mock_watchdog._raise_on_condition = False
+            with open(log_path, 'w') as crash_log:
+                crash_log.write('crash line 1\ncrash line 2')
+
+            mock_watchdog.stop()
+
+        mock_print.assert_any_call('crash line 1')
+        mock_print.assert_any_call('crash line 2')
 
     @mock.patch('threading.Thread.join', mock.MagicMock())
     @mock.patch('builtins.print')
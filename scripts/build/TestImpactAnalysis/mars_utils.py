@@ -6,13 +6,32 @@
 #
 #
 
+import contextlib
 import datetime
+import errno
 import json
+import os
 import socket
+import tempfile
+import time
 from tiaf_logger import get_logger
 
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
 logger = get_logger(__file__)
 
+# Events which could not be sent to Filebeat are kept in this file and sent by the next run, unless another path is given
+MARS_SPOOL_PATH = os.path.join(tempfile.gettempdir(), "tiaf_mars_spool.ndjson")
+FILEBEAT_MAX_BATCH_BYTES = 64 * 1024
+FILEBEAT_MAX_BUFFERED_BYTES = 16 * 1024 * 1024
+FILEBEAT_MAX_SPOOL_BYTES = 64 * 1024 * 1024
+FILEBEAT_RECONNECT_INTERVAL = 5
+SPOOL_LOCK_TIMEOUT = 60
+SPOOL_LOCK_RETRY_INTERVAL = 0.1
+
 MARS_JOB_KEY = "job"
 BUILD_NUMBER_KEY = "build_number"
 SRC_COMMIT_KEY = "src_commit"
@@ -101,6 +120,13 @@ class FilebeatClient(object):
         self._open_socket()
 
     def send_event(self, payload, index, timestamp=None, pipeline="filebeat"):
+        data = self._serialize_event(payload, index, timestamp, pipeline)
+
+        #print(f"-> {data}")
+        self._send_data(data)
+
+    @staticmethod
+    def _serialize_event(payload, index, timestamp, pipeline):
         if not timestamp:
             timestamp = datetime.datetime.utcnow().timestamp()
 
@@ -113,10 +139,7 @@ class FilebeatClient(object):
 
         # Serialise event, add new line and encode as UTF-8 before sending to Filebeat.
         data = json.dumps(event, sort_keys=True) + "\n"
-        data = data.encode()
-
-        #print(f"-> {data}")
-        self._send_data(data)
+        return data.encode()
 
     def _open_socket(self):
         logger.info(f"Connecting to Filebeat on {self._filebeat_host}:{self._filebeat_port}")
@@ -143,6 +166,228 @@ class FilebeatClient(object):
             else:
                 total_sent = total_sent + sent
 
+@contextlib.contextmanager
+def _locked_spool(spool_path):
+    """
+    Opens the spool file and holds an exclusive lock on it, so that clients in other processes sharing the spool file
+    do not append to it while it is sent and truncated. The file is only ever modified in place, never removed or
+    replaced, so that every client locks the same file.
+
+    @param spool_path: Path of the spool file, which is created if it doesn't exist.
+    @raises TimeoutError: If another process still holds the lock after SPOOL_LOCK_TIMEOUT seconds.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(spool_path)), exist_ok=True)
+    with os.fdopen(os.open(spool_path, os.O_RDWR | os.O_CREAT), "r+b") as spool:
+        # Only lock contention is retried, any other error is raised immediately
+        if os.name == "nt":
+            busy_errors = (errno.EDEADLOCK, errno.EACCES)
+        else:
+            busy_errors = (errno.EAGAIN, errno.EWOULDBLOCK)
+        deadline = time.monotonic() + SPOOL_LOCK_TIMEOUT
+        while True:
+            try:
+                if os.name == "nt":
+                    spool.seek(0)
+                    msvcrt.locking(spool.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(spool.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError as e:
+                if e.errno not in busy_errors:
+                    raise
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(errno.ETIMEDOUT, f"Timed out waiting for another process to release the "
+                                                        f"spool file {spool_path}") from e
+            time.sleep(SPOOL_LOCK_RETRY_INTERVAL)
+        try:
+            yield spool
+        finally:
+            spool.flush()
+            if os.name == "nt":
+                spool.seek(0)
+                msvcrt.locking(spool.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(spool.fileno(), fcntl.LOCK_UN)
+
+def _remove_spool_head(spool, start, chunk_bytes=FILEBEAT_MAX_BATCH_BYTES):
+    """
+    Moves the content of the locked spool file from start to the beginning of the file, dropping the content before it.
+
+    @param spool:       Spool file opened by _locked_spool().
+    @param start:       Offset of the first byte to keep.
+    @param chunk_bytes: Size of the chunks copied at once.
+    """
+    read_position = start
+    write_position = 0
+    while True:
+        spool.seek(read_position)
+        data = spool.read(chunk_bytes)
+        if not data:
+            break
+        read_position += len(data)
+        spool.seek(write_position)
+        spool.write(data)
+        write_position += len(data)
+    spool.truncate(write_position)
+
+class BufferedFilebeatClient(FilebeatClient):
+    def __init__(self, host="127.0.0.1", port=9000, timeout=20, spool_path=None,
+                 max_batch_bytes=FILEBEAT_MAX_BATCH_BYTES, max_buffered_bytes=FILEBEAT_MAX_BUFFERED_BYTES,
+                 max_spool_bytes=FILEBEAT_MAX_SPOOL_BYTES, reconnect_interval=FILEBEAT_RECONNECT_INTERVAL):
+        """
+        Filebeat client which batches events into newline-delimited frames sent over one persistent connection.
+        Sending a frame blocks while Filebeat is not reading, up to the socket timeout.
+        While Filebeat can't be reached the events are appended to the spool file, which is sent before any other event
+        once Filebeat is reached again, by this client or by a later client using the same spool file.
+        The spool file is locked while it is modified, so it can be shared by clients in several processes.
+
+        @param host:               Host of Filebeat.
+        @param port:               Port of Filebeat.
+        @param timeout:            Seconds to wait for Filebeat to connect or to read a frame before it is considered down.
+        @param spool_path:         Path of the file keeping events while Filebeat is down, or None to keep them in memory.
+        @param max_batch_bytes:    Size of buffered events which are sent as one frame.
+        @param max_buffered_bytes: Size of events kept in memory while Filebeat is down and there is no spool file.
+        @param max_spool_bytes:    Size of the spool file above which the oldest events in it are dropped.
+        @param reconnect_interval: Seconds between attempts to reconnect to Filebeat while it is down.
+        """
+        self._filebeat_host = host
+        self._filebeat_port = port
+        self._socket_timeout = timeout
+        self._socket = None
+        self._spool_path = spool_path
+        self._max_batch_bytes = max_batch_bytes
+        self._max_buffered_bytes = max_buffered_bytes
+        self._max_spool_bytes = max_spool_bytes
+        self._reconnect_interval = reconnect_interval
+        self._next_connect_time = 0
+        self._buffer = []
+        self._buffered_bytes = 0
+
+        if self._connect():
+            self._send_spool()
+        elif spool_path is None:
+            raise FilebeatExn("Failed to connect to Filebeat")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def send_event(self, payload, index, timestamp=None, pipeline="filebeat"):
+        data = self._serialize_event(payload, index, timestamp, pipeline)
+        self._buffer.append(data)
+        self._buffered_bytes += len(data)
+        if self._buffered_bytes >= self._max_batch_bytes:
+            self.flush()
+
+    def flush(self):
+        """
+        Sends the buffered events to Filebeat, or appends them to the spool file if Filebeat can't be reached.
+        """
+        if not self._buffer:
+            return
+
+        data = b"".join(self._buffer)
+        if self._connect() and self._send_spool() and self._send_frame(data):
+            pass
+        elif self._spool_path is not None:
+            logger.info(f"Filebeat can't be reached, spooling {len(self._buffer)} events to {self._spool_path}")
+            self._append_spool(data)
+        elif self._buffered_bytes > self._max_buffered_bytes:
+            raise FilebeatExn(f"Filebeat can't be reached and {self._buffered_bytes} bytes of events are buffered")
+        else:
+            # Keep the events, they are sent with the next frame
+            return
+
+        self._buffer = []
+        self._buffered_bytes = 0
+
+    def close(self):
+        """
+        Sends the buffered events and closes the connection.
+        """
+        try:
+            self.flush()
+            if self._buffer:
+                raise FilebeatExn(f"Filebeat can't be reached, {len(self._buffer)} events were not sent")
+        finally:
+            self._close_socket()
+
+    def _connect(self):
+        if self._socket is not None:
+            return True
+        if time.monotonic() < self._next_connect_time:
+            return False
+
+        try:
+            self._open_socket()
+        except (FilebeatExn, OSError) as e:
+            logger.warning(f"Failed to connect to Filebeat: {e}")
+            self._close_socket()
+            self._next_connect_time = time.monotonic() + self._reconnect_interval
+            return False
+        return True
+
+    def _close_socket(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _send_frame(self, data):
+        # The peer may have closed an idle connection, so reconnect once before considering Filebeat down
+        for attempt in range(2):
+            if attempt and not self._connect():
+                return False
+            try:
+                self._socket.sendall(data)
+                return True
+            except OSError as e:
+                logger.warning(f"Failed to send to Filebeat: {e}")
+                self._close_socket()
+        return False
+
+    def _append_spool(self, data):
+        with _locked_spool(self._spool_path) as spool:
+            spool.seek(0, os.SEEK_END)
+            spool.write(data)
+            size = spool.tell()
+            if size > self._max_spool_bytes:
+                # Drop the oldest events, keeping the file starting on an event boundary
+                spool.seek(size - self._max_spool_bytes - 1)
+                spool.readline()
+                start = spool.tell()
+                logger.warning(f"Spool file {self._spool_path} is full, dropping the oldest {start} bytes of events")
+                _remove_spool_head(spool, start)
+
+    def _send_spool(self):
+        """
+        Sends the events of the spool file, and empties the file once they are all sent.
+
+        @return: True if the spool file is empty.
+        """
+        if self._spool_path is None or not os.path.isfile(self._spool_path):
+            return True
+
+        with _locked_spool(self._spool_path) as spool:
+            frame = b""
+            while True:
+                data = spool.read(self._max_batch_bytes)
+                frame += data
+                # Frames end on an event boundary
+                end = frame.rfind(b"\n") + 1 if data else len(frame)
+                if end and not self._send_frame(frame[:end]):
+                    break
+                frame = frame[end:]
+                if not data:
+                    break
+
+            # Keep the events which were not sent
+            start = spool.tell() - len(frame)
+            sent_all = start == spool.seek(0, os.SEEK_END)
+            _remove_spool_head(spool, start)
+            return sent_all
+
 def format_timestamp(timestamp: float):
     """
     Formats the given floating point timestamp into "yyyy-MM-dd'T'HH:mm:ss.SSSXX" format.
@@ -422,34 +667,35 @@ def generate_mars_test_targets(sequence_report: dict, mars_job: dict, t0_timesta
 
     return mars_test_targets
 
-def transmit_report_to_mars(mars_index_prefix: str, tiaf_result: dict, driver_args: list, build_number: int):
+def transmit_report_to_mars(mars_index_prefix: str, tiaf_result: dict, driver_args: list, build_number: int, spool_path: str = MARS_SPOOL_PATH):
     """
     Transforms the TIAF result into the appropriate MARS documents and transmits them to MARS.
 
     @param mars_index_prefix: The index prefix to be used for all MARS documents.
     @param tiaf_result:       The result object from the TIAF script.
     @param driver_args:       The arguments passed to the TIAF driver script.
+    @param spool_path:        The file keeping the documents while Filebeat can't be reached, shared by the runs using it.
     """
     
     try:
-        filebeat = FilebeatClient("localhost", 9000, 60)
-
-        # T0 is the current timestamp that the report timings will be offset from
-        t0_timestamp = datetime.datetime.now().timestamp()
-
-        # Generate and transmit the MARS job document
-        mars_job = generate_mars_job(tiaf_result, driver_args, build_number)
-        filebeat.send_event(mars_job, f"{mars_index_prefix}.tiaf.job")
-
-        if tiaf_result[REPORT_KEY]:
-            # Generate and transmit the MARS sequence document
-            mars_sequence = generate_mars_sequence(tiaf_result[REPORT_KEY], mars_job, tiaf_result[CHANGE_LIST_KEY], t0_timestamp)
-            filebeat.send_event(mars_sequence, f"{mars_index_prefix}.tiaf.sequence")
-            
-            # Generate and transmit the MARS test target documents
-            mars_test_targets = generate_mars_test_targets(tiaf_result[REPORT_KEY], mars_job, t0_timestamp)
-            for mars_test_target in mars_test_targets:
-                filebeat.send_event(mars_test_target, f"{mars_index_prefix}.tiaf.test_target")
+        # The events are sent in batches, and spooled to be sent by the next run if Filebeat can't be reached
+        with BufferedFilebeatClient("localhost", 9000, 60, spool_path=spool_path) as filebeat:
+            # T0 is the current timestamp that the report timings will be offset from
+            t0_timestamp = datetime.datetime.now().timestamp()
+
+            # Generate and transmit the MARS job document
+            mars_job = generate_mars_job(tiaf_result, driver_args, build_number)
+            filebeat.send_event(mars_job, f"{mars_index_prefix}.tiaf.job")
+
+            if tiaf_result[REPORT_KEY]:
+                # Generate and transmit the MARS sequence document
+                mars_sequence = generate_mars_sequence(tiaf_result[REPORT_KEY], mars_job, tiaf_result[CHANGE_LIST_KEY], t0_timestamp)
+                filebeat.send_event(mars_sequence, f"{mars_index_prefix}.tiaf.sequence")
+
+                # Generate and transmit the MARS test target documents
+                mars_test_targets = generate_mars_test_targets(tiaf_result[REPORT_KEY], mars_job, t0_timestamp)
+                for mars_test_target in mars_test_targets:
+                    filebeat.send_event(mars_test_target, f"{mars_index_prefix}.tiaf.test_target")
     except FilebeatExn as e:
         logger.error(e)
     except KeyError as e:
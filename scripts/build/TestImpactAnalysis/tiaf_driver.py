@@ -88,6 +88,14 @@ def parse_args():
         required=False
     )
 
+    # MARS spool path
+    parser.add_argument(
+        '--mars-spool-path', 
+        help="File keeping the MARS documents while they can't be transmitted, which are sent by the next run using it", 
+        default=mars_utils.MARS_SPOOL_PATH,
+        required=False
+    )
+
     # Build number
     parser.add_argument(
         '--build-number', 
@@ -154,7 +162,7 @@ if __name__ == "__main__":
         
         if args.mars_index_prefix:
             logger.info("Transmitting report to MARS...")
-            mars_utils.transmit_report_to_mars(args.mars_index_prefix, tiaf_result, sys.argv, args.build_number)
+            mars_utils.transmit_report_to_mars(args.mars_index_prefix, tiaf_result, sys.argv, args.build_number, args.mars_spool_path)
 
         logger.info("Complete!")
         # Non-gating will be removed from this script and handled at the job level in SPEC-7413
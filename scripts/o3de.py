@@ -7,6 +7,7 @@
 #
 
 import argparse
+import importlib
 import logging
 import pathlib
 import sys
@@ -14,18 +15,68 @@ import sys
 logger = logging.getLogger('o3de')
 
 
-def add_args(parser: argparse.ArgumentParser) -> None:
+# The module which adds each sub-command, in the order the sub-commands are listed in the help.
+# Only the modules of the sub-commands being run are imported, so that starting o3de.py stays fast
+O3DE_COMMAND_MODULES = {
+    # global project
+    'get-global-project': 'global_project',
+    'set-global-project': 'global_project',
+    # engine template
+    'create-template': 'engine_template',
+    'create-from-template': 'engine_template',
+    'create-project': 'engine_template',
+    'create-gem': 'engine_template',
+    # registration
+    'register': 'register',
+    # show registration
+    'register-show': 'print_registration',
+    # get registration
+    'get-registered': 'get_registration',
+    # add a gem to a project
+    'enable-gem': 'enable_gem',
+    # remove a gem from a project
+    'disable-gem': 'disable_gem',
+    # modify engine properties
+    'edit-engine-properties': 'engine_properties',
+    # modify project properties
+    'edit-project-properties': 'project_properties',
+    # modify gem properties
+    'edit-gem-properties': 'gem_properties',
+    # sha256
+    'sha256': 'sha256',
+    # download
+    'download': 'download'
+}
+
+
+def get_command_names(args: list) -> list:
+    """
+    Returns the sub-command being run from the command line arguments
+    :param args: the command line arguments, without the script name
+    :return: list containing the sub-command name, or an empty list if no sub-command is given
+    """
+    return [arg for arg in args if arg in O3DE_COMMAND_MODULES][:1]
+
+
+def add_args(parser: argparse.ArgumentParser, command_names: list = None) -> None:
     """
     add_args is called to add expected parser arguments and subparsers arguments to each command such that it can be
     invoked by o3de.py
     Ex o3de.py can invoke the register  downloadable commands by importing register,
     call add_args and execute: python o3de.py register --gem-path "C:/TestGem"
     :param parser: the caller instantiates an ArgumentParser and passes it in here
+    :param command_names: the sub-commands whose module is imported to add their arguments, the other sub-commands
+     are only listed by name. If None the modules of all sub-commands are imported
     """
 
     subparsers = parser.add_subparsers(help='To get help on a sub-command:\no3de.py <sub-command> -h',
                                        title='Sub-Commands')
 
+    if command_names is None:
+        command_names = O3DE_COMMAND_MODULES.keys()
+    module_names = set(O3DE_COMMAND_MODULES[command_name] for command_name in command_names
+                       if command_name in O3DE_COMMAND_MODULES)
+
     # As o3de.py shares the same name as the o3de package attempting to use a regular
     # from o3de import <module> line tries to import from the current o3de.py script and not the package
     # So the {current script directory} / 'o3de' is added to the front of the sys.path
@@ -33,55 +84,26 @@ def add_args(parser: argparse.ArgumentParser) -> None:
     o3de_package_dir = (script_dir / 'o3de').resolve()
     # add the scripts/o3de directory to the front of the sys.path
     sys.path.insert(0, str(o3de_package_dir))
-    from o3de import engine_properties, engine_template, gem_properties, \
-        global_project, register, print_registration, get_registration, \
-        enable_gem, disable_gem, project_properties, sha256, download
+    modules = {module_name: importlib.import_module(f'o3de.{module_name}') for module_name in sorted(module_names)}
     # Remove the temporarily added path
     sys.path = sys.path[1:]
 
-    # global project
-    global_project.add_args(subparsers)
-
-    # engine template
-    engine_template.add_args(subparsers)
-
-    # registration
-    register.add_args(subparsers)
-
-    # show registration
-    print_registration.add_args(subparsers)
-
-    # get registration
-    get_registration.add_args(subparsers)
-
-    # add a gem to a project
-    enable_gem.add_args(subparsers)
-
-    # remove a gem from a project
-    disable_gem.add_args(subparsers)
-
-    # modify engine properties
-    engine_properties.add_args(subparsers)
-
-    # modify project properties
-    project_properties.add_args(subparsers)
-
-    # modify gem properties
-    gem_properties.add_args(subparsers)
-
-    # sha256
-    sha256.add_args(subparsers)
-
-    # download
-    download.add_args(subparsers)
+    for command_name, module_name in O3DE_COMMAND_MODULES.items():
+        if command_name in subparsers.choices:
+            continue
+        if module_name in modules:
+            # the module adds all of its sub-commands
+            modules[module_name].add_args(subparsers)
+        else:
+            subparsers.add_parser(command_name)
 
 
 if __name__ == "__main__":
     # parse the command line args
     the_parser = argparse.ArgumentParser()
 
-    # add args to the parser
-    add_args(the_parser)
+    # add args to the parser, importing only the module of the sub-command being run
+    add_args(the_parser, get_command_names(sys.argv[1:]))
 
     # parse args
     the_args = the_parser.parse_args()
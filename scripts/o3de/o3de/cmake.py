@@ -25,147 +25,142 @@ enable_gem_end_marker = ')'
 def add_gem_dependency(cmake_file: pathlib.Path,
                        gem_name: str) -> int:
     """
-    adds a gem dependency to a cmake file
+    adds a gem dependency to a cmake file, see update_gem_dependencies
     :param cmake_file: path to the cmake file
     :param gem_name: name of the gem
     :return: 0 for success or non 0 failure code
     """
-    if not cmake_file.is_file():
-        logger.error(f'Failed to locate cmake file {str(cmake_file)}')
-        return 1
-
-    # on a line by basis, see if there already is {gem_name}
-    # find the first occurrence of a gem, copy its formatting and replace
-    # the gem name with the new one and append it
-    t_data = []
-    added = False
-    start_marker_line_index = None
-    end_marker_line_index = None
-    with cmake_file.open('r') as s:
-        in_gem_list = False
-        line_index = 0
-        for line in s:
-            parsed_line = line.strip()
-            if parsed_line.startswith(enable_gem_start_marker):
-                # Skip pass the 'set(ENABLED_GEMS' marker just in case their are gems declared on the same line
-                parsed_line = parsed_line[len(enable_gem_start_marker):]
-                # Set the flag to indicate that we are in the ENABLED_GEMS variable
-                in_gem_list = True
-                start_marker_line_index = line_index
-
-            if in_gem_list:
-                # Since we are inside the ENABLED_GEMS variable determine if the line has the end_marker of ')'
-                if parsed_line.endswith(enable_gem_end_marker):
-                    # Strip away the line end marker
-                    parsed_line = parsed_line[:-len(enable_gem_end_marker)]
-                    # Set the flag to indicate that we are no longer in the ENABLED_GEMS variable after this line
-                    in_gem_list = False
-                    end_marker_line_index = line_index
-
-                # Split the rest of the line on whitespace just in case there are multiple gems in a line
-                gem_name_list = map(lambda gem_name: gem_name.strip('"'), parsed_line.split())
-                if gem_name in gem_name_list:
-                    logger.info(f'{gem_name} is already enabled in file {str(cmake_file)}.')
-                    return 0
+    return update_gem_dependencies(cmake_file, add_gem_names=[gem_name])
 
-            t_data.append(line)
-            line_index += 1
-
-    indent = 4
-    if start_marker_line_index:
-        # Make sure if there is a enable gem start marker, there is an end marker as well
-        if not end_marker_line_index:
-            logger.error(f'The Enable Gem start marker of "{enable_gem_start_marker}" has been found, but not the'
-                         f' Enable Gem end marker of "{enable_gem_end_marker}"')
-            return 1
-
-        # Insert the gem before the ')' end marker
-        end_marker_partition = list(t_data[end_marker_line_index].rpartition(enable_gem_end_marker))
-        end_marker_partition[1] = f'{" " * indent}{gem_name}\n' + end_marker_partition[1]
-        t_data[end_marker_line_index] = ''.join(end_marker_partition)
-        added = True
-
-    # if we didn't add, then create a new set(ENABLED_GEMS) variable
-    # add a new gem, if empty the correct format is 1 tab=4spaces
-    if not added:
-        t_data.append('\n')
-        t_data.append(f'{enable_gem_start_marker}\n')
-        t_data.append(f'{" "  * indent}{gem_name}\n')
-        t_data.append(f'{enable_gem_end_marker}\n')
-
-    # write the cmake
-    with cmake_file.open('w') as s:
-        s.writelines(t_data)
-
-    return 0
 
 def remove_gem_dependency(cmake_file: pathlib.Path,
                           gem_name: str) -> int:
     """
-    removes a gem dependency from a cmake file
+    removes a gem dependency from a cmake file, see update_gem_dependencies
     :param cmake_file: path to the cmake file
     :param gem_name: name of the gem
     :return: 0 for success or non 0 failure code
     """
+    return update_gem_dependencies(cmake_file, remove_gem_names=[gem_name])
+
+
+def update_gem_dependencies(cmake_file: pathlib.Path,
+                            add_gem_names: list = None,
+                            remove_gem_names: list = None) -> int:
+    """
+    adds and removes multiple gem dependencies in a cmake file. The file is read once, the gems are added and
+    removed as a set difference against the gems already enabled and the file is written once, to a temporary
+    file which then replaces the cmake file so that it is never left partially written
+    :param cmake_file: path to the cmake file
+    :param add_gem_names: names of the gems to add
+    :param remove_gem_names: names of the gems to remove
+    :return: 0 for success or non 0 failure code
+    """
     if not cmake_file.is_file():
         logger.error(f'Failed to locate cmake file {cmake_file}')
         return 1
 
-    # on a line by basis, remove any line with {gem_name}
-    t_data = []
-    removed = False
+    remove_gem_names = set(remove_gem_names or [])
 
     with cmake_file.open('r') as s:
-        in_gem_list = False
-        for line in s:
-            # Strip whitespace from both ends of the line, but keep track of the leading whitespace
-            # for indenting the result line
-            parsed_line = line.lstrip()
-            indent = line[:-len(parsed_line)]
-            parsed_line = parsed_line.rstrip()
-            result_line = indent
-            if parsed_line.startswith(enable_gem_start_marker):
-                # Skip pass the 'set(ENABLED_GEMS' marker just in case their are gems declared on the same line
-                parsed_line = parsed_line[len(enable_gem_start_marker):]
-                result_line += enable_gem_start_marker
-                # Set the flag to indicate that we are in the ENABLED_GEMS variable
-                in_gem_list = True
+        source_data = s.readlines()
 
-            if in_gem_list:
-                # Since we are inside the ENABLED_GEMS variable determine if the line has the end_marker of ')'
-                if parsed_line.endswith(enable_gem_end_marker):
-                    # Strip away the line end marker
-                    parsed_line = parsed_line[:-len(enable_gem_end_marker)]
-                    # Set the flag to indicate that we are no longer in the ENABLED_GEMS variable after this line
-                    in_gem_list = False
-                # Split the rest of the line on whitespace just in case there are multiple gems in a line
-                # Strip double quotes surround any gem name
-                gem_name_list = list(map(lambda gem_name: gem_name.strip('"'), parsed_line.split()))
-                while gem_name in gem_name_list:
-                    gem_name_list.remove(gem_name)
-                    removed = True
-
-                # Append the renaming gems to the line
-                result_line += ' '.join(gem_name_list)
-                # If the in_gem_list was flipped to false, that means the currently parsed line contained the
-                # line end marker, so append that to the result_line
-                result_line += enable_gem_end_marker if not in_gem_list else ''
-                # Strip of trailing whitespace. This also strips result lines which are empty of the indent
-                result_line = result_line.rstrip()
-                if result_line:
-                    t_data.append(result_line + '\n')
-            else:
-                t_data.append(line)
+    t_data = []
+    enabled_gem_names = set()
+    start_marker_found = False
+    end_marker_line_index = None
+    in_gem_list = False
+    for line in source_data:
+        # Strip whitespace from both ends of the line, but keep track of the leading whitespace
+        # for indenting the result line
+        parsed_line = line.lstrip()
+        indent = line[:len(line) - len(parsed_line)]
+        parsed_line = parsed_line.rstrip()
+        result_line = indent
+        if parsed_line.startswith(enable_gem_start_marker):
+            # Skip pass the 'set(ENABLED_GEMS' marker just in case their are gems declared on the same line
+            parsed_line = parsed_line[len(enable_gem_start_marker):]
+            result_line += enable_gem_start_marker
+            in_gem_list = True
+            start_marker_found = True
+
+        if not in_gem_list:
+            t_data.append(line)
+            continue
+
+        if parsed_line.endswith(enable_gem_end_marker):
+            parsed_line = parsed_line[:-len(enable_gem_end_marker)]
+            in_gem_list = False
+
+        # Split the rest of the line on whitespace just in case there are multiple gems in a line
+        # Strip double quotes surround any gem name
+        gem_name_list = list(map(lambda gem_name: gem_name.strip('"'), parsed_line.split()))
+        enabled_gem_names.update(gem_name_list)
+        remaining_gem_name_list = [gem_name for gem_name in gem_name_list if gem_name not in remove_gem_names]
+
+        # Lines which no gem is removed from are kept as is
+        if len(remaining_gem_name_list) != len(gem_name_list):
+            result_line += ' '.join(remaining_gem_name_list)
+            result_line += enable_gem_end_marker if not in_gem_list else ''
+            result_line = result_line.rstrip()
+            line = result_line + '\n' if result_line else ''
+        if line:
+            t_data.append(line)
+            if not in_gem_list:
+                end_marker_line_index = len(t_data) - 1
 
-    if not removed:
-        logger.error(f'Failed to remove {gem_name} from cmake file {cmake_file}')
+    # Make sure if there is a enable gem start marker, there is an end marker as well
+    if in_gem_list:
+        logger.error(f'The Enable Gem start marker of "{enable_gem_start_marker}" has been found, but not the'
+                     f' Enable Gem end marker of "{enable_gem_end_marker}"')
         return 1
 
-    # write the cmake
-    with cmake_file.open('w') as s:
-        s.writelines(t_data)
+    ret_val = 0
+    for gem_name in sorted(remove_gem_names - enabled_gem_names):
+        logger.error(f'Failed to remove {gem_name} from cmake file {cmake_file}')
+        ret_val = 1
+
+    gem_names_to_add = [gem_name for gem_name in dict.fromkeys(add_gem_names or [])
+                        if gem_name not in enabled_gem_names]
+    for gem_name in dict.fromkeys(add_gem_names or []):
+        if gem_name in enabled_gem_names:
+            logger.info(f'{gem_name} is already enabled in file {str(cmake_file)}.')
+
+    if gem_names_to_add:
+        indent = 4
+        gem_lines = ''.join(f'{" " * indent}{gem_name}\n' for gem_name in gem_names_to_add)
+        if start_marker_found:
+            # Insert the gems before the ')' end marker of the last ENABLED_GEMS variable
+            before_marker, end_marker, after_marker = t_data[end_marker_line_index].rpartition(enable_gem_end_marker)
+            if before_marker.strip():
+                t_data[end_marker_line_index] = before_marker + '\n' + gem_lines + end_marker + after_marker
+            else:
+                t_data[end_marker_line_index] = gem_lines + before_marker + end_marker + after_marker
+        else:
+            # create a new set(ENABLED_GEMS) variable
+            t_data.append('\n')
+            t_data.append(f'{enable_gem_start_marker}\n')
+            t_data.append(gem_lines)
+            t_data.append(f'{enable_gem_end_marker}\n')
+
+    if t_data == source_data:
+        return ret_val
+
+    # write the cmake to a temporary file and replace the cmake file with it
+    temp_cmake_file = cmake_file.with_name(f'{cmake_file.name}.{os.getpid()}.tmp')
+    try:
+        with temp_cmake_file.open('w') as s:
+            s.writelines(t_data)
+        os.replace(temp_cmake_file, cmake_file)
+    except OSError as e:
+        logger.error(f'Failed to write cmake file {cmake_file}: {str(e)}')
+        try:
+            os.unlink(temp_cmake_file)
+        except OSError:
+            pass
+        return 1
 
-    return 0
+    return ret_val
 
 
 def get_enabled_gems(cmake_file: pathlib.Path) -> set:
@@ -35,6 +35,28 @@ def disable_gem_in_project(gem_name: str = None,
     :param enabled_gem_file: File to remove enabled gem from
     :return: 0 for success or non 0 failure code
     """
+    return disable_gems_in_project(gem_names=[gem_name] if gem_name and not gem_path else None,
+                                   gem_paths=[gem_path] if gem_path else None,
+                                   project_name=project_name,
+                                   project_path=project_path,
+                                   enabled_gem_file=enabled_gem_file)
+
+
+def disable_gems_in_project(gem_names: list = None,
+                            gem_paths: list = None,
+                            project_name: str = None,
+                            project_path: pathlib.Path = None,
+                            enabled_gem_file: pathlib.Path = None) -> int:
+    """
+    disable multiple gems in a projects enabled_gems.cmake file. The enabled gems file is rewritten once and
+    the project.json is updated once
+    :param gem_names: names of the gems to remove
+    :param gem_paths: paths to the gems to remove
+    :param project_name: name of the project to remove the gems from
+    :param project_path: path to the project to remove the gems from
+    :param enabled_gem_file: File to remove enabled gems from
+    :return: 0 for success or non 0 failure code
+    """
 
     # we need either a project name or path
     if not project_name and not project_path:
@@ -54,29 +76,41 @@ def disable_gem_in_project(gem_name: str = None,
         logger.error(f'Project path {project_path} is not a folder.')
         return 1
 
-    # We need either a gem name or path
-    if not gem_name and not gem_path:
-        logger.error(f'Must either specify a Gem path or Gem Name.')
+    # We need either gem names or paths
+    if not gem_names and not gem_paths:
+        logger.error(f'Must either specify Gem paths or Gem Names.')
         return 1
 
-    # if gem name resolve it into a path
-    if gem_name and not gem_path:
+    ret_val = 0
+    resolved_gem_paths = list(gem_paths or [])
+    # resolve gem names into paths
+    for gem_name in gem_names or []:
         gem_path = manifest.get_registered(gem_name=gem_name, project_path=project_path)
-    if not gem_path:
-        logger.error(f'Unable to locate gem path from the registered manifest.json files:'
-                     f' {str(pathlib.Path.home() / ".o3de/manifest.json")},'
-                     f' {project_path / "project.json"}, engine.json')
-        return 1
-    gem_path = pathlib.Path(gem_path).resolve()
-    # make sure the gem path is a directory
-    if not gem_path.is_dir():
-        logger.error(f'Gem Path {gem_path} does not exist.')
-        return 1
+        if not gem_path:
+            logger.error(f'Unable to locate gem path for {gem_name} from the registered manifest.json files:'
+                         f' {str(pathlib.Path("~/.o3de/o3de_manifest.json").expanduser())},'
+                         f' {project_path / "project.json"}, engine.json')
+            ret_val = 1
+            continue
+        resolved_gem_paths.append(gem_path)
+
+    # Read gem.json from each gem path
+    remove_gem_names = []
+    for gem_path in resolved_gem_paths:
+        gem_path = pathlib.Path(gem_path).resolve()
+        # make sure the gem path is a directory
+        if not gem_path.is_dir():
+            logger.error(f'Gem Path {gem_path} does not exist.')
+            ret_val = 1
+            continue
+        gem_json_data = manifest.get_gem_json_data(gem_path=gem_path, project_path=project_path)
+        if not gem_json_data:
+            logger.error(f'Could not read gem.json content under {gem_path}.')
+            ret_val = 1
+            continue
+        remove_gem_names.append(gem_json_data['gem_name'])
 
-    # Read gem.json from the gem path
-    gem_json_data = manifest.get_gem_json_data(gem_path=gem_path, project_path=project_path)
-    if not gem_json_data:
-        logger.error(f'Could not read gem.json content under {gem_path}.')
+    if not remove_gem_names:
         return 1
 
     if not enabled_gem_file:
@@ -87,15 +121,12 @@ def disable_gem_in_project(gem_name: str = None,
         logger.error(f'Enabled gem file {enabled_gem_file} is not present.')
         return 1
 
-    # remove the gem
-    error_code = cmake.remove_gem_dependency(enabled_gem_file, gem_json_data['gem_name'])
+    # remove the gems
+    error_code = cmake.update_gem_dependencies(enabled_gem_file, remove_gem_names=remove_gem_names)
 
-    # Remove the name of the gem from the project.json "gem_names" field if the gem is neither
-    # registered with the project.json nor engine.json
-    ret_val = project_properties.edit_project_props(project_path,
-                                                    delete_gem_names=gem_json_data['gem_name']) or error_code
-
-    return ret_val
+    # Remove the names of the gems from the project.json "gem_names" field
+    return project_properties.edit_project_props(project_path,
+                                                 delete_gem_names=remove_gem_names) or error_code or ret_val
 
 
 def remove_explicit_gem_activation_for_all_paths(gem_root_folders: list,
@@ -134,18 +165,26 @@ def remove_explicit_gem_activation_for_all_paths(gem_root_folders: list,
             elif 'gem.json' in files:
                 gem_dirs_set.add(pathlib.Path(root))
 
-    for gem_dir in sorted(gem_dirs_set):
-        # Run the command to remove explicit activation even if previous calls failed
-        ret_val = disable_gem_in_project(gem_path=gem_dir,
-                                        project_name=project_name,
-                                        project_path=project_path,
-                                        enabled_gem_file=enabled_gem_file) or ret_val
+    if not gem_dirs_set:
+        return ret_val
+
+    # Remove explicit activation of all the gems at once, even if previous calls failed
+    ret_val = disable_gems_in_project(gem_paths=sorted(gem_dirs_set),
+                                      project_name=project_name,
+                                      project_path=project_path,
+                                      enabled_gem_file=enabled_gem_file) or ret_val
 
     return ret_val
 
 
 def _run_disable_gem_in_project(args: argparse) -> int:
-    if args.all_gem_paths:
+    if args.gem_names:
+        return disable_gems_in_project(args.gem_names,
+                                       None,
+                                       args.project_name,
+                                       args.project_path,
+                                       args.enabled_gem_file)
+    elif args.all_gem_paths:
         return remove_explicit_gem_activation_for_all_paths(
             args.all_gem_paths,
             args.project_name,
@@ -181,6 +220,9 @@ def add_parser_args(parser):
                        help='The path to the gem.')
     group.add_argument('-gn', '--gem-name', type=str, required=False,
                        help='The name of the gem.')
+    group.add_argument('-gns', '--gem-names', type=str, nargs='+', required=False,
+                       help='The names of multiple gems, which are disabled with a single update of the'
+                            ' enabled gem file.')
     group.add_argument('-agp', '--all-gem-paths', type=pathlib.Path, nargs='*', required=False,
                        help='Removes explicit activation of all gems in the path recursively.')
     parser.add_argument('-egf', '--enabled-gem-file', type=pathlib.Path, required=False,
@@ -41,7 +41,7 @@ def unzip_manifest_json_data(download_zip_path: pathlib.Path, zip_file_name: str
 
 
 def validate_downloaded_zip_sha256(download_uri_json_data: dict, download_zip_path: pathlib.Path,
-                                   manifest_json_name) -> int:
+                                   manifest_json_name, download_zip_sha256: str = None) -> int:
     # if the json has a sha256 check it against a sha256 of the zip
     try:
         sha256A = download_uri_json_data['sha256']
@@ -55,12 +55,12 @@ def validate_downloaded_zip_sha256(download_uri_json_data: dict, download_zip_pa
                         ' We cannot verify this is the actually the advertised object!!!')
             return 1
 
-        with download_zip_path.open('rb') as f:
-            sha256B = hashlib.sha256(f.read()).hexdigest()
-            if sha256A != sha256B:
-                logger.error(f'SECURITY VIOLATION: Downloaded zip sha256 {sha256B} does not match'
-                            f' the advertised "sha256":{sha256A} in the f{manifest_json_name}.')
-                return 0
+        # the sha256 is computed while the zip is downloaded, otherwise the zip is read in blocks to compute it
+        sha256B = download_zip_sha256 if download_zip_sha256 else utils.get_file_sha256(download_zip_path)
+        if sha256A != sha256B:
+            logger.error(f'SECURITY VIOLATION: Downloaded zip sha256 {sha256B} does not match'
+                        f' the advertised "sha256":{sha256A} in the f{manifest_json_name}.')
+            return 0
 
     unzipped_manifest_json_data = unzip_manifest_json_data(download_zip_path, manifest_json_name)
 
@@ -111,11 +111,14 @@ def download_o3de_object(object_name: str, default_folder_name: str, dest_path:
     origin_uri = downloadable_object_data['origin_uri']
     parsed_uri = urllib.parse.urlparse(origin_uri)
 
-    download_zip_result = utils.download_zip_file(parsed_uri, download_zip_path, force_overwrite, download_progress_callback)
+    download_zip_sha256 = hashlib.sha256()
+    download_zip_result = utils.download_zip_file(parsed_uri, download_zip_path, force_overwrite, download_progress_callback,
+                                                  download_zip_sha256)
     if download_zip_result != 0:
         return download_zip_result
 
-    if not validate_downloaded_zip_sha256(downloadable_object_data, download_zip_path, f'{object_type}.json'):
+    if not validate_downloaded_zip_sha256(downloadable_object_data, download_zip_path, f'{object_type}.json',
+                                          download_zip_sha256.hexdigest()):
         logger.error(f'Could not validate zip, deleting {download_zip_path}')
         os.unlink(download_zip_path)
         return 1
@@ -36,6 +36,28 @@ def enable_gem_in_project(gem_name: str = None,
     :param enabled_gem_file: if this dependency goes/is in a specific file
     :return: 0 for success or non 0 failure code
     """
+    return enable_gems_in_project(gem_names=[gem_name] if gem_name and not gem_path else None,
+                                  gem_paths=[gem_path] if gem_path else None,
+                                  project_name=project_name,
+                                  project_path=project_path,
+                                  enabled_gem_file=enabled_gem_file)
+
+
+def enable_gems_in_project(gem_names: list = None,
+                           gem_paths: list = None,
+                           project_name: str = None,
+                           project_path: pathlib.Path = None,
+                           enabled_gem_file: pathlib.Path = None) -> int:
+    """
+    enable multiple gems in a projects enabled_gems.cmake file. The gems buildable by the project are
+    gathered once, the project.json is updated once and the enabled gems file is rewritten once
+    :param gem_names: names of the gems to add
+    :param gem_paths: paths to the gems to add
+    :param project_name: name of to the project to add the gems to
+    :param project_path: path to the project to add the gems to
+    :param enabled_gem_file: if these dependencies go/are in a specific file
+    :return: 0 for success or non 0 failure code
+    """
     # we need either a project name or path
     if not project_name and not project_path:
         logger.error(f'Must either specify a Project path or Project Name.')
@@ -46,7 +68,7 @@ def enable_gem_in_project(gem_name: str = None,
         project_path = manifest.get_registered(project_name=project_name)
     if not project_path:
         logger.error(f'Unable to locate project path from the registered manifest.json files:'
-                     f' {str(pathlib.Path.home() / ".o3de/manifest.json")}, engine.json')
+                     f' {str(pathlib.Path("~/.o3de/o3de_manifest.json").expanduser())}, engine.json')
         return 1
 
     project_path = pathlib.Path(project_path).resolve()
@@ -54,30 +76,41 @@ def enable_gem_in_project(gem_name: str = None,
         logger.error(f'Project path {project_path} is not a folder.')
         return 1
 
-    # we need either a gem name or path
-    if not gem_name and not gem_path:
-        logger.error(f'Must either specify a Gem path or Gem Name.')
+    # we need either gem names or paths
+    if not gem_names and not gem_paths:
+        logger.error(f'Must either specify Gem paths or Gem Names.')
         return 1
 
-    # if gem name resolve it into a path
-    if gem_name and not gem_path:
+    ret_val = 0
+    resolved_gem_paths = list(gem_paths or [])
+    # resolve gem names into paths
+    for gem_name in gem_names or []:
         gem_path = manifest.get_registered(gem_name=gem_name, project_path=project_path)
-    if not gem_path:
-        logger.error(f'Unable to locate gem path from the registered manifest.json files:'
-                     f' {str(pathlib.Path( "~/.o3de/o3de_manifest.json").expanduser())},'
-                     f' {project_path / "project.json"}, engine.json')
-        return 1
-
-    gem_path = pathlib.Path(gem_path).resolve()
-    # make sure this gem already exists if we're adding.  We can always remove a gem.
-    if not gem_path.is_dir():
-        logger.error(f'Gem Path {gem_path} does not exist.')
-        return 1
+        if not gem_path:
+            logger.error(f'Unable to locate gem path for {gem_name} from the registered manifest.json files:'
+                         f' {str(pathlib.Path("~/.o3de/o3de_manifest.json").expanduser())},'
+                         f' {project_path / "project.json"}, engine.json')
+            ret_val = 1
+            continue
+        resolved_gem_paths.append(gem_path)
+
+    # Read gem.json from each gem path
+    gem_json_names = {}
+    for gem_path in resolved_gem_paths:
+        gem_path = pathlib.Path(gem_path).resolve()
+        # make sure this gem already exists if we're adding.  We can always remove a gem.
+        if not gem_path.is_dir():
+            logger.error(f'Gem Path {gem_path} does not exist.')
+            ret_val = 1
+            continue
+        gem_json_data = manifest.get_gem_json_data(gem_path=gem_path, project_path=project_path)
+        if not gem_json_data:
+            logger.error(f'Could not read gem.json content under {gem_path}.')
+            ret_val = 1
+            continue
+        gem_json_names[gem_path] = gem_json_data['gem_name']
 
-    # Read gem.json from the gem path
-    gem_json_data = manifest.get_gem_json_data(gem_path=gem_path, project_path=project_path)
-    if not gem_json_data:
-        logger.error(f'Could not read gem.json content under {gem_path}.')
+    if not gem_json_names:
         return 1
 
     if enabled_gem_file:
@@ -94,21 +127,18 @@ def enable_gem_in_project(gem_name: str = None,
         if not project_enabled_gem_file.is_file():
             project_enabled_gem_file.touch()
 
-    # Before adding the gem_dependency check if the project is registered in either the project or engine manifest
+    # The gems buildable by the project are gathered once for all the gems
     buildable_gems = manifest.get_engine_gems()
     buildable_gems.extend(manifest.get_project_gems(project_path))
-    # Convert each path to pathlib.Path object and filter out duplicates using dict.fromkeys
-    buildable_gems = list(dict.fromkeys(map(lambda gem_path_string: pathlib.Path(gem_path_string), buildable_gems)))
-
-    ret_val = 0
-    # If the gem is not part of buildable set, it's gem_name should be registered to the "gem_names" field
-    if gem_path not in buildable_gems:
-        ret_val = project_properties.edit_project_props(project_path, new_gem_names=gem_json_data['gem_name'])
+    buildable_gems = set(map(lambda gem_path_string: pathlib.Path(gem_path_string), buildable_gems))
 
-    # add the gem if it is registered in either the project.json or engine.json
-    ret_val = ret_val or cmake.add_gem_dependency(project_enabled_gem_file, gem_json_data['gem_name'])
+    # The gem_name of gems which are not part of buildable set should be registered to the "gem_names" field
+    new_gem_names = [gem_name for gem_path, gem_name in gem_json_names.items() if gem_path not in buildable_gems]
+    if new_gem_names and project_properties.edit_project_props(project_path, new_gem_names=new_gem_names):
+        return 1
 
-    return ret_val
+    return cmake.update_gem_dependencies(project_enabled_gem_file,
+                                         add_gem_names=list(gem_json_names.values())) or ret_val
 
 
 def add_explicit_gem_activation_for_all_paths(gem_root_folders: list,
@@ -145,18 +175,26 @@ def add_explicit_gem_activation_for_all_paths(gem_root_folders: list,
             elif 'gem.json' in files:
                 gem_dirs_set.add(pathlib.Path(root))
 
-    for gem_dir in sorted(gem_dirs_set):
-        # Run the command to add explicit activation even if previous calls failed
-        ret_val = enable_gem_in_project(gem_path=gem_dir,
-                                        project_name=project_name,
-                                        project_path=project_path,
-                                        enabled_gem_file=enabled_gem_file) or ret_val
+    if not gem_dirs_set:
+        return ret_val
+
+    # Add explicit activation of all the gems at once, even if previous calls failed
+    ret_val = enable_gems_in_project(gem_paths=sorted(gem_dirs_set),
+                                     project_name=project_name,
+                                     project_path=project_path,
+                                     enabled_gem_file=enabled_gem_file) or ret_val
 
     return ret_val
 
 
 def _run_enable_gem_in_project(args: argparse) -> int:
-    if args.all_gem_paths:
+    if args.gem_names:
+        return enable_gems_in_project(args.gem_names,
+                                      None,
+                                      args.project_name,
+                                      args.project_path,
+                                      args.enabled_gem_file)
+    elif args.all_gem_paths:
         return add_explicit_gem_activation_for_all_paths(
             args.all_gem_paths,
             args.project_name,
@@ -193,6 +231,9 @@ def add_parser_args(parser):
                        help='The path to the gem.')
     group.add_argument('-gn', '--gem-name', type=str, required=False,
                        help='The name of the gem.')
+    group.add_argument('-gns', '--gem-names', type=str, nargs='+', required=False,
+                       help='The names of multiple gems, which are enabled with a single update of the'
+                            ' enabled gem file.')
     group.add_argument('-agp', '--all-gem-paths', type=pathlib.Path, nargs='*', required=False,
                        help='Explicitly activates all gems in the path recursively.')
     parser.add_argument('-egf', '--enabled-gem-file', type=pathlib.Path, required=False,
@@ -8,6 +8,10 @@
 This file contains all the code that has to do with creating and instantiate engine templates
 """
 import argparse
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import logging
 import os
 import pathlib
@@ -96,6 +100,27 @@ O3DE_LICENSE_TEXT = \
 
 this_script_parent = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
 
+# templated parameters are delimited as ${Parameter}, so matches of two different parameters can never overlap
+template_parameter_pattern = re.compile(r'\$\{[^${}\r\n]*\}')
+random_uuid_parameter = '${Random_Uuid}'
+
+# sidecar written next to the template.json by create_template in incremental mode
+TEMPLATE_SOURCE_HASHES_FILENAME = 'template_source_hashes.json'
+
+# templated files larger than this are transformed a block of lines at a time instead of being read whole
+TRANSFORM_STREAMING_THRESHOLD = 4 * 1024 * 1024
+TRANSFORM_STREAMING_BLOCK_SIZE = 1024 * 1024
+
+# templated files are transformed on worker processes, as the regex replacements are serialized by the GIL on threads.
+# with fewer templated files than this, starting the worker processes costs more than it saves
+TRANSFORM_PROCESS_POOL_MIN_FILES = 32
+# the most worker processes ProcessPoolExecutor supports on Windows
+TRANSFORM_PROCESS_POOL_MAX_WORKERS = 61
+
+# the replacements of a transform worker process, set once when the worker starts
+_worker_replacements = None
+_worker_keep_license_text = False
+
 
 def _replace_license_text(source_data: str):
     while '{BEGIN_LICENSE}' in source_data:
@@ -112,6 +137,49 @@ def _replace_license_text(source_data: str):
     return source_data
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_replacements(replacements: tuple) -> callable:
+    """
+    Internal function which compiles a list of transformation pairs into a function applying them to a string.
+    When every pattern is a ${Parameter} and no replacement contains a '$', no match can overlap another or be
+    produced by an earlier replacement, so all pairs and ${Random_Uuid} are applied in a single regex pass with a
+    dictionary lookup. Otherwise each pair is applied in order with str.replace.
+    :param replacements: tuple of transformation pairs A->B
+    :return: function transforming a string
+    """
+    replacement_map = {}
+    for replace_this, with_this in replacements:
+        # only the first pair of a pattern has any effect when applied in order
+        replacement_map.setdefault(replace_this, with_this)
+
+    if all(template_parameter_pattern.fullmatch(replace_this) for replace_this in replacement_map) and \
+            all('$' not in with_this for with_this in replacement_map.values()):
+        patterns = sorted(set(replacement_map) | {random_uuid_parameter}, key=len, reverse=True)
+        replacement_regex = re.compile('|'.join(map(re.escape, patterns)))
+
+        def replace_match(match) -> str:
+            with_this = replacement_map.get(match.group(0))
+            # if someone hand edits the template to have ${Random_Uuid} then replace it with a randomly generated uuid
+            return with_this if with_this is not None else str(uuid.uuid4())
+
+        def transform_single_pass(s_data: str) -> str:
+            return replacement_regex.sub(replace_match, s_data)
+
+        return transform_single_pass
+
+    def transform_in_order(s_data: str) -> str:
+        t_data = s_data
+        for replace_this, with_this in replacements:
+            t_data = t_data.replace(replace_this, with_this)
+
+        # if someone hand edits the template to have ${Random_Uuid} then replace it with a randomly generated uuid
+        while random_uuid_parameter in t_data:
+            t_data = t_data.replace(random_uuid_parameter, str(uuid.uuid4()), 1)
+        return t_data
+
+    return transform_in_order
+
+
 def _transform(s_data: str,
                replacements: list,
                keep_license_text: bool = False) -> str:
@@ -123,19 +191,43 @@ def _transform(s_data: str,
     :return: the potentially transformed data
     """
     # copy the s_data into t_data, then apply all transformations only on t_data
-    t_data = str(s_data)
-    for replacement in replacements:
-        t_data = t_data.replace(replacement[0], replacement[1])
-
-    # if someone hand edits the template to have ${Random_Uuid} then replace it with a randomly generated uuid
-    while '${Random_Uuid}' in t_data:
-        t_data = t_data.replace('${Random_Uuid}', str(uuid.uuid4()), 1)
+    t_data = _compile_replacements(tuple(map(tuple, replacements)))(str(s_data))
 
     if not keep_license_text:
         t_data = _replace_license_text(t_data)
     return t_data
 
 
+def _transform_copy_streamed(source_file: pathlib.Path,
+                             destination_file: pathlib.Path,
+                             replacements: list,
+                             keep_license_text: bool = False) -> bool:
+    """
+    Internal function which transforms a source file into the destination file a block of whole lines at a time
+    :return: False if license text has to be removed, which requires the whole file and is left to the caller
+    """
+    transform_text = _compile_replacements(tuple(map(tuple, replacements)))
+    with open(source_file, 'r') as s, open(destination_file, 'w') as d:
+        remaining_data = ''
+        while True:
+            block = s.read(TRANSFORM_STREAMING_BLOCK_SIZE)
+            s_data = remaining_data + block
+            # only transform whole lines, the remainder is carried over to the next block until the end of the file
+            lines_end = s_data.rfind('\n') + 1 if block else len(s_data)
+            remaining_data = s_data[lines_end:]
+
+            if lines_end:
+                d_data = transform_text(s_data[:lines_end])
+                if not keep_license_text and '{BEGIN_LICENSE}' in d_data:
+                    return False
+                d.write(d_data)
+
+            if not block:
+                break
+
+    return True
+
+
 def _transform_copy(source_file: pathlib.Path,
                     destination_file: pathlib.Path,
                     replacements: list,
@@ -155,14 +247,21 @@ def _transform_copy(source_file: pathlib.Path,
         shutil.copy(source_file, destination_file)
     else:
         try:
+            # if the dst file we are about to write exists already for some reason delete it
+            if os.path.isfile(destination_file):
+                os.unlink(destination_file)
+
+            # large files are streamed as long as no pattern spans multiple lines
+            if os.path.getsize(source_file) > TRANSFORM_STREAMING_THRESHOLD and \
+                    all('\n' not in replacement[0] for replacement in replacements) and \
+                    _transform_copy_streamed(source_file, destination_file, replacements, keep_license_text):
+                return
+
             # open the file and transform its data
             with open(source_file, 'r') as s:
                 s_data = s.read()
                 d_data = _transform(s_data, replacements, keep_license_text)
 
-                # if the dst file we are about to write exists already for some reason delete it
-                if os.path.isfile(destination_file):
-                    os.unlink(destination_file)
                 with open(destination_file, 'w') as d:
                     d.write(d_data)
         except Exception as e:
@@ -171,6 +270,70 @@ def _transform_copy(source_file: pathlib.Path,
             pass
 
 
+def _init_transform_worker(replacements: list, keep_license_text: bool) -> None:
+    """
+    Internal function which keeps the replacements in a transform worker process, so that they are sent to each
+    worker once instead of with every file
+    """
+    global _worker_replacements, _worker_keep_license_text
+    _worker_replacements = replacements
+    _worker_keep_license_text = keep_license_text
+
+
+def _transform_copy_in_worker(source_file: pathlib.Path, destination_file: pathlib.Path) -> None:
+    _transform_copy(source_file, destination_file, _worker_replacements, _worker_keep_license_text)
+
+
+def _can_start_worker_processes() -> bool:
+    # worker processes run sys.executable, which is the host application rather than a python interpreter
+    # when python is embedded, such as in the Project Manager
+    return os.path.basename(sys.executable).lower().startswith('python')
+
+
+def _copy_template_files(copy_files: list,
+                         replacements: list,
+                         keep_license_text: bool = False) -> None:
+    """
+    Internal function which copies the files of a template in parallel. Templated files are transformed on worker
+    processes when there are enough of them, and the other files are copied on a thread pool
+    :param copy_files: list of (source file, destination file, is templated) tuples
+    :param replacements: list of transformation pairs A->B
+    :param keep_license_text: whether or not you want to keep license text
+    """
+    if len(copy_files) <= 1:
+        for in_file, out_file, is_templated in copy_files:
+            # if templated _transformCopy the file, if not just copy it
+            if is_templated:
+                _transform_copy(in_file, out_file, replacements, keep_license_text)
+            else:
+                shutil.copy(in_file, out_file)
+        return
+
+    templated_file_count = sum(1 for copy_file in copy_files if copy_file[2])
+    with contextlib.ExitStack() as executors:
+        thread_executor = executors.enter_context(concurrent.futures.ThreadPoolExecutor())
+        process_executor = None
+        max_workers = min(templated_file_count, os.cpu_count() or 1, TRANSFORM_PROCESS_POOL_MAX_WORKERS)
+        if templated_file_count >= TRANSFORM_PROCESS_POOL_MIN_FILES and max_workers > 1 and \
+                _can_start_worker_processes():
+            process_executor = executors.enter_context(concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_transform_worker,
+                initargs=(replacements, keep_license_text)))
+
+        futures = []
+        for in_file, out_file, is_templated in copy_files:
+            if not is_templated:
+                futures.append(thread_executor.submit(shutil.copy, in_file, out_file))
+            elif process_executor:
+                futures.append(process_executor.submit(_transform_copy_in_worker, in_file, out_file))
+            else:
+                futures.append(thread_executor.submit(_transform_copy, in_file, out_file, replacements,
+                                                      keep_license_text))
+        # re-raise the first failure in template order
+        for future in futures:
+            future.result()
+
+
 def _execute_template_json(json_data: dict,
                            destination_path: pathlib.Path,
                            template_path: pathlib.Path,
@@ -203,6 +366,7 @@ def _execute_template_json(json_data: dict,
 
     # for each copyFiles entry, _transformCopy the templated source file into a concrete instance file or
     # regular copy if not templated
+    template_files = []
     for copy_file in json_data['copyFiles']:
         # construct the input file name
         in_file = template_path / 'Template' / copy_file['file']
@@ -228,11 +392,9 @@ def _execute_template_json(json_data: dict,
         # if for some reason the output folder for this file was not created above do it now
         os.makedirs(os.path.dirname(out_file), exist_ok=True)
 
-        # if templated _transformCopy the file, if not just copy it
-        if copy_file['isTemplated']:
-            _transform_copy(in_file, out_file, replacements, keep_license_text)
-        else:
-            shutil.copy(in_file, out_file)
+        template_files.append((in_file, out_file, copy_file['isTemplated']))
+
+    _copy_template_files(template_files, replacements, keep_license_text)
 
 
 def _execute_restricted_template_json(template_json_data: dict,
@@ -323,6 +485,7 @@ def _execute_restricted_template_json(template_json_data: dict,
     # for each copyFiles entry, _transformCopy the templated source file into a concrete instance file or
     # regular copy if not templated
     if 'copyFiles' in json_data:
+        template_files = []
         for copy_file in json_data['copyFiles']:
             # construct the input file name
             if template_restricted_path:
@@ -344,11 +507,9 @@ def _execute_restricted_template_json(template_json_data: dict,
             # if for some reason the output folder for this file was not created above do it now
             os.makedirs(os.path.dirname(out_file), exist_ok=True)
 
-            # if templated _transformCopy the file, if not just copy it
-            if copy_file['isTemplated']:
-                _transform_copy(in_file, out_file, replacements, keep_license_text)
-            else:
-                shutil.copy(in_file, out_file)
+            template_files.append((in_file, out_file, copy_file['isTemplated']))
+
+        _copy_template_files(template_files, replacements, keep_license_text)
 
 
 def _instantiate_template(template_json_data: dict,
@@ -436,6 +597,23 @@ def _instantiate_template(template_json_data: dict,
     return 0
 
 
+def _load_template_source_hashes(source_hashes_path: pathlib.Path) -> dict:
+    """
+    Internal function to load the source file records written by an incremental create_template run
+    :param source_hashes_path: path to the template_source_hashes.json file
+    :return: dictionary of source file path to its record, empty if the file is missing or invalid
+    """
+    if not source_hashes_path.is_file():
+        return {}
+    with source_hashes_path.open('r') as s:
+        try:
+            source_hashes_data = json.load(s)
+        except json.JSONDecodeError as e:
+            logger.warning(f'Failed to load {source_hashes_path}, all files will be templatized: ' + str(e))
+            return {}
+    return source_hashes_data.get('files', {}) if isinstance(source_hashes_data, dict) else {}
+
+
 def create_template(source_path: pathlib.Path,
                     template_path: pathlib.Path,
                     source_name: str = None,
@@ -449,7 +627,8 @@ def create_template(source_path: pathlib.Path,
                     keep_license_text: bool = False,
                     replace: list = None,
                     force: bool = False,
-                    no_register: bool = False) -> int:
+                    no_register: bool = False,
+                    incremental: bool = False) -> int:
     """
     Create a template from a source directory using replacement
 
@@ -476,6 +655,10 @@ def create_template(source_path: pathlib.Path,
      because most people will not want license text in their instances.
      :param force Overrides existing files even if they exist
      :param no_register: whether or not after completion that the new object is registered
+     :param incremental: refresh an existing template, only templatizing the source files whose content or
+      replacements changed since the previous incremental run. The content hash of each source file is recorded in
+      a template_source_hashes.json file next to the template.json. An existing template without that file is only
+      replaced with force. The templated files of source files deleted since the previous run are removed
     :return: 0 for success or non 0 failure code
     """
 
@@ -502,7 +685,9 @@ def create_template(source_path: pathlib.Path,
         default_templates_folder = manifest.get_registered(default_folder='templates')
         template_path = default_templates_folder / source_name
         logger.info(f'Template path empty. Using default templates folder {template_path}')
-    if not force and template_path.is_dir() and len(list(template_path.iterdir())):
+    # an incremental run may only refresh a template which was created by a previous incremental run
+    if not force and template_path.is_dir() and len(list(template_path.iterdir())) and \
+            not (incremental and (template_path / TEMPLATE_SOURCE_HASHES_FILENAME).is_file()):
         logger.error(f'Template path {template_path} already exists.')
         return 1
 
@@ -692,6 +877,90 @@ def create_template(source_path: pathlib.Path,
         else:
             return False, t_data
 
+    # the source file records of the previous incremental run and of this run
+    source_hashes_path = template_path / TEMPLATE_SOURCE_HASHES_FILENAME
+    previous_source_hashes = _load_template_source_hashes(source_hashes_path) if incremental else {}
+    source_hashes = {}
+
+    def _templatize_file(entry_abs: pathlib.Path,
+                         destination_entry_abs: pathlib.Path) -> bool:
+        """
+        Internal function to transform a source file into a templated file, binary files are copied as is.
+        In incremental mode the file is skipped if its content and the replacements applied to it are the same as
+        in the previous run, and the class ids it added to the replacements in that run are added again
+        :param entry_abs: the source file
+        :param destination_entry_abs: the templated file
+        :return: bool: whether or not the file MAY need to be transformed to instantiate it
+        """
+        name, ext = os.path.splitext(entry_abs)
+        prefer_sanitized_name = _is_cpp_file(entry_abs)
+        source_key = pathlib.Path(entry_abs).as_posix()
+
+        if incremental:
+            with open(entry_abs, 'rb') as s:
+                source_hash = hashlib.sha256(s.read()).hexdigest()
+            replacements_fingerprint = hashlib.sha256(
+                json.dumps([replacements, prefer_sanitized_name, keep_license_text]).encode()).hexdigest()
+            source_record = {'source_hash': source_hash,
+                             'replacements_fingerprint': replacements_fingerprint,
+                             'destination': pathlib.Path(destination_entry_abs).as_posix()}
+
+            previous_record = previous_source_hashes.get(source_key, {})
+            try:
+                destination_stat = os.stat(destination_entry_abs)
+                destination_stamp = [destination_stat.st_mtime_ns, destination_stat.st_size]
+            except OSError:
+                destination_stamp = None
+            if destination_stamp and previous_record.get('destination_stamp') == destination_stamp and \
+                    all(previous_record.get(key) == value for key, value in source_record.items()):
+                replacements.extend(tuple(replacement) for replacement in
+                                    previous_record.get('discovered_replacements', []))
+                source_hashes[source_key] = previous_record
+                return previous_record.get('templated', False)
+
+        replacements_count = len(replacements)
+        templated = False
+
+        # if this file is a known binary file, there is no transformation needed and just copy it
+        # if not a known binary file open it and try to transform the data. if it is an unknown binary
+        # type it will throw and we catch copy
+        # if we had no known binary type it would still work, but much slower
+        if ext in binary_file_ext:
+            shutil.copy(entry_abs, destination_entry_abs)
+        else:
+            try:
+                # open the file and attempt to transform it
+                with open(entry_abs, 'r') as s:
+                    source_data = s.read()
+                    templated, source_data = _transform_into_template(source_data, prefer_sanitized_name)
+
+                    # if the file type is a file that we expect to find a license header and we don't find any
+                    # warn that the we didn't find the license info, this makes it easy to make sure we didn't
+                    # miss any files we want to have license info in.
+                    if keep_license_text and ext in expect_license_info_ext:
+                        if 'Copyright (c)' not in source_data or '{BEGIN_LICENSE}' not in source_data:
+                            logger.warning(f'Un-templated License header in {entry_abs}')
+
+                # if the transformed file we are about to write already exists for some reason, delete it
+                if os.path.isfile(destination_entry_abs):
+                    os.unlink(destination_entry_abs)
+                with open(destination_entry_abs, 'w') as s:
+                    s.write(source_data)
+            except Exception as e:
+                # we were not able to template the file, this is usually due to a unknown binary format
+                # so we catch copy it
+                shutil.copy(entry_abs, destination_entry_abs)
+                pass
+
+        if incremental:
+            destination_stat = os.stat(destination_entry_abs)
+            source_record.update({'destination_stamp': [destination_stat.st_mtime_ns, destination_stat.st_size],
+                                  'templated': templated,
+                                  'discovered_replacements': replacements[replacements_count:]})
+            source_hashes[source_key] = source_record
+
+        return templated
+
     def _transform_restricted_into_copyfiles_and_createdirs(root_abs: pathlib.Path,
                                                             path_abs: pathlib.Path = None) -> None:
         """
@@ -760,38 +1029,7 @@ def create_template(source_path: pathlib.Path,
             # if the entry is a folder then we need to add the entry to the createDirs and recurse into that folder
             templated = False
             if os.path.isfile(entry_abs):
-
-                # if this file is a known binary file, there is no transformation needed and just copy it
-                # if not a known binary file open it and try to transform the data.
-                # if it is an unknown binary type it will throw and we catch copy
-                # if we had no known binary type it would still work, but much slower
-                name, ext = os.path.splitext(entry)
-                if ext in binary_file_ext:
-                    shutil.copy(entry_abs, destination_entry_abs)
-                else:
-                    try:
-                        # open the file and attempt to transform it
-                        with open(entry_abs, 'r') as s:
-                            source_data = s.read()
-                            templated, source_data = _transform_into_template(source_data, _is_cpp_file(entry_abs))
-
-                            # if the file type is a file that we expect to find a license header and we don't find any
-                            # warn that the we didn't find the license info, this makes it easy to make sure we didn't
-                            # miss any files we want to have license info in.
-                            if keep_license_text and ext in expect_license_info_ext:
-                                if 'Copyright (c)' not in source_data or '{BEGIN_LICENSE}' not in source_data:
-                                    logger.warning(f'Un-templated License header in {entry_abs}')
-
-                        # if the transformed file we are about to write already exists for some reason, delete it
-                        if os.path.isfile(destination_entry_abs):
-                            os.unlink(destination_entry_abs)
-                        with open(destination_entry_abs, 'w') as s:
-                            s.write(source_data)
-                    except Exception as e:
-                        # we were not able to template the file, this is usually due to a unknown binary format
-                        # so we catch copy it
-                        shutil.copy(entry_abs, destination_entry_abs)
-                        pass
+                templated = _templatize_file(entry_abs, destination_entry_abs)
 
                 if keep_restricted_in_template:
                     copy_files.append({
@@ -911,38 +1149,7 @@ def create_template(source_path: pathlib.Path,
             # if the entry is a folder then we need to add the entry to the createDirs and recurse into that folder
             templated = False
             if os.path.isfile(entry_abs):
-
-                # if this file is a known binary file, there is no transformation needed and just copy it
-                # if not a known binary file open it and try to transform the data. if it is an unknown binary
-                # type it will throw and we catch copy
-                # if we had no known binary type it would still work, but much slower
-                name, ext = os.path.splitext(entry)
-                if ext in binary_file_ext:
-                    shutil.copy(entry_abs, destination_entry_abs)
-                else:
-                    try:
-                        # open the file and attempt to transform it
-                        with open(entry_abs, 'r') as s:
-                            source_data = s.read()
-                            templated, source_data = _transform_into_template(source_data, _is_cpp_file(entry_abs))
-
-                            # if the file type is a file that we expect to fins license header and we don't find any
-                            # warn that the we didn't find the license info, this makes it easy to make sure we didn't
-                            # miss any files we want to have license info in.
-                            if keep_license_text and ext in expect_license_info_ext:
-                                if 'Copyright (c)' not in source_data or '{BEGIN_LICENSE}' not in source_data:
-                                    logger.warning(f'Un-templated License header in {entry_abs}')
-
-                        # if the transformed file we are about to write already exists for some reason, delete it
-                        if os.path.isfile(destination_entry_abs):
-                            os.unlink(destination_entry_abs)
-                        with open(destination_entry_abs, 'w') as s:
-                            s.write(source_data)
-                    except Exception as e:
-                        # we were not able to template the file, this is usually due to a unknown binary format
-                        # so we catch copy it
-                        shutil.copy(entry_abs, destination_entry_abs)
-                        pass
+                templated = _templatize_file(entry_abs, destination_entry_abs)
 
                 # if the file was for a restricted platform add the entry to the restricted platform, otherwise add it
                 # to the non restricted
@@ -1026,6 +1233,20 @@ def create_template(source_path: pathlib.Path,
     with json_name.open('w') as s:
         s.write(json.dumps(json_data, indent=4) + '\n')
 
+    if incremental:
+        # remove the templated files of source files which were deleted since the previous incremental run
+        destinations = {source_record['destination'] for source_record in source_hashes.values()}
+        for source_key, previous_record in previous_source_hashes.items():
+            destination = previous_record.get('destination')
+            if source_key in source_hashes or not destination or destination in destinations:
+                continue
+            if os.path.isfile(destination):
+                logger.info(f'Removing templated file {destination} of deleted source file {source_key}')
+                os.unlink(destination)
+
+        with source_hashes_path.open('w') as s:
+            s.write(json.dumps({'files': source_hashes}, indent=4) + '\n')
+
     # copy the default preview.png
     preview_png_src = this_script_parent / 'resources' / 'preview.png'
     preview_png_dst = template_path / 'preview.png'
@@ -2152,7 +2373,8 @@ def _run_create_template(args: argparse) -> int:
                            args.keep_license_text,
                            args.replace,
                            args.force,
-                           args.no_register)
+                           args.no_register,
+                           args.incremental)
 
 
 def _run_create_from_template(args: argparse) -> int:
@@ -2305,6 +2527,12 @@ def add_args(subparsers) -> None:
     create_template_subparser.add_argument('--no-register', action='store_true', default=False,
                                            help='If the template is created successfully, it will not register the'
                                                 ' template with the global or engine manifest file.')
+    create_template_subparser.add_argument('--incremental', action='store_true', default=False,
+                                           help='Refreshes an existing template, only templatizing the source files'
+                                                ' whose content changed since the previous incremental run.'
+                                                ' File hashes are recorded in ' + TEMPLATE_SOURCE_HASHES_FILENAME +
+                                                ' next to the template.json. The templated files of deleted'
+                                                ' source files are removed.')
     create_template_subparser.set_defaults(func=_run_create_template)
 
     # create from template
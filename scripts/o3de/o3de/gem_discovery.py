@@ -0,0 +1,135 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+"""
+Contains functions for discovering the gem directories within a set of external subdirectories
+"""
+
+import concurrent.futures
+import logging
+import os
+import pathlib
+
+from o3de import registry_index, utils
+
+logger = logging.getLogger('o3de.gem_discovery')
+logging.basicConfig(format=utils.LOG_FORMAT)
+
+# Directories which never contain gems and are not descended into when searching for gem.json files
+PRUNED_DIRECTORY_NAMES = frozenset([
+    '.git', '.hg', '.svn', '.vs', '.vscode', '__pycache__', 'node_modules',
+    'Assets', 'Code', 'Cache', 'build', 'Build', 'BinTemp', 'user'
+])
+
+
+def _is_subpath(path: str, parent_path: str) -> bool:
+    return path.startswith(parent_path.rstrip(os.sep) + os.sep)
+
+
+def _gem_declares_external_subdirectories(gem_json_path: str) -> bool:
+    _, gem_json_data = registry_index.get_json_data(pathlib.Path(gem_json_path))
+    return bool(gem_json_data and gem_json_data.get('external_subdirectories'))
+
+
+def walk_gem_directories(root: str or pathlib.Path) -> tuple:
+    """
+    Walks the directory tree with os.scandir in the same top-down order as os.walk looking for gem.json files.
+    Directories in PRUNED_DIRECTORY_NAMES are skipped and the directories below a gem are only searched
+    if that gem declares its own external subdirectories.
+    The modification time of each directory is recorded before it is listed, as is the modification time of each
+    gem.json file which decided whether to descend, so that any later change invalidates the result
+    :param root: the directory to walk
+    :return: tuple of (paths, gem_directories) where paths maps each directory and gem.json file visited to its
+     modification time and gem_directories is a list of posix paths to the gem directories found
+    """
+    paths = {}
+    gem_directories = []
+    pending_directories = [os.path.abspath(root)]
+    while pending_directories:
+        directory = pending_directories.pop()
+        paths[directory] = registry_index.get_path_mtime(directory)
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirectories = []
+        gem_json_path = None
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink() and entry.name not in PRUNED_DIRECTORY_NAMES:
+                    subdirectories.append(entry.path)
+            elif entry.name == 'gem.json':
+                gem_json_path = entry.path
+
+        if gem_json_path:
+            gem_directories.append(pathlib.PurePath(directory).as_posix())
+            paths[gem_json_path] = registry_index.get_path_mtime(gem_json_path)
+            if not _gem_declares_external_subdirectories(gem_json_path):
+                continue
+
+        pending_directories.extend(reversed(subdirectories))
+
+    return paths, gem_directories
+
+
+def _get_root_gem_directories(root: str) -> tuple:
+    root_entry = registry_index.get_subdirectory_entry(root)
+    if root_entry:
+        return root_entry
+
+    paths, gem_directories = walk_gem_directories(root)
+    registry_index.set_subdirectory_entry(root, paths, gem_directories)
+    return paths, gem_directories
+
+
+def find_gem_directories(external_subdirs: list, max_workers: int = None) -> list:
+    """
+    Returns the gem directories within each of the external subdirectories.
+    Duplicate subdirectories are only searched once and a subdirectory nested within another one is resolved from
+    the walk of the outer subdirectory. The remaining independent subdirectories are walked on a thread pool
+    and the result of each walk is stored in the registry index
+    :param external_subdirs: list of external subdirectory paths
+    :param max_workers: maximum number of threads used to walk the subdirectories. Defaults to the
+     concurrent.futures.ThreadPoolExecutor default
+    :return: list of posix paths to the gem directories found, in the order of the external subdirectories
+    """
+    roots = list(dict.fromkeys(os.path.abspath(subdirectory) for subdirectory in external_subdirs))
+    if not roots:
+        return []
+
+    outer_roots = [root for root in roots if not any(_is_subpath(root, other_root) for other_root in roots)]
+
+    # Load the index before any worker threads use it
+    registry_index.load_registry_index()
+    if len(outer_roots) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            root_results = dict(zip(outer_roots, executor.map(_get_root_gem_directories, outer_roots)))
+    else:
+        root_results = {root: _get_root_gem_directories(root) for root in outer_roots}
+
+    gem_directories = []
+    for root in roots:
+        if root not in root_results:
+            outer_root = next(outer_root for outer_root in outer_roots if _is_subpath(root, outer_root))
+            outer_paths, outer_gem_directories = root_results[outer_root]
+            if root in outer_paths:
+                root_posix = pathlib.PurePath(root).as_posix()
+                root_results[root] = (None, [gem_directory for gem_directory in outer_gem_directories
+                                             if gem_directory == root_posix
+                                             or gem_directory.startswith(root_posix.rstrip('/') + '/')])
+            else:
+                # The subdirectory was pruned by the walk of the outer subdirectory, so it is walked on its own
+                root_results[root] = _get_root_gem_directories(root)
+        gem_directories.extend(root_results[root][1])
+
+    return list(dict.fromkeys(gem_directories))
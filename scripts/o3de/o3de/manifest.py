@@ -9,18 +9,35 @@
 Contains functions for data from json files such as the o3de_manifests.json, engine.json, project.json, etc...
 """
 
+import contextlib
+import copy
+import errno
 import json
 import logging
 import os
 import pathlib
 import shutil
 import hashlib
+import time
 
-from o3de import validation, utils
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+from o3de import gem_discovery, registry_index, validation, utils
 
 logger = logging.getLogger('o3de.manifest')
 logging.basicConfig(format=utils.LOG_FORMAT)
 
+# The open manifest transactions, keyed by the resolved manifest path
+_manifest_transactions = {}
+
+# Seconds to wait for other o3de processes to release the o3de manifest lock
+MANIFEST_LOCK_TIMEOUT = 60
+# Seconds to wait between attempts to take the o3de manifest lock
+_MANIFEST_LOCK_RETRY_INTERVAL = 0.1
+
 # Directory methods
 
 def get_this_engine_path() -> pathlib.Path:
@@ -166,15 +183,126 @@ def get_o3de_manifest() -> pathlib.Path:
     return manifest_path
 
 
+@contextlib.contextmanager
+def _manifest_file_lock(manifest_path: pathlib.Path):
+    """
+    Context which holds an advisory lock on the o3de manifest, so that other o3de processes
+    do not modify the manifest at the same time. The lock is taken on ~/.o3de/o3de_manifest.lock,
+    as the manifest itself is replaced rather than written in place.
+    Other manifest files, such as engine, project or gem json files, are not locked
+    raises TimeoutError if the lock is not released by other o3de processes within MANIFEST_LOCK_TIMEOUT seconds
+    :param manifest_path: path to the manifest file to lock
+    """
+    o3de_folder = get_o3de_folder()
+    if pathlib.Path(manifest_path).resolve() != (o3de_folder / 'o3de_manifest.json').resolve():
+        yield
+        return
+
+    with open(o3de_folder / 'o3de_manifest.lock', 'a+b') as lock_file:
+        # Only lock contention is retried, any other error is raised immediately
+        if os.name == 'nt':
+            busy_errors = (errno.EDEADLOCK, errno.EACCES)
+        else:
+            busy_errors = (errno.EAGAIN, errno.EWOULDBLOCK)
+        deadline = time.monotonic() + MANIFEST_LOCK_TIMEOUT
+        while True:
+            try:
+                if os.name == 'nt':
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError as e:
+                if e.errno not in busy_errors:
+                    raise
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(errno.ETIMEDOUT, 'Timed out waiting for another o3de process to release'
+                                                        f' the o3de manifest lock "{lock_file.name}"') from e
+            time.sleep(_MANIFEST_LOCK_RETRY_INTERVAL)
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_o3de_manifest(json_data: dict, manifest_path: pathlib.Path) -> bool:
+    # The manifest is written to a temporary file which then replaces it,
+    # so that a reader never sees a partially written manifest
+    temp_manifest_path = manifest_path.with_name(f'{manifest_path.name}.{os.getpid()}.tmp')
+    try:
+        with temp_manifest_path.open('w') as s:
+            s.write(json.dumps(json_data, indent=4) + '\n')
+        os.replace(temp_manifest_path, manifest_path)
+    except OSError as e:
+        logger.error(f'Manifest json failed to save: {str(e)}')
+        try:
+            os.unlink(temp_manifest_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+@contextlib.contextmanager
+def transaction(manifest_path: pathlib.Path = None, json_data: dict = None):
+    """
+    Context in which the supplied manifest file or ~/.o3de/o3de_manifest.json if None is loaded once
+    and all saves to it are applied in memory, then written once when the context exits.
+    The o3de manifest is locked for the whole transaction so that other o3de processes cannot modify it in between.
+    If the context exits with an exception the saved changes are discarded.
+    raises OSError if the o3de manifest lock could not be taken,
+     or if the saved changes could not be written to the manifest when the transaction completes
+    Transactions on the same manifest may be nested, in which case only the outermost one writes the manifest
+
+    Ex. with manifest.transaction():
+            for gem_path in gem_paths:
+                register.register(gem_path=gem_path)
+
+    :param manifest_path: optional path to the manifest file
+    :param json_data: optional data to start the transaction with instead of loading the manifest,
+     such as default data replacing a manifest which could not be decoded
+    """
+    if not manifest_path:
+        manifest_path = get_o3de_manifest()
+    transaction_key = pathlib.Path(manifest_path).resolve()
+    if transaction_key in _manifest_transactions:
+        yield
+        return
+
+    with _manifest_file_lock(transaction_key):
+        if json_data is None:
+            json_data = load_o3de_manifest(manifest_path)
+        _manifest_transactions[transaction_key] = {'data': copy.deepcopy(json_data), 'modified': False}
+        try:
+            yield
+            manifest_transaction = _manifest_transactions[transaction_key]
+            if manifest_transaction['modified'] and \
+                    not _write_o3de_manifest(manifest_transaction['data'], transaction_key):
+                raise OSError(f'Manifest json failed to save at path "{transaction_key}"')
+        finally:
+            del _manifest_transactions[transaction_key]
+            invalidate_registered_name_tables()
+
+
 def load_o3de_manifest(manifest_path: pathlib.Path = None) -> dict:
     """
     Loads supplied manifest file or ~/.o3de/o3de_manifest.json if None
+    Within a transaction on the manifest, a copy of the data last saved in the transaction is returned
 
     raises Json.JSONDecodeError if manifest data could not be decoded to JSON
     :param manifest_path: optional path to manifest file to load
     """
     if not manifest_path:
         manifest_path = get_o3de_manifest()
+    if _manifest_transactions:
+        manifest_transaction = _manifest_transactions.get(pathlib.Path(manifest_path).resolve())
+        if manifest_transaction:
+            return copy.deepcopy(manifest_transaction['data'])
     with manifest_path.open('r') as f:
         try:
             json_data = json.load(f)
@@ -190,40 +318,41 @@ def load_o3de_manifest(manifest_path: pathlib.Path = None) -> dict:
 def save_o3de_manifest(json_data: dict, manifest_path: pathlib.Path = None) -> bool:
     """
     Save the json dictionary to the supplied manifest file or ~/.o3de/o3de_manifest.json if None
+    The file is replaced by a temporary file, so it is never partially written, and the o3de manifest is locked
+    while it is written. Use transaction() to also lock the o3de manifest between loading and saving it.
+    Within a transaction on the manifest, the data is only written when the transaction completes
 
     :param json_data: dictionary to save in json format at the file path
     :param manifest_path: optional path to manifest file to save
     """
     if not manifest_path:
         manifest_path = get_o3de_manifest()
-    with manifest_path.open('w') as s:
-        try:
-            s.write(json.dumps(json_data, indent=4) + '\n')
+    # Registered object names and paths may change with any manifest, engine.json, project.json or gem.json save
+    invalidate_registered_name_tables()
+    if _manifest_transactions:
+        manifest_transaction = _manifest_transactions.get(pathlib.Path(manifest_path).resolve())
+        if manifest_transaction:
+            manifest_transaction.update({'data': copy.deepcopy(json_data), 'modified': True})
             return True
-        except OSError as e:
-            logger.error(f'Manifest json failed to save: {str(e)}')
-            return False
+    try:
+        with _manifest_file_lock(manifest_path):
+            return _write_o3de_manifest(json_data, manifest_path)
+    except OSError as e:
+        logger.error(f'Manifest json failed to save: {str(e)}')
+        return False
 
 
 def get_gems_from_external_subdirectories(external_subdirs: list) -> list:
     '''
     Helper Method for scanning a set of external subdirectories for gem.json files
+    See gem_discovery.find_gem_directories for the directories which are searched
     '''
-    def is_gem_subdirectory(subdir_files):
-        for name in files:
-            if name == 'gem.json':
-                return True
-        return False
+    if not external_subdirs:
+        return []
 
-    gem_directories = []
     # Locate all subfolders with gem.json files within them
-    if external_subdirs:
-        for subdirectory in external_subdirs:
-            for root, dirs, files in os.walk(pathlib.Path(subdirectory).resolve()):
-                if is_gem_subdirectory(files):
-                    gem_directories.append(pathlib.PurePath(root).as_posix())
-
-    return gem_directories
+    return gem_discovery.find_gem_directories([pathlib.Path(subdirectory).resolve()
+                                               for subdirectory in external_subdirs])
 
 
 # Data query methods
@@ -358,7 +487,13 @@ def get_all_external_subdirectories(project_path: pathlib.Path = None) -> list:
     if project_path:
         external_subdirectories_data.extend(get_project_external_subdirectories(project_path))
 
+    # Each gem is only descended once, which also protects against gems declaring each other
+    descended_gems = set()
+
     def descend_gems(gem_path: pathlib.Path):
+        if gem_path in descended_gems:
+            return
+        descended_gems.add(gem_path)
         new_external_subdirectories_data = get_gem_external_subdirectories(gem_path)
         external_subdirectories_data.extend(new_external_subdirectories_data)
         new_gems_data = get_gems_from_external_subdirectories(new_external_subdirectories_data)
@@ -453,19 +588,14 @@ def get_json_data_file(object_json: pathlib.Path,
         logger.error(f'Invalid {object_typename} json {object_json} supplied or file missing.')
         return None
 
-    if not object_validator or not object_validator(object_json):
+    # The validation result and json data are retrieved from the registry index if the file is unchanged
+    is_valid, object_json_data = registry_index.get_json_data(object_json, object_validator) \
+        if object_validator else (False, None)
+    if not is_valid:
         logger.error(f'{object_typename} json {object_json} is not valid or could not be validated.')
         return None
 
-    with object_json.open('r') as f:
-        try:
-            object_json_data = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.warning(f'{object_json} failed to load: {e}')
-        else:
-            return object_json_data
-
-    return None
+    return object_json_data
 
 
 def get_json_data(object_typename: str,
@@ -558,6 +688,75 @@ def get_repo_path(repo_uri: str, cache_folder: str or pathlib.Path = None) -> pa
     return cache_folder / str(repo_sha256.hexdigest() + '.json')
 
 
+def _get_registered_json_data(object_json: pathlib.Path) -> dict or None:
+    if not object_json.is_file():
+        logger.warning(f'{object_json} does not exist')
+        return None
+
+    _, object_json_data = registry_index.get_json_data(object_json)
+    return object_json_data
+
+
+# Per-process lookup tables mapping the name of each registered o3de object to its path
+# The tables are built on first use and discarded by invalidate_registered_name_tables()
+_registered_name_tables = {}
+
+
+def invalidate_registered_name_tables() -> None:
+    """
+    Discards the name to path lookup tables used by get_registered, so that they are rebuilt on the next lookup.
+    This must be called whenever the o3de manifest or the json file of a registered object is modified
+    """
+    _registered_name_tables.clear()
+
+
+def _build_registered_name_table(object_typename: str, project_path: pathlib.Path = None) -> dict:
+    name_table = {}
+
+    if object_typename == 'repo':
+        cache_folder = get_o3de_cache_folder()
+        for repo_uri in load_o3de_manifest().get('repos', []):
+            cache_file = get_repo_path(repo_uri=repo_uri, cache_folder=cache_folder)
+            if cache_file.is_file():
+                _, repo_json_data = registry_index.get_json_data(pathlib.Path(cache_file).resolve())
+                if repo_json_data and 'repo_name' in repo_json_data:
+                    name_table.setdefault(repo_json_data['repo_name'], repo_uri)
+        return name_table
+
+    if object_typename == 'engine':
+        object_paths = get_manifest_engines()
+    elif object_typename == 'project':
+        object_paths = get_all_projects()
+    elif object_typename == 'gem':
+        object_paths = get_all_gems(project_path)
+    elif object_typename == 'template':
+        object_paths = get_all_templates(project_path)
+    elif object_typename == 'restricted':
+        object_paths = get_manifest_restricted()
+    else:
+        logger.error(f'Unknown o3de object type "{object_typename}".')
+        return name_table
+
+    name_key = f'{object_typename}_name'
+    for object_path in object_paths:
+        object_path = pathlib.Path(object_path).resolve()
+        object_json_data = _get_registered_json_data(object_path / f'{object_typename}.json')
+        if object_json_data and name_key in object_json_data:
+            # The first registered object with a name takes precedence
+            name_table.setdefault(object_json_data[name_key], object_path)
+
+    return name_table
+
+
+def _get_registered_name_table(object_typename: str, project_path: pathlib.Path = None) -> dict:
+    table_key = (object_typename, pathlib.Path(project_path).resolve().as_posix() if project_path else None)
+    name_table = _registered_name_tables.get(table_key)
+    if name_table is None:
+        name_table = _build_registered_name_table(object_typename, project_path)
+        _registered_name_tables[table_key] = name_table
+    return name_table
+
+
 def get_registered(engine_name: str = None,
                    project_name: str = None,
                    gem_name: str = None,
@@ -588,107 +787,35 @@ def get_registered(engine_name: str = None,
        :param project_path: Path to project root, which is used to examined the project.json file in order to
               query either gems, templates or restricted directories registered with the project
 
+       The json files of the registered objects are read through the registry index in ~/.o3de/Cache,
+       so unmodified files are not re-parsed on each lookup.
+       Name lookups are answered from per-process tables built on first use of each object type,
+       see invalidate_registered_name_tables()
+
        :return path value associated with the registered object name if found. Otherwise None is returned
     """
     json_data = load_o3de_manifest()
 
     # check global first then this engine
     if isinstance(engine_name, str):
-        engines = get_manifest_engines()
-        for engine in engines:
-            if isinstance(engine, dict):
-                engine_path = pathlib.Path(engine['path']).resolve()
-            else:
-                engine_path = pathlib.Path(engine).resolve()
-
-            engine_json = engine_path / 'engine.json'
-            if not pathlib.Path(engine_json).is_file():
-                logger.warning(f'{engine_json} does not exist')
-            else:
-                with engine_json.open('r') as f:
-                    try:
-                        engine_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{engine_json} failed to load: {str(e)}')
-                    else:
-                        this_engines_name = engine_json_data.get('engine_name','')
-                        if this_engines_name == engine_name:
-                            return engine_path
+        engine_path = _get_registered_name_table('engine').get(engine_name)
+        if engine_path:
+            return engine_path
         engines_path = json_data.get('engines_path', {})
         if engine_name in engines_path:
             return pathlib.Path(engines_path[engine_name]).resolve()
 
     elif isinstance(project_name, str):
-        projects = get_all_projects()
-        for project_path in projects:
-            project_path = pathlib.Path(project_path).resolve()
-            project_json = project_path / 'project.json'
-            if not pathlib.Path(project_json).is_file():
-                logger.warning(f'{project_json} does not exist')
-            else:
-                with project_json.open('r') as f:
-                    try:
-                        project_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{project_json} failed to load: {str(e)}')
-                    else:
-                        this_projects_name = project_json_data['project_name']
-                        if this_projects_name == project_name:
-                            return project_path
+        return _get_registered_name_table('project').get(project_name)
 
     elif isinstance(gem_name, str):
-        gems = get_all_gems(project_path)
-        for gem_path in gems:
-            gem_path = pathlib.Path(gem_path).resolve()
-            gem_json = gem_path / 'gem.json'
-            if not pathlib.Path(gem_json).is_file():
-                logger.warning(f'{gem_json} does not exist')
-            else:
-                with gem_json.open('r') as f:
-                    try:
-                        gem_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{gem_json} failed to load: {str(e)}')
-                    else:
-                        this_gems_name = gem_json_data['gem_name']
-                        if this_gems_name == gem_name:
-                            return gem_path
+        return _get_registered_name_table('gem', project_path).get(gem_name)
 
     elif isinstance(template_name, str):
-        templates = get_all_templates(project_path)
-        for template_path in templates:
-            template_path = pathlib.Path(template_path).resolve()
-            template_json = template_path / 'template.json'
-            if not pathlib.Path(template_json).is_file():
-                logger.warning(f'{template_json} does not exist')
-            else:
-                with template_json.open('r') as f:
-                    try:
-                        template_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{template_path} failed to load: {str(e)}')
-                    else:
-                        this_templates_name = template_json_data['template_name']
-                        if this_templates_name == template_name:
-                            return template_path
+        return _get_registered_name_table('template', project_path).get(template_name)
 
     elif isinstance(restricted_name, str):
-        restricted = get_manifest_restricted()
-        for restricted_path in restricted:
-            restricted_path = pathlib.Path(restricted_path).resolve()
-            restricted_json = restricted_path / 'restricted.json'
-            if not pathlib.Path(restricted_json).is_file():
-                logger.warning(f'{restricted_json} does not exist')
-            else:
-                with restricted_json.open('r') as f:
-                    try:
-                        restricted_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{restricted_json} failed to load: {str(e)}')
-                    else:
-                        this_restricted_name = restricted_json_data['restricted_name']
-                        if this_restricted_name == restricted_name:
-                            return restricted_path
+        return _get_registered_name_table('restricted').get(restricted_name)
 
     elif isinstance(default_folder, str):
         if default_folder == 'engines':
@@ -708,18 +835,5 @@ def get_registered(engine_name: str = None,
             return default_restricted_folder
 
     elif isinstance(repo_name, str):
-        cache_folder = get_o3de_cache_folder()
-        for repo_uri in json_data['repos']:
-            cache_file = get_repo_path(repo_uri=repo_uri, cache_folder=cache_folder)
-            if cache_file.is_file():
-                repo = pathlib.Path(cache_file).resolve()
-                with repo.open('r') as f:
-                    try:
-                        repo_json_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f'{cache_file} failed to load: {str(e)}')
-                    else:
-                        this_repos_name = repo_json_data['repo_name']
-                        if this_repos_name == repo_name:
-                            return repo_uri
+        return _get_registered_name_table('repo').get(repo_name)
     return None
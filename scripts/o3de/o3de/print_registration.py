@@ -14,7 +14,7 @@ import pathlib
 import sys
 import urllib.parse
 
-from o3de import manifest, validation, utils
+from o3de import gem_discovery, manifest, registry_index, validation, utils
 
 logger = logging.getLogger('o3de.print_registration')
 logging.basicConfig(format=utils.LOG_FORMAT)
@@ -298,6 +298,121 @@ def print_repos(verbose: int) -> int:
     return 0
 
 
+def get_registration_json_data(project_path: pathlib.Path = None, project_name: str = None) -> dict or None:
+    """
+    Resolves every registered engine, project, external subdirectory, gem, template, restricted directory and repo
+    along with the parsed json data of each, in a single traversal of the manifest, the engine.json,
+    the project.json files and the gem.json files.
+    Each json file is read once and shared between every section that references it
+    :param project_path: optional path of the project whose gems and templates are included, instead of those
+     of all registered projects
+    :param project_name: optional name of the project whose gems and templates are included
+    :return: dictionary of the registration data, or None if the project could not be found
+    """
+    json_data_cache = {}
+
+    def get_object_json_data(object_json: pathlib.Path, name_key: str) -> dict or None:
+        object_json = pathlib.Path(object_json).resolve()
+        if object_json not in json_data_cache:
+            object_json_data = None
+            if object_json.is_file():
+                # The plain json data is shared with the gem search and the registered name lookups,
+                # and is only read again from files that have changed since they were indexed
+                _, object_json_data = registry_index.get_json_data(object_json)
+            json_data_cache[object_json] = object_json_data \
+                if isinstance(object_json_data, dict) and name_key in object_json_data else None
+        return json_data_cache[object_json]
+
+    def get_relative_paths(object_path: str or pathlib.Path, object_json_data: dict, key: str) -> list:
+        if not object_json_data:
+            return []
+        return [(pathlib.Path(object_path) / rel_path).as_posix() for rel_path in object_json_data.get(key, [])]
+
+    def get_object_entries(object_paths: list, object_typename: str) -> list:
+        return [{'path': pathlib.Path(object_path).as_posix(),
+                 'json_data': get_object_json_data(pathlib.Path(object_path) / f'{object_typename}.json',
+                                                   f'{object_typename}_name')}
+                for object_path in object_paths]
+
+    if project_path or project_name:
+        project_path = get_project_path(project_path, project_name)
+        if not project_path:
+            return None
+
+    manifest_json_data = manifest.load_o3de_manifest()
+    this_engine_path = manifest.get_this_engine_path()
+    this_engine_json_data = get_object_json_data(this_engine_path / 'engine.json', 'engine_name')
+
+    engines = [engine.get('path', '') if isinstance(engine, dict) else engine
+               for engine in manifest_json_data.get('engines', [])]
+
+    projects = list(dict.fromkeys(manifest_json_data.get('projects', []) +
+                                  get_relative_paths(this_engine_path, this_engine_json_data, 'projects')))
+    project_entries = get_object_entries(projects, 'project')
+
+    external_subdirectories = manifest_json_data.get('external_subdirectories', []) + \
+        get_relative_paths(this_engine_path, this_engine_json_data, 'external_subdirectories')
+    templates = manifest_json_data.get('templates', []) + \
+        get_relative_paths(this_engine_path, this_engine_json_data, 'templates')
+    # The gems and templates of the supplied project are included, otherwise those of all registered projects
+    for included_project_path in [project_path] if project_path else projects:
+        project_json_data = get_object_json_data(pathlib.Path(included_project_path) / 'project.json',
+                                                 'project_name')
+        external_subdirectories += get_relative_paths(included_project_path, project_json_data,
+                                                      'external_subdirectories')
+        templates += get_relative_paths(included_project_path, project_json_data, 'templates')
+    external_subdirectories = list(dict.fromkeys(external_subdirectories))
+
+    # Search the external subdirectories for gems a level at a time, adding the external subdirectories
+    # of the gems found, so each directory is only searched once
+    gems = []
+    new_external_subdirectories = external_subdirectories
+    while new_external_subdirectories:
+        new_gems = [gem_path for gem_path in gem_discovery.find_gem_directories(new_external_subdirectories)
+                    if gem_path not in gems]
+        gems.extend(new_gems)
+        new_external_subdirectories = []
+        for gem_path in new_gems:
+            gem_json_data = get_object_json_data(pathlib.Path(gem_path) / 'gem.json', 'gem_name')
+            new_external_subdirectories += get_relative_paths(gem_path, gem_json_data, 'external_subdirectories')
+            templates += get_relative_paths(gem_path, gem_json_data, 'templates')
+        new_external_subdirectories = [external_subdirectory for external_subdirectory
+                                       in dict.fromkeys(new_external_subdirectories)
+                                       if external_subdirectory not in external_subdirectories]
+        external_subdirectories.extend(new_external_subdirectories)
+
+    repo_entries = []
+    cache_folder = manifest.get_o3de_cache_folder()
+    for repo_uri in manifest_json_data.get('repos', []):
+        cache_file = manifest.get_repo_path(repo_uri=repo_uri, cache_folder=cache_folder)
+        repo_entries.append({'uri': repo_uri, 'cache_file': cache_file.as_posix(),
+                             'json_data': get_object_json_data(cache_file, 'repo_name')})
+
+    return {
+        'manifest_path': manifest.get_o3de_manifest().as_posix(),
+        'manifest': manifest_json_data,
+        'this_engine': {'path': this_engine_path.as_posix(), 'json_data': this_engine_json_data},
+        'engines': get_object_entries(engines, 'engine'),
+        'projects': project_entries,
+        'external_subdirectories': external_subdirectories,
+        'gems': get_object_entries(gems, 'gem'),
+        'templates': get_object_entries(list(dict.fromkeys(templates)), 'template'),
+        'restricted': get_object_entries(manifest_json_data.get('restricted', []), 'restricted'),
+        'repos': repo_entries
+    }
+
+
+def print_registration_json(project_path: pathlib.Path = None, project_name: str = None) -> int:
+    """
+    Outputs all of the registration data as a single json document, see get_registration_json_data
+    """
+    registration_json_data = get_registration_json_data(project_path, project_name)
+    if registration_json_data is None:
+        return 1
+    print(json.dumps(registration_json_data, indent=4))
+    return 0
+
+
 def register_show(verbose: int, project_path: pathlib.Path = None, project_name: str = None) -> int:
     json_data = manifest.load_o3de_manifest()
     print(f"{manifest.get_o3de_manifest()}:")
@@ -316,7 +431,9 @@ def register_show(verbose: int, project_path: pathlib.Path = None, project_name:
 
 
 def _run_register_show(args: argparse) -> int:
-    if args.this_engine:
+    if args.json:
+        return print_registration_json(args.project_path, args.project_name)
+    elif args.this_engine:
         return print_this_engine(args.verbose)
     elif args.engines:
         return print_engines(args.verbose)
@@ -457,6 +574,12 @@ def add_parser_args(parser):
                             ' If --project-path or --project-name options is supplied, outputs external'
                             ' subdirectories registered in that project\'s project.json otherwise outputs external'
                             ' subdirectories registered from all registered projects. Ignores repos')
+    group.add_argument('-j', '--json', action='store_true', required=False,
+                       default=False,
+                       help='Output all registered engines, projects, external subdirectories, gems, templates,'
+                            ' restricted directories and repos along with their json data as a single json document.'
+                            ' If --project-path or --project-name option is supplied, outputs the gems and templates of'
+                            ' that project otherwise outputs the gems and templates of all registered projects.')
 
     parser.add_argument('-v', '--verbose', action='count', required=False,
                         default=0,
@@ -0,0 +1,221 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+"""
+Contains a long-lived daemon which serves the project_manager_interface functions as JSON-RPC 2.0 over stdio.
+Each request and response is a single line of json. The daemon keeps the registry warm in memory between requests
+and watches the o3de manifest and the object json files it has read, so that the registry is refreshed when any of
+them changes.
+
+Ex. echo '{"jsonrpc": "2.0", "id": 1, "method": "get_all_gem_infos", "params": {"project_path": "D:/TestProject"}}' |
+    python project_manager_daemon.py
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import sys
+
+from o3de import manifest, project_manager_interface, registry_index, utils
+
+logger = logging.getLogger('o3de.project_manager_daemon')
+logging.basicConfig(format=utils.LOG_FORMAT)
+
+JSONRPC_VERSION = '2.0'
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# The project_manager_interface functions which are served by the daemon. The functions which are not implemented
+# yet are left out, so that requests for them fail with METHOD_NOT_FOUND instead of silently doing nothing
+DAEMON_METHODS = [
+    'get_enabled_gem_names',
+    'get_project_info',
+    'get_all_project_infos',
+    'add_gem_to_project',
+    'remove_gem_from_project',
+    'get_gem_info',
+    'get_all_gem_infos'
+]
+
+
+def _get_path_stamp(path: str) -> tuple or None:
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        return None
+    return path_stat.st_mtime_ns, path_stat.st_size
+
+
+class RegistryWatcher:
+    """
+    Tracks the o3de manifest, every object json file and every directory searched for gems that the registry
+    has read, so that the in-memory name lookup tables are discarded when any of them changes.
+    The parsed json data itself is validated against the file by the registry index on each read
+    """
+
+    def __init__(self):
+        self._stamps = {}
+
+    @staticmethod
+    def get_watched_paths() -> list:
+        index = registry_index.load_registry_index()
+        watched_paths = [str(manifest.get_o3de_manifest())]
+        watched_paths.extend(index['json_files'])
+        for subdirectory_entry in index['subdirectories'].values():
+            watched_paths.extend(subdirectory_entry['paths'])
+        return watched_paths
+
+    def update(self) -> None:
+        """
+        Records the current state of the watched paths
+        """
+        self._stamps = {path: _get_path_stamp(path) for path in self.get_watched_paths()}
+
+    def check(self) -> bool:
+        """
+        Checks the watched paths against the state recorded by the last update and refreshes the registry
+        if any of them changed
+        :return: True if any watched path changed
+        """
+        changed_path = next((path for path, stamp in self._stamps.items() if _get_path_stamp(path) != stamp), None)
+        if not changed_path:
+            return False
+        logger.info(f'{changed_path} changed, refreshing the registry.')
+        manifest.invalidate_registered_name_tables()
+        return True
+
+
+def _error_response(request_id, code: int, message: str) -> dict:
+    return {'jsonrpc': JSONRPC_VERSION, 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+def handle_request(request) -> dict or None:
+    """
+    Calls the project_manager_interface function of a JSON-RPC request
+    :param request: the decoded JSON-RPC request
+    :return: the JSON-RPC response, or None if the request is a notification
+    """
+    if not isinstance(request, dict) or request.get('jsonrpc') != JSONRPC_VERSION \
+            or not isinstance(request.get('method'), str):
+        return _error_response(request.get('id') if isinstance(request, dict) else None,
+                               INVALID_REQUEST, 'Invalid Request')
+
+    request_id = request.get('id')
+    method = request['method']
+    params = request.get('params', [])
+    if method not in DAEMON_METHODS:
+        response = _error_response(request_id, METHOD_NOT_FOUND, f'Method not found: {method}')
+    elif not isinstance(params, (list, dict)):
+        response = _error_response(request_id, INVALID_PARAMS, 'Params must be an array or object')
+    else:
+        # The function is looked up on each call so that it can be replaced at runtime
+        method_func = getattr(project_manager_interface, method)
+        try:
+            result = method_func(*params) if isinstance(params, list) else method_func(**params)
+        except TypeError as e:
+            response = _error_response(request_id, INVALID_PARAMS, str(e))
+        except Exception as e:
+            logger.exception(f'{method} failed')
+            response = _error_response(request_id, INTERNAL_ERROR, str(e))
+        else:
+            response = {'jsonrpc': JSONRPC_VERSION, 'id': request_id, 'result': result}
+
+    return response if 'id' in request else None
+
+
+def handle_message(message: str) -> list or dict or None:
+    """
+    Handles a single JSON-RPC request or a batch of requests
+    :param message: a line of json containing the request or batch
+    :return: the response, list of responses for a batch, or None if there is nothing to respond
+    """
+    try:
+        requests = json.loads(message)
+    except json.JSONDecodeError as e:
+        return _error_response(None, PARSE_ERROR, f'Parse error: {str(e)}')
+
+    if isinstance(requests, list):
+        if not requests:
+            return _error_response(None, INVALID_REQUEST, 'Invalid Request')
+        responses = [response for response in map(handle_request, requests) if response]
+        return responses or None
+    return handle_request(requests)
+
+
+def serve(input_stream=None, output_stream=None) -> int:
+    """
+    Serves JSON-RPC requests read line by line from the input stream until it is closed
+    :param input_stream: stream to read requests from, defaults to stdin
+    :param output_stream: stream to write responses to, defaults to stdout
+    :return: 0 for success
+    """
+    input_stream = input_stream or sys.stdin
+    output_stream = output_stream or sys.stdout
+
+    watcher = RegistryWatcher()
+    for message in input_stream:
+        if not message.strip():
+            continue
+
+        watcher.check()
+        # Anything the o3de scripts print would corrupt the responses, so it is redirected to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            response = handle_message(message)
+        if response is not None:
+            # paths are returned as strings
+            output_stream.write(json.dumps(response, default=str) + '\n')
+            output_stream.flush()
+        # The request may have read object json files which were not watched yet
+        watcher.update()
+        # Let other o3de processes use the registry index built by the daemon
+        registry_index.save_registry_index()
+
+    return 0
+
+
+def _run_daemon(args: argparse) -> int:
+    return serve()
+
+
+def add_parser_args(parser):
+    """
+    add_parser_args is called to add arguments to each command such that it can be
+    invoked locally or added by a central python file.
+    Ex. Directly run from this file alone with: python project_manager_daemon.py
+    :param parser: the caller passes an argparse parser like instance to this method
+    """
+    utils.add_verbosity_arg(parser)
+    parser.set_defaults(func=_run_daemon)
+
+
+def main():
+    """
+    Runs project_manager_daemon.py script as standalone script
+    """
+    # parse the command line args
+    the_parser = argparse.ArgumentParser()
+
+    # add args to the parser
+    add_parser_args(the_parser)
+
+    # parse args
+    the_args = the_parser.parse_args()
+
+    # run
+    ret = the_args.func(the_args) if hasattr(the_args, 'func') else 1
+
+    # return
+    sys.exit(ret)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ Contains functions for the project manager to call that gather data from o3de sc
 import logging
 import pathlib
 
-from o3de import cmake, disable_gem, download, enable_gem, engine_properties, engine_template, manifest, project_properties, register, repo
+from o3de import cmake, disable_gem, download, enable_gem, engine_properties, engine_template, manifest, project_properties, register, repo, utils
 
 logger = logging.getLogger('o3de.project_manager_interface')
 logging.basicConfig(format=utils.LOG_FORMAT)
@@ -116,7 +116,10 @@ def get_enabled_gem_names(project_path: str) -> list:
 
         :return list of strs of enable gems for project.
     """
-    return list()
+    enabled_gem_file = cmake.get_enabled_gem_cmake_file(project_path=project_path)
+    if not enabled_gem_file or not enabled_gem_file.is_file():
+        return list()
+    return sorted(cmake.get_enabled_gems(enabled_gem_file))
 
 
 def get_project_info(project_path: str) -> dict or None:
@@ -127,7 +130,11 @@ def get_project_info(project_path: str) -> dict or None:
 
         :return dict with project info. Otherwise None is returned
     """
-    return dict()
+    project_json_data = manifest.get_project_json_data(project_path=project_path)
+    if not project_json_data:
+        return None
+    project_json_data['path'] = pathlib.Path(project_path).resolve().as_posix()
+    return project_json_data
 
 
 def get_all_project_infos() -> list:
@@ -138,7 +145,8 @@ def get_all_project_infos() -> list:
 
         :return list of dicts containing project infos.
     """
-    return list()
+    project_infos = map(get_project_info, manifest.get_all_projects())
+    return [project_info for project_info in project_infos if project_info]
 
 
 def set_project_info(project_info: dict):
@@ -156,8 +164,10 @@ def add_gem_to_project(gem_path: str, project_path: str):
 
         :param gem_path: Gem path to activate
         :param project_path: Project path to activate
+
+        :return 0 for success or non 0 failure code
     """
-    pass
+    return enable_gem.enable_gem_in_project(gem_path=pathlib.Path(gem_path), project_path=pathlib.Path(project_path))
 
 def remove_gem_from_project(gem_path: str, project_path: str):
     """
@@ -165,8 +175,10 @@ def remove_gem_from_project(gem_path: str, project_path: str):
 
         :param gem_path: Gem path to deactivate
         :param project_path: Project path to deactivate
+
+        :return 0 for success or non 0 failure code
     """
-    pass
+    return disable_gem.disable_gem_in_project(gem_path=pathlib.Path(gem_path), project_path=pathlib.Path(project_path))
 
 
 #### Gem methods ###
@@ -194,14 +206,18 @@ def unregister_gem(gem_path: str, project_path: str = None,):
 
 
 def get_gem_info(gem_path: str) -> dict or None:
-        """
+    """
         Call get_gem_json_data
 
         :param gem_path: Gem path to gather info for
 
         :return dict with project info. Otherwise None is returned
     """
-    return dict()
+    gem_json_data = manifest.get_gem_json_data(gem_path=gem_path)
+    if not gem_json_data:
+        return None
+    gem_json_data['path'] = pathlib.Path(gem_path).resolve().as_posix()
+    return gem_json_data
 
 
 def get_all_gem_infos(project_path: str) -> list:
@@ -214,7 +230,8 @@ def get_all_gem_infos(project_path: str) -> list:
 
         :return list of dicts containing gem infos.
     """
-    return list()
+    gem_infos = map(get_gem_info, manifest.get_all_gems(project_path))
+    return [gem_info for gem_info in gem_infos if gem_info]
 
 
 def download_gem(gem_name: str, force_overwrite: bool = False, progress_callback = None):
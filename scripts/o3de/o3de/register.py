@@ -11,6 +11,8 @@ This file contains all the code that has to do with registering engines, project
 """
 
 import argparse
+import concurrent.futures
+import contextlib
 import hashlib
 import logging
 import json
@@ -21,7 +23,7 @@ import sys
 import urllib.parse
 import urllib.request
 
-from o3de import get_registration, manifest, repo, utils, validation
+from o3de import get_registration, manifest, registry_index, repo, utils, validation
 
 logger = logging.getLogger('o3de.register')
 logging.basicConfig(format=utils.LOG_FORMAT)
@@ -100,31 +102,39 @@ def register_all_in_folder(folder_path: pathlib.Path,
             elif name == 'repo.json':
                 repo_set.add(root)
 
-    for engine in sorted(engines_set, reverse=True):
-        error_code = register(engine_path=engine, remove=remove)
-        if error_code:
-            ret_val = error_code
-
-    for project in sorted(projects_set, reverse=True):
-        error_code = register(engine_path=engine_path, project_path=project, remove=remove)
-        if error_code:
-            ret_val = error_code
-
-    for gem in sorted(gems_set, reverse=True):
-        error_code = register(engine_path=engine_path, gem_path=gem, remove=remove)
-        if error_code:
-            ret_val = error_code
-
-    for template in sorted(templates_set, reverse=True):
-        error_code = register(engine_path=engine_path, template_path=template, remove=remove)
-        if error_code:
-            ret_val = error_code
-
-    for restricted in sorted(restricted_set, reverse=True):
-        error_code = register(engine_path=engine_path, restricted_path=restricted, remove=remove)
-        if error_code:
-            ret_val = error_code
-
+    # register all the objects with a single write of the manifest
+    try:
+        with manifest.transaction():
+            for engine in sorted(engines_set, reverse=True):
+                error_code = register(engine_path=engine, remove=remove)
+                if error_code:
+                    ret_val = error_code
+
+            for project in sorted(projects_set, reverse=True):
+                error_code = register(engine_path=engine_path, project_path=project, remove=remove)
+                if error_code:
+                    ret_val = error_code
+
+            for gem in sorted(gems_set, reverse=True):
+                error_code = register(engine_path=engine_path, gem_path=gem, remove=remove)
+                if error_code:
+                    ret_val = error_code
+
+            for template in sorted(templates_set, reverse=True):
+                error_code = register(engine_path=engine_path, template_path=template, remove=remove)
+                if error_code:
+                    ret_val = error_code
+
+            for restricted in sorted(restricted_set, reverse=True):
+                error_code = register(engine_path=engine_path, restricted_path=restricted, remove=remove)
+                if error_code:
+                    ret_val = error_code
+    except OSError as e:
+        logger.error(f'Failed to register the o3de objects in folder {folder_path}: {str(e)}')
+        ret_val = 1
+
+    # Repos are downloaded when they are registered, so each one is registered in its own transaction
+    # rather than keeping the o3de manifest locked for all of the downloads
     for repo in sorted(repo_set, reverse=True):
         error_code = register(engine_path=engine_path, repo_uri=repo, remove=remove)
         if error_code:
@@ -162,11 +172,19 @@ def register_all_o3de_objects_of_type_in_folder(o3de_object_path: pathlib.Path,
             # Nested o3de objects of the same type aren't supported(i.e an engine cannot be inside of a engine).
             dirs[:] = []
 
-    for o3de_object_type_root in sorted(o3de_object_type_set, reverse=True):
-        error_code = register(**{register_path_kwarg: o3de_object_type_root},
-                              remove=remove, force=force, **register_kwargs)
-        if error_code:
-            ret_val = error_code
+    # register all the objects with a single write of the manifest.
+    # Repos are downloaded when they are registered, so each one is registered in its own transaction
+    # rather than keeping the o3de manifest locked for all of the downloads
+    try:
+        with manifest.transaction() if o3de_object_type != 'repo' else contextlib.nullcontext():
+            for o3de_object_type_root in sorted(o3de_object_type_set, reverse=True):
+                error_code = register(**{register_path_kwarg: o3de_object_type_root},
+                                      remove=remove, force=force, **register_kwargs)
+                if error_code:
+                    ret_val = error_code
+    except OSError as e:
+        logger.error(f'Failed to register the {o3de_object_type} objects in folder {o3de_object_path}: {str(e)}')
+        ret_val = 1
 
     return ret_val
 
@@ -469,15 +487,44 @@ def register_restricted_path(json_data: dict,
                                      pathlib.Path(project_path).resolve() if project_path else None)
 
 
+def download_repo(repo_uri: str) -> tuple:
+    """
+    Downloads the repo.json of a repo, the object json files it lists and its child repos into the o3de cache folder.
+    This does not use the o3de manifest, so it can be called before the manifest is locked for the registration
+    :param repo_uri: uri of the repo
+    :return: tuple of the result of downloading the repo.json and the result of downloading what it lists,
+     0 for success or 1 for failure
+    """
+    url = f'{repo_uri}/repo.json'
+    parsed_uri = urllib.parse.urlparse(url)
+    repo_sha256 = hashlib.sha256(url.encode())
+    cache_file = manifest.get_o3de_cache_folder() / str(repo_sha256.hexdigest() + '.json')
+
+    download_result = utils.download_file(parsed_uri, cache_file, True)
+
+    repo_set = set()
+    return download_result, repo.process_add_o3de_repo(cache_file, repo_set)
+
+
 def register_repo(json_data: dict,
                   repo_uri: str,
-                  remove: bool = False) -> int:
+                  remove: bool = False,
+                  download_results: tuple = None) -> int:
+    """
+    Adds or removes a repo uri in the o3de manifest json data
+    :param json_data: the o3de manifest json data
+    :param repo_uri: uri of the repo
+    :param remove: remove the repo uri instead of adding it
+    :param download_results: results of download_repo for the repo uri if it was already downloaded,
+     otherwise the repo is downloaded
+    :return: 0 for success or 1 for failure
+    """
     if not repo_uri:
         logger.error(f'Repo URI cannot be empty.')
         return 1
 
-    url = f'{repo_uri}/repo.json'
-    parsed_uri = urllib.parse.urlparse(url)
+    download_uri = repo_uri
+    parsed_uri = urllib.parse.urlparse(f'{repo_uri}/repo.json')
 
     if parsed_uri.scheme in ['http', 'https', 'ftp', 'ftps']:
         while repo_uri in json_data.get('repos', []):
@@ -490,16 +537,11 @@ def register_repo(json_data: dict,
     if remove:
         logger.warning(f'Removing repo uri {repo_uri}.')
         return 0
-    repo_sha256 = hashlib.sha256(url.encode())
-    cache_file = manifest.get_o3de_cache_folder() / str(repo_sha256.hexdigest() + '.json')
 
-    result = utils.download_file(parsed_uri, cache_file, True)
-    if result == 0:
+    download_result, result = download_results or download_repo(download_uri)
+    if download_result == 0:
         json_data.setdefault('repos', []).insert(0, repo_uri)
 
-    repo_set = set()
-    result = repo.process_add_o3de_repo(cache_file, repo_set)
-
     return result
 
 
@@ -582,86 +624,146 @@ def remove_invalid_o3de_projects(manifest_path: pathlib.Path = None) -> int:
     return result
 
 
-def remove_invalid_o3de_objects() -> None:
-    for engine_path in manifest.get_engines():
-        if not validation.valid_o3de_engine_json(pathlib.Path(engine_path).resolve() / 'engine.json'):
-            logger.warning(f"Engine path {engine_path} is invalid.")
-            register(engine_path=engine_path, remove=True)
-
-    remove_invalid_o3de_projects()
-
-    for external in manifest.get_external_subdirectories():
-        external = pathlib.Path(external).resolve()
-        if not external.is_dir():
-            logger.warning(f"External subdirectory {external} is invalid.")
-            register(engine_path=engine_path, external_subdir_path=external, remove=True)
-
-    for template in manifest.get_templates():
-        if not validation.valid_o3de_template_json(pathlib.Path(template).resolve() / 'template.json'):
-            logger.warning(f"Template path {template} is invalid.")
-            register(template_path=template, remove=True)
-
-    for restricted in manifest.get_restricted():
-        if not validation.valid_o3de_restricted_json(pathlib.Path(restricted).resolve() / 'restricted.json'):
-            logger.warning(f"Restricted path {restricted} is invalid.")
-            register(restricted_path=restricted, remove=True)
-
-    json_data = manifest.load_o3de_manifest()
-    default_engines_folder = pathlib.Path(
-        json_data.get('default_engines_folder', manifest.get_o3de_engines_folder())).resolve()
-    if not default_engines_folder.is_dir():
-        new_default_engines_folder = manifest.get_o3de_folder() / 'Engines'
-        new_default_engines_folder.mkdir(parents=True, exist_ok=True)
-        logger.warning(
-            f"Default engines folder {default_engines_folder} is invalid. Set default {new_default_engines_folder}")
-        register(default_engines_folder=new_default_engines_folder.as_posix())
-
-    default_projects_folder = pathlib.Path(
-        json_data.get('default_projects_folder', manifest.get_o3de_projects_folder())).resolve()
-    if not default_projects_folder.is_dir():
-        new_default_projects_folder = manifest.get_o3de_folder() / 'Projects'
-        new_default_projects_folder.mkdir(parents=True, exist_ok=True)
-        logger.warning(
-            f"Default projects folder {default_projects_folder} is invalid. Set default {new_default_projects_folder}")
-        register(default_projects_folder=new_default_projects_folder.as_posix())
-
-    default_gems_folder = pathlib.Path(json_data.get('default_gems_folder', manifest.get_o3de_gems_folder())).resolve()
-    if not default_gems_folder.is_dir():
-        new_default_gems_folder = manifest.get_o3de_folder() / 'Gems'
-        new_default_gems_folder.mkdir(parents=True, exist_ok=True)
-        logger.warning(f"Default gems folder {default_gems_folder} is invalid."
-                       f" Set default {new_default_gems_folder}")
-        register(default_gems_folder=new_default_gems_folder.as_posix())
-
-    default_templates_folder = pathlib.Path(
-        json_data.get('default_templates_folder', manifest.get_o3de_templates_folder())).resolve()
-    if not default_templates_folder.is_dir():
-        new_default_templates_folder = manifest.get_o3de_folder() / 'Templates'
-        new_default_templates_folder.mkdir(parents=True, exist_ok=True)
-        logger.warning(
-            f"Default templates folder {default_templates_folder} is invalid."
-            f" Set default {new_default_templates_folder}")
-        register(default_templates_folder=new_default_templates_folder.as_posix())
-
-    default_restricted_folder = pathlib.Path(
-        json_data.get('default_restricted_folder', manifest.get_o3de_restricted_folder())).resolve()
-    if not default_restricted_folder.is_dir():
-        default_restricted_folder = manifest.get_o3de_folder() / 'Restricted'
-        default_restricted_folder.mkdir(parents=True, exist_ok=True)
-        logger.warning(
-            f"Default restricted folder {default_restricted_folder} is invalid."
-            f" Set default {default_restricted_folder}")
-        register(default_restricted_folder=default_restricted_folder.as_posix())
-
-    default_third_party_folder = pathlib.Path(
-        json_data.get('default_third_party_folder', manifest.get_o3de_third_party_folder())).resolve()
-    if not default_third_party_folder.is_dir():
-        default_third_party_folder = manifest.get_o3de_folder() / '3rdParty'
-        default_third_party_folder.mkdir(parents=True, exist_ok=True)
-        logger.warning(
-            f"Default 3rd Party folder {default_third_party_folder} is invalid."
-            f" Set default {default_third_party_folder}")
-        register(default_third_party_folder=default_third_party_folder.as_posix())
+# The json file and validator of each o3de object type listed in the o3de manifest.
+# External subdirectories are only required to be directories
+_MANIFEST_OBJECT_VALIDATORS = {
+    'engines': ('engine.json', validation.valid_o3de_engine_json),
+    'projects': ('project.json', validation.valid_o3de_project_json),
+    'external_subdirectories': (None, None),
+    'templates': ('template.json', validation.valid_o3de_template_json),
+    'restricted': ('restricted.json', validation.valid_o3de_restricted_json),
+    'repos': ('repo.json', validation.valid_o3de_repo_json)
+}
+
+# The folder within the ~/.o3de folder that each default folder of the o3de manifest is reset to when invalid
+_MANIFEST_DEFAULT_FOLDERS = {
+    'default_engines_folder': 'Engines',
+    'default_projects_folder': 'Projects',
+    'default_gems_folder': 'Gems',
+    'default_templates_folder': 'Templates',
+    'default_restricted_folder': 'Restricted',
+    'default_third_party_folder': '3rdParty'
+}
+
+
+def _get_manifest_entry_path(entry: str or dict) -> str:
+    # engines may be stored as dictionaries with a path key
+    return entry.get('path', '') if isinstance(entry, dict) else entry
+
+
+def _is_valid_manifest_entry(o3de_object_key: str, entry: str, dry_run: bool = False) -> bool:
+    if o3de_object_key in _MANIFEST_DEFAULT_FOLDERS:
+        return os.path.isdir(entry)
+
+    if o3de_object_key == 'repos' and urllib.parse.urlparse(entry).scheme in ['http', 'https', 'ftp', 'ftps']:
+        # Remote repos are validated when they are refreshed
+        return True
+
+    json_filename, validator = _MANIFEST_OBJECT_VALIDATORS[o3de_object_key]
+    if not json_filename:
+        return os.path.isdir(entry)
+
+    object_json = pathlib.Path(entry).resolve() / json_filename
+    if o3de_object_key == 'projects' and dry_run:
+        # valid_o3de_project_json writes a missing project_id to the project.json, which a dry run must not do
+        if not object_json.is_file():
+            return False
+        _, project_json_data = registry_index.get_json_data(object_json)
+        return isinstance(project_json_data, dict) and 'project_name' in project_json_data
+
+    # Files that have not changed since they were last validated are not read again
+    is_valid, _ = registry_index.get_json_data(object_json, validator)
+    return is_valid
+
+
+def find_invalid_o3de_objects(json_data: dict, dry_run: bool = False, max_workers: int = None) -> dict:
+    """
+    Validates every engine, project, external subdirectory, template, restricted and local repo entry
+    and every default folder of the o3de manifest data. The entries are stat'ed and parsed on a thread pool,
+    which is much faster than validating them one after the other when they are on a network drive
+    :param json_data: the o3de manifest json data
+    :param dry_run: do not generate missing project ids in the project.json files
+    :param max_workers: maximum number of threads used to validate the entries. Defaults to the
+     concurrent.futures.ThreadPoolExecutor default
+    :return: dictionary of each manifest key with invalid entries to the list of invalid entries
+    """
+    manifest_entries = []
+    for o3de_object_key in _MANIFEST_OBJECT_VALIDATORS:
+        for entry in json_data.get(o3de_object_key, []):
+            manifest_entries.append((o3de_object_key, _get_manifest_entry_path(entry)))
+    for default_folder_key in _MANIFEST_DEFAULT_FOLDERS:
+        if default_folder_key in json_data:
+            manifest_entries.append((default_folder_key, json_data[default_folder_key]))
+
+    # Load the index before any worker threads use it
+    registry_index.load_registry_index()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        validation_results = list(executor.map(lambda manifest_entry: _is_valid_manifest_entry(*manifest_entry, dry_run),
+                                               manifest_entries))
+
+    invalid_objects = {}
+    for (o3de_object_key, entry), is_valid in zip(manifest_entries, validation_results):
+        if not is_valid:
+            invalid_objects.setdefault(o3de_object_key, []).append(entry)
+    return invalid_objects
+
+
+def remove_invalid_o3de_objects(dry_run: bool = False, max_workers: int = None) -> int:
+    """
+    Removes every invalid o3de object registered in the o3de manifest and resets each invalid default folder.
+    All of the entries are validated first, without locking the manifest, then the manifest is reloaded
+    in a transaction and written once with all of the changes
+    :param dry_run: only report the changes which would be made, without modifying any file
+    :param max_workers: maximum number of threads used to validate the entries
+    :return: 0 for success or 1 if the manifest could not be loaded or saved
+    """
+    try:
+        invalid_objects = find_invalid_o3de_objects(manifest.load_o3de_manifest(), dry_run, max_workers)
+    except json.JSONDecodeError:
+        logger.error(f'Unable to remove invalid o3de objects from manifest {manifest.get_o3de_manifest()}')
+        return 1
+
+    for o3de_object_key, invalid_entries in invalid_objects.items():
+        for entry in invalid_entries:
+            if o3de_object_key in _MANIFEST_DEFAULT_FOLDERS:
+                new_default_folder = manifest.get_o3de_folder() / _MANIFEST_DEFAULT_FOLDERS[o3de_object_key]
+                message = f'Default folder {o3de_object_key} {entry} is invalid.' \
+                          f' Set default {new_default_folder.as_posix()}'
+            else:
+                message = f'{o3de_object_key} path {entry} is invalid. Remove it from the manifest'
+            logger.warning(f'Dry run: {message}' if dry_run else message)
+
+    if dry_run or not invalid_objects:
+        return 0
+
+    try:
+        # The manifest is reloaded in the transaction, so that only the invalid entries are removed
+        # from the manifest even if another o3de process modified it during the validation
+        with manifest.transaction():
+            json_data = manifest.load_o3de_manifest()
+            for o3de_object_key, invalid_entries in invalid_objects.items():
+                if o3de_object_key in _MANIFEST_DEFAULT_FOLDERS:
+                    if json_data.get(o3de_object_key) not in invalid_entries:
+                        continue
+                    new_default_folder = manifest.get_o3de_folder() / _MANIFEST_DEFAULT_FOLDERS[o3de_object_key]
+                    new_default_folder.mkdir(parents=True, exist_ok=True)
+                    json_data[o3de_object_key] = new_default_folder.as_posix()
+                    continue
+
+                json_data[o3de_object_key] = [entry for entry in json_data.get(o3de_object_key, [])
+                                              if _get_manifest_entry_path(entry) not in invalid_entries]
+                if o3de_object_key == 'engines':
+                    invalid_engine_paths = [pathlib.Path(engine_path).resolve() for engine_path in invalid_entries]
+                    json_data['engines_path'] = {engine_name: engine_path for engine_name, engine_path
+                                                 in json_data.get('engines_path', {}).items()
+                                                 if pathlib.Path(engine_path).resolve() not in invalid_engine_paths}
+
+            manifest.save_o3de_manifest(json_data)
+    except (json.JSONDecodeError, OSError):
+        logger.error(f'Unable to remove invalid o3de objects from manifest {manifest.get_o3de_manifest()}')
+        return 1
+
+    return 0
 
 
 def register(engine_path: pathlib.Path = None,
@@ -708,97 +810,123 @@ def register(engine_path: pathlib.Path = None,
     :return: 0 for success or non 0 failure code
     """
 
-    try:
-        json_data = manifest.load_o3de_manifest()
-    except json.JSONDecodeError:
-        if not force:
-            logger.error('O3DE object registration has halted due to JSON Decode Error in manifest at path:'
-                         f' "{manifest.get_o3de_manifest()}".'
-                         '\n      Registration can be forced using the --force option,'
-                         ' but that will result in the manifest using default data')
+    # Repos are downloaded before the o3de manifest is locked,
+    # so that a slow download does not block other o3de processes
+    repo_download_results = None
+    if isinstance(repo_uri, str) and repo_uri and not remove:
+        repo_download_results = download_repo(repo_uri)
+
+    # The o3de manifest is locked from when it is loaded until it is saved,
+    # so that registrations run by other o3de processes are not overwritten
+    with contextlib.ExitStack() as manifest_transaction:
+        try:
+            manifest_transaction.enter_context(manifest.transaction())
+        except json.JSONDecodeError:
+            if not force:
+                logger.error('O3DE object registration has halted due to JSON Decode Error in manifest at path:'
+                             f' "{manifest.get_o3de_manifest()}".'
+                             '\n      Registration can be forced using the --force option,'
+                             ' but that will result in the manifest using default data')
+                return 1
+            else:
+                # Use a default manifest data an proceed
+                manifest_transaction.enter_context(
+                    manifest.transaction(json_data=manifest.get_default_o3de_manifest_json_data()))
+        except OSError as e:
+            logger.error(f'O3DE object registration has halted as the manifest could not be locked: {str(e)}')
             return 1
-        else:
-            # Use a default manifest data an proceed
-            json_data = manifest.get_default_o3de_manifest_json_data()
+        json_data = manifest.load_o3de_manifest()
 
-    result = 0
+        result = 0
 
-    # do anything that could require a engine context first
-    if isinstance(project_path, pathlib.PurePath):
-        if not project_path:
-            logger.error(f'Project path cannot be empty.')
-            return 1
-        result = result or register_project_path(json_data, project_path, remove, engine_path)
+        # do anything that could require a engine context first
+        if isinstance(project_path, pathlib.PurePath):
+            if not project_path:
+                logger.error(f'Project path cannot be empty.')
+                return 1
+            result = result or register_project_path(json_data, project_path, remove, engine_path)
 
-    if isinstance(gem_path, pathlib.PurePath):
-        if not gem_path:
-            logger.error(f'Gem path cannot be empty.')
-            return 1
-        result = result or register_gem_path(json_data, gem_path, remove,
-                                             external_subdir_engine_path, external_subdir_project_path)
+        if isinstance(gem_path, pathlib.PurePath):
+            if not gem_path:
+                logger.error(f'Gem path cannot be empty.')
+                return 1
+            result = result or register_gem_path(json_data, gem_path, remove,
+                                                 external_subdir_engine_path, external_subdir_project_path)
 
-    if isinstance(external_subdir_path, pathlib.PurePath):
-        if not external_subdir_path:
-            logger.error(f'External Subdirectory path is None.')
-            return 1
-        result = result or register_external_subdirectory(json_data, external_subdir_path, remove,
-                                                          external_subdir_engine_path, external_subdir_project_path)
+        if isinstance(external_subdir_path, pathlib.PurePath):
+            if not external_subdir_path:
+                logger.error(f'External Subdirectory path is None.')
+                return 1
+            result = result or register_external_subdirectory(json_data, external_subdir_path, remove,
+                                                              external_subdir_engine_path, external_subdir_project_path)
 
-    if isinstance(template_path, pathlib.PurePath):
-        if not template_path:
-            logger.error(f'Template path cannot be empty.')
-            return 1
-        result = result or register_template_path(json_data, template_path, remove, project_path, engine_path)
+        if isinstance(template_path, pathlib.PurePath):
+            if not template_path:
+                logger.error(f'Template path cannot be empty.')
+                return 1
+            result = result or register_template_path(json_data, template_path, remove, project_path, engine_path)
 
-    if isinstance(restricted_path, pathlib.PurePath):
-        if not restricted_path:
-            logger.error(f'Restricted path cannot be empty.')
-            return 1
-        result = result or register_restricted_path(json_data, restricted_path, remove, project_path, engine_path)
+        if isinstance(restricted_path, pathlib.PurePath):
+            if not restricted_path:
+                logger.error(f'Restricted path cannot be empty.')
+                return 1
+            result = result or register_restricted_path(json_data, restricted_path, remove, project_path, engine_path)
 
-    if isinstance(repo_uri, str):
-        if not repo_uri:
-            logger.error(f'Repo URI cannot be empty.')
-            return 1
-        result = result or register_repo(json_data, repo_uri, remove)
+        if isinstance(repo_uri, str):
+            if not repo_uri:
+                logger.error(f'Repo URI cannot be empty.')
+                return 1
+            result = result or register_repo(json_data, repo_uri, remove, repo_download_results)
 
-    if isinstance(default_engines_folder, pathlib.PurePath):
-        result = result or register_default_engines_folder(json_data, default_engines_folder, remove)
+        if isinstance(default_engines_folder, pathlib.PurePath):
+            result = result or register_default_engines_folder(json_data, default_engines_folder, remove)
 
-    if isinstance(default_projects_folder, pathlib.PurePath):
-        result = result or register_default_projects_folder(json_data, default_projects_folder, remove)
+        if isinstance(default_projects_folder, pathlib.PurePath):
+            result = result or register_default_projects_folder(json_data, default_projects_folder, remove)
 
-    if isinstance(default_gems_folder, pathlib.PurePath):
-        result = result or register_default_gems_folder(json_data, default_gems_folder, remove)
+        if isinstance(default_gems_folder, pathlib.PurePath):
+            result = result or register_default_gems_folder(json_data, default_gems_folder, remove)
 
-    if isinstance(default_templates_folder, pathlib.PurePath):
-        result = result or register_default_templates_folder(json_data, default_templates_folder, remove)
+        if isinstance(default_templates_folder, pathlib.PurePath):
+            result = result or register_default_templates_folder(json_data, default_templates_folder, remove)
 
-    if isinstance(default_restricted_folder, pathlib.PurePath):
-        result = result or register_default_restricted_folder(json_data, default_restricted_folder, remove)
+        if isinstance(default_restricted_folder, pathlib.PurePath):
+            result = result or register_default_restricted_folder(json_data, default_restricted_folder, remove)
 
-    if isinstance(default_third_party_folder, pathlib.PurePath):
-        result = result or register_default_third_party_folder(json_data, default_third_party_folder, remove)
+        if isinstance(default_third_party_folder, pathlib.PurePath):
+            result = result or register_default_third_party_folder(json_data, default_third_party_folder, remove)
 
-    # engine is done LAST
-    # Now that everything that could have an engine context is done, if the engine is supplied that means this is
-    # registering the engine itself
-    if isinstance(engine_path, pathlib.PurePath):
-        if not engine_path:
-            logger.error(f'Engine path cannot be empty.')
-            return 1
-        result = result or register_engine_path(json_data, engine_path, remove, force)
+        # engine is done LAST
+        # Now that everything that could have an engine context is done, if the engine is supplied that means this is
+        # registering the engine itself
+        if isinstance(engine_path, pathlib.PurePath):
+            if not engine_path:
+                logger.error(f'Engine path cannot be empty.')
+                return 1
+            result = result or register_engine_path(json_data, engine_path, remove, force)
+
+        if not result:
+            manifest.save_o3de_manifest(json_data)
+            try:
+                # The manifest is written when the transaction completes
+                manifest_transaction.close()
+            except OSError:
+                result = 1
 
-    if not result:
-        manifest.save_o3de_manifest(json_data)
+    # The engine.json, project.json or repo cache may have been updated even if registration failed,
+    # so the name lookup tables are always rebuilt on the next query
+    manifest.invalidate_registered_name_tables()
 
     return result
 
 
 def _run_register(args: argparse) -> int:
     if args.update:
-        remove_invalid_o3de_objects()
-        return repo.refresh_repos()
+        if args.dry_run:
+            return remove_invalid_o3de_objects(dry_run=True)
+        # The repos are refreshed even if the invalid objects could not be removed
+        remove_result = remove_invalid_o3de_objects()
+        return repo.refresh_repos() or remove_result
     elif args.this_engine:
         ret_val = register(engine_path=manifest.get_this_engine_path(), force=args.force, remove=args.remove)
         return ret_val
@@ -896,6 +1024,8 @@ def add_parser_args(parser):
                         help='Remove entry.')
     parser.add_argument('-f', '--force', action='store_true', default=False,
                         help='For the update of the registration field being modified.')
+    parser.add_argument('--dry-run', action='store_true', default=False,
+                        help='With --update, only report the invalid entries which would be removed from the manifest.')
 
     external_subdir_group = parser.add_argument_group(title='external-subdirectory',
                                                       description='path arguments to use with the --external-subdirectory option')
@@ -0,0 +1,227 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+"""
+Contains the on-disk registry index which stores parsed o3de object json files and the gem directories found
+within external subdirectories, so that they do not need to be re-read on every invocation of the o3de scripts.
+The index is saved to ~/.o3de/Cache/o3de_registry_index.json and each entry is validated against the
+modification time of the file or directories it was built from before it is used.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import pathlib
+
+from o3de import utils
+
+logger = logging.getLogger('o3de.registry_index')
+logging.basicConfig(format=utils.LOG_FORMAT)
+
+REGISTRY_INDEX_FILENAME = 'o3de_registry_index.json'
+REGISTRY_INDEX_VERSION = 2
+
+_registry_index = None
+_registry_index_dirty = False
+_registry_index_save_registered = False
+
+
+def get_registry_index_path() -> pathlib.Path:
+    # The manifest module imports this module, so it is imported on first use instead
+    from o3de import manifest
+    return manifest.get_o3de_cache_folder() / REGISTRY_INDEX_FILENAME
+
+
+def get_default_registry_index_data() -> dict:
+    return {'version': REGISTRY_INDEX_VERSION, 'json_files': {}, 'subdirectories': {}}
+
+
+def load_registry_index() -> dict:
+    """
+    Returns the in-memory registry index, loading it from ~/.o3de/Cache on first use.
+    A missing, unreadable or out of date index file results in an empty index
+    """
+    global _registry_index
+    if _registry_index is None:
+        _registry_index = get_default_registry_index_data()
+        index_path = get_registry_index_path()
+        try:
+            with open(index_path, 'r') as f:
+                index_data = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.info(f'Registry index at path "{index_path}" could not be loaded and will be rebuilt: {str(e)}')
+        else:
+            if isinstance(index_data, dict) and index_data.get('version') == REGISTRY_INDEX_VERSION:
+                _registry_index['json_files'] = index_data.get('json_files', {})
+                _registry_index['subdirectories'] = index_data.get('subdirectories', {})
+    return _registry_index
+
+
+def save_registry_index() -> bool:
+    """
+    Saves the in-memory registry index to ~/.o3de/Cache if it has been modified since it was loaded.
+    The index is written to a temporary file first and then renamed so that other processes never read a partial index
+    :return: True if the index did not need saving or was saved successfully
+    """
+    global _registry_index_dirty
+    if _registry_index is None or not _registry_index_dirty:
+        return True
+
+    index_path = get_registry_index_path()
+    temp_index_path = index_path.with_name(f'{index_path.name}.{os.getpid()}.tmp')
+    try:
+        with open(temp_index_path, 'w') as s:
+            s.write(json.dumps(_registry_index) + '\n')
+        os.replace(temp_index_path, index_path)
+    except OSError as e:
+        logger.warning(f'Registry index failed to save to path "{index_path}": {str(e)}')
+        try:
+            os.unlink(temp_index_path)
+        except OSError:
+            pass
+        return False
+
+    _registry_index_dirty = False
+    return True
+
+
+def clear_registry_index(remove_file: bool = False) -> None:
+    """
+    Discards all entries of the in-memory registry index
+    :param remove_file: If True the index file in ~/.o3de/Cache is deleted as well
+    """
+    global _registry_index, _registry_index_dirty
+    _registry_index = get_default_registry_index_data()
+    _registry_index_dirty = False
+    if remove_file:
+        try:
+            os.unlink(get_registry_index_path())
+        except OSError:
+            pass
+
+
+def _mark_registry_index_dirty() -> None:
+    global _registry_index_dirty, _registry_index_save_registered
+    _registry_index_dirty = True
+    if not _registry_index_save_registered:
+        # The index is written once when the process exits rather than after every update
+        atexit.register(save_registry_index)
+        _registry_index_save_registered = True
+
+
+def _get_validator_key(validator: callable) -> str or None:
+    """
+    Returns the key used to store the result of the validator within an index entry.
+    Only validators from the o3de.validation module are indexed, as their result is a function of the file contents
+    """
+    if not validator:
+        return 'json'
+    if getattr(validator, '__module__', None) != 'o3de.validation':
+        return None
+    return validator.__name__
+
+
+def _read_json_data(json_path: pathlib.Path, validator: callable = None) -> tuple:
+    if validator and not validator(json_path):
+        return False, None
+
+    with pathlib.Path(json_path).open('r') as f:
+        try:
+            json_data = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.warning(f'{json_path} failed to load: {str(e)}')
+        else:
+            return True, json_data
+
+    return True, None
+
+
+def get_json_data(json_path: pathlib.Path, validator: callable = None) -> tuple:
+    """
+    Returns the validation result and parsed json data of an o3de object json file.
+    The data is returned from the registry index if the modification time and size of the file
+    match the indexed entry, otherwise the file is validated, read and the index entry is updated
+    :param json_path: path to the json file to read
+    :param validator: optional function from the o3de.validation module used to validate the json file
+    :return: tuple of (is_valid, json_data). json_data is None if the file is invalid or could not be decoded
+    """
+    validator_key = _get_validator_key(validator)
+    if not validator_key:
+        return _read_json_data(json_path, validator)
+
+    json_key = os.path.abspath(json_path)
+    index = load_registry_index()
+    try:
+        json_stat = os.stat(json_key)
+    except OSError:
+        if index['json_files'].pop(json_key, None):
+            _mark_registry_index_dirty()
+        return _read_json_data(json_path, validator)
+
+    stamp = [json_stat.st_mtime_ns, json_stat.st_size]
+    entry = index['json_files'].get(json_key)
+    if entry and entry.get('stamp') == stamp and validator_key in entry.get('valid', {}):
+        is_valid = entry['valid'][validator_key]
+        return is_valid, copy.deepcopy(entry.get('data')) if is_valid else None
+
+    is_valid, json_data = _read_json_data(json_path, validator)
+
+    if not entry or entry.get('stamp') != stamp:
+        entry = {'stamp': stamp, 'valid': {}, 'data': None}
+        index['json_files'][json_key] = entry
+    entry['valid'][validator_key] = is_valid
+    if json_data is not None:
+        entry['data'] = copy.deepcopy(json_data)
+    elif is_valid:
+        # the file could not be decoded, so no validator can have succeeded against this version of it
+        entry['valid'] = {validator_key: is_valid}
+    _mark_registry_index_dirty()
+
+    return is_valid, json_data
+
+
+def get_path_mtime(path: str) -> int or None:
+    """
+    Returns the modification time of a path in nanoseconds, which validates the indexed results read from it
+    :param path: path of a file or directory
+    :return: the modification time in nanoseconds, or None if the path cannot be accessed
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_subdirectory_entry(subdirectory: str or pathlib.Path) -> tuple or None:
+    """
+    Returns the indexed result of the last gem discovery walk of an external subdirectory.
+    The entry is only returned if none of the directories and gem.json files recorded by that walk have been modified
+    :param subdirectory: path to the external subdirectory
+    :return: tuple of (paths, gem_directories) where paths maps each recorded path to its modification time,
+     or None if the subdirectory is not indexed or has changed
+    """
+    root = os.path.abspath(subdirectory)
+    entry = load_registry_index()['subdirectories'].get(root)
+    if entry and all(get_path_mtime(path) == mtime for path, mtime in entry['paths'].items()):
+        return entry['paths'], list(entry['gems'])
+    return None
+
+
+def set_subdirectory_entry(subdirectory: str or pathlib.Path, paths: dict, gem_directories: list) -> None:
+    """
+    Stores the result of a gem discovery walk of an external subdirectory in the index
+    :param subdirectory: path to the external subdirectory
+    :param paths: the modification time of each directory and gem.json file the result depends on
+    :param gem_directories: list of posix paths to the gem directories found
+    """
+    root = os.path.abspath(subdirectory)
+    load_registry_index()['subdirectories'][root] = {'paths': paths, 'gems': list(gem_directories)}
+    _mark_registry_index_dirty()
@@ -12,8 +12,7 @@ import pathlib
 import urllib.parse
 import urllib.request
 import hashlib
-from datetime import datetime
-from o3de import manifest, utils, validation
+from o3de import manifest, repo_refresh, utils
 
 logger = logging.getLogger('o3de.repo')
 logging.basicConfig(format=utils.LOG_FORMAT)
@@ -21,87 +20,13 @@ logging.basicConfig(format=utils.LOG_FORMAT)
 
 def process_add_o3de_repo(file_name: str or pathlib.Path,
                           repo_set: set) -> int:
-    file_name = pathlib.Path(file_name).resolve()
-    if not validation.valid_o3de_repo_json(file_name):
-        logger.error(f'Repository JSON {file_name} could not be loaded or is missing required values')
-        return 1
-    cache_folder = manifest.get_o3de_cache_folder()
-
-    repo_data = {}
-    with file_name.open('r') as f:
-        try:
-            repo_data = json.load(f)
-        except json.JSONDecodeError as e:
-            logger.error(f'{file_name} failed to load: {str(e)}')
-            return 1
-
-    with file_name.open('w') as f:
-        try:
-            time_now = datetime.now()
-            # Convert to lower case because AM/PM is capitalized
-            time_str = time_now.strftime('%d/%m/%Y %I:%M%p').lower()
-            repo_data.update({'last_updated': time_str})
-            f.write(json.dumps(repo_data, indent=4) + '\n')
-        except Exception as e:
-            logger.error(f'{file_name} failed to save: {str(e)}')
-            return 1
-
-    # A repo may not contain all types of object.
-    manifest_download_list = []
-    try:
-        manifest_download_list.append((repo_data['engines'], 'engine.json'))
-    except KeyError:
-        pass
-    try:
-        manifest_download_list.append((repo_data['projects'], 'project.json'))
-    except KeyError:
-        pass
-    try:
-        manifest_download_list.append((repo_data['gems'], 'gem.json'))
-    except KeyError:
-        pass
-    try:
-        manifest_download_list.append((repo_data['templates'], 'template.json'))
-    except KeyError:
-        pass
-    try:
-        manifest_download_list.append((repo_data['restricted'], 'restricted.json'))
-    except KeyError:
-        pass
-
-    for o3de_object_uris, manifest_json in manifest_download_list:
-        for o3de_object_uri in o3de_object_uris:
-            manifest_json_uri = f'{o3de_object_uri}/{manifest_json}'
-            manifest_json_sha256 = hashlib.sha256(manifest_json_uri.encode())
-            cache_file = cache_folder / str(manifest_json_sha256.hexdigest() + '.json')
-
-            parsed_uri = urllib.parse.urlparse(manifest_json_uri)
-            download_file_result = utils.download_file(parsed_uri, cache_file, True)
-            if download_file_result != 0:
-                return download_file_result
-
-    # Having a repo is also optional
-    repo_list = []
-    try:
-        repo_list.append(repo_data['repos'])
-    except KeyError:
-        pass
-
-    for repo in repo_list:
-        if repo not in repo_set:
-            repo_set.add(repo)
-            for o3de_object_uri in o3de_object_uris:
-                parsed_uri = urllib.parse.urlparse(f'{repo}/repo.json')
-                manifest_json_sha256 = hashlib.sha256(parsed_uri.geturl().encode())
-                cache_file = cache_folder / str(manifest_json_sha256.hexdigest() + '.json')
-                if cache_file.is_file():
-                    cache_file.unlink()
-                download_file_result = utils.download_file(parsed_uri, cache_file, True)
-                if download_file_result != 0:
-                    return download_file_result
-
-                return process_add_o3de_repo(parsed_uri.geturl(), repo_set)
-    return 0
+    """
+    Downloads the object json files and child repos listed by a cached repo.json into the o3de cache folder
+    :param file_name: path to the cached repo.json
+    :param repo_set: repo uris which have already been refreshed, these are not downloaded again
+    :return: 0 for success or 1 for failure
+    """
+    return repo_refresh.RepoRefresher().refresh_repo_json(file_name, repo_set)
 
 
 def get_gem_json_paths_from_cached_repo(repo_uri: str) -> set:
@@ -156,44 +81,28 @@ def get_gem_json_paths_from_all_cached_repos() -> set:
 def refresh_repo(repo_uri: str,
                  cache_folder: str = None,
                  repo_set: set = None) -> int:
-    if not cache_folder:
-        cache_folder = manifest.get_o3de_cache_folder()
-    if not repo_set:
-        repo_set = set()
-
-    parsed_uri = urllib.parse.urlparse(f'{repo_uri}/repo.json')
-    repo_sha256 = hashlib.sha256(parsed_uri.geturl().encode())
-    cache_file = cache_folder / str(repo_sha256.hexdigest() + '.json')
-
-    download_file_result = utils.download_file(parsed_uri, cache_file, True)
-    if download_file_result != 0:
-        logger.error(f'Repo json {repo_uri} could not download.')
-        return download_file_result
-
-    if not validation.valid_o3de_repo_json(cache_file):
-        logger.error(f'Repo json {repo_uri} is not valid.')
-        cache_file.unlink()
-        return 1
-
-    return process_add_o3de_repo(cache_file, repo_set)
-
-def refresh_repos() -> int:
+    """
+    Downloads a repo.json, the object json files it lists and its child repos into the o3de cache folder.
+    Cached files are only downloaded again if they changed on the server
+    :param repo_uri: uri of the repo
+    :param cache_folder: folder to download to, defaults to the o3de cache folder
+    :param repo_set: repo uris which have already been refreshed, these are not downloaded again
+    :return: 0 for success or 1 for failure
+    """
+    return repo_refresh.RepoRefresher(cache_folder).refresh([repo_uri], repo_set)
+
+
+def refresh_repos(max_workers: int = None, progress_callback=None) -> int:
+    """
+    Refreshes every repo registered in the o3de manifest concurrently
+    :param max_workers: maximum number of concurrent downloads
+    :param progress_callback: called with the number of completed and the total number of downloads so far,
+     returns true to request to cancel the refresh
+    :return: 0 for success or 1 if any repo failed to refresh
+    """
     json_data = manifest.load_o3de_manifest()
-    cache_folder = manifest.get_o3de_cache_folder()
-    result = 0
-
-    # set will stop circular references
-    repo_set = set()
-
-    for repo_uri in json_data.get('repos', []):
-        if repo_uri not in repo_set:
-            repo_set.add(repo_uri)
-
-            last_failure = refresh_repo(repo_uri, cache_folder, repo_set)
-            if last_failure:
-                result = last_failure
-
-    return result
+    refresher = repo_refresh.RepoRefresher(max_workers=max_workers, progress_callback=progress_callback)
+    return refresher.refresh(json_data.get('repos', []))
 
 
 def search_repo(manifest_json_data: dict,
@@ -0,0 +1,395 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+"""
+Contains the concurrent refresher which downloads the repo.json of a set of repos, the object json files they list
+and the repos they reference into the o3de cache folder.
+The downloads run on a thread pool, each worker thread keeps one connection open per host, and files which are
+already cached are only downloaded again if the server reports that they changed since the cached ETag or
+Last-Modified time.
+Proxies are configured like for urllib, with the HTTP_PROXY, HTTPS_PROXY and NO_PROXY environment variables
+or the system proxy settings
+"""
+
+import base64
+import concurrent.futures
+import hashlib
+import http.client
+import json
+import logging
+import os
+import pathlib
+import threading
+import urllib.parse
+import urllib.request
+from datetime import datetime
+
+from o3de import manifest, utils, validation
+
+logger = logging.getLogger('o3de.repo_refresh')
+logging.basicConfig(format=utils.LOG_FORMAT)
+
+# stores the ETag and Last-Modified header of each cached download, keyed by the url
+REPO_CACHE_HEADERS_FILENAME = 'repo_cache_headers.json'
+REPO_REFRESH_TIMEOUT = 30
+REPO_REFRESH_MAX_REDIRECTS = 5
+
+# the object json file listed under each key of a repo.json
+REPO_OBJECT_MANIFESTS = [
+    ('engines', 'engine.json'),
+    ('projects', 'project.json'),
+    ('gems', 'gem.json'),
+    ('templates', 'template.json'),
+    ('restricted', 'restricted.json')
+]
+
+
+def get_cache_file(cache_folder: pathlib.Path, url: str) -> pathlib.Path:
+    """
+    Returns the path a download is cached at, which is named after the sha256 of its url
+    :param cache_folder: the o3de cache folder
+    :param url: the url of the download
+    """
+    return pathlib.Path(cache_folder) / str(hashlib.sha256(url.encode()).hexdigest() + '.json')
+
+
+def update_repo_json(repo_json_path: pathlib.Path) -> dict or None:
+    """
+    Loads a cached repo.json and records the time it was last updated in it
+    :param repo_json_path: path to the cached repo.json
+    :return: the repo json data or None if it is invalid or could not be saved
+    """
+    repo_json_path = pathlib.Path(repo_json_path).resolve()
+    if not validation.valid_o3de_repo_json(repo_json_path):
+        logger.error(f'Repository JSON {repo_json_path} could not be loaded or is missing required values')
+        return None
+
+    with repo_json_path.open('r') as f:
+        try:
+            repo_data = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.error(f'{repo_json_path} failed to load: {str(e)}')
+            return None
+
+    with repo_json_path.open('w') as f:
+        try:
+            time_now = datetime.now()
+            # Convert to lower case because AM/PM is capitalized
+            time_str = time_now.strftime('%d/%m/%Y %I:%M%p').lower()
+            repo_data.update({'last_updated': time_str})
+            f.write(json.dumps(repo_data, indent=4) + '\n')
+        except Exception as e:
+            logger.error(f'{repo_json_path} failed to save: {str(e)}')
+            return None
+
+    return repo_data
+
+
+class RepoRefresher:
+    """
+    Downloads repos and the object json files they list into the o3de cache folder on a bounded thread pool.
+    Each repo uri is only visited once per refresh, so circular repo references are not followed
+    """
+
+    def __init__(self,
+                 cache_folder: pathlib.Path = None,
+                 max_workers: int = None,
+                 force: bool = False,
+                 progress_callback=None):
+        """
+        :param cache_folder: folder the downloads are cached in, defaults to the o3de cache folder
+        :param max_workers: maximum number of concurrent downloads, defaults to the
+         concurrent.futures.ThreadPoolExecutor default
+        :param force: download every file even if the cached copy is up to date
+        :param progress_callback: called with the number of completed and the total number of downloads so far,
+         returns true to request to cancel the refresh
+        """
+        self.cache_folder = pathlib.Path(cache_folder) if cache_folder else manifest.get_o3de_cache_folder()
+        self.max_workers = max_workers
+        self.force = force
+        self.progress_callback = progress_callback
+
+        self._thread_local = threading.local()
+        self._connections = []
+        self._cache_headers = {}
+        self._lock = threading.Lock()
+        self._proxies = urllib.request.getproxies()
+
+    def refresh(self, repo_uris: list, repo_set: set = None) -> int:
+        """
+        Downloads the repo.json of each repo, then the object json files and repos it lists
+        :param repo_uris: the repos to refresh
+        :param repo_set: repo uris which have already been refreshed and are skipped, refreshed repos are added to it
+        :return: 0 for success or 1 if any download failed
+        """
+        return self._run([(self._refresh_repo, repo_uri) for repo_uri in repo_uris], repo_set)
+
+    def refresh_repo_json(self, repo_json_path: pathlib.Path, repo_set: set = None) -> int:
+        """
+        Downloads the object json files and repos listed by an already downloaded repo.json
+        :param repo_json_path: path to the cached repo.json
+        :param repo_set: repo uris which have already been refreshed and are skipped, refreshed repos are added to it
+        :return: 0 for success or 1 if any download failed
+        """
+        repo_data = update_repo_json(repo_json_path)
+        if repo_data is None:
+            return 1
+        return self._run(self._get_repo_downloads(repo_data), repo_set)
+
+    def _run(self, downloads: list, repo_set: set = None) -> int:
+        if repo_set is None:
+            repo_set = set()
+        visited_urls = set()
+        self._load_cache_headers()
+
+        result = 0
+        completed = 0
+        pending = set()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                def submit_downloads(new_downloads: list) -> None:
+                    # repos and object json files are only downloaded once, however many repos list them
+                    for download_func, uri in new_downloads:
+                        if download_func == self._refresh_repo:
+                            if uri in repo_set:
+                                continue
+                            repo_set.add(uri)
+                        elif uri in visited_urls:
+                            continue
+                        visited_urls.add(uri)
+                        pending.add(executor.submit(download_func, uri))
+
+                submit_downloads(downloads)
+                while pending:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        completed += 1
+                        download_result, new_downloads = future.result()
+                        if download_result != 0:
+                            result = download_result
+                        submit_downloads(new_downloads)
+
+                    total = completed + len(pending)
+                    logger.info(f'Refreshed {completed} of {total} repo files.')
+                    if self.progress_callback and self.progress_callback(completed, total):
+                        logger.info('Repo refresh cancelled.')
+                        for future in pending:
+                            future.cancel()
+                        pending.clear()
+                        result = 1
+        finally:
+            self._close_connections()
+            self._save_cache_headers()
+
+        return result
+
+    def _get_repo_downloads(self, repo_data: dict) -> list:
+        # A repo may not contain all types of object, and having child repos is optional
+        downloads = []
+        for o3de_object_key, manifest_json in REPO_OBJECT_MANIFESTS:
+            for o3de_object_uri in repo_data.get(o3de_object_key, []):
+                downloads.append((self._download_object_json, f'{o3de_object_uri}/{manifest_json}'))
+        for repo_uri in repo_data.get('repos', []):
+            downloads.append((self._refresh_repo, repo_uri))
+        return downloads
+
+    def _refresh_repo(self, repo_uri: str) -> tuple:
+        url = f'{repo_uri}/repo.json'
+        cache_file = get_cache_file(self.cache_folder, url)
+        download_result = self.download(url, cache_file)
+        if download_result != 0:
+            logger.error(f'Repo json {repo_uri} could not download.')
+            return download_result, []
+
+        if not validation.valid_o3de_repo_json(cache_file):
+            logger.error(f'Repo json {repo_uri} is not valid.')
+            cache_file.unlink()
+            return 1, []
+
+        repo_data = update_repo_json(cache_file)
+        if repo_data is None:
+            return 1, []
+        return 0, self._get_repo_downloads(repo_data)
+
+    def _download_object_json(self, url: str) -> tuple:
+        return self.download(url, get_cache_file(self.cache_folder, url)), []
+
+    def download(self, url: str, cache_file: pathlib.Path) -> int:
+        """
+        Downloads a url to the cache file. http and https downloads send the cached ETag and Last-Modified time
+        of the cache file, and the cache file is kept as is if the server reports that it is not modified.
+        Other uris are always downloaded with utils.download_file
+        :param url: the url to download
+        :param cache_file: path to download the file to
+        :return: 0 for success or 1 for failure
+        """
+        parsed_uri = urllib.parse.urlparse(url)
+        if parsed_uri.scheme not in ['http', 'https']:
+            return utils.download_file(parsed_uri, cache_file, True)
+
+        headers = {}
+        if not self.force and cache_file.is_file():
+            with self._lock:
+                cache_headers = self._cache_headers.get(url, {})
+            if cache_headers.get('etag'):
+                headers['If-None-Match'] = cache_headers['etag']
+            if cache_headers.get('last_modified'):
+                headers['If-Modified-Since'] = cache_headers['last_modified']
+
+        try:
+            status, response_headers, body = self._http_get(url, headers)
+        except (OSError, http.client.HTTPException) as e:
+            logger.error(f'URL Error {str(e)} opening {url}')
+            return 1
+
+        if status == 304:
+            logger.debug(f'{url} is not modified since it was cached.')
+            return 0
+        if status != 200:
+            logger.error(f'HTTP Error {status} opening {url}')
+            return 1
+
+        # write to a temporary file first so that a failed download never leaves a partial cache file
+        temp_cache_file = cache_file.with_name(f'{cache_file.name}.{threading.get_ident()}.tmp')
+        try:
+            with temp_cache_file.open('wb') as f:
+                f.write(body)
+            os.replace(temp_cache_file, cache_file)
+        except OSError as e:
+            logger.error(f'Could not write download of {url} to {cache_file}: {str(e)}')
+            try:
+                os.unlink(temp_cache_file)
+            except OSError:
+                pass
+            return 1
+
+        cache_headers = {'etag': response_headers.get('ETag'), 'last_modified': response_headers.get('Last-Modified')}
+        with self._lock:
+            if any(cache_headers.values()):
+                self._cache_headers[url] = cache_headers
+            else:
+                self._cache_headers.pop(url, None)
+        return 0
+
+    def _http_get(self, url: str, headers: dict) -> tuple:
+        for _ in range(REPO_REFRESH_MAX_REDIRECTS + 1):
+            parsed_uri = urllib.parse.urlparse(url)
+            request_path = parsed_uri.path or '/'
+            if parsed_uri.query:
+                request_path += f'?{parsed_uri.query}'
+
+            # a kept alive connection may have been closed by the server since its last request,
+            # in which case the request is sent again on a new connection
+            for attempt in range(2):
+                connection, forward_proxy_headers = self._get_connection(parsed_uri.scheme, parsed_uri.netloc)
+                try:
+                    if forward_proxy_headers is None:
+                        connection.request('GET', request_path, headers=headers)
+                    else:
+                        # requests forwarded by a proxy are sent with the absolute url
+                        connection.request('GET', parsed_uri._replace(fragment='').geturl(),
+                                           headers={**headers, **forward_proxy_headers})
+                    response = connection.getresponse()
+                    body = response.read()
+                    break
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    if attempt:
+                        raise
+
+            location = response.getheader('Location')
+            if response.status in (301, 302, 303, 307, 308) and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            return response.status, response.headers, body
+
+        raise http.client.HTTPException(f'Too many redirects')
+
+    def _get_proxy(self, scheme: str, netloc: str) -> urllib.parse.SplitResult or None:
+        """
+        Returns the proxy to connect to a host through, the same way urllib.request.urlopen would
+        :param scheme: the scheme of the url
+        :param netloc: the host and optional port of the url
+        :return: the parsed proxy url, or None to connect to the host directly
+        """
+        proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(urllib.parse.urlsplit(f'//{netloc}').hostname or netloc):
+            return None
+        return urllib.parse.urlsplit(proxy if '://' in proxy else f'http://{proxy}')
+
+    @staticmethod
+    def _get_proxy_headers(proxy: urllib.parse.SplitResult) -> dict:
+        if not proxy.username:
+            return {}
+        credentials = f'{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or "")}'
+        return {'Proxy-Authorization': f'Basic {base64.b64encode(credentials.encode()).decode()}'}
+
+    def _get_connection(self, scheme: str, netloc: str) -> tuple:
+        """
+        Returns the connection of the current thread to a host, which is opened on its first request
+        :param scheme: the scheme of the url
+        :param netloc: the host and optional port of the url
+        :return: tuple of the connection and the headers to send with each request if requests are forwarded by
+         a proxy, or None if requests are sent to the host
+        """
+        # http.client connections are not thread safe, so each worker thread has its own connection to each host
+        connections = getattr(self._thread_local, 'connections', None)
+        if connections is None:
+            connections = self._thread_local.connections = {}
+
+        connection_entry = connections.get((scheme, netloc))
+        if not connection_entry:
+            proxy = self._get_proxy(scheme, netloc)
+            forward_proxy_headers = None
+            if not proxy:
+                connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+                connection = connection_class(netloc, timeout=REPO_REFRESH_TIMEOUT)
+            else:
+                proxy_netloc = proxy.netloc.rpartition('@')[2]
+                if scheme == 'https':
+                    # https requests are tunneled through the proxy with CONNECT
+                    connection = http.client.HTTPSConnection(proxy_netloc, timeout=REPO_REFRESH_TIMEOUT)
+                    connection.set_tunnel(netloc, headers=self._get_proxy_headers(proxy))
+                else:
+                    connection = http.client.HTTPConnection(proxy_netloc, timeout=REPO_REFRESH_TIMEOUT)
+                    forward_proxy_headers = self._get_proxy_headers(proxy)
+            connection_entry = connections[(scheme, netloc)] = (connection, forward_proxy_headers)
+            with self._lock:
+                self._connections.append(connection)
+        return connection_entry
+
+    def _close_connections(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._thread_local = threading.local()
+
+    def _load_cache_headers(self) -> None:
+        cache_headers_path = self.cache_folder / REPO_CACHE_HEADERS_FILENAME
+        self._cache_headers = {}
+        try:
+            with cache_headers_path.open('r') as f:
+                cache_headers = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.info(f'Repo cache headers at path "{cache_headers_path}" could not be loaded: {str(e)}')
+            return
+        if isinstance(cache_headers, dict):
+            self._cache_headers = cache_headers
+
+    def _save_cache_headers(self) -> None:
+        cache_headers_path = self.cache_folder / REPO_CACHE_HEADERS_FILENAME
+        temp_cache_headers_path = cache_headers_path.with_name(f'{cache_headers_path.name}.{os.getpid()}.tmp')
+        try:
+            with temp_cache_headers_path.open('w') as f:
+                f.write(json.dumps(self._cache_headers, indent=4) + '\n')
+            os.replace(temp_cache_headers_path, cache_headers_path)
+        except OSError as e:
+            logger.warning(f'Repo cache headers failed to save to path "{cache_headers_path}": {str(e)}')
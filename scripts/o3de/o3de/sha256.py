@@ -9,7 +9,6 @@
 import argparse
 import json
 import logging
-import hashlib
 import pathlib
 import sys
 
@@ -35,7 +34,7 @@ def sha256(file_path: str or pathlib.Path,
             logger.error(f'Json path {json_path} does not exist.')
             return 1
 
-    the_sha256 = hashlib.sha256(file_path.open('rb').read()).hexdigest()
+    the_sha256 = utils.get_file_sha256(file_path)
 
     if json_path:
         with json_path.open('r') as s:
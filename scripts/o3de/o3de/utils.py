@@ -9,6 +9,9 @@
 This file contains utility functions
 """
 import argparse
+import hashlib
+import http.client
+import json
 import sys
 import uuid
 import os
@@ -25,6 +28,10 @@ logging.basicConfig(format=LOG_FORMAT)
 
 COPY_BUFSIZE = 64 * 1024
 
+# resumable downloads are written to the download path with this suffix until they complete, next to a json
+# sidecar with the same name which records the url and version of the file being downloaded
+PARTIAL_DOWNLOAD_SUFFIX = '.part'
+
 
 class VerbosityAction(argparse.Action):
     def __init__(self,
@@ -66,15 +73,18 @@ def add_verbosity_arg(parser: argparse.ArgumentParser) -> None:
                         help='Additional logging verbosity, can be -v or -vv')
 
 
-def copyfileobj(fsrc, fdst, callback, length=0):
+def copyfileobj(fsrc, fdst, callback, length=0, hasher=None):
     # This is functionally the same as the python shutil copyfileobj but
     # allows for a callback to return the download progress in blocks and allows
     # to early out to cancel the copy.
+    # If a hashlib object is supplied it is updated with each block as it is written,
+    # so the hash of the copy is available without reading it again.
     if not length:
         length = COPY_BUFSIZE
 
     fsrc_read = fsrc.read
     fdst_write = fdst.write
+    hasher_update = hasher.update if hasher else None
 
     copied = 0
     while True:
@@ -82,12 +92,46 @@ def copyfileobj(fsrc, fdst, callback, length=0):
         if not buf:
             break
         fdst_write(buf)
+        if hasher_update:
+            hasher_update(buf)
         copied += len(buf)
         if callback(copied):
             return 1
     return 0
 
 
+def update_hash_from_file(hasher, file_path: str or pathlib.Path, size: int = -1, length: int = 0) -> None:
+    """
+    Update a hashlib object with the contents of a file, reading it in blocks so the file is never held in memory
+    :param hasher: the hashlib object to update
+    :param file_path: path to the file to hash
+    :param size: the number of bytes to hash from the start of the file, -1 for the whole file
+    :param length: the block size, defaults to COPY_BUFSIZE
+    """
+    if not length:
+        length = COPY_BUFSIZE
+
+    with open(file_path, 'rb') as f:
+        while size:
+            buf = f.read(length if size < 0 else min(length, size))
+            if not buf:
+                break
+            hasher.update(buf)
+            if size > 0:
+                size -= len(buf)
+
+
+def get_file_sha256(file_path: str or pathlib.Path) -> str:
+    """
+    Compute the sha256 of a file, reading it in blocks so the file is never held in memory
+    :param file_path: path to the file to hash
+    :return: str: the sha256 hex digest of the file contents
+    """
+    hasher = hashlib.sha256()
+    update_hash_from_file(hasher, file_path)
+    return hasher.hexdigest()
+
+
 def validate_identifier(identifier: str) -> bool:
     """
     Determine if the identifier supplied is valid
@@ -163,12 +207,130 @@ def backup_folder(folder: str or pathlib.Path) -> None:
                 renamed = True
 
 
-def download_file(parsed_uri, download_path: pathlib.Path, force_overwrite: bool = False, download_progress_callback = None) -> int:
+def get_partial_download_path(download_path: pathlib.Path) -> pathlib.Path:
+    """
+    Returns the path a resumable download is written to until it completes
+    :param download_path: location path on disk to download file
+    """
+    return download_path.with_name(download_path.name + PARTIAL_DOWNLOAD_SUFFIX)
+
+
+def _get_partial_download_sidecar_path(download_path: pathlib.Path) -> pathlib.Path:
+    partial_download_path = get_partial_download_path(download_path)
+    return partial_download_path.with_name(partial_download_path.name + '.json')
+
+
+def _remove_partial_download(download_path: pathlib.Path) -> None:
+    for path in [get_partial_download_path(download_path), _get_partial_download_sidecar_path(download_path)]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def _load_partial_download_data(download_path: pathlib.Path) -> dict:
+    sidecar_path = _get_partial_download_sidecar_path(download_path)
+    try:
+        with sidecar_path.open('r') as f:
+            partial_download_data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return partial_download_data if isinstance(partial_download_data, dict) else {}
+
+
+def _get_if_range_validator(partial_download_data: dict) -> str or None:
+    # If-Range only accepts a strong ETag, otherwise the Last-Modified time is used
+    etag = partial_download_data.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return partial_download_data.get('last_modified')
+
+
+def _download_file_resumable(parsed_uri, download_path: pathlib.Path, download_progress_callback = None,
+                             hasher = None) -> int:
+    """
+    Download a http or https uri to a partial file next to the download path, which is renamed to the download path
+    once it completes. If a partial file from an earlier download of the same uri exists, only the remaining bytes
+    are requested with a Range request, which the server only honours if the file has not changed since
+    :param parsed_uri: uniform resource identifier to the file to download
+    :param download_path: location path on disk to download file
+    :param download_progress_callback: callback called with the downloaded and total bytes, returns true to request
+     to cancel the download
+    :param hasher: optional hashlib object which is updated with the contents of the whole downloaded file
+    """
+    url = parsed_uri.geturl()
+    partial_download_path = get_partial_download_path(download_path)
+    sidecar_path = _get_partial_download_sidecar_path(download_path)
+
+    request = urllib.request.Request(url)
+    resume_offset = 0
+    partial_download_data = _load_partial_download_data(download_path)
+    if_range_validator = _get_if_range_validator(partial_download_data)
+    if partial_download_path.is_file() and partial_download_data.get('url') == url and if_range_validator:
+        resume_offset = partial_download_path.stat().st_size
+    if resume_offset:
+        request.add_header('Range', f'bytes={resume_offset}-')
+        request.add_header('If-Range', if_range_validator)
+
+    try:
+        with urllib.request.urlopen(request) as s:
+            # a full response means the server does not support ranges or the file changed, so the download restarts
+            if resume_offset and (s.status != 206 or
+                                  not s.headers.get('Content-Range', '').startswith(f'bytes {resume_offset}-')):
+                logger.info(f'Download of {url} could not be resumed, restarting it.')
+                resume_offset = 0
+            elif resume_offset:
+                logger.info(f'Resuming download of {url} from byte {resume_offset}.')
+
+            content_length = int(s.headers.get('Content-Length') or 0)
+            download_file_size = resume_offset + content_length if content_length else 0
+
+            if resume_offset == 0:
+                with sidecar_path.open('w') as f:
+                    f.write(json.dumps({'url': url,
+                                        'etag': s.headers.get('ETag'),
+                                        'last_modified': s.headers.get('Last-Modified')}, indent=4) + '\n')
+            if hasher and resume_offset:
+                update_hash_from_file(hasher, partial_download_path, resume_offset)
+
+            def download_progress(downloaded_bytes):
+                if download_progress_callback:
+                    return download_progress_callback(int(resume_offset + downloaded_bytes), int(download_file_size))
+                return False
+
+            with partial_download_path.open('ab' if resume_offset else 'wb') as f:
+                download_cancelled = copyfileobj(s, f, download_progress, hasher=hasher)
+                if download_cancelled:
+                    logger.info(f'Download of file to {download_path} cancelled.')
+                    return 1
+    except urllib.error.HTTPError as e:
+        if e.code == 416 and resume_offset:
+            # the partial file does not match the file on the server, so it is discarded and the download restarts
+            _remove_partial_download(download_path)
+            return _download_file_resumable(parsed_uri, download_path, download_progress_callback, hasher)
+        logger.error(f'HTTP Error {e.code} opening {url}')
+        return 1
+    except urllib.error.URLError as e:
+        logger.error(f'URL Error {e.reason} opening {url}')
+        return 1
+    except (OSError, http.client.HTTPException) as e:
+        logger.error(f'Download of {url} was interrupted, it will be resumed by the next download: {str(e)}')
+        return 1
+
+    os.replace(partial_download_path, download_path)
+    _remove_partial_download(download_path)
+    return 0
+
+
+def download_file(parsed_uri, download_path: pathlib.Path, force_overwrite: bool = False, download_progress_callback = None,
+                  resume: bool = False, hasher = None) -> int:
     """
     Download file
     :param parsed_uri: uniform resource identifier to zip file to download
     :param download_path: location path on disk to download file
     :param download_progress_callback: callback called with the download progress as a percentage, returns true to request to cancel the download
+    :param resume: download http and https uris to a partial file first, so that an interrupted download is resumed from where it stopped by the next call
+    :param hasher: optional hashlib object which is updated with the contents of the downloaded file as it is written
     """
     if download_path.is_file():
         if not force_overwrite:
@@ -181,6 +343,9 @@ def download_file(parsed_uri, download_path: pathlib.Path, force_overwrite: bool
                 logger.error(f'Could not remove existing download path {download_path}.')
                 return 1
 
+    if resume and parsed_uri.scheme in ['http', 'https']:
+        return _download_file_resumable(parsed_uri, download_path, download_progress_callback, hasher)
+
     if parsed_uri.scheme in ['http', 'https', 'ftp', 'ftps']:
         try:
             with urllib.request.urlopen(parsed_uri.geturl()) as s:
@@ -196,7 +361,7 @@ def download_file(parsed_uri, download_path: pathlib.Path, force_overwrite: bool
                     return False
 
                 with download_path.open('wb') as f:
-                    download_cancelled = copyfileobj(s, f, download_progress)
+                    download_cancelled = copyfileobj(s, f, download_progress, hasher=hasher)
                     if download_cancelled:
                         logger.info(f'Download of file to {download_path} cancelled.')
                         return 1
@@ -211,16 +376,22 @@ def download_file(parsed_uri, download_path: pathlib.Path, force_overwrite: bool
         if not origin_file.is_file():
             return 1
         shutil.copy(origin_file, download_path)
+        if hasher:
+            update_hash_from_file(hasher, download_path)
 
     return 0
 
 
-def download_zip_file(parsed_uri, download_zip_path: pathlib.Path, force_overwrite: bool, download_progress_callback = None) -> int:
+def download_zip_file(parsed_uri, download_zip_path: pathlib.Path, force_overwrite: bool, download_progress_callback = None,
+                      hasher = None) -> int:
     """
+    Download a zip file, resuming an earlier interrupted download of the same uri
     :param parsed_uri: uniform resource identifier to zip file to download
     :param download_zip_path: path to output zip file
+    :param hasher: optional hashlib object which is updated with the contents of the zip file as it is written
     """
-    download_file_result = download_file(parsed_uri, download_zip_path, force_overwrite, download_progress_callback)
+    download_file_result = download_file(parsed_uri, download_zip_path, force_overwrite, download_progress_callback,
+                                         resume=True, hasher=hasher)
     if download_file_result != 0:
         return download_file_result
 
@@ -0,0 +1,72 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import argparse
+import importlib.util
+import pathlib
+import pytest
+import subprocess
+import sys
+
+O3DE_SCRIPT_PATH = pathlib.Path(__file__).resolve().parents[2] / 'o3de.py'
+
+# Budget for the total time spent importing modules when o3de.py starts a sub-command, in microseconds
+CLI_IMPORT_TIME_BUDGET_US = 500000
+
+# Modules which are slow to import and only needed by the sub-commands which use them
+SLOW_IMPORT_MODULES = ['o3de.engine_template', 'o3de.download', 'o3de.repo', 'o3de.repo_refresh', 'o3de.register']
+
+
+def load_o3de_script():
+    spec = importlib.util.spec_from_file_location('o3de_script', O3DE_SCRIPT_PATH)
+    o3de_script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(o3de_script)
+    return o3de_script
+
+
+def get_import_times(args: list) -> dict:
+    """
+    Runs o3de.py with -X importtime and returns the time spent importing each module
+    :param args: arguments to o3de.py
+    :return: dictionary of module name to the time spent importing it, excluding its own imports, in microseconds
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', str(O3DE_SCRIPT_PATH)] + args,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    assert result.returncode == 0, result.stderr
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_time, _, module_name = line[len('import time:'):].split('|')
+        if self_time.strip().isdigit():
+            import_times[module_name.strip()] = int(self_time)
+    return import_times
+
+
+def test_command_table_lists_every_sub_command():
+    o3de_script = load_o3de_script()
+    parser = argparse.ArgumentParser()
+    o3de_script.add_args(parser)
+
+    subparsers_action = next(action for action in parser._actions if isinstance(action, argparse._SubParsersAction))
+    assert list(subparsers_action.choices) == list(o3de_script.O3DE_COMMAND_MODULES)
+
+
+@pytest.mark.parametrize("args", [
+    pytest.param(['-h']),
+    pytest.param(['get-registered', '-h']),
+    pytest.param(['register-show', '-h']),
+    pytest.param(['sha256', '-h']),
+    pytest.param(['enable-gem', '-h']),
+])
+def test_sub_command_startup_import_time(args):
+    import_times = get_import_times(args)
+
+    assert not [module_name for module_name in SLOW_IMPORT_MODULES if module_name in import_times]
+    assert sum(import_times.values()) < CLI_IMPORT_TIME_BUDGET_US
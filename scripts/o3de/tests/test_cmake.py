@@ -9,6 +9,7 @@
 import io
 import json
 import logging
+import os
 import unittest.mock
 
 import pytest
@@ -114,28 +115,12 @@ class TestAddGemDependency:
                 """, set(['foo', 'bar', 'baz']), 1),
         ]
     )
-    def test_add_gem_dependency(self, enable_gems_cmake_data, expected_set, expected_return):
-        enabled_gems_set = set()
-        add_gem_return = None
-
-        class StringBufferIOWrapper(io.StringIO):
-            def __init__(self):
-                nonlocal enable_gems_cmake_data
-                super().__init__(enable_gems_cmake_data)
-            def __enter__(self):
-                return super().__enter__()
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                nonlocal enable_gems_cmake_data
-                enable_gems_cmake_data = super().getvalue()
-                super().__exit__(exc_tb, exc_val, exc_tb)
-
+    def test_add_gem_dependency(self, tmp_path, enable_gems_cmake_data, expected_set, expected_return):
+        cmake_file = tmp_path / 'enabled_gems.cmake'
+        cmake_file.write_text(enable_gems_cmake_data)
 
-        with patch('pathlib.Path.resolve', return_value=pathlib.Path('enabled_gems.cmake')) as pathlib_is_resolve_mock,\
-                patch('pathlib.Path.is_file', return_value=True) as pathlib_is_file_mock,\
-                patch('pathlib.Path.open', side_effect=lambda mode: StringBufferIOWrapper()) as pathlib_open_mock:
-
-            add_gem_return = cmake.add_gem_dependency(pathlib.Path('enabled_gems.cmake'), 'TestGem')
-            enabled_gems_set = cmake.get_enabled_gems(pathlib.Path('enabled_gems.cmake'))
+        add_gem_return = cmake.add_gem_dependency(cmake_file, 'TestGem')
+        enabled_gems_set = cmake.get_enabled_gems(cmake_file)
 
         assert add_gem_return == expected_return
         assert enabled_gems_set == expected_set
@@ -202,28 +187,68 @@ class TestRemoveGemDependency:
                 """, set(['foo', 'bar', 'baz']), 1),
         ]
     )
-    def test_remove_gem_dependency(self, enable_gems_cmake_data, expected_set, expected_return):
-        enabled_gems_set = set()
-        add_gem_return = None
-
-        class StringBufferIOWrapper(io.StringIO):
-            def __init__(self):
-                nonlocal enable_gems_cmake_data
-                super().__init__(enable_gems_cmake_data)
-            def __enter__(self):
-                return super().__enter__()
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                nonlocal enable_gems_cmake_data
-                enable_gems_cmake_data = super().getvalue()
-                super().__exit__(exc_tb, exc_val, exc_tb)
+    def test_remove_gem_dependency(self, tmp_path, enable_gems_cmake_data, expected_set, expected_return):
+        cmake_file = tmp_path / 'enabled_gems.cmake'
+        cmake_file.write_text(enable_gems_cmake_data)
 
+        remove_gem_return = cmake.remove_gem_dependency(cmake_file, 'TestGem')
+        enabled_gems_set = cmake.get_enabled_gems(cmake_file)
 
-        with patch('pathlib.Path.resolve', return_value=pathlib.Path('enabled_gems.cmake')) as pathlib_is_resolve_mock,\
-                patch('pathlib.Path.is_file', return_value=True) as pathlib_is_file_mock,\
-                patch('pathlib.Path.open', side_effect=lambda mode: StringBufferIOWrapper()) as pathlib_open_mock:
+        assert remove_gem_return == expected_return
+        assert enabled_gems_set == expected_set
 
-            add_gem_return = cmake.remove_gem_dependency(pathlib.Path('enabled_gems.cmake'), 'TestGem')
-            enabled_gems_set = cmake.get_enabled_gems(pathlib.Path('enabled_gems.cmake'))
 
-        assert add_gem_return == expected_return
-        assert enabled_gems_set == expected_set
+class TestUpdateGemDependencies:
+    @pytest.mark.parametrize(
+        "enable_gems_cmake_data, add_gem_names, remove_gem_names, expected_set, expected_return", [
+            pytest.param("""
+                # Comment
+                set(ENABLED_GEMS foo bar baz)
+            """, ['TestGem', 'OtherGem', 'foo'], [], set(['foo', 'bar', 'baz', 'TestGem', 'OtherGem']), 0),
+            pytest.param("""
+                        set(ENABLED_GEMS
+                            foo
+                            "bar"
+                            baz
+                        )
+                    """, ['TestGem'], ['foo', 'bar'], set(['baz', 'TestGem']), 0),
+            pytest.param("""
+                    set(ENABLED_GEMS
+                        foo bar
+                        baz)
+                """, ['TestGem', 'TestGem'], ['bar'], set(['foo', 'baz', 'TestGem']), 0),
+            pytest.param("""
+                """, ['TestGem', 'OtherGem'], [], set(['TestGem', 'OtherGem']), 0),
+            pytest.param("""
+                set(ENABLED_GEMS foo bar)
+                """, [], ['foo', 'missing'], set(['bar']), 1),
+            pytest.param("""
+                        set(ENABLED_GEMS foo bar baz
+                """, ['TestGem'], [], set(['foo', 'bar', 'baz']), 1),
+        ]
+    )
+    def test_update_gem_dependencies(self, tmp_path, enable_gems_cmake_data, add_gem_names, remove_gem_names,
+                                     expected_set, expected_return):
+        cmake_file = tmp_path / 'enabled_gems.cmake'
+        cmake_file.write_text(enable_gems_cmake_data)
+
+        with patch('os.replace', wraps=os.replace) as os_replace_patch:
+            result = cmake.update_gem_dependencies(cmake_file, add_gem_names, remove_gem_names)
+            # the cmake file is written at most once
+            assert os_replace_patch.call_count <= 1
+
+        assert result == expected_return
+        assert cmake.get_enabled_gems(cmake_file) == expected_set
+        assert list(tmp_path.iterdir()) == [cmake_file]
+
+    def test_update_gem_dependencies_keeps_unchanged_file(self, tmp_path):
+        enable_gems_cmake_data = 'set(ENABLED_GEMS\n    foo\n    bar\n)\n'
+        cmake_file = tmp_path / 'enabled_gems.cmake'
+        cmake_file.write_text(enable_gems_cmake_data)
+
+        with patch('os.replace') as os_replace_patch:
+            assert cmake.update_gem_dependencies(cmake_file, ['foo'], []) == 0
+            os_replace_patch.assert_not_called()
+
+        assert cmake.update_gem_dependencies(cmake_file, ['baz'], ['foo']) == 0
+        assert cmake_file.read_text() == 'set(ENABLED_GEMS\n    bar\n    baz\n)\n'
@@ -139,12 +139,13 @@ class TestDisableGemCommand:
         def get_engine_gems():
             return [pathlib.Path(gem_path).resolve()] if gem_registered_with_engine else []
 
-        def add_gem_dependency(enable_gem_cmake_file: pathlib.Path, gem_name: str):
-            project_gem_dependencies.append(gem_name)
-            return 0
-
-        def remove_gem_dependency(enable_gem_cmake_file: pathlib.Path, gem_name: str):
-            project_gem_dependencies.remove(gem_name)
+        def update_gem_dependencies(enable_gem_cmake_file: pathlib.Path, add_gem_names: list = None,
+                                    remove_gem_names: list = None):
+            for gem_name in add_gem_names or []:
+                if gem_name not in project_gem_dependencies:
+                    project_gem_dependencies.append(gem_name)
+            for gem_name in remove_gem_names or []:
+                project_gem_dependencies.remove(gem_name)
             return 0
 
         def get_enabled_gems(enable_gem_cmake_file: pathlib.Path) -> list:
@@ -160,9 +161,8 @@ class TestDisableGemCommand:
                 patch('o3de.manifest.get_project_json_data', side_effect=get_project_json_data) as get_gem_json_data_patch,\
                 patch('o3de.manifest.get_project_gems', side_effect=get_project_gems) as get_project_gems_patch,\
                 patch('o3de.manifest.get_engine_gems', side_effect=get_engine_gems) as get_engine_gems_patch,\
-                patch('o3de.cmake.add_gem_dependency', side_effect=add_gem_dependency) as add_gem_dependency_patch, \
-                patch('o3de.cmake.remove_gem_dependency',
-                      side_effect=remove_gem_dependency) as remove_gem_dependency_patch, \
+                patch('o3de.cmake.update_gem_dependencies',
+                      side_effect=update_gem_dependencies) as update_gem_dependencies_patch, \
                 patch('o3de.cmake.get_enabled_gems',
                       side_effect=get_enabled_gems) as get_enabled_gems, \
                 patch('o3de.validation.valid_o3de_gem_json', return_value=True) as valid_gem_json_patch:
@@ -6,6 +6,7 @@
 #
 #
 
+import argparse
 import io
 import json
 import logging
@@ -139,7 +140,8 @@ class TestEnableGemCommand:
         def get_engine_gems():
             return [pathlib.Path(gem_path).resolve()] if gem_registered_with_engine else []
 
-        def add_gem_dependency(enable_gem_cmake_file: pathlib.Path, gem_name: str):
+        def update_gem_dependencies(enable_gem_cmake_file: pathlib.Path, add_gem_names: list = None,
+                                    remove_gem_names: list = None):
             return 0
 
         with patch('pathlib.Path.is_dir', return_value=True) as pathlib_is_dir_patch,\
@@ -151,7 +153,8 @@ class TestEnableGemCommand:
                 patch('o3de.manifest.get_project_json_data', side_effect=get_project_json_data) as get_gem_json_data_patch,\
                 patch('o3de.manifest.get_project_gems', side_effect=get_project_gems) as get_project_gems_patch,\
                 patch('o3de.manifest.get_engine_gems', side_effect=get_engine_gems) as get_engine_gems_patch,\
-                patch('o3de.cmake.add_gem_dependency', side_effect=add_gem_dependency) as add_gem_dependency_patch,\
+                patch('o3de.cmake.update_gem_dependencies',
+                      side_effect=update_gem_dependencies) as update_gem_dependencies_patch,\
                 patch('o3de.validation.valid_o3de_gem_json', return_value=True) as valid_gem_json_patch:
 
             self.enable_gem.project_data.pop('gem_names', None)
@@ -164,3 +167,47 @@ class TestEnableGemCommand:
                 assert gem_json.get('gem_name', '') in project_json.get('gem_names', [])
             else:
                 assert gem_json.get('gem_name', '') not in project_json.get('gem_names', [])
+
+
+class TestEnableGemsCommand:
+    def test_enable_gems_updates_project_files_once(self, tmp_path):
+        project_path = tmp_path / 'TestProject'
+        project_path.mkdir()
+        enabled_gem_file = project_path / 'enabled_gems.cmake'
+        enabled_gem_file.write_text('set(ENABLED_GEMS\n    foo\n)\n')
+        gem_paths = {}
+        for gem_name in ['GemA', 'GemB', 'GemC']:
+            gem_paths[gem_name] = tmp_path / gem_name
+            gem_paths[gem_name].mkdir()
+
+        def get_registered(project_name: str = None, gem_name: str = None, project_path: pathlib.Path = None):
+            return gem_paths.get(gem_name)
+
+        def get_gem_json_data(gem_path: pathlib.Path, project_path: pathlib.Path):
+            return {'gem_name': gem_path.name}
+
+        with patch('o3de.manifest.get_registered', side_effect=get_registered) as get_registered_patch, \
+                patch('o3de.manifest.get_gem_json_data', side_effect=get_gem_json_data) as get_gem_json_data_patch, \
+                patch('o3de.manifest.get_engine_gems', return_value=[gem_paths['GemA']]) as get_engine_gems_patch, \
+                patch('o3de.manifest.get_project_gems', return_value=[]) as get_project_gems_patch, \
+                patch('o3de.project_properties.edit_project_props', return_value=0) as edit_project_props_patch:
+            result = enable_gem.enable_gems_in_project(gem_names=['GemA', 'GemB', 'GemC'], project_path=project_path,
+                                                       enabled_gem_file=enabled_gem_file)
+
+            assert result == 0
+            get_engine_gems_patch.assert_called_once()
+            get_project_gems_patch.assert_called_once()
+            # only the gems which are not buildable by the project are added to its gem_names
+            edit_project_props_patch.assert_called_once_with(project_path, new_gem_names=['GemB', 'GemC'])
+
+        with enabled_gem_file.open('r') as s:
+            assert s.read() == 'set(ENABLED_GEMS\n    foo\n    GemA\n    GemB\n    GemC\n)\n'
+
+    def test_enable_gems_cli_accepts_multiple_gem_names(self):
+        parser = argparse.ArgumentParser()
+        enable_gem.add_parser_args(parser)
+        args = parser.parse_args(['--project-path', 'TestProject', '--gem-names', 'GemA', 'GemB'])
+
+        with patch('o3de.enable_gem.enable_gems_in_project', return_value=0) as enable_gems_patch:
+            assert args.func(args) == 0
+            enable_gems_patch.assert_called_once_with(['GemA', 'GemB'], None, None, pathlib.Path('TestProject'), None)
@@ -212,6 +212,69 @@ def test_create_template(tmpdir,
             assert s_data == templated_contents_without_license
 
 
+def test_create_template_incremental_only_templatizes_changed_files(tmpdir):
+    engine_root = (pathlib.Path(tmpdir) / 'engine-root').resolve()
+    template_source_path = engine_root / 'TestTemplates'
+    source_include_path = template_source_path / 'Code/Include/TestTemplate'
+    source_include_path.mkdir(parents=True, exist_ok=True)
+    gem_bus_file = source_include_path / 'TestTemplateBus.h'
+    gem_bus_file.write_text(TEST_CONCRETE_TESTTEMPLATE_CONTENT_WITH_LICENSE)
+    gem_requests_file = source_include_path / 'TestTemplateRequests.h'
+    gem_requests_file.write_text(TEST_CONCRETE_TESTTEMPLATE_CONTENT_WITH_LICENSE)
+    template_folder = engine_root / 'Templates'
+
+    def create_template_incremental() -> int:
+        return engine_template.create_template(template_source_path, template_folder, source_name='TestTemplate',
+                                               keep_license_text=True, no_register=True, incremental=True)
+
+    assert create_template_incremental() == 0
+    source_hashes_path = template_folder / engine_template.TEMPLATE_SOURCE_HASHES_FILENAME
+    assert source_hashes_path.is_file()
+    templated_bus_file = template_folder / 'Template/Code/Include/${Name}/${Name}Bus.h'
+    templated_requests_file = template_folder / 'Template/Code/Include/${Name}/${Name}Requests.h'
+    assert templated_bus_file.read_text() == TEST_TEMPLATED_CONTENT_WITH_LICENSE
+    template_json_data = json.loads((template_folder / 'template.json').read_text())
+
+    # an existing template is not an error in incremental mode and unchanged files are not rewritten
+    templated_bus_file_mtime = templated_bus_file.stat().st_mtime_ns
+    with patch('builtins.open', wraps=open) as open_patch:
+        assert create_template_incremental() == 0
+        assert not any(call.args[1:2] == ('w',) and 'Code' in str(call.args[0]) for call in open_patch.call_args_list)
+    assert templated_bus_file.stat().st_mtime_ns == templated_bus_file_mtime
+    assert json.loads((template_folder / 'template.json').read_text()) == template_json_data
+
+    # a changed source file is templatized again
+    gem_requests_file.write_text(TEST_CONCRETE_TESTTEMPLATE_CONTENT_WITH_LICENSE + '// TestTemplate changed\n')
+    assert create_template_incremental() == 0
+    assert templated_requests_file.read_text() == TEST_TEMPLATED_CONTENT_WITH_LICENSE + '// ${SanitizedCppName} changed\n'
+    assert templated_bus_file.stat().st_mtime_ns == templated_bus_file_mtime
+
+    # a modified templated file is templatized again as well
+    templated_bus_file.write_text('modified')
+    assert create_template_incremental() == 0
+    assert templated_bus_file.read_text() == TEST_TEMPLATED_CONTENT_WITH_LICENSE
+
+    # the templated file of a deleted source file is removed
+    gem_requests_file.unlink()
+    assert create_template_incremental() == 0
+    assert not templated_requests_file.exists()
+    assert templated_bus_file.is_file()
+
+
+def test_create_template_incremental_fails_on_existing_template_without_source_hashes(tmpdir):
+    engine_root = (pathlib.Path(tmpdir) / 'engine-root').resolve()
+    template_source_path = engine_root / 'TestTemplates'
+    template_source_path.mkdir(parents=True)
+    (template_source_path / 'TestTemplate.txt').write_text('TestTemplate')
+    template_folder = engine_root / 'Templates'
+    template_folder.mkdir()
+    (template_folder / 'template.json').write_text('{}')
+
+    assert engine_template.create_template(template_source_path, template_folder, source_name='TestTemplate',
+                                           no_register=True, incremental=True) == 1
+    assert (template_folder / 'template.json').read_text() == '{}'
+
+
 class TestCreateTemplate:
     def instantiate_template_wrapper(self, tmpdir, create_from_template_func, instantiated_name,
                                      concrete_contents, templated_contents,
@@ -375,3 +438,75 @@ class TestCreateTemplate:
         self.instantiate_template_wrapper(tmpdir, engine_template.create_gem, 'TestGem', concrete_contents,
                                           templated_contents, keep_license_text, force, expect_failure,
                                           template_json_contents, template_file_map, gem_name='TestGem', no_register=True)
+
+
+@pytest.mark.parametrize(
+    "replacements, templated_contents", [
+        # parameters which are prefixes of each other
+        pytest.param([('${Name}', 'TestGem'), ('${NameLower}', 'testgem'), ('${NameUpper}', 'TESTGEM')],
+                     '${Name} ${NameLower} ${NameUpper} ${NameOther} $Name {Name}'),
+        # a parameter listed twice only applies its first replacement
+        pytest.param([('${Name}', 'TestGem'), ('${Name}', 'Other')], '${Name}${Name}'),
+        # replacements containing a parameter are applied in order
+        pytest.param([('${Name}', '${NameLower}'), ('${NameLower}', 'testgem')], '${Name} ${NameLower}'),
+        # patterns which are not template parameters are applied in order
+        pytest.param([('Test', 'Prod'), ('ProdGem', 'Result')], 'TestGem ${Name}')
+    ]
+)
+def test_transform_matches_ordered_replacements(replacements, templated_contents):
+    expected_contents = templated_contents
+    for replace_this, with_this in replacements:
+        expected_contents = expected_contents.replace(replace_this, with_this)
+
+    assert engine_template._transform(templated_contents, replacements, True) == expected_contents
+
+
+def test_transform_replaces_each_random_uuid():
+    transformed_contents = engine_template._transform('${Random_Uuid} ${Random_Uuid}', [('${Name}', 'TestGem')], True)
+
+    first_uuid, second_uuid = transformed_contents.split(' ')
+    assert uuid.UUID(first_uuid) != uuid.UUID(second_uuid)
+
+
+@pytest.mark.parametrize(
+    "templated_contents, keep_license_text, expected_contents", [
+        pytest.param('${Name}Requests\n' * 8 + '${Name}', True, 'TestGemRequests\n' * 8 + 'TestGem'),
+        pytest.param(TEST_TEMPLATED_CONTENT_WITH_LICENSE.replace('${Random_Uuid}', '00000000'), False,
+                     TEST_CONCRETE_TESTGEM_TEMPLATE_CONTENT_WITHOUT_LICENSE.replace('${Random_Uuid}', '00000000')),
+    ]
+)
+def test_transform_copy_streams_large_files(tmpdir, templated_contents, keep_license_text, expected_contents):
+    source_file = pathlib.Path(tmpdir) / 'Source.h'
+    source_file.write_text(templated_contents)
+    destination_file = pathlib.Path(tmpdir) / 'Destination.h'
+
+    replacements = [('${Name}', 'TestGem'), ('${SanitizedCppName}', 'TestGem')]
+    with patch('o3de.engine_template.TRANSFORM_STREAMING_THRESHOLD', 0), \
+            patch('o3de.engine_template.TRANSFORM_STREAMING_BLOCK_SIZE', 16):
+        engine_template._transform_copy(source_file, destination_file, replacements, keep_license_text)
+
+    assert destination_file.read_text() == expected_contents
+
+
+@pytest.mark.parametrize("use_worker_processes", [True, False])
+def test_copy_template_files_transforms_templated_files_on_worker_processes(tmpdir, use_worker_processes):
+    source_path = pathlib.Path(tmpdir) / 'Template'
+    destination_path = pathlib.Path(tmpdir) / 'TestGem'
+    source_path.mkdir()
+    destination_path.mkdir()
+    copy_files = []
+    for index in range(4):
+        source_file = source_path / f'${{Name}}{index}.h'
+        source_file.write_text(f'${{Name}}Requests{index}')
+        copy_files.append((source_file, destination_path / f'TestGem{index}.h', index % 2 == 0))
+
+    with patch('o3de.engine_template.TRANSFORM_PROCESS_POOL_MIN_FILES', 2), \
+            patch('os.cpu_count', return_value=2), \
+            patch('o3de.engine_template._can_start_worker_processes', return_value=use_worker_processes), \
+            patch('concurrent.futures.ProcessPoolExecutor',
+                  wraps=engine_template.concurrent.futures.ProcessPoolExecutor) as process_pool_patch:
+        engine_template._copy_template_files(copy_files, [('${Name}', 'TestGem')], True)
+
+    assert process_pool_patch.called == use_worker_processes
+    assert [(destination_path / f'TestGem{index}.h').read_text() for index in range(4)] == \
+        ['TestGemRequests0', '${Name}Requests1', 'TestGemRequests2', '${Name}Requests3']
@@ -0,0 +1,101 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import json
+import os
+import pytest
+import pathlib
+from unittest.mock import patch
+
+from o3de import gem_discovery, registry_index
+
+
+@pytest.fixture
+def registry_index_path(tmp_path):
+    index_path = tmp_path / 'Cache' / registry_index.REGISTRY_INDEX_FILENAME
+    index_path.parent.mkdir()
+    with patch('o3de.registry_index.get_registry_index_path', return_value=index_path):
+        registry_index.clear_registry_index()
+        yield index_path
+        registry_index.clear_registry_index()
+
+
+def write_gem_json(gem_path: pathlib.Path, gem_name: str, external_subdirectories: list = None) -> pathlib.Path:
+    gem_path.mkdir(parents=True, exist_ok=True)
+    gem_json_data = {'gem_name': gem_name}
+    if external_subdirectories:
+        gem_json_data['external_subdirectories'] = external_subdirectories
+    gem_json = gem_path / 'gem.json'
+    gem_json.write_text(json.dumps(gem_json_data))
+    return gem_json
+
+
+def touch_directory(directory: pathlib.Path) -> None:
+    directory_stat = directory.stat()
+    os.utime(directory, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns + 1000000))
+
+
+class TestWalkGemDirectories:
+    def test_pruned_directories_are_not_searched(self, tmp_path, registry_index_path):
+        write_gem_json(tmp_path / 'Gems' / 'GemA', 'GemA')
+        write_gem_json(tmp_path / 'Gems' / '.git' / 'GemB', 'GemB')
+        write_gem_json(tmp_path / 'Gems' / 'build' / 'GemC', 'GemC')
+
+        _, gem_directories = gem_discovery.walk_gem_directories(tmp_path / 'Gems')
+        assert gem_directories == [(tmp_path / 'Gems' / 'GemA').as_posix()]
+
+    def test_nested_gems_require_declared_external_subdirectories(self, tmp_path, registry_index_path):
+        write_gem_json(tmp_path / 'Gems' / 'GemA', 'GemA')
+        write_gem_json(tmp_path / 'Gems' / 'GemA' / 'Nested', 'NestedA')
+        write_gem_json(tmp_path / 'Gems' / 'GemB', 'GemB', ['Nested'])
+        write_gem_json(tmp_path / 'Gems' / 'GemB' / 'Nested', 'NestedB')
+
+        _, gem_directories = gem_discovery.walk_gem_directories(tmp_path / 'Gems')
+        assert sorted(gem_directories) == sorted([(tmp_path / 'Gems' / 'GemA').as_posix(),
+                                                  (tmp_path / 'Gems' / 'GemB').as_posix(),
+                                                  (tmp_path / 'Gems' / 'GemB' / 'Nested').as_posix()])
+
+
+class TestFindGemDirectories:
+    def test_gem_directories_are_found_in_each_root(self, tmp_path, registry_index_path):
+        write_gem_json(tmp_path / 'Engine' / 'Gems' / 'GemA', 'GemA')
+        write_gem_json(tmp_path / 'Project' / 'Gem', 'ProjectGem')
+
+        gem_directories = gem_discovery.find_gem_directories([tmp_path / 'Engine', tmp_path / 'Project'])
+        assert gem_directories == [(tmp_path / 'Engine' / 'Gems' / 'GemA').as_posix(),
+                                   (tmp_path / 'Project' / 'Gem').as_posix()]
+
+    def test_overlapping_roots_are_walked_once(self, tmp_path, registry_index_path):
+        write_gem_json(tmp_path / 'Gems' / 'GemA', 'GemA')
+        write_gem_json(tmp_path / 'Gems' / 'GemB', 'GemB')
+
+        with patch('o3de.gem_discovery.walk_gem_directories',
+                   side_effect=gem_discovery.walk_gem_directories) as walk_patch:
+            gem_directories = gem_discovery.find_gem_directories([tmp_path / 'Gems' / 'GemB', tmp_path / 'Gems',
+                                                                  tmp_path / 'Gems'])
+            walk_patch.assert_called_once()
+        assert gem_directories == [(tmp_path / 'Gems' / 'GemB').as_posix(), (tmp_path / 'Gems' / 'GemA').as_posix()]
+
+    def test_unmodified_roots_are_not_rewalked(self, tmp_path, registry_index_path):
+        write_gem_json(tmp_path / 'Gems' / 'GemA', 'GemA')
+        gem_discovery.find_gem_directories([tmp_path / 'Gems'])
+
+        with patch('os.scandir') as scandir_patch:
+            assert gem_discovery.find_gem_directories([tmp_path / 'Gems']) == \
+                   [(tmp_path / 'Gems' / 'GemA').as_posix()]
+            scandir_patch.assert_not_called()
+
+    def test_added_gem_invalidates_root(self, tmp_path, registry_index_path):
+        write_gem_json(tmp_path / 'Gems' / 'GemA', 'GemA')
+        (tmp_path / 'Gems' / 'GemB').mkdir()
+        gem_discovery.find_gem_directories([tmp_path / 'Gems'])
+
+        write_gem_json(tmp_path / 'Gems' / 'GemB', 'GemB')
+        touch_directory(tmp_path / 'Gems' / 'GemB')
+
+        assert (tmp_path / 'Gems' / 'GemB').as_posix() in gem_discovery.find_gem_directories([tmp_path / 'Gems'])
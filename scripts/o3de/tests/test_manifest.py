@@ -7,6 +7,8 @@
 #
 
 import argparse
+import contextlib
+import errno
 import json
 import logging
 import pytest
@@ -147,3 +149,201 @@ class TestGetTemplatesForCreation:
 
             # make sure the o3de manifest isn't attempted to be loaded
             load_o3de_manifest_patch.assert_not_called()
+
+
+class TestGetRegisteredNameTables:
+    @pytest.fixture(autouse=True)
+    def clear_name_tables(self):
+        manifest.invalidate_registered_name_tables()
+        yield
+        manifest.invalidate_registered_name_tables()
+
+    @staticmethod
+    def create_gems(root_path: pathlib.Path, gem_names: list) -> list:
+        gem_paths = []
+        for gem_name in gem_names:
+            gem_path = root_path / gem_name
+            gem_path.mkdir()
+            (gem_path / 'gem.json').write_text(json.dumps({'gem_name': gem_name}))
+            gem_paths.append(gem_path.as_posix())
+        return gem_paths
+
+    def test_gem_names_are_resolved_from_a_single_scan(self, tmp_path):
+        gem_paths = self.create_gems(tmp_path, ['GemA', 'GemB', 'GemC'])
+
+        with patch('o3de.manifest.load_o3de_manifest', return_value={}) as load_o3de_manifest_patch, \
+                patch('o3de.manifest.get_all_gems', return_value=gem_paths) as get_all_gems_patch:
+            for gem_path in gem_paths:
+                assert manifest.get_registered(gem_name=pathlib.Path(gem_path).name) == pathlib.Path(gem_path).resolve()
+            assert manifest.get_registered(gem_name='MissingGem') is None
+            get_all_gems_patch.assert_called_once()
+
+    def test_save_o3de_manifest_invalidates_name_tables(self, tmp_path):
+        gem_paths = self.create_gems(tmp_path, ['GemA'])
+
+        with patch('o3de.manifest.load_o3de_manifest', return_value={}) as load_o3de_manifest_patch, \
+                patch('o3de.manifest.get_all_gems', return_value=gem_paths) as get_all_gems_patch:
+            assert manifest.get_registered(gem_name='GemA')
+            assert not manifest.get_registered(gem_name='GemB')
+
+            gem_paths.extend(self.create_gems(tmp_path, ['GemB']))
+            assert manifest.save_o3de_manifest({}, tmp_path / 'o3de_manifest.json')
+
+            assert manifest.get_registered(gem_name='GemB') == (tmp_path / 'GemB').resolve()
+            assert get_all_gems_patch.call_count == 2
+
+
+class TestManifestTransaction:
+    @pytest.fixture(autouse=True)
+    def o3de_folder(self, tmp_path):
+        with patch('o3de.manifest.get_o3de_folder', return_value=tmp_path):
+            self.manifest_path = tmp_path / 'o3de_manifest.json'
+            self.manifest_path.write_text(json.dumps({'gems': []}))
+            yield tmp_path
+
+    def test_transaction_writes_manifest_once(self):
+        with patch('o3de.manifest._write_o3de_manifest', wraps=manifest._write_o3de_manifest) as write_patch:
+            with manifest.transaction(self.manifest_path):
+                for gem_name in ['GemA', 'GemB', 'GemC']:
+                    json_data = manifest.load_o3de_manifest(self.manifest_path)
+                    json_data['gems'].append(gem_name)
+                    assert manifest.save_o3de_manifest(json_data, self.manifest_path)
+                # the saved data is not written until the transaction completes
+                assert json.loads(self.manifest_path.read_text()) == {'gems': []}
+                assert manifest.load_o3de_manifest(self.manifest_path) == {'gems': ['GemA', 'GemB', 'GemC']}
+            write_patch.assert_called_once()
+
+        assert json.loads(self.manifest_path.read_text()) == {'gems': ['GemA', 'GemB', 'GemC']}
+        assert not list(self.manifest_path.parent.glob('*.tmp'))
+
+    def test_transaction_discards_changes_on_exception(self):
+        with pytest.raises(RuntimeError):
+            with manifest.transaction(self.manifest_path):
+                json_data = manifest.load_o3de_manifest(self.manifest_path)
+                json_data['gems'].append('GemA')
+                manifest.save_o3de_manifest(json_data, self.manifest_path)
+                raise RuntimeError('Registration failed')
+
+        assert json.loads(self.manifest_path.read_text()) == {'gems': []}
+
+    def test_unsaved_changes_are_not_committed(self):
+        with manifest.transaction(self.manifest_path):
+            with manifest.transaction(self.manifest_path):
+                manifest.load_o3de_manifest(self.manifest_path)['gems'].append('GemA')
+            json_data = manifest.load_o3de_manifest(self.manifest_path)
+            json_data['gems'].append('GemB')
+            manifest.save_o3de_manifest(json_data, self.manifest_path)
+
+        assert json.loads(self.manifest_path.read_text()) == {'gems': ['GemB']}
+
+    def test_only_o3de_manifest_is_locked(self, tmp_path):
+        project_json_path = tmp_path / 'Project' / 'project.json'
+        project_json_path.parent.mkdir()
+
+        assert manifest.save_o3de_manifest({'project_name': 'Project'}, project_json_path)
+        assert manifest.save_o3de_manifest({'gems': ['GemA']}, self.manifest_path)
+
+        assert json.loads(project_json_path.read_text()) == {'project_name': 'Project'}
+        assert [lock_path.name for lock_path in tmp_path.rglob('*.lock')] == ['o3de_manifest.lock']
+
+    def test_register_locks_manifest_from_load_to_save(self, tmp_path):
+        from o3de import register
+
+        lock_held = []
+        real_manifest_file_lock = manifest._manifest_file_lock
+        real_load_o3de_manifest = manifest.load_o3de_manifest
+
+        @contextlib.contextmanager
+        def manifest_file_lock(manifest_path):
+            with real_manifest_file_lock(manifest_path):
+                lock_held.append(True)
+                try:
+                    yield
+                finally:
+                    lock_held.pop()
+
+        def load_o3de_manifest(manifest_path=None):
+            assert lock_held, 'The manifest was loaded without holding its lock'
+            return real_load_o3de_manifest(manifest_path)
+
+        with patch('o3de.manifest._manifest_file_lock', side_effect=manifest_file_lock), \
+                patch('o3de.manifest.load_o3de_manifest', side_effect=load_o3de_manifest):
+            assert register.register(default_gems_folder=tmp_path) == 0
+
+        assert json.loads(self.manifest_path.read_text())['default_gems_folder'] == tmp_path.resolve().as_posix()
+
+    def test_transaction_raises_when_manifest_fails_to_save(self):
+        with patch('os.replace', side_effect=OSError('Access is denied')):
+            with pytest.raises(OSError):
+                with manifest.transaction(self.manifest_path):
+                    manifest.save_o3de_manifest({'gems': ['GemA']}, self.manifest_path)
+
+        assert json.loads(self.manifest_path.read_text()) == {'gems': []}
+        assert not list(self.manifest_path.parent.glob('*.tmp'))
+
+    def test_register_fails_when_manifest_fails_to_save(self, tmp_path):
+        from o3de import register
+
+        with patch('os.replace', side_effect=OSError('Access is denied')):
+            assert register.register(default_gems_folder=tmp_path) == 1
+
+        assert 'default_gems_folder' not in json.loads(self.manifest_path.read_text())
+
+    def test_register_downloads_repo_without_holding_lock(self, tmp_path):
+        from o3de import register
+
+        lock_held = []
+        real_manifest_file_lock = manifest._manifest_file_lock
+
+        @contextlib.contextmanager
+        def manifest_file_lock(manifest_path):
+            with real_manifest_file_lock(manifest_path):
+                lock_held.append(True)
+                try:
+                    yield
+                finally:
+                    lock_held.pop()
+
+        def download_repo(repo_uri):
+            assert not lock_held, 'The repo was downloaded while holding the manifest lock'
+            return 0, 0
+
+        with patch('o3de.manifest._manifest_file_lock', side_effect=manifest_file_lock), \
+                patch('o3de.register.download_repo', side_effect=download_repo) as download_repo_patch:
+            assert register.register(repo_uri='https://o3de.org/repo') == 0
+            download_repo_patch.assert_called_once_with('https://o3de.org/repo')
+
+        assert json.loads(self.manifest_path.read_text())['repos'] == ['https://o3de.org/repo']
+
+    @staticmethod
+    def patch_lock_function(side_effect):
+        if manifest.os.name == 'nt':
+            return patch('o3de.manifest.msvcrt.locking', side_effect=side_effect)
+        return patch('o3de.manifest.fcntl.flock', side_effect=side_effect)
+
+    def test_transaction_times_out_while_manifest_is_locked(self):
+        lock_busy_error = OSError(errno.EACCES if manifest.os.name == 'nt' else errno.EWOULDBLOCK, 'Resource busy')
+
+        with self.patch_lock_function(lock_busy_error) as lock_patch, \
+                patch('o3de.manifest.MANIFEST_LOCK_TIMEOUT', 0.3), \
+                patch('o3de.manifest._MANIFEST_LOCK_RETRY_INTERVAL', 0.1):
+            with pytest.raises(TimeoutError):
+                with manifest.transaction(self.manifest_path):
+                    pass
+            assert 1 < lock_patch.call_count < 10
+
+    def test_transaction_raises_lock_errors_without_retrying(self):
+        with self.patch_lock_function(OSError(errno.EBADF, 'Bad file descriptor')) as lock_patch:
+            with pytest.raises(OSError) as raised:
+                with manifest.transaction(self.manifest_path):
+                    pass
+            assert raised.value.errno == errno.EBADF
+            lock_patch.assert_called_once()
+
+    def test_register_fails_when_manifest_lock_times_out(self, tmp_path):
+        from o3de import register
+
+        with patch('o3de.manifest._manifest_file_lock', side_effect=TimeoutError('Timed out')):
+            assert register.register(default_gems_folder=tmp_path) == 1
+
+        assert 'default_gems_folder' not in json.loads(self.manifest_path.read_text())
@@ -370,3 +370,79 @@ class TestPrintRegistration:
                 patch('o3de.print_registration.get_project_path', return_value=project_path) as get_project_path_patch:
             result = print_registration._run_register_show(test_args)
             assert result == 0
+
+
+class TestPrintRegistrationJson:
+    @staticmethod
+    def write_object(object_path: pathlib.Path, json_filename: str, json_data: dict) -> pathlib.Path:
+        object_path.mkdir(parents=True, exist_ok=True)
+        (object_path / json_filename).write_text(json.dumps(json_data))
+        return object_path
+
+    def test_registration_json_resolves_each_object_once(self, tmp_path, capsys):
+        engine_path = self.write_object(tmp_path / 'o3de', 'engine.json',
+                                        {'engine_name': 'o3de', 'external_subdirectories': ['Gems/EngineGem'],
+                                         'templates': ['Templates/EngineTemplate']})
+        self.write_object(engine_path / 'Gems' / 'EngineGem', 'gem.json',
+                          {'gem_name': 'EngineGem', 'external_subdirectories': ['../../External/NestedGem']})
+        self.write_object(engine_path / 'External' / 'NestedGem', 'gem.json',
+                          {'gem_name': 'NestedGem', 'templates': ['Template']})
+        self.write_object(engine_path / 'External' / 'NestedGem' / 'Template', 'template.json',
+                          {'template_name': 'NestedGemTemplate'})
+        self.write_object(engine_path / 'Templates' / 'EngineTemplate', 'template.json',
+                          {'template_name': 'EngineTemplate'})
+        project_path = self.write_object(tmp_path / 'TestProject', 'project.json',
+                                         {'project_name': 'TestProject', 'project_id': '{1}',
+                                          'external_subdirectories': ['Gem']})
+        self.write_object(project_path / 'Gem', 'gem.json', {'gem_name': 'ProjectGem'})
+        restricted_path = self.write_object(tmp_path / 'Restricted', 'restricted.json', {'restricted_name': 'o3de'})
+
+        cache_folder = tmp_path / 'Cache'
+        cache_folder.mkdir()
+        repo_uri = 'https://example.com/repo'
+        manifest_json_data = {
+            'engines': [engine_path.as_posix()],
+            'projects': [project_path.as_posix()],
+            'external_subdirectories': [(engine_path / 'Gems').as_posix()],
+            'templates': [],
+            'restricted': [restricted_path.as_posix()],
+            'repos': [repo_uri]
+        }
+        repo_cache_file = print_registration.manifest.get_repo_path(repo_uri, cache_folder)
+        repo_cache_file.write_text(json.dumps({'repo_name': 'TestRepo', 'origin': 'Test'}))
+
+        parser = argparse.ArgumentParser()
+        print_registration.add_parser_args(parser)
+        test_args = parser.parse_args(['--json'])
+
+        with patch('o3de.manifest.load_o3de_manifest', return_value=manifest_json_data), \
+                patch('o3de.manifest.get_o3de_manifest', return_value=tmp_path / 'o3de_manifest.json'), \
+                patch('o3de.manifest.get_this_engine_path', return_value=engine_path), \
+                patch('o3de.manifest.get_o3de_cache_folder', return_value=cache_folder), \
+                patch('o3de.registry_index.get_registry_index_path', return_value=cache_folder / 'registry_index.json'), \
+                patch('o3de.registry_index._read_json_data',
+                      wraps=print_registration.registry_index._read_json_data) as read_json_data_patch:
+            print_registration.registry_index.clear_registry_index()
+            try:
+                result = print_registration._run_register_show(test_args)
+            finally:
+                print_registration.registry_index.clear_registry_index()
+        assert result == 0
+
+        # every json file is read once even though the engine and gems are referenced by several sections
+        read_json_files = [call.args[0] for call in read_json_data_patch.call_args_list]
+        assert len(read_json_files) == len(set(read_json_files))
+
+        registration_json_data = json.loads(capsys.readouterr().out)
+        assert registration_json_data['manifest'] == manifest_json_data
+        assert registration_json_data['this_engine']['json_data']['engine_name'] == 'o3de'
+        assert [engine['json_data']['engine_name'] for engine in registration_json_data['engines']] == ['o3de']
+        assert [project['json_data']['project_name'] for project in registration_json_data['projects']] == \
+               ['TestProject']
+        assert sorted(gem['json_data']['gem_name'] for gem in registration_json_data['gems']) == \
+               ['EngineGem', 'NestedGem', 'ProjectGem']
+        assert sorted(template['json_data']['template_name'] for template in registration_json_data['templates']) == \
+               ['EngineTemplate', 'NestedGemTemplate']
+        assert registration_json_data['restricted'][0]['json_data'] == {'restricted_name': 'o3de'}
+        assert registration_json_data['repos'][0]['uri'] == repo_uri
+        assert registration_json_data['repos'][0]['json_data']['repo_name'] == 'TestRepo'
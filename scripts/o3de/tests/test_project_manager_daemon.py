@@ -0,0 +1,105 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import io
+import json
+import pytest
+import pathlib
+from unittest.mock import patch
+
+from o3de import project_manager_daemon, project_manager_interface
+
+
+def serve_messages(messages: list) -> list:
+    input_stream = io.StringIO(''.join(message + '\n' for message in messages))
+    output_stream = io.StringIO()
+    with patch('o3de.project_manager_daemon.RegistryWatcher.get_watched_paths', return_value=[]), \
+            patch('o3de.registry_index.save_registry_index', return_value=True):
+        assert project_manager_daemon.serve(input_stream, output_stream) == 0
+    return [json.loads(line) for line in output_stream.getvalue().splitlines()]
+
+
+def rpc_request(request_id, method: str, params=None) -> str:
+    request = {'jsonrpc': '2.0', 'method': method, 'params': params if params is not None else []}
+    if request_id is not None:
+        request['id'] = request_id
+    return json.dumps(request)
+
+
+class TestProjectManagerDaemon:
+    def test_requests_are_served_in_order(self):
+        def get_enabled_gem_names(project_path: str) -> list:
+            return [f'{pathlib.PurePath(project_path).name}Gem']
+
+        with patch('o3de.project_manager_interface.get_enabled_gem_names',
+                   side_effect=get_enabled_gem_names):
+            responses = serve_messages([rpc_request(1, 'get_enabled_gem_names', ['ProjectA']),
+                                        rpc_request(2, 'get_enabled_gem_names', {'project_path': 'ProjectB'})])
+
+        assert responses == [{'jsonrpc': '2.0', 'id': 1, 'result': ['ProjectAGem']},
+                             {'jsonrpc': '2.0', 'id': 2, 'result': ['ProjectBGem']}]
+
+    def test_batch_is_answered_in_one_response(self):
+        with patch('o3de.project_manager_interface.get_gem_info', side_effect=lambda gem_path: {'path': gem_path}):
+            responses = serve_messages([json.dumps([
+                json.loads(rpc_request(1, 'get_gem_info', ['GemA'])),
+                # notifications are not answered
+                json.loads(rpc_request(None, 'get_gem_info', ['GemB'])),
+                json.loads(rpc_request(2, 'get_gem_info', ['GemC'])),
+            ])])
+
+        assert responses == [[{'jsonrpc': '2.0', 'id': 1, 'result': {'path': 'GemA'}},
+                              {'jsonrpc': '2.0', 'id': 2, 'result': {'path': 'GemC'}}]]
+
+    @pytest.mark.parametrize("message, expected_code", [
+        pytest.param('{"jsonrpc": "2.0", "id": 1', project_manager_daemon.PARSE_ERROR),
+        pytest.param('{"id": 1, "method": "get_gem_info"}', project_manager_daemon.INVALID_REQUEST),
+        pytest.param(rpc_request(1, 'load_o3de_manifest'), project_manager_daemon.METHOD_NOT_FOUND),
+        pytest.param(rpc_request(1, 'register_project', ['ProjectA']), project_manager_daemon.METHOD_NOT_FOUND),
+        pytest.param(rpc_request(1, 'get_gem_info', ['GemA', 'Unexpected']), project_manager_daemon.INVALID_PARAMS),
+    ])
+    def test_invalid_requests_return_errors(self, message, expected_code):
+        responses = serve_messages([message])
+
+        assert len(responses) == 1
+        assert responses[0]['error']['code'] == expected_code
+
+    def test_printed_output_does_not_corrupt_responses(self):
+        def get_all_project_infos() -> list:
+            print('Scanning projects')
+            return []
+
+        with patch('o3de.project_manager_interface.get_all_project_infos', side_effect=get_all_project_infos):
+            responses = serve_messages([rpc_request(1, 'get_all_project_infos')])
+
+        assert responses == [{'jsonrpc': '2.0', 'id': 1, 'result': []}]
+
+
+class TestRegistryWatcher:
+    def test_changed_file_refreshes_registry(self, tmp_path):
+        project_json = tmp_path / 'project.json'
+        project_json.write_text('{}')
+
+        watcher = project_manager_daemon.RegistryWatcher()
+        with patch('o3de.project_manager_daemon.RegistryWatcher.get_watched_paths', return_value=[str(project_json)]), \
+                patch('o3de.manifest.invalidate_registered_name_tables') as invalidate_patch:
+            watcher.update()
+            assert not watcher.check()
+            invalidate_patch.assert_not_called()
+
+            project_json.write_text('{"project_name": "TestProject"}')
+            assert watcher.check()
+            invalidate_patch.assert_called_once()
+
+
+def test_get_enabled_gem_names(tmp_path):
+    enabled_gem_file = tmp_path / 'Gem' / 'enabled_gems.cmake'
+    enabled_gem_file.parent.mkdir()
+    enabled_gem_file.write_text('set(ENABLED_GEMS\n    GemB\n    GemA\n)\n')
+
+    assert project_manager_interface.get_enabled_gem_names(tmp_path) == ['GemA', 'GemB']
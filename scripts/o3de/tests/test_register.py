@@ -7,6 +7,7 @@
 #
 
 import argparse
+import contextlib
 import json
 import logging
 import pytest
@@ -40,7 +41,7 @@ def test_register_engine_path(engine_path, engine_name, force, expected_result):
         arg_list += ['--force']
     args = parser.parse_args(arg_list)
 
-    def load_manifest_from_string() -> dict:
+    def load_manifest_from_string(manifest_path: pathlib.Path = None) -> dict:
         try:
             manifest_json = json.loads(string_manifest_data)
         except json.JSONDecodeError as err:
@@ -91,7 +92,7 @@ class TestRegisterThisEngine:
             arg_list += ['--force']
         args = parser.parse_args(arg_list)
 
-        def load_manifest_from_string() -> dict:
+        def load_manifest_from_string(manifest_path: pathlib.Path = None) -> dict:
             try:
                 manifest_json = json.loads(self.manifest_data.json_string)
             except json.JSONDecodeError as err:
@@ -248,3 +249,110 @@ class TestRegisterGem:
             elif expected_manifest_file == pathlib.PurePath('engine.json'):
                 assert gem_path in map(lambda subdir: TestRegisterGem.engine_path / subdir,
                                        self.engine_data.get('external_subdirectories', []))
+
+
+class TestRemoveInvalidO3deObjects:
+    @pytest.fixture(autouse=True)
+    def o3de_folder(self, tmp_path):
+        o3de_folder = tmp_path / '.o3de'
+        o3de_folder.mkdir()
+        self.objects_path = tmp_path / 'objects'
+        with patch('o3de.manifest.get_o3de_folder', return_value=o3de_folder), \
+                patch('o3de.registry_index.get_registry_index_path',
+                      return_value=o3de_folder / 'Cache' / 'registry_index.json'):
+            register.registry_index.clear_registry_index()
+            self.manifest_path = o3de_folder / 'o3de_manifest.json'
+            self.manifest_path.write_text(json.dumps({
+                'default_gems_folder': (tmp_path / 'MissingGems').as_posix(),
+                'engines': [self.add_object('ValidEngine', 'engine.json', {'engine_name': 'o3de'}),
+                            self.add_object('InvalidEngine', 'engine.json', {})],
+                'engines_path': {'o3de': (self.objects_path / 'ValidEngine').as_posix(),
+                                 'missing': (self.objects_path / 'InvalidEngine').as_posix()},
+                'projects': [self.add_object('ValidProject', 'project.json', {'project_name': 'TestProject'}),
+                             (self.objects_path / 'MissingProject').as_posix()],
+                'external_subdirectories': [self.add_object('ValidGem', 'gem.json', {'gem_name': 'TestGem'}),
+                                            (self.objects_path / 'MissingGem').as_posix()],
+                'templates': [self.add_object('InvalidTemplate', 'template.json', None)],
+                'restricted': [self.add_object('ValidRestricted', 'restricted.json', {'restricted_name': 'o3de'})],
+                'repos': ['https://example.com/repo', (self.objects_path / 'MissingRepo').as_posix()]
+            }))
+            yield o3de_folder
+            register.registry_index.clear_registry_index()
+
+    def add_object(self, object_name: str, json_filename: str, json_data: dict or None) -> str:
+        object_path = self.objects_path / object_name
+        object_path.mkdir(parents=True)
+        (object_path / json_filename).write_text(json.dumps(json_data) if json_data is not None else '{ invalid')
+        return object_path.as_posix()
+
+    def test_invalid_objects_are_removed_with_one_manifest_write(self, o3de_folder):
+        with patch('o3de.manifest._write_o3de_manifest', wraps=register.manifest._write_o3de_manifest) as write_patch:
+            assert register.remove_invalid_o3de_objects(max_workers=4) == 0
+            write_patch.assert_called_once()
+
+        json_data = json.loads(self.manifest_path.read_text())
+        assert json_data['engines'] == [(self.objects_path / 'ValidEngine').as_posix()]
+        assert json_data['engines_path'] == {'o3de': (self.objects_path / 'ValidEngine').as_posix()}
+        assert json_data['projects'] == [(self.objects_path / 'ValidProject').as_posix()]
+        assert json_data['external_subdirectories'] == [(self.objects_path / 'ValidGem').as_posix()]
+        assert json_data['templates'] == []
+        assert json_data['restricted'] == [(self.objects_path / 'ValidRestricted').as_posix()]
+        # remote repos are only validated when they are refreshed
+        assert json_data['repos'] == ['https://example.com/repo']
+        assert json_data['default_gems_folder'] == (o3de_folder / 'Gems').as_posix()
+        assert (o3de_folder / 'Gems').is_dir()
+
+        # a project without a project_id is valid and has one generated
+        assert 'project_id' in json.loads((self.objects_path / 'ValidProject' / 'project.json').read_text())
+
+    def test_dry_run_reports_without_changes(self, o3de_folder, caplog):
+        manifest_data = self.manifest_path.read_text()
+        project_data = (self.objects_path / 'ValidProject' / 'project.json').read_text()
+
+        parser = argparse.ArgumentParser()
+        register.add_parser_args(parser)
+        with patch('o3de.repo.refresh_repos') as refresh_repos_patch:
+            assert register._run_register(parser.parse_args(['--update', '--dry-run'])) == 0
+            refresh_repos_patch.assert_not_called()
+
+        assert self.manifest_path.read_text() == manifest_data
+        assert (self.objects_path / 'ValidProject' / 'project.json').read_text() == project_data
+        assert not (o3de_folder / 'Gems').exists()
+        report = caplog.text
+        for invalid_object_name in ['InvalidEngine', 'MissingProject', 'MissingGem', 'InvalidTemplate', 'MissingRepo',
+                                    'MissingGems']:
+            assert invalid_object_name in report
+        for valid_object_name in ['ValidEngine', 'ValidProject', 'ValidGem', 'ValidRestricted', 'example.com']:
+            assert valid_object_name not in report
+
+    def test_validation_does_not_hold_manifest_lock(self, o3de_folder):
+        lock_held = []
+        real_manifest_file_lock = register.manifest._manifest_file_lock
+        real_find_invalid_o3de_objects = register.find_invalid_o3de_objects
+
+        @contextlib.contextmanager
+        def manifest_file_lock(manifest_path):
+            with real_manifest_file_lock(manifest_path):
+                lock_held.append(True)
+                try:
+                    yield
+                finally:
+                    lock_held.pop()
+
+        def find_invalid_o3de_objects(*args, **kwargs):
+            assert not lock_held, 'The manifest entries were validated while holding the manifest lock'
+            return real_find_invalid_o3de_objects(*args, **kwargs)
+
+        with patch('o3de.manifest._manifest_file_lock', side_effect=manifest_file_lock), \
+                patch('o3de.register.find_invalid_o3de_objects', side_effect=find_invalid_o3de_objects):
+            assert register.remove_invalid_o3de_objects() == 0
+
+        assert json.loads(self.manifest_path.read_text())['templates'] == []
+
+    def test_update_refreshes_repos_when_removal_fails(self):
+        parser = argparse.ArgumentParser()
+        register.add_parser_args(parser)
+        with patch('o3de.register.remove_invalid_o3de_objects', return_value=1), \
+                patch('o3de.repo.refresh_repos', return_value=0) as refresh_repos_patch:
+            assert register._run_register(parser.parse_args(['--update'])) == 1
+            refresh_repos_patch.assert_called_once()
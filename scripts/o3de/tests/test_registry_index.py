@@ -0,0 +1,98 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import json
+import os
+import pytest
+import pathlib
+from unittest.mock import patch
+
+from o3de import registry_index, validation
+
+
+@pytest.fixture
+def registry_index_path(tmp_path):
+    index_path = tmp_path / 'Cache' / registry_index.REGISTRY_INDEX_FILENAME
+    index_path.parent.mkdir()
+    with patch('o3de.registry_index.get_registry_index_path', return_value=index_path):
+        registry_index.clear_registry_index()
+        yield index_path
+        registry_index.clear_registry_index()
+
+
+def write_gem_json(gem_path: pathlib.Path, gem_name: str) -> pathlib.Path:
+    gem_path.mkdir(parents=True, exist_ok=True)
+    gem_json = gem_path / 'gem.json'
+    gem_json.write_text(json.dumps({'gem_name': gem_name}))
+    return gem_json
+
+
+class TestRegistryIndexJsonData:
+    def test_unmodified_json_is_not_reread(self, tmp_path, registry_index_path):
+        gem_json = write_gem_json(tmp_path / 'TestGem', 'TestGem')
+
+        assert registry_index.get_json_data(gem_json, validation.valid_o3de_gem_json) == (True, {'gem_name': 'TestGem'})
+        with patch('pathlib.Path.open') as open_patch:
+            is_valid, json_data = registry_index.get_json_data(gem_json, validation.valid_o3de_gem_json)
+            open_patch.assert_not_called()
+        assert is_valid
+        assert json_data == {'gem_name': 'TestGem'}
+
+        # The returned data must be a copy, so callers can modify it without changing the index
+        json_data['gem_name'] = 'Modified'
+        assert registry_index.get_json_data(gem_json, validation.valid_o3de_gem_json)[1] == {'gem_name': 'TestGem'}
+
+    def test_modified_json_is_reread(self, tmp_path, registry_index_path):
+        gem_json = write_gem_json(tmp_path / 'TestGem', 'TestGem')
+        registry_index.get_json_data(gem_json, validation.valid_o3de_gem_json)
+
+        gem_json.write_text(json.dumps({'gem_name': 'RenamedGem'}))
+        json_stat = gem_json.stat()
+        os.utime(gem_json, ns=(json_stat.st_atime_ns, json_stat.st_mtime_ns + 1000000))
+
+        assert registry_index.get_json_data(gem_json, validation.valid_o3de_gem_json) == \
+               (True, {'gem_name': 'RenamedGem'})
+
+    def test_invalid_json_result_is_indexed(self, tmp_path, registry_index_path):
+        gem_json = write_gem_json(tmp_path / 'TestGem', 'TestGem')
+
+        assert registry_index.get_json_data(gem_json, validation.valid_o3de_project_json) == (False, None)
+        assert registry_index.get_json_data(gem_json, validation.valid_o3de_gem_json)[0]
+
+    def test_index_is_saved_and_reloaded(self, tmp_path, registry_index_path):
+        gem_json = write_gem_json(tmp_path / 'TestGem', 'TestGem')
+        registry_index.get_json_data(gem_json, validation.valid_o3de_gem_json)
+        assert registry_index.save_registry_index()
+        assert registry_index_path.is_file()
+
+        # Drop the in-memory index so that it is reloaded from disk
+        registry_index._registry_index = None
+        with patch('pathlib.Path.open') as open_patch:
+            assert registry_index.get_json_data(gem_json, validation.valid_o3de_gem_json) == \
+                   (True, {'gem_name': 'TestGem'})
+            open_patch.assert_not_called()
+
+
+class TestRegistryIndexSubdirectories:
+    def test_unmodified_subdirectory_entry_is_returned(self, tmp_path, registry_index_path):
+        gem_json = write_gem_json(tmp_path / 'Gems' / 'GemA', 'GemA')
+        paths = {str(tmp_path / 'Gems'): (tmp_path / 'Gems').stat().st_mtime_ns,
+                 str(gem_json): gem_json.stat().st_mtime_ns}
+        registry_index.set_subdirectory_entry(tmp_path / 'Gems', paths, [gem_json.parent.as_posix()])
+
+        assert registry_index.get_subdirectory_entry(tmp_path / 'Gems') == (paths, [gem_json.parent.as_posix()])
+
+    def test_modified_subdirectory_entry_is_not_returned(self, tmp_path, registry_index_path):
+        gems_path = tmp_path / 'Gems'
+        gems_path.mkdir()
+        registry_index.set_subdirectory_entry(gems_path, {str(gems_path): gems_path.stat().st_mtime_ns}, [])
+
+        directory_stat = gems_path.stat()
+        os.utime(gems_path, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns + 1000000))
+
+        assert registry_index.get_subdirectory_entry(gems_path) is None
@@ -0,0 +1,185 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+#
+
+import hashlib
+import http.server
+import json
+import os
+import pytest
+import threading
+import urllib.parse
+from unittest.mock import patch
+
+from o3de import repo, repo_refresh
+
+
+class RepoRequestHandler(http.server.BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection alive between requests
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        # a proxy receives the absolute url
+        path = urllib.parse.urlsplit(self.path).path
+        with server.lock:
+            server.requests.append((path, self.headers.get('If-None-Match')))
+            server.client_ports.add(self.client_address[1])
+            if path != self.path:
+                server.proxied_requests.append((self.path, self.headers.get('Proxy-Authorization')))
+        content = server.files.get(path)
+        if content is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        etag = '"' + hashlib.sha256(content).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def repo_server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), RepoRequestHandler)
+    server.files = {}
+    server.requests = []
+    server.client_ports = set()
+    server.proxied_requests = []
+    server.lock = threading.Lock()
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache_folder(tmp_path):
+    with patch('o3de.manifest.get_o3de_cache_folder', return_value=tmp_path):
+        yield tmp_path
+
+
+def add_repo(server, repo_name: str, gem_names: list, child_repo_names: list = None) -> str:
+    repo_json = {
+        'repo_name': repo_name,
+        'origin': server.url,
+        'gems': [f'{server.url}/{gem_name}' for gem_name in gem_names],
+        'repos': [f'{server.url}/{child_repo_name}' for child_repo_name in child_repo_names or []]
+    }
+    server.files[f'/{repo_name}/repo.json'] = json.dumps(repo_json).encode()
+    for gem_name in gem_names:
+        server.files[f'/{gem_name}/gem.json'] = json.dumps({'gem_name': gem_name}).encode()
+    return f'{server.url}/{repo_name}'
+
+
+def test_refresh_repo_downloads_each_file_once(repo_server, cache_folder):
+    repo_uri = add_repo(repo_server, 'ParentRepo', ['GemA', 'GemB'], ['ChildRepo'])
+    # the child repo lists a gem from the parent and references the parent again
+    add_repo(repo_server, 'ChildRepo', ['GemB', 'GemC'], ['ParentRepo'])
+
+    assert repo.refresh_repo(repo_uri) == 0
+
+    requested_paths = [path for path, _ in repo_server.requests]
+    assert sorted(requested_paths) == sorted(['/ParentRepo/repo.json', '/ChildRepo/repo.json',
+                                              '/GemA/gem.json', '/GemB/gem.json', '/GemC/gem.json'])
+    gem_json_paths = repo.get_gem_json_paths_from_cached_repo(repo_uri)
+    assert {json.loads(gem_json_path.read_text())['gem_name'] for gem_json_path in gem_json_paths} == {'GemA', 'GemB'}
+    assert repo.get_gem_json_paths_from_cached_repo(f'{repo_server.url}/ChildRepo')
+
+
+def test_refresh_repo_keeps_unmodified_cache_files(repo_server, cache_folder):
+    repo_uri = add_repo(repo_server, 'Repo', ['GemA', 'GemB'])
+    assert repo.refresh_repo(repo_uri) == 0
+    gem_a_cache_file = repo_refresh.get_cache_file(cache_folder, f'{repo_server.url}/GemA/gem.json')
+    gem_a_mtime = gem_a_cache_file.stat().st_mtime_ns
+
+    repo_server.files['/GemB/gem.json'] = json.dumps({'gem_name': 'GemB', 'version': '2.0.0'}).encode()
+    repo_server.requests.clear()
+    assert repo.refresh_repo(repo_uri) == 0
+
+    # every cached file is requested with its ETag, and only the changed file is downloaded again
+    assert all(etag for _, etag in repo_server.requests)
+    assert gem_a_cache_file.stat().st_mtime_ns == gem_a_mtime
+    gem_b_cache_file = repo_refresh.get_cache_file(cache_folder, f'{repo_server.url}/GemB/gem.json')
+    assert json.loads(gem_b_cache_file.read_text())['version'] == '2.0.0'
+
+
+def test_refresh_reuses_connections_and_reports_progress(repo_server, cache_folder):
+    repo_uri = add_repo(repo_server, 'Repo', [f'Gem{index}' for index in range(8)])
+
+    progress = []
+    refresher = repo_refresh.RepoRefresher(max_workers=1,
+                                           progress_callback=lambda completed, total: progress.append((completed, total)))
+    assert refresher.refresh([repo_uri]) == 0
+
+    assert len(repo_server.requests) == 9
+    assert len(repo_server.client_ports) == 1
+    assert progress[-1] == (9, 9)
+
+
+def test_refresh_repo_fails_on_missing_files(repo_server, cache_folder):
+    repo_uri = add_repo(repo_server, 'Repo', ['GemA'])
+    del repo_server.files['/GemA/gem.json']
+
+    assert repo.refresh_repo(repo_uri) == 1
+    assert repo.refresh_repo(f'{repo_server.url}/MissingRepo') == 1
+
+
+def get_proxy_environment(proxies: dict) -> dict:
+    environment = {key: value for key, value in os.environ.items() if not key.lower().endswith('_proxy')}
+    environment.update(proxies)
+    return environment
+
+
+def test_refresh_repo_connects_through_http_proxy(repo_server, cache_folder):
+    # the repo host only exists behind the proxy
+    proxy_url = repo_server.url
+    repo_server.url = 'http://o3de-repo.test'
+    repo_uri = add_repo(repo_server, 'Repo', ['GemA'])
+
+    with patch.dict(os.environ, get_proxy_environment({'http_proxy': proxy_url.replace('http://', 'http://user:pass@')}),
+                    clear=True):
+        assert repo.refresh_repo(repo_uri) == 0
+
+    assert sorted(path for path, _ in repo_server.proxied_requests) == ['http://o3de-repo.test/GemA/gem.json',
+                                                                         'http://o3de-repo.test/Repo/repo.json']
+    assert all(authorization == 'Basic dXNlcjpwYXNz' for _, authorization in repo_server.proxied_requests)
+
+
+def test_refresh_repo_bypasses_proxy_for_no_proxy_hosts(repo_server, cache_folder):
+    repo_uri = add_repo(repo_server, 'Repo', ['GemA'])
+
+    # nothing listens on the proxy port, so the refresh only succeeds if the proxy is bypassed
+    with patch.dict(os.environ, get_proxy_environment({'http_proxy': 'http://127.0.0.1:1', 'no_proxy': '127.0.0.1'}),
+                    clear=True):
+        assert repo.refresh_repo(repo_uri) == 0
+
+    assert not repo_server.proxied_requests
+
+
+def test_https_connection_is_tunneled_through_proxy(cache_folder):
+    with patch.dict(os.environ, get_proxy_environment({'https_proxy': 'http://proxy.test:3128'}), clear=True):
+        refresher = repo_refresh.RepoRefresher()
+    connection, forward_proxy_headers = refresher._get_connection('https', 'o3de-repo.test')
+
+    assert (connection.host, connection.port) == ('proxy.test', 3128)
+    assert connection._tunnel_host == 'o3de-repo.test'
+    assert forward_proxy_headers is None
@@ -6,7 +6,11 @@
 #
 #
 
+import hashlib
+import http.server
 import pytest
+import threading
+import urllib.parse
 
 from o3de import utils
 
@@ -37,3 +41,80 @@ def test_validate_identifier(value, expected_result):
 def test_validate_uuid4(value, expected_result):
     result = utils.validate_uuid4(value)
     assert result == expected_result
+
+
+def test_get_file_sha256_streams_file(tmp_path):
+    test_file = tmp_path / 'test.zip'
+    test_data = bytes(range(256)) * 1024
+    test_file.write_bytes(test_data)
+
+    assert utils.get_file_sha256(test_file) == hashlib.sha256(test_data).hexdigest()
+
+
+class RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        content = self.server.content
+        etag = '"' + hashlib.sha256(content).hexdigest() + '"'
+        self.server.range_headers.append(self.headers.get('Range'))
+
+        start = 0
+        range_header = self.headers.get('Range')
+        if range_header and self.headers.get('If-Range') == etag:
+            start = int(range_header[len('bytes='):].split('-')[0])
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(content) - 1}/{len(content)}')
+        else:
+            self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content) - start))
+        self.end_headers()
+        self.wfile.write(content[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def range_server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), RangeRequestHandler)
+    server.content = bytes(range(256)) * 1024
+    server.range_headers = []
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "content_changed", [
+        pytest.param(False),
+        pytest.param(True)
+    ]
+)
+def test_download_file_resumes_partial_download(tmp_path, range_server, content_changed):
+    parsed_uri = urllib.parse.urlparse(f'http://127.0.0.1:{range_server.server_address[1]}/test.zip')
+    download_path = tmp_path / 'test.zip'
+
+    # cancel the first download after the first block to leave a partial download behind
+    assert utils.download_file(parsed_uri, download_path, resume=True,
+                               download_progress_callback=lambda downloaded, total: True) == 1
+    assert not download_path.is_file()
+    partial_download_path = utils.get_partial_download_path(download_path)
+    assert partial_download_path.stat().st_size == utils.COPY_BUFSIZE
+
+    if content_changed:
+        range_server.content = bytes(reversed(range_server.content))
+    hasher = hashlib.sha256()
+    progress = []
+    assert utils.download_file(parsed_uri, download_path, resume=True, hasher=hasher,
+                               download_progress_callback=lambda downloaded, total: progress.append((downloaded, total))) == 0
+
+    assert range_server.range_headers == [None, f'bytes={utils.COPY_BUFSIZE}-']
+    assert download_path.read_bytes() == range_server.content
+    assert hasher.hexdigest() == hashlib.sha256(range_server.content).hexdigest()
+    assert progress[-1] == (len(range_server.content), len(range_server.content))
+    assert not partial_download_path.exists()
+    assert not list(tmp_path.glob('*.json'))